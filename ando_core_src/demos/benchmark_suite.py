@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark suite for ando_barrier_core
+Sweeps scenario, mesh resolution, thread count and PCG precision mode; records
+step timings, per-phase StepStats and peak RSS to JSON and optionally compares
+against a saved baseline
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'build'))
+
+
+SCENARIOS = ('drape', 'curtains', 'rigid')
+PRECISIONS = ('float', 'mixed')
+
+
+def _make_drape(resolution):
+    """Cloth pinned at four corners draping onto a ground wall"""
+    from demo_stress_test import StressTestDemo
+    return StressTestDemo(resolution=resolution)
+
+
+def _make_curtains(resolution):
+    """Three stacked, self-folding curtain panels (fixed resolution)"""
+    from demo_cascading_curtains import CascadingCurtainsDemo
+    return CascadingCurtainsDemo()
+
+
+def _make_rigid(resolution):
+    """Cloth falling onto a dynamic rigid plate (two-way coupling)"""
+    import ando_barrier_core as abc
+    from demo_framework import PhysicsDemo, create_grid_mesh, create_cloth_material
+
+    class RigidCouplingDemo(PhysicsDemo):
+        def __init__(self):
+            super().__init__(
+                name=f"Rigid Coupling ({resolution}×{resolution})",
+                description="Cloth dropping onto a free rigid plate"
+            )
+            self.rigid_bodies = []
+
+        def setup(self):
+            vertices, triangles = create_grid_mesh(resolution=resolution, size=1.0)
+            vertices[:, 2] = 0.05
+
+            self.rest_positions = vertices.copy()
+            self.triangles = triangles
+
+            self.mesh = abc.Mesh()
+            self.mesh.initialize(vertices, triangles, create_cloth_material('cotton'))
+            self.state = abc.State()
+            self.state.initialize(self.mesh)
+            self.constraints = abc.Constraints()
+
+            plate_verts = np.array([
+                [-0.6, -0.6, 0.0], [0.6, -0.6, 0.0], [0.6, 0.6, 0.0], [-0.6, 0.6, 0.0],
+            ], dtype=np.float32)
+            plate_tris = np.array([[0, 1, 2], [0, 2, 3]], dtype=np.int32)
+            body = abc.RigidBody()
+            body.initialize(plate_verts, plate_tris, 1000.0)
+            self.rigid_bodies = [body]
+
+            self.params = abc.SimParams()
+            self.params.beta_max = 0.25
+            self.params.min_newton_steps = 2
+            self.params.max_newton_steps = 6
+            self.params.pcg_tol = 1e-3
+            self.params.pcg_max_iters = 100
+            self.params.contact_gap_max = 0.01
+            self.params.wall_gap = 0.002
+            self.params.enable_ccd = True
+
+    return RigidCouplingDemo()
+
+
+_FACTORIES = {
+    'drape': _make_drape,
+    'curtains': _make_curtains,
+    'rigid': _make_rigid,
+}
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak / (1024.0 * 1024.0) if sys.platform == 'darwin' else peak / 1024.0
+
+
+def run_case(scenario, resolution, frames, warmup, dt, precision='float'):
+    """Run one benchmark case in this process and return its result dict"""
+    import ando_barrier_core as abc
+
+    demo = _FACTORIES[scenario](resolution)
+    demo.setup()
+    demo.params.dt = dt
+    if precision == 'mixed':
+        if not hasattr(demo.params, 'pcg_mixed_precision'):
+            raise RuntimeError("core module built without mixed-precision PCG")
+        demo.params.pcg_mixed_precision = True
+    rigid_bodies = getattr(demo, 'rigid_bodies', None) or None
+
+    gravity = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+    step_stats = abc.StepStats() if hasattr(abc, 'StepStats') else None
+    profile = {}
+    step_ms = []
+    for frame in range(warmup + frames):
+        demo.state.apply_gravity(gravity, dt)
+        t0 = time.perf_counter()
+        if step_stats is not None:
+            abc.Integrator.step(demo.mesh, demo.state, demo.constraints, demo.params, rigid_bodies,
+                                stats=step_stats)
+        else:
+            abc.Integrator.step(demo.mesh, demo.state, demo.constraints, demo.params, rigid_bodies)
+        elapsed = (time.perf_counter() - t0) * 1000.0
+        if frame >= warmup:
+            step_ms.append(elapsed)
+            if step_stats is not None:
+                for key, value in step_stats.as_dict().items():
+                    profile[key] = profile.get(key, 0) + value
+
+    step_ms = np.asarray(step_ms, dtype=np.float64)
+    return {
+        'scenario': scenario,
+        'resolution': resolution,
+        'threads': os.environ.get('OMP_NUM_THREADS', ''),
+        'precision': precision,
+        'vertices': int(demo.mesh.num_vertices()),
+        'triangles': int(demo.mesh.num_triangles()),
+        'frames': frames,
+        'dt': dt,
+        'step_ms': {
+            'mean': float(step_ms.mean()),
+            'median': float(np.median(step_ms)),
+            'p95': float(np.percentile(step_ms, 95)),
+            'min': float(step_ms.min()),
+            'max': float(step_ms.max()),
+        },
+        # Per-step averages of StepStats phase times (ms) and counters
+        'profile': {key: value / frames for key, value in profile.items()},
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def case_key(result):
+    key = f"{result['scenario']}/res={result['resolution']}/threads={result['threads'] or 'default'}"
+    # Float cases keep the original key so older baselines still compare
+    precision = result.get('precision', 'float')
+    return key if precision == 'float' else f"{key}/{precision}"
+
+
+def run_suite(scenarios, resolutions, threads, frames, warmup, dt, precisions=('float',)):
+    """Run every case in a fresh subprocess so peak RSS and thread count are per case"""
+    results = []
+    for scenario in scenarios:
+        # The curtain scene has a fixed resolution, sweeping it would only repeat work
+        res_list = resolutions if scenario != 'curtains' else [0]
+        cases = [(res, nthreads, precision)
+                 for res in res_list for nthreads in threads for precision in precisions]
+        for res, nthreads, precision in cases:
+            env = dict(os.environ)
+            if nthreads:
+                env['OMP_NUM_THREADS'] = str(nthreads)
+            fd, out_path = tempfile.mkstemp(suffix='.json')
+            os.close(fd)
+            try:
+                cmd = [
+                    sys.executable, os.path.abspath(__file__), '--worker', out_path,
+                    '--scenarios', scenario, '--resolutions', str(res),
+                    '--frames', str(frames), '--warmup', str(warmup), '--dt', str(dt),
+                    '--precision', precision,
+                ]
+                proc = subprocess.run(cmd, env=env, cwd=os.path.dirname(os.path.abspath(__file__)),
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+                if proc.returncode != 0:
+                    print(f"  {scenario} res={res} threads={nthreads or 'default'} {precision}: FAILED")
+                    print(proc.stderr.strip())
+                    continue
+                with open(out_path, 'r') as f:
+                    result = json.load(f)
+            finally:
+                os.unlink(out_path)
+            results.append(result)
+            print(f"  {case_key(result):40s} | "
+                  f"median {result['step_ms']['median']:8.2f}ms | "
+                  f"p95 {result['step_ms']['p95']:8.2f}ms | "
+                  f"PCG {result['profile'].get('pcg_iterations', 0):7.1f} it/step | "
+                  f"RSS {result['peak_rss_mb'] or 0:7.1f}MB")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print per-case deltas against a baseline; return the list of regressed case keys"""
+    base = {case_key(r): r for r in baseline.get('results', [])}
+    regressions = []
+    print(f"\n{'case':40s} | {'base ms':>9s} | {'now ms':>9s} | {'delta':>7s}")
+    for r in results:
+        key = case_key(r)
+        b = base.get(key)
+        if b is None:
+            print(f"{key:40s} | {'-':>9s} | {r['step_ms']['median']:9.2f} | {'new':>7s}")
+            continue
+        before = b['step_ms']['median']
+        now = r['step_ms']['median']
+        delta = (now - before) / before if before > 0 else 0.0
+        flag = ''
+        if delta > tolerance:
+            regressions.append(key)
+            flag = '  REGRESSION'
+        print(f"{key:40s} | {before:9.2f} | {now:9.2f} | {delta:+6.1%}{flag}")
+    return regressions
+
+
+def _int_list(text):
+    return [int(x) for x in text.split(',') if x.strip()]
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Scaling benchmark for ando_barrier_core')
+    parser.add_argument('--scenarios', type=str, default=','.join(SCENARIOS),
+                        help=f"Comma separated scenarios (default: {','.join(SCENARIOS)})")
+    parser.add_argument('--resolutions', type=str, default='20,40,60',
+                        help='Comma separated grid resolutions (default: 20,40,60)')
+    parser.add_argument('--threads', type=str, default='0',
+                        help='Comma separated OMP_NUM_THREADS values, 0 = inherit (default: 0)')
+    parser.add_argument('--precision', type=str, default='float',
+                        help=f"Comma separated PCG precision modes ({', '.join(PRECISIONS)}; default: float)")
+    parser.add_argument('--frames', type=int, default=30,
+                        help='Timed frames per case (default: 30)')
+    parser.add_argument('--warmup', type=int, default=3,
+                        help='Untimed warmup frames per case (default: 3)')
+    parser.add_argument('--dt', type=float, default=0.005,
+                        help='Time step in seconds (default: 0.005)')
+    parser.add_argument('--output', type=str, default='',
+                        help='Write results JSON to this path')
+    parser.add_argument('--compare', type=str, default='',
+                        help='Baseline JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='Allowed median step time regression before failing (default: 0.10)')
+    parser.add_argument('--worker', type=str, default='', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    for s in scenarios:
+        if s not in _FACTORIES:
+            parser.error(f"unknown scenario '{s}' (choose from {', '.join(SCENARIOS)})")
+    resolutions = _int_list(args.resolutions)
+    precisions = [p.strip() for p in args.precision.split(',') if p.strip()]
+    for p in precisions:
+        if p not in PRECISIONS:
+            parser.error(f"unknown precision '{p}' (choose from {', '.join(PRECISIONS)})")
+
+    if args.worker:
+        result = run_case(scenarios[0], resolutions[0], args.frames, args.warmup, args.dt,
+                          precisions[0])
+        with open(args.worker, 'w') as f:
+            json.dump(result, f)
+        return 0
+
+    import ando_barrier_core as abc
+
+    print(f"\n{'='*60}")
+    print("ANDO BARRIER BENCHMARK")
+    print(f"Core version: {abc.version()}")
+    print(f"{'='*60}\n")
+
+    results = run_suite(scenarios, resolutions, _int_list(args.threads) or [0],
+                        args.frames, args.warmup, args.dt, precisions)
+
+    report = {
+        'version': abc.version(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.tolerance:.0%}")
+            return 1
+        print("\nNo regressions")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
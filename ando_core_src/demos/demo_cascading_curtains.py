@@ -144,20 +144,23 @@ if __name__ == '__main__':
     parser.add_argument('--dt', type=float, default=0.004,
                         help='Time step in seconds (default: 0.004)')
     parser.add_argument('--output', type=str, default='output/cascading_curtains',
-                        help='Output directory for OBJ files (default: output/cascading_curtains)')
+                        help='Output directory for the frame cache (default: output/cascading_curtains)')
+    parser.add_argument('--obj', action='store_true',
+                        help='Also export an OBJ sequence for external tools')
     args = parser.parse_args()
     
     demo = CascadingCurtainsDemo()
     
     if args.cached:
-        # Load from cached OBJ files
+        # Load from the frame cache (or OBJ files from older runs)
         demo.load_cached(args.output)
     else:
         # Run simulation
         demo.run(num_frames=args.frames, dt=args.dt)
         
-        # Export OBJ sequence
-        demo.export_obj_sequence(args.output)
+        demo.export_frame_cache(args.output)
+        if args.obj:
+            demo.export_obj_sequence(args.output)
     
     # Visualize
     try:
@@ -165,5 +168,5 @@ if __name__ == '__main__':
     except Exception as e:
         print(f"Visualization failed: {e}")
         if not args.cached:
-            print(f"OBJ sequence exported to {args.output}/")
+            print(f"Frames exported to {args.output}/")
 
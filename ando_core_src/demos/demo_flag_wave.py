@@ -186,20 +186,23 @@ if __name__ == '__main__':
     parser.add_argument('--frames', type=int, default=300,
                         help='Number of frames to simulate (default: 300)')
     parser.add_argument('--output', type=str, default='output/flag_wave',
-                        help='Output directory for OBJ files (default: output/flag_wave)')
+                        help='Output directory for the frame cache (default: output/flag_wave)')
+    parser.add_argument('--obj', action='store_true',
+                        help='Also export an OBJ sequence for external tools')
     args = parser.parse_args()
     
     demo = WavingFlagDemo()
     
     if args.cached:
-        # Load from cached OBJ files
+        # Load from the frame cache (or OBJ files from older runs)
         demo.load_cached(args.output)
     else:
         # Run simulation
         demo.run(num_frames=args.frames)
         
-        # Export OBJ sequence
-        demo.export_obj_sequence(args.output)
+        demo.export_frame_cache(args.output)
+        if args.obj:
+            demo.export_obj_sequence(args.output)
     
     # Visualize if PyVista available
     try:
@@ -207,5 +210,5 @@ if __name__ == '__main__':
     except Exception as e:
         print(f"Visualization failed: {e}")
         if not args.cached:
-            print(f"OBJ sequence exported to {args.output}/")
+            print(f"Frames exported to {args.output}/")
 
@@ -40,6 +40,8 @@ except ImportError:
 
 import ando_barrier_core as abc
 
+from frame_cache import FrameCache, has_frame_cache, write_frame_cache
+
 
 class PhysicsDemo:
     """Base class for physics demonstrations"""
@@ -61,12 +63,29 @@ class PhysicsDemo:
         raise NotImplementedError
     
     def load_cached(self, cache_dir):
-        """Load cached simulation from OBJ sequence"""
+        """Load cached simulation from a frame cache, or an OBJ sequence as fallback"""
         import glob
         
         if not os.path.exists(cache_dir):
             raise FileNotFoundError(f"Cache directory not found: {cache_dir}")
         
+        if has_frame_cache(cache_dir):
+            # Frames decode lazily from the memory-mapped cache
+            load_start = time.time()
+            self.frames = FrameCache(cache_dir)
+            self.triangles = self.frames.triangles
+            self.rest_positions = np.array(self.frames[0])
+            print(f"\n{'='*60}")
+            print(f"Demo: {self.name}")
+            print(f"{'='*60}")
+            print(f"Opened frame cache: {self.frames.path} "
+                  f"({(time.time() - load_start) * 1000:.1f}ms)")
+            print(f"Frames: {len(self.frames)}")
+            print(f"Vertices: {self.frames.num_vertices}")
+            print(f"Triangles: {len(self.triangles)}")
+            print(f"{'='*60}\n")
+            return
+        
         # Find all OBJ files
         obj_files = sorted(glob.glob(os.path.join(cache_dir, "frame_*.obj")))
         
@@ -403,7 +422,7 @@ class PhysicsDemo:
         print("  - Q/Escape: Quit")
         print()
 
-        frames = [np.asarray(frame) for frame in self.frames]
+        frames = self.frames
         triangles = np.asarray(self.triangles, dtype=int)
 
         fig = plt.figure(figsize=(10, 7))
@@ -415,7 +434,7 @@ class PhysicsDemo:
 
         # Build triangle vertex list for Poly3DCollection
         def make_faces(points):
-            return [points[tri] for tri in triangles]
+            return np.asarray(points)[triangles]
 
         poly = Poly3DCollection(make_faces(frames[0]), facecolors=(0.6, 0.8, 1.0, 0.9),
                                 edgecolors='gray', linewidths=0.5)
@@ -429,10 +448,13 @@ class PhysicsDemo:
             pin_scatter = ax.scatter(pin_positions[:, 0], pin_positions[:, 1],
                                      pin_positions[:, 2], color='blue', s=30, label='Pins')
 
-        # Auto scale axes
-        all_points = np.vstack(frames)
-        min_bounds = all_points.min(axis=0)
-        max_bounds = all_points.max(axis=0)
+        # Auto scale axes (a frame cache stores its bounds; avoid decoding every frame)
+        if isinstance(frames, FrameCache):
+            min_bounds, max_bounds = frames.bounds
+        else:
+            all_points = np.vstack(frames)
+            min_bounds = all_points.min(axis=0)
+            max_bounds = all_points.max(axis=0)
         center = (max_bounds + min_bounds) / 2.0
         extent = (max_bounds - min_bounds).max() * 0.6
         extent = max(extent, 1e-3)
@@ -502,6 +524,21 @@ class PhysicsDemo:
         # Override in subclasses if you track pins
         return []
     
+    def export_frame_cache(self, output_dir, quantize=None):
+        """Export frames as a single binary frame cache (see frame_cache.py)
+
+        ``quantize`` is an optional step in metres (e.g. 1e-5) that stores frames
+        as int16 offsets from float32 keyframes.
+        """
+        if self.triangles is None:
+            print("ERROR: Triangles not stored. Store triangles in setup() before exporting.")
+            return None
+        
+        path = write_frame_cache(output_dir, self.triangles, self.frames, quantize=quantize)
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"Exported {len(self.frames)} frames to {path} ({size_mb:.1f} MB)")
+        return path
+    
     def export_obj_sequence(self, output_dir):
         """Export frames as OBJ sequence (for compatibility)"""
         if self.triangles is None:
@@ -129,8 +129,17 @@ if __name__ == '__main__':
                        help='Number of frames to simulate (default: 200)')
     parser.add_argument('--no-viz', action='store_true',
                        help='Skip visualization (export only)')
+    parser.add_argument('--cached', action='store_true',
+                       help='Load the cached simulation from the output directory instead of simulating')
+    parser.add_argument('--output', type=str, default=None,
+                       help='Output directory for the frame cache (default: output/stress_test_RxR)')
+    parser.add_argument('--quantize', type=float, default=None,
+                       help='Store frames as int16 offsets with this step in metres (e.g. 1e-5)')
+    parser.add_argument('--obj', action='store_true',
+                       help='Also export an OBJ sequence for external tools')
     
     args = parser.parse_args()
+    output_dir = args.output or f'output/stress_test_{args.resolution}x{args.resolution}'
     
     print(f"\n{'='*60}")
     print("STRESS TEST")
@@ -139,10 +148,15 @@ if __name__ == '__main__':
     print(f"{'='*60}\n")
     
     demo = StressTestDemo(resolution=args.resolution)
-    demo.run(num_frames=args.frames)
-    
-    # Always export
-    demo.export_obj_sequence(f'output/stress_test_{args.resolution}x{args.resolution}')
+    if args.cached:
+        demo.load_cached(output_dir)
+    else:
+        demo.run(num_frames=args.frames)
+        
+        # Always export
+        demo.export_frame_cache(output_dir, quantize=args.quantize)
+        if args.obj:
+            demo.export_obj_sequence(output_dir)
     
     # Visualize unless disabled
     if not args.no_viz:
@@ -150,6 +164,6 @@ if __name__ == '__main__':
             demo.visualize(window_size=(1600, 900), fps=60)
         except Exception as e:
             print(f"Visualization failed: {e}")
-            print(f"OBJ sequence exported to output/stress_test_{args.resolution}x{args.resolution}/")
+            print(f"Frames exported to {output_dir}/")
     else:
         print("Visualization skipped (--no-viz)")
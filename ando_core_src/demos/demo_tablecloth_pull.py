@@ -189,12 +189,11 @@ if __name__ == '__main__':
     demo = TableclothPullDemo()
     demo.run(num_frames=400)
     
-    # Export OBJ sequence
-    demo.export_obj_sequence('output/tablecloth_pull')
+    demo.export_frame_cache('output/tablecloth_pull')
     
     # Visualize
     try:
         demo.visualize(window_size=(1600, 900), fps=60)
     except Exception as e:
         print(f"Visualization failed: {e}")
-        print("OBJ sequence exported to output/tablecloth_pull/")
+        print("Frames exported to output/tablecloth_pull/")
@@ -0,0 +1,234 @@
+"""
+Binary frame cache for demo playback.
+
+A cache is one file: a fixed header, the triangle list (stored once) and the
+per-frame vertex positions. Raw caches keep every frame as float32 so the
+position block memory-maps straight into a (frames, vertices, 3) array.
+Quantized caches store keyframes as float32 and the frames in between as int16
+offsets from their keyframe, which halves the size. Any frame still decodes
+independently.
+
+Layout (little-endian):
+    header      magic, version, flags, counts, section offsets, quantization
+                step, position bounds
+    triangles   int32 (T, 3)
+    index       per frame: uint64 byte offset, uint32 keyframe id, uint32 kind
+                (quantized caches only)
+    data        float32 (F, V, 3) for raw caches; float32 keyframes and
+                int16 (V, 3) deltas for quantized caches
+"""
+
+import os
+import struct
+
+import numpy as np
+
+CACHE_FILENAME = "frames.andocache"
+
+_MAGIC = b"ANDOFRM1"
+_VERSION = 1
+_FLAG_QUANTIZED = 0x1
+
+# magic, version, flags, num_vertices, num_triangles, num_frames,
+# triangles_offset, index_offset, data_offset, quant_step, bounds_min[3], bounds_max[3]
+_HEADER = struct.Struct("<8sIIIIIQQQd3f3f")
+_INDEX_DTYPE = np.dtype([("offset", "<u8"), ("keyframe", "<u4"), ("kind", "<u4")])
+_KIND_KEY = 0
+_KIND_DELTA = 1
+_ALIGN = 64
+_INT16_LIMIT = 32767
+
+
+def _aligned(offset):
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def resolve_cache_path(path):
+    """Return the cache file for ``path``.
+
+    ``path`` is either a cache file or a directory holding ``frames.andocache``;
+    paths without an extension count as directories even before they exist.
+    """
+    if os.path.isdir(path) or not os.path.splitext(path)[1]:
+        return os.path.join(path, CACHE_FILENAME)
+    return path
+
+
+def has_frame_cache(path):
+    """True when ``path`` is, or contains, a frame cache."""
+    return os.path.isfile(resolve_cache_path(path))
+
+
+def write_frame_cache(path, triangles, frames, quantize=None):
+    """Write ``frames`` (an iterable of (V, 3) position arrays) to a cache file.
+
+    Args:
+        path: Cache file or output directory (the file is then ``frames.andocache``)
+        triangles: (T, 3) triangle indices, stored once
+        frames: Sequence of per-frame positions; all frames share one vertex count
+        quantize: Quantization step in scene units (e.g. 1e-5). ``None`` stores
+            raw float32 positions; otherwise frames are stored as int16 offsets
+            from a float32 keyframe, and a new keyframe starts whenever an
+            offset would not fit.
+
+    Returns:
+        Path of the written cache file.
+    """
+    path = resolve_cache_path(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    triangles = np.ascontiguousarray(triangles, dtype="<i4").reshape(-1, 3)
+    frames = [np.ascontiguousarray(frame, dtype="<f4").reshape(-1, 3) for frame in frames]
+    if not frames:
+        raise ValueError("Cannot write an empty frame cache")
+    num_vertices = frames[0].shape[0]
+    if any(frame.shape[0] != num_vertices for frame in frames):
+        raise ValueError("All frames must have the same vertex count")
+    if quantize is not None and not quantize > 0.0:
+        raise ValueError("Quantization step must be positive")
+
+    bounds_min = np.min([frame.min(axis=0) for frame in frames], axis=0) if num_vertices else np.zeros(3)
+    bounds_max = np.max([frame.max(axis=0) for frame in frames], axis=0) if num_vertices else np.zeros(3)
+
+    triangles_offset = _aligned(_HEADER.size)
+    index_offset = _aligned(triangles_offset + triangles.nbytes)
+    flags = 0
+    quant_step = 0.0
+
+    if quantize is None:
+        data_offset = index_offset
+        blocks = frames
+        index = None
+    else:
+        flags |= _FLAG_QUANTIZED
+        quant_step = float(quantize)
+        index = np.zeros(len(frames), dtype=_INDEX_DTYPE)
+        data_offset = _aligned(index_offset + index.nbytes)
+        blocks = []
+        offset = data_offset
+        keyframe = None
+        keyframe_id = 0
+        for i, frame in enumerate(frames):
+            codes = None
+            if keyframe is not None:
+                scaled = np.rint((frame.astype(np.float64) - keyframe) / quant_step)
+                if np.abs(scaled).max(initial=0.0) <= _INT16_LIMIT:
+                    codes = scaled.astype("<i2")
+            if codes is None:
+                keyframe = frame.astype(np.float64)
+                keyframe_id = i
+                index[i] = (offset, keyframe_id, _KIND_KEY)
+                blocks.append(frame)
+            else:
+                index[i] = (offset, keyframe_id, _KIND_DELTA)
+                blocks.append(codes)
+            offset = _aligned(offset + blocks[-1].nbytes)
+
+    header = _HEADER.pack(
+        _MAGIC, _VERSION, flags, num_vertices, len(triangles), len(frames),
+        triangles_offset, index_offset, data_offset, quant_step,
+        *(float(v) for v in bounds_min), *(float(v) for v in bounds_max),
+    )
+
+    with open(path, "wb") as handle:
+        handle.write(header)
+        handle.seek(triangles_offset)
+        handle.write(triangles.tobytes())
+        if index is not None:
+            handle.seek(index_offset)
+            handle.write(index.tobytes())
+        handle.seek(data_offset)
+        if index is None:
+            # Raw frames are contiguous so they map as one (F, V, 3) array
+            for block in blocks:
+                handle.write(block.tobytes())
+        else:
+            for block, entry in zip(blocks, index):
+                handle.seek(int(entry["offset"]))
+                handle.write(block.tobytes())
+
+    return path
+
+
+class FrameCache:
+    """Lazy, read-only view of a frame cache.
+
+    Behaves like a sequence of (V, 3) float32 arrays: ``len(cache)`` and
+    ``cache[i]`` decode one frame on demand from a memory map, so opening a
+    cache costs a header read regardless of its length.
+    """
+
+    def __init__(self, path):
+        self.path = resolve_cache_path(path)
+        with open(self.path, "rb") as handle:
+            raw_header = handle.read(_HEADER.size)
+        if len(raw_header) < _HEADER.size:
+            raise ValueError(f"Not a frame cache: {self.path}")
+        fields = _HEADER.unpack(raw_header)
+        magic, version, flags = fields[0], fields[1], fields[2]
+        if magic != _MAGIC:
+            raise ValueError(f"Not a frame cache: {self.path}")
+        if version != _VERSION:
+            raise ValueError(f"Unsupported frame cache version {version}: {self.path}")
+
+        self.num_vertices, num_triangles, self._num_frames = fields[3], fields[4], fields[5]
+        triangles_offset, index_offset, data_offset = fields[6], fields[7], fields[8]
+        self.quant_step = fields[9]
+        self.bounds = (np.array(fields[10:13], dtype=np.float32), np.array(fields[13:16], dtype=np.float32))
+        self.quantized = bool(flags & _FLAG_QUANTIZED)
+
+        self._data = np.memmap(self.path, dtype=np.uint8, mode="r")
+        self.triangles = np.frombuffer(
+            self._data, dtype="<i4", count=num_triangles * 3, offset=triangles_offset,
+        ).reshape(-1, 3)
+
+        if self.quantized:
+            self._index = np.frombuffer(self._data, dtype=_INDEX_DTYPE, count=self._num_frames, offset=index_offset)
+            self._positions = None
+        else:
+            self._index = None
+            self._positions = np.frombuffer(
+                self._data, dtype="<f4", count=self._num_frames * self.num_vertices * 3, offset=data_offset,
+            ).reshape(self._num_frames, self.num_vertices, 3)
+
+    def __len__(self):
+        return self._num_frames
+
+    def __getitem__(self, frame_idx):
+        if isinstance(frame_idx, slice):
+            return [self[i] for i in range(*frame_idx.indices(self._num_frames))]
+        if frame_idx < 0:
+            frame_idx += self._num_frames
+        if not 0 <= frame_idx < self._num_frames:
+            raise IndexError(f"Frame {frame_idx} out of range (0-{self._num_frames - 1})")
+
+        if self._positions is not None:
+            return self._positions[frame_idx]
+
+        entry = self._index[frame_idx]
+        keyframe = self._read_block(int(self._index[entry["keyframe"]]["offset"]), "<f4")
+        if entry["kind"] == _KIND_KEY:
+            return keyframe
+        codes = self._read_block(int(entry["offset"]), "<i2")
+        return (keyframe + codes.astype(np.float32) * np.float32(self.quant_step)).astype(np.float32)
+
+    def __iter__(self):
+        for frame_idx in range(self._num_frames):
+            yield self[frame_idx]
+
+    def _read_block(self, offset, dtype):
+        return np.frombuffer(self._data, dtype=dtype, count=self.num_vertices * 3, offset=offset).reshape(-1, 3)
+
+    def close(self):
+        """Release the memory map. Frames returned earlier may reference it."""
+        self._positions = None
+        self._index = None
+        self._data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -32,7 +32,7 @@ def check_dependencies():
         for pkg in missing:
             print(f"  - {pkg}")
         print("\nInstall with: pip install " + " ".join(missing))
-        print("OBJ sequences will still be exported.\n")
+        print("Frame caches will still be exported.\n")
     
     return len(missing) == 0
 
@@ -47,7 +47,7 @@ def run_demo(demo_name, visualize=True):
             from demo_flag_wave import WavingFlagDemo
             demo = WavingFlagDemo()
             demo.run(num_frames=300)
-            demo.export_obj_sequence('output/flag_wave')
+            demo.export_frame_cache('output/flag_wave')
             if visualize:
                 demo.visualize(window_size=(1600, 900), fps=60)
                 
@@ -55,7 +55,7 @@ def run_demo(demo_name, visualize=True):
             from demo_tablecloth_pull import TableclothPullDemo
             demo = TableclothPullDemo()
             demo.run(num_frames=400)
-            demo.export_obj_sequence('output/tablecloth_pull')
+            demo.export_frame_cache('output/tablecloth_pull')
             if visualize:
                 demo.visualize(window_size=(1600, 900), fps=60)
                 
@@ -63,7 +63,7 @@ def run_demo(demo_name, visualize=True):
             from demo_cascading_curtains import CascadingCurtainsDemo
             demo = CascadingCurtainsDemo()
             demo.run(num_frames=500)
-            demo.export_obj_sequence('output/cascading_curtains')
+            demo.export_frame_cache('output/cascading_curtains')
             if visualize:
                 demo.visualize(window_size=(1600, 900), fps=60)
                 
@@ -71,7 +71,7 @@ def run_demo(demo_name, visualize=True):
             from demo_stress_test import StressTestDemo
             demo = StressTestDemo(resolution=50)
             demo.run(num_frames=200)
-            demo.export_obj_sequence('output/stress_test_50x50')
+            demo.export_frame_cache('output/stress_test_50x50')
             if visualize:
                 demo.visualize(window_size=(1600, 900), fps=60)
         
@@ -110,7 +110,7 @@ Examples:
                        choices=['flag', 'tablecloth', 'curtains', 'stress', 'all'],
                        help='Demo to run (default: all)')
     parser.add_argument('--no-viz', action='store_true',
-                       help='Skip visualization, export OBJ only')
+                       help='Skip visualization, export frame caches only')
     parser.add_argument('--list', action='store_true',
                        help='List available demos and exit')
     
@@ -137,7 +137,7 @@ Examples:
     visualize = has_viz and not args.no_viz
     
     if args.no_viz:
-        print("Visualization disabled - will export OBJ sequences only\n")
+        print("Visualization disabled - will export frame caches only\n")
     
     # Run demo(s)
     if args.demo == 'all':
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Simple OBJ sequence viewer using matplotlib
+Simple frame viewer using matplotlib for frame caches and OBJ sequences
 Useful for quick visualization of demo outputs
 """
 
@@ -12,6 +12,8 @@ import glob
 import sys
 import os
 
+from frame_cache import FrameCache, has_frame_cache
+
 def load_obj(filename):
     """Load vertices and faces from OBJ file"""
     vertices = []
@@ -35,10 +37,7 @@ def plot_frame(ax, vertices, faces, title=""):
     ax.clear()
     
     # Create triangle collection
-    triangles = []
-    for face in faces:
-        triangle = vertices[face]
-        triangles.append(triangle)
+    triangles = np.asarray(vertices)[np.asarray(faces)]
     
     # Plot mesh
     collection = Poly3DCollection(triangles, alpha=0.7, facecolor='cyan', edgecolor='black', linewidth=0.5)
@@ -60,18 +59,24 @@ def plot_frame(ax, vertices, faces, title=""):
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python view_sequence.py <directory_or_pattern>")
-        print("Example: python view_sequence.py output/cloth_drape")
+        print("Usage: python view_sequence.py <cache_directory_or_pattern>")
+        print("Example: python view_sequence.py output/flag_wave")
+        print("   or:   python view_sequence.py output/flag_wave/frames.andocache")
         print("   or:   python view_sequence.py output/cloth_drape/frame_*.obj")
         sys.exit(1)
     
     pattern = sys.argv[1]
     
-    # If it's a directory, add the frame_*.obj pattern
-    if os.path.isdir(pattern):
-        pattern = os.path.join(pattern, "frame_*.obj")
+    # Prefer a frame cache: frames decode lazily as they are shown
+    cache = FrameCache(pattern) if has_frame_cache(pattern) else None
     
-    files = sorted(glob.glob(pattern))
+    if cache is not None:
+        files = [f"frame {i}" for i in range(len(cache))]
+    else:
+        # If it's a directory, add the frame_*.obj pattern
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "frame_*.obj")
+        files = sorted(glob.glob(pattern))
     
     if not files:
         print(f"No files found matching: {pattern}")
@@ -101,7 +106,10 @@ def main():
     
     def update_plot():
         filename = files[current_frame[0]]
-        vertices, faces = load_obj(filename)
+        if cache is not None:
+            vertices, faces = cache[current_frame[0]], cache.triangles
+        else:
+            vertices, faces = load_obj(filename)
         title = f"Frame {current_frame[0]}/{len(files)-1} - {os.path.basename(filename)}"
         plot_frame(ax, vertices, faces, title)
         plt.draw()
@@ -1,4 +1,5 @@
 #include "adaptive_timestep.h"
+#include "integrator.h"
 #include <algorithm>
 #include <cmath>
 #include <limits>
@@ -80,53 +81,8 @@ Real AdaptiveTimestep::smooth_dt_change(
 }
 
 Real AdaptiveTimestep::compute_min_edge_length(const Mesh& mesh) {
-    if (mesh.edges.empty()) {
-        return static_cast<Real>(0.0);
-    }
-
-    Real min_edge_sq = std::numeric_limits<Real>::max();
-    bool found_valid_edge = false;
-
-    const size_t num_vertices = mesh.vertices.size();
-
-    // Iterate over all edges
-    for (const auto& edge : mesh.edges) {
-        const Index v0 = edge.v[0];
-        const Index v1 = edge.v[1];
-
-        // Skip edges that reference invalid vertices
-        if (v0 < 0 || v1 < 0 ||
-            static_cast<size_t>(v0) >= num_vertices ||
-            static_cast<size_t>(v1) >= num_vertices) {
-            continue;
-        }
-
-        // Get vertex positions
-        const Vec3& p0 = mesh.vertices[v0];
-        const Vec3& p1 = mesh.vertices[v1];
-
-        // Compute squared edge length
-        const Real edge_length_sq = (p1 - p0).squaredNorm();
-
-        if (!std::isfinite(edge_length_sq)) {
-            continue;
-        }
-
-        min_edge_sq = std::min(min_edge_sq, edge_length_sq);
-        found_valid_edge = true;
-    }
-
-    if (!found_valid_edge) {
-        return static_cast<Real>(0.0);
-    }
-
-    const Real min_edge = std::sqrt(std::max(min_edge_sq, static_cast<Real>(0.0)));
-
-    if (!std::isfinite(min_edge)) {
-        return static_cast<Real>(0.0);
-    }
-
-    return min_edge;
+    // Cached on the mesh until its topology or vertex positions change
+    return mesh.min_edge_length();
 }
 
 Real AdaptiveTimestep::compute_max_velocity(const VecX& velocities) {
@@ -148,4 +104,162 @@ Real AdaptiveTimestep::compute_max_velocity(const VecX& velocities) {
     return std::sqrt(max_vel_sq);
 }
 
+Real AdaptiveTimestep::convergence_scale(const StepStats& stats, const SimParams& params, bool* reject) {
+    const bool stalled = stats.beta_reached < 0.5 * static_cast<double>(params.beta_max);
+    if (reject) {
+        *reject = stalled;
+    }
+    if (stalled) {
+        return kRejectFactor;
+    }
+    if (stats.newton_iterations == 0) {
+        // Nothing to solve (e.g. every island asleep)
+        return kGrowFactor;
+    }
+
+    // The error-reduction pass runs one more inner Newton loop after β accumulation
+    const double newton_per_beta = static_cast<double>(stats.newton_iterations) /
+                                   static_cast<double>(stats.beta_iterations + 1);
+    const double pcg_per_solve = stats.pcg_solves > 0
+        ? static_cast<double>(stats.pcg_iterations) / static_cast<double>(stats.pcg_solves)
+        : 0.0;
+    const double pcg_budget = static_cast<double>(std::max(1, params.pcg_max_iters));
+
+    const bool hard = stats.min_alpha < 0.5 ||
+                      stats.pcg_failures > 0 ||
+                      newton_per_beta >= static_cast<double>(params.max_newton_steps) ||
+                      pcg_per_solve > 0.5 * pcg_budget;
+    if (hard) {
+        return kHardFactor;
+    }
+
+    const bool easy = stats.min_alpha > 0.99 &&
+                      newton_per_beta <= static_cast<double>(params.min_newton_steps + 1) &&
+                      pcg_per_solve <= 0.25 * pcg_budget;
+    return easy ? kGrowFactor : static_cast<Real>(1.0);
+}
+
+bool AdaptiveTimestep::state_is_finite(const State& state) {
+    for (size_t i = 0; i < state.num_vertices(); ++i) {
+        if (!state.positions[i].allFinite() || !state.velocities[i].allFinite()) {
+            return false;
+        }
+    }
+    return true;
+}
+
+AdaptiveAdvanceReport AdaptiveTimestep::advance(
+    Mesh& mesh,
+    State& state,
+    Constraints& constraints,
+    const SimParams& params,
+    Real duration,
+    const Vec3& gravity,
+    Real dt_min,
+    Real dt_max,
+    Real safety_factor,
+    std::vector<RigidBody>* rigid_bodies,
+    StepStats* stats
+) {
+    AdaptiveAdvanceReport report;
+    if (stats) {
+        stats->reset();
+    }
+
+    dt_max = std::max(dt_max, dt_min);
+    Real dt = std::clamp(params.dt, dt_min, dt_max);
+    report.next_dt = dt;
+    if (!(duration > 0.0)) {
+        return report;
+    }
+
+    const Real min_edge = std::max(compute_min_edge_length(mesh), kMinEdgeLengthThreshold);
+    // Growth stays below the last rejected size so the controller does not
+    // climb straight back into the same failure
+    Real dt_ceiling = dt_max;
+    SimParams step_params = params;
+    StepStats step_stats;
+
+    // Elapsed time is tracked in double so float Real does not drift off the boundary
+    const double total = static_cast<double>(duration);
+    const double boundary_tolerance = 1e-6 * total;
+    double elapsed = 0.0;
+
+    while (total - elapsed > boundary_tolerance) {
+        const Real remaining = static_cast<Real>(total - elapsed);
+
+        Real h = dt;
+        Real max_vel = 0.0;
+        for (const Vec3& v : state.velocities) {
+            max_vel = std::max(max_vel, v.norm());
+        }
+        if (max_vel >= kStaticVelocityThreshold) {
+            h = std::min(h, std::max(dt_min, compute_cfl_timestep(max_vel, min_edge, safety_factor)));
+        }
+
+        // Land on the boundary: take the remainder when it fits, split it in
+        // two when one more full step would leave a sliver
+        if (h >= remaining * static_cast<Real>(1.0 - 1e-4)) {
+            h = remaining;
+        } else if (h > static_cast<Real>(0.5) * remaining) {
+            h = static_cast<Real>(0.5) * remaining;
+        }
+
+        State saved_state = state;
+        Constraints saved_constraints = constraints;
+        std::vector<RigidBody> saved_rigid_bodies;
+        if (rigid_bodies) {
+            saved_rigid_bodies = *rigid_bodies;
+        }
+
+        step_params.dt = h;
+        state.apply_gravity(gravity, h);
+        Integrator::step(mesh, state, constraints, step_params, rigid_bodies, &step_stats);
+
+        bool reject = false;
+        Real scale = convergence_scale(step_stats, step_params, &reject);
+        const bool finite = state_is_finite(state);
+        if (!finite) {
+            reject = true;
+            scale = kRejectFactor;
+        }
+
+        // A finite step already at dt_min is kept: there is nothing smaller to
+        // try. A non-finite one is rolled back and ends the call as failed.
+        const bool at_min = h <= dt_min * static_cast<Real>(1.0 + 1e-4);
+        if (reject && (!at_min || !finite)) {
+            state = std::move(saved_state);
+            constraints = std::move(saved_constraints);
+            if (rigid_bodies) {
+                *rigid_bodies = std::move(saved_rigid_bodies);
+            }
+            ++report.rejected;
+            if (at_min) {
+                report.failed = true;
+                break;
+            }
+            dt_ceiling = std::max(dt_min, h * kHardFactor);
+            dt = std::max(dt_min, h * kRejectFactor);
+            continue;
+        }
+
+        elapsed += static_cast<double>(h);
+        ++report.steps;
+        report.smallest_dt = report.steps == 1 ? h : std::min(report.smallest_dt, h);
+        report.largest_dt = std::max(report.largest_dt, h);
+        if (stats) {
+            stats->accumulate(step_stats);
+        }
+
+        // Shrink from the size that struggled; grow from the controller's dt
+        // so a clipped boundary step does not hold the next interval back
+        const Real base = scale < static_cast<Real>(1.0) ? std::min(dt, h) : dt;
+        dt = std::clamp(base * scale, dt_min, dt_ceiling);
+    }
+
+    report.elapsed = elapsed;
+    report.next_dt = dt;
+    return report;
+}
+
 } // namespace ando_barrier
@@ -3,9 +3,27 @@
 #include "types.h"
 #include "mesh.h"
 #include "state.h"
+#include "constraints.h"
+#include "rigid_body.h"
+#include "step_stats.h"
+
+#include <vector>
 
 namespace ando_barrier {
 
+/**
+ * Summary of one AdaptiveTimestep::advance call
+ */
+struct AdaptiveAdvanceReport {
+    int steps = 0;              // Accepted substeps
+    int rejected = 0;           // Substeps rolled back and retried with a smaller dt
+    Real smallest_dt = 0.0;     // Smallest accepted substep (s)
+    Real largest_dt = 0.0;      // Largest accepted substep (s)
+    double elapsed = 0.0;       // Time covered (s); the requested duration unless failed
+    Real next_dt = 0.0;         // Controller's proposal for the next interval (s)
+    bool failed = false;        // A substep at dt_min went non-finite; the state was rolled back
+};
+
 /**
  * Adaptive timestepping based on CFL (Courant-Friedrichs-Lewy) condition
  * 
@@ -16,6 +34,9 @@ namespace ando_barrier {
  * 
  * Increases dt when velocities are low (cloth settling)
  * Decreases dt when velocities spike (collisions)
+ *
+ * advance() adds a controller driven by solver convergence on top of the CFL
+ * bound, with rollback of rejected steps.
  * 
  * Reference: Phase 4 Task 3 specification
  */
@@ -108,6 +129,58 @@ public:
      * Returns 0 if all velocities are below threshold (1e-6 m/s).
      */
     static Real compute_max_velocity(const VecX& velocities);
+
+    /**
+     * Rate a finished step by how hard its solve was
+     *
+     * @param stats Telemetry of the step (Newton/PCG iterations, α, β reached)
+     * @param params Parameters the step ran with
+     * @param reject Set when the step should be rolled back and retried
+     * @return Factor for the next dt: > 1 when the solve was easy, < 1 on trouble
+     *
+     * A step is rejected when β accumulation stalled below half of β_max
+     * (the line search made no progress). It counts as hard when the line
+     * search cut α below 0.5, PCG failed to converge, Newton ran to its
+     * iteration cap, or PCG used over half its iteration budget. It counts as
+     * easy when every line search took α ≈ 1 with at most min_newton_steps + 1
+     * Newton iterations per β iteration.
+     */
+    static Real convergence_scale(const StepStats& stats, const SimParams& params, bool* reject);
+
+    /**
+     * Integrate exactly `duration` seconds with convergence-controlled substeps
+     *
+     * @param mesh, state, constraints, rigid_bodies As for Integrator::step
+     * @param params Parameters; params.dt seeds the first substep
+     * @param duration Interval to cover (e.g. one frame), in seconds
+     * @param gravity Acceleration applied before every substep (State::apply_gravity)
+     * @param dt_min Smallest substep; a step at dt_min is only rejected when non-finite
+     * @param dt_max Largest substep
+     * @param safety_factor CFL safety factor capping each substep
+     * @param stats Optional totals over the accepted substeps
+     * @return Substep counts and the dt to seed the next call with
+     *
+     * Each substep is the smaller of the convergence-controlled dt and the
+     * CFL bound. The state, constraints and rigid bodies are snapshotted
+     * before every substep; a rejected substep is rolled back and retried at
+     * half the size, and later growth in the call stays below it. A substep
+     * at dt_min that leaves a non-finite state is rolled back too, and the
+     * call stops early with `failed` set. The last substeps are balanced so
+     * the interval ends exactly at `duration` without a sliver step.
+     */
+    static AdaptiveAdvanceReport advance(
+        Mesh& mesh,
+        State& state,
+        Constraints& constraints,
+        const SimParams& params,
+        Real duration,
+        const Vec3& gravity,
+        Real dt_min,
+        Real dt_max,
+        Real safety_factor = static_cast<Real>(0.5),
+        std::vector<RigidBody>* rigid_bodies = nullptr,
+        StepStats* stats = nullptr
+    );
     
 private:
     // Velocity threshold for "static" detection (m/s)
@@ -115,6 +188,13 @@ private:
     
     // Minimum edge length threshold (meters)
     static constexpr Real kMinEdgeLengthThreshold = static_cast<Real>(1e-5);
+
+    // Convergence controller factors
+    static constexpr Real kGrowFactor = static_cast<Real>(1.25);
+    static constexpr Real kHardFactor = static_cast<Real>(0.7);
+    static constexpr Real kRejectFactor = static_cast<Real>(0.5);
+
+    static bool state_is_finite(const State& state);
 };
 
 } // namespace ando_barrier
@@ -1,4 +1,5 @@
 #include "collision.h"
+#include "parallel.h"
 #include <algorithm>
 #include <limits>
 
@@ -61,6 +62,63 @@ static AABB compute_edge_aabb(const Vec3& a, const Vec3& b) {
     return box;
 }
 
+// Candidates per worker below which the narrow phase stays single-threaded
+constexpr size_t kNarrowPhaseMinChunk = 4096;
+
+// Deterministic contact ordering: (type, idx0, idx1, idx2, idx3)
+static bool contact_order_less(const ContactPair& a, const ContactPair& b) {
+    if (a.type != b.type) return static_cast<int>(a.type) < static_cast<int>(b.type);
+    if (a.idx0 != b.idx0) return a.idx0 < b.idx0;
+    if (a.idx1 != b.idx1) return a.idx1 < b.idx1;
+    if (a.idx2 != b.idx2) return a.idx2 < b.idx2;
+    return a.idx3 < b.idx3;
+}
+
+// Fill gap, normal, witnesses and weights of a self-contact pair from the
+// current positions; returns false for pair types without deformable geometry
+static bool update_pair_geometry(const State& state, ContactPair& pair) {
+    if (pair.type == ContactType::POINT_TRIANGLE) {
+        const Vec3& p = state.positions[pair.idx0];
+        const Vec3& a = state.positions[pair.idx1];
+        const Vec3& b = state.positions[pair.idx2];
+        const Vec3& c = state.positions[pair.idx3];
+
+        if (Collision::narrow_phase_point_triangle(p, a, b, c, pair.gap, pair.normal,
+                                                   pair.witness_p, pair.witness_q)) {
+            Vec3 bary = compute_triangle_barycentric(pair.witness_q, a, b, c);
+            pair.barycentric = bary;
+            pair.weights[0] = static_cast<Real>(1.0);
+            pair.weights[1] = -bary[0];
+            pair.weights[2] = -bary[1];
+            pair.weights[3] = -bary[2];
+            pair.vertex_count = 4;
+            return true;
+        }
+    } else if (pair.type == ContactType::EDGE_EDGE) {
+        const Vec3& p0 = state.positions[pair.idx0];
+        const Vec3& p1 = state.positions[pair.idx1];
+        const Vec3& q0 = state.positions[pair.idx2];
+        const Vec3& q1 = state.positions[pair.idx3];
+
+        if (Collision::narrow_phase_edge_edge(p0, p1, q0, q1, pair.gap, pair.normal,
+                                              pair.witness_p, pair.witness_q)) {
+            pair.vertex_count = 4;
+            pair.weights[0] = static_cast<Real>(0.5);
+            pair.weights[1] = static_cast<Real>(0.5);
+            pair.weights[2] = static_cast<Real>(-0.5);
+            pair.weights[3] = static_cast<Real>(-0.5);
+            return true;
+        }
+    }
+    return false;
+}
+
+// Narrow phase for one broad-phase candidate; fills geometry and weights and
+// returns true when the pair is within the collision threshold.
+static bool narrow_phase_candidate(const State& state, ContactPair& pair, Real threshold) {
+    return update_pair_geometry(state, pair) && pair.gap < threshold;
+}
+
 // Build BVH recursively using SAH (Surface Area Heuristic) split
 int Collision::build_bvh_recursive(std::vector<BVHNode>& nodes,
                                    std::vector<AABB>& prim_boxes,
@@ -68,25 +126,26 @@ int Collision::build_bvh_recursive(std::vector<BVHNode>& nodes,
                                    int start, int end) {
     int node_idx = nodes.size();
     nodes.emplace_back();
-    BVHNode& node = nodes[node_idx];
-    
+
     // Compute bounding box for all primitives in range
+    AABB bbox;
     for (int i = start; i < end; ++i) {
-        node.bbox.expand(prim_boxes[prim_indices[i]]);
+        bbox.expand(prim_boxes[prim_indices[i]]);
     }
+    nodes[node_idx].bbox = bbox;
     
     int num_prims = end - start;
     
-    // Leaf node if few primitives
-    if (num_prims <= 4) {
+    // Leaves hold exactly one primitive (traversal reads prim_idx only)
+    if (num_prims <= 1) {
         if (num_prims == 1) {
-            node.prim_idx = prim_indices[start];
+            nodes[node_idx].prim_idx = prim_indices[start];
         }
         return node_idx;
     }
     
     // Find best split axis
-    int axis = node.bbox.longest_axis();
+    int axis = bbox.longest_axis();
     
     // Sort primitives by centroid along axis
     std::sort(prim_indices.begin() + start, prim_indices.begin() + end,
@@ -97,9 +156,12 @@ int Collision::build_bvh_recursive(std::vector<BVHNode>& nodes,
     // Split in middle
     int mid = start + num_prims / 2;
     
-    // Recursively build children
-    node.left = build_bvh_recursive(nodes, prim_boxes, prim_indices, start, mid);
-    node.right = build_bvh_recursive(nodes, prim_boxes, prim_indices, mid, end);
+    // Recursively build children; the recursion grows `nodes`, so index
+    // into it afterwards rather than holding a reference across the calls
+    int left = build_bvh_recursive(nodes, prim_boxes, prim_indices, start, mid);
+    int right = build_bvh_recursive(nodes, prim_boxes, prim_indices, mid, end);
+    nodes[node_idx].left = left;
+    nodes[node_idx].right = right;
     
     return node_idx;
 }
@@ -128,14 +190,16 @@ void Collision::build_triangle_bvh(const Mesh& mesh, const State& state,
         prim_indices[i] = i;
     }
     
-    // Build BVH
+    // Build BVH (a binary tree with one primitive per leaf has 2n - 1 nodes)
+    nodes.reserve(2 * prim_indices.size());
     build_bvh_recursive(nodes, tri_boxes, prim_indices, 0, prim_indices.size());
 }
 
 // Build edge BVH
 void Collision::build_edge_bvh(const Mesh& mesh, const State& state,
                               std::vector<BVHNode>& nodes,
-                              std::vector<int>& prim_indices) {
+                              std::vector<int>& prim_indices,
+                              Real margin) {
     nodes.clear();
     prim_indices.clear();
     
@@ -146,6 +210,8 @@ void Collision::build_edge_bvh(const Mesh& mesh, const State& state,
     for (size_t i = 0; i < mesh.edges.size(); ++i) {
         const auto& edge = mesh.edges[i];
         edge_boxes[i] = compute_edge_aabb(state.positions[edge.v[0]], state.positions[edge.v[1]]);
+        edge_boxes[i].min -= Vec3::Constant(0.5 * margin);
+        edge_boxes[i].max += Vec3::Constant(0.5 * margin);
     }
     
     // Initialize primitive indices
@@ -154,7 +220,8 @@ void Collision::build_edge_bvh(const Mesh& mesh, const State& state,
         prim_indices[i] = i;
     }
     
-    // Build BVH
+    // Build BVH (a binary tree with one primitive per leaf has 2n - 1 nodes)
+    nodes.reserve(2 * prim_indices.size());
     build_bvh_recursive(nodes, edge_boxes, prim_indices, 0, prim_indices.size());
 }
 
@@ -197,15 +264,16 @@ void Collision::traverse_bvh_pair(const std::vector<BVHNode>& bvh1,
 // Broad phase for vertex-triangle
 void Collision::broad_phase_triangles(const Mesh& mesh, const State& state,
                                      const std::vector<BVHNode>& bvh,
-                                     std::vector<ContactPair>& candidates) {
+                                     std::vector<ContactPair>& candidates,
+                                     Real margin) {
     if (bvh.empty()) return;
     
     // For each vertex, find overlapping triangles
     for (size_t v = 0; v < state.positions.size(); ++v) {
         const Vec3& p = state.positions[v];
         
-        // Create point AABB with small epsilon
-        AABB point_box(p - Vec3::Constant(1e-4), p + Vec3::Constant(1e-4));
+        // Point AABB inflated by the query margin
+        AABB point_box(p - Vec3::Constant(margin), p + Vec3::Constant(margin));
         
         // Traverse BVH to find overlapping triangles
         std::vector<int> overlapping_tris;
@@ -474,107 +542,123 @@ void Collision::detect_wall_collisions(const State& state,
     }
 }
 
+void Collision::update_contact_geometry(const State& state,
+                                        std::vector<ContactPair>& contacts) {
+    for (ContactPair& pair : contacts) {
+        update_pair_geometry(state, pair);
+    }
+}
+
 // Full collision detection
 void Collision::detect_all_collisions(const Mesh& mesh, const State& state,
-                                     std::vector<ContactPair>& contacts) {
+                                     std::vector<ContactPair>& contacts,
+                                     StepStats* stats,
+                                     Real margin) {
     contacts.clear();
+    const Real threshold = std::max(kContactThreshold, margin);
     
     // Build BVHs
     std::vector<BVHNode> tri_bvh, edge_bvh;
     std::vector<int> tri_indices, edge_indices;
     
-    build_triangle_bvh(mesh, state, tri_bvh, tri_indices);
-    build_edge_bvh(mesh, state, edge_bvh, edge_indices);
+    {
+        ScopedPhaseTimer timer(phase_ms(stats, &StepStats::bvh_build_ms));
+        build_triangle_bvh(mesh, state, tri_bvh, tri_indices);
+        build_edge_bvh(mesh, state, edge_bvh, edge_indices, margin);
+    }
     
     // Broad phase
     std::vector<ContactPair> candidates;
-    broad_phase_triangles(mesh, state, tri_bvh, candidates);
+    broad_phase_triangles(mesh, state, tri_bvh, candidates, margin);
     broad_phase_edges(mesh, state, tri_bvh, edge_bvh, candidates);
     
-    // Narrow phase
-    for (auto& pair : candidates) {
-        if (pair.type == ContactType::POINT_TRIANGLE) {
-            const Vec3& p = state.positions[pair.idx0];
-            const Vec3& a = state.positions[pair.idx1];
-            const Vec3& b = state.positions[pair.idx2];
-            const Vec3& c = state.positions[pair.idx3];
-
-            if (narrow_phase_point_triangle(p, a, b, c, pair.gap, pair.normal,
-                                           pair.witness_p, pair.witness_q)) {
-                if (pair.gap < 0.01) {  // Within collision threshold
-                    Vec3 bary = compute_triangle_barycentric(pair.witness_q, a, b, c);
-                    pair.barycentric = bary;
-                    pair.weights[0] = static_cast<Real>(1.0);
-                    pair.weights[1] = -bary[0];
-                    pair.weights[2] = -bary[1];
-                    pair.weights[3] = -bary[2];
-                    pair.vertex_count = 4;
-                    contacts.push_back(pair);
-                }
-            }
-        } else if (pair.type == ContactType::EDGE_EDGE) {
-            const Vec3& p0 = state.positions[pair.idx0];
-            const Vec3& p1 = state.positions[pair.idx1];
-            const Vec3& q0 = state.positions[pair.idx2];
-            const Vec3& q1 = state.positions[pair.idx3];
-
-            if (narrow_phase_edge_edge(p0, p1, q0, q1, pair.gap, pair.normal,
-                                      pair.witness_p, pair.witness_q)) {
-                if (pair.gap < 0.01) {  // Within collision threshold
-                    pair.vertex_count = 4;
-                    pair.weights[0] = static_cast<Real>(0.5);
-                    pair.weights[1] = static_cast<Real>(0.5);
-                    pair.weights[2] = static_cast<Real>(-0.5);
-                    pair.weights[3] = static_cast<Real>(-0.5);
-                    contacts.push_back(pair);
+    // Narrow phase: candidate chunks run on worker threads into per-chunk
+    // buffers, which are concatenated in chunk order and then sorted so the
+    // contact list is identical for any thread count.
+    const size_t workers = static_cast<size_t>(std::max(1, parallel::worker_count()));
+    std::vector<std::vector<ContactPair>> buffers(workers);
+    size_t used = parallel::for_chunks(candidates.size(), kNarrowPhaseMinChunk, workers,
+        [&](size_t chunk, size_t begin, size_t end) {
+            std::vector<ContactPair>& out = buffers[chunk];
+            for (size_t i = begin; i < end; ++i) {
+                ContactPair pair = candidates[i];
+                if (narrow_phase_candidate(state, pair, threshold)) {
+                    out.push_back(pair);
                 }
             }
-        }
+        });
+
+    size_t total = 0;
+    for (size_t c = 0; c < used; ++c) {
+        total += buffers[c].size();
+    }
+    contacts.reserve(total);
+    for (size_t c = 0; c < used; ++c) {
+        contacts.insert(contacts.end(), buffers[c].begin(), buffers[c].end());
     }
+    std::stable_sort(contacts.begin(), contacts.end(), contact_order_less);
 }
 
 void Collision::detect_all_collisions(const Mesh& mesh, const State& state,
                                       const std::vector<RigidBody>& rigids,
-                                      std::vector<ContactPair>& contacts) {
+                                      std::vector<ContactPair>& contacts,
+                                      StepStats* stats,
+                                      Real margin) {
     contacts.clear();
 
     // Deformable self collisions
-    detect_all_collisions(mesh, state, contacts);
+    detect_all_collisions(mesh, state, contacts, stats, margin);
 
     if (rigids.empty()) {
         return;
     }
 
     // Deformable vs rigid
+    const Real threshold = std::max(kContactThreshold, margin);
+    const size_t workers = static_cast<size_t>(std::max(1, parallel::worker_count()));
     for (size_t rb = 0; rb < rigids.size(); ++rb) {
         const RigidBody& body = rigids[rb];
         std::vector<Vec3> rigid_vertices = body.world_vertices();
 
-        for (size_t v = 0; v < state.positions.size(); ++v) {
-            const Vec3& p = state.positions[v];
-
-            for (const Triangle& tri : body.triangles()) {
-                const Vec3& a = rigid_vertices[tri.v[0]];
-                const Vec3& b = rigid_vertices[tri.v[1]];
-                const Vec3& c = rigid_vertices[tri.v[2]];
-
-                ContactPair pair;
-                pair.type = ContactType::RIGID_POINT_TRIANGLE;
-                pair.idx0 = static_cast<Index>(v);
-                pair.idx1 = tri.v[0];
-                pair.idx2 = tri.v[1];
-                pair.idx3 = tri.v[2];
-                pair.rigid_body_index = static_cast<int>(rb);
-
-                if (narrow_phase_point_triangle(p, a, b, c, pair.gap, pair.normal,
-                                                pair.witness_p, pair.witness_q)) {
-                    if (pair.gap < 0.01) {
-                        pair.vertex_count = 1;
-                        pair.weights[0] = static_cast<Real>(1.0);
-                        contacts.push_back(pair);
+        // Vertices are chunked in index order, so concatenating the per-chunk
+        // buffers reproduces the serial contact order.
+        std::vector<std::vector<ContactPair>> buffers(workers);
+        auto scan = [&](size_t chunk, size_t begin, size_t end) {
+            std::vector<ContactPair>& out = buffers[chunk];
+            for (size_t v = begin; v < end; ++v) {
+                const Vec3& p = state.positions[v];
+
+                for (const Triangle& tri : body.triangles()) {
+                    const Vec3& a = rigid_vertices[tri.v[0]];
+                    const Vec3& b = rigid_vertices[tri.v[1]];
+                    const Vec3& c = rigid_vertices[tri.v[2]];
+
+                    ContactPair pair;
+                    pair.type = ContactType::RIGID_POINT_TRIANGLE;
+                    pair.idx0 = static_cast<Index>(v);
+                    pair.idx1 = tri.v[0];
+                    pair.idx2 = tri.v[1];
+                    pair.idx3 = tri.v[2];
+                    pair.rigid_body_index = static_cast<int>(rb);
+
+                    if (narrow_phase_point_triangle(p, a, b, c, pair.gap, pair.normal,
+                                                    pair.witness_p, pair.witness_q)) {
+                        if (pair.gap < threshold) {
+                            pair.vertex_count = 1;
+                            pair.weights[0] = static_cast<Real>(1.0);
+                            out.push_back(pair);
+                        }
                     }
                 }
             }
+        };
+        size_t work_per_vertex = std::max<size_t>(1, body.triangles().size());
+        size_t used = parallel::for_chunks(state.positions.size(),
+                                           std::max<size_t>(1, kNarrowPhaseMinChunk / work_per_vertex),
+                                           workers, scan);
+
+        for (size_t c = 0; c < used; ++c) {
+            contacts.insert(contacts.end(), buffers[c].begin(), buffers[c].end());
         }
     }
 }
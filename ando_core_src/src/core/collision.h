@@ -3,6 +3,7 @@
 #include "types.h"
 #include "mesh.h"
 #include "state.h"
+#include "step_stats.h"
 #include <array>
 #include <memory>
 #include <vector>
@@ -105,18 +106,27 @@ struct ContactPair {
 // Collision detection system
 class Collision {
 public:
+    // Broad-phase query margin used when the caller does not supply one
+    static constexpr Real kDefaultQueryMargin = static_cast<Real>(1e-4);
+
+    // Narrow-phase distance below which candidates become contacts
+    static constexpr Real kContactThreshold = static_cast<Real>(0.01);
+
     // Build BVH from mesh triangles
     static void build_triangle_bvh(const Mesh& mesh, const State& state,
                                    std::vector<BVHNode>& nodes, std::vector<int>& prim_indices);
     
-    // Build BVH from mesh edges
+    // Build BVH from mesh edges (boxes inflated by margin / 2 so edges
+    // closer than margin overlap)
     static void build_edge_bvh(const Mesh& mesh, const State& state,
-                              std::vector<BVHNode>& nodes, std::vector<int>& prim_indices);
+                              std::vector<BVHNode>& nodes, std::vector<int>& prim_indices,
+                              Real margin = 0.0);
     
     // Broad phase: find potential contact pairs using BVH
     static void broad_phase_triangles(const Mesh& mesh, const State& state,
                                      const std::vector<BVHNode>& bvh,
-                                     std::vector<ContactPair>& candidates);
+                                     std::vector<ContactPair>& candidates,
+                                     Real margin = kDefaultQueryMargin);
     
     static void broad_phase_edges(const Mesh& mesh, const State& state,
                                  const std::vector<BVHNode>& tri_bvh,
@@ -140,13 +150,27 @@ public:
                                       Real plane_offset,
                                       std::vector<ContactPair>& contacts);
     
-    // Full collision detection pipeline
+    // Recompute gap, normal and weights of deformable self-contact pairs from
+    // the current positions (pair indices are kept; rigid and wall pairs are
+    // left untouched)
+    static void update_contact_geometry(const State& state,
+                                        std::vector<ContactPair>& contacts);
+
+    // Full collision detection pipeline (optional stats receive BVH build time)
+    //
+    // margin is the broad-phase query distance; callers pass the contact gap
+    // plus the motion expected this step so approaching surfaces, including
+    // separate bodies packed into one mesh, are paired before they meet.
     static void detect_all_collisions(const Mesh& mesh, const State& state,
-                                     std::vector<ContactPair>& contacts);
+                                     std::vector<ContactPair>& contacts,
+                                     StepStats* stats = nullptr,
+                                     Real margin = kDefaultQueryMargin);
 
     static void detect_all_collisions(const Mesh& mesh, const State& state,
                                       const std::vector<RigidBody>& rigids,
-                                      std::vector<ContactPair>& contacts);
+                                      std::vector<ContactPair>& contacts,
+                                      StepStats* stats = nullptr,
+                                      Real margin = kDefaultQueryMargin);
 
 private:
     // Helper: build BVH recursively
@@ -27,6 +27,26 @@ void Constraints::clear_strain_limits() {
     strain_limits.clear();
 }
 
+void StrainActiveSet::reset() {
+    topology_version = 0;
+    reference_positions.clear();
+    sigma_ref.clear();
+    dm_inv_norm.clear();
+    candidates.clear();
+}
+
+void IslandSleepState::reset() {
+    topology_version = 0;
+    quiet_steps.clear();
+    sleeping.clear();
+    face_awake.clear();
+    island.clear();
+    num_islands = 0;
+    num_sleeping = 0;
+    pin_snapshot.clear();
+    rest_positions.clear();
+}
+
 size_t Constraints::num_active_pins() const {
     size_t count = 0;
     for (const auto& pin : pins) {
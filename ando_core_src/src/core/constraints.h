@@ -1,6 +1,7 @@
 #pragma once
 
 #include "types.h"
+#include <cstdint>
 #include <vector>
 
 namespace ando_barrier {
@@ -43,6 +44,40 @@ struct StrainConstraint {
     bool active = true;
 };
 
+// Active-set bookkeeping for strain limiting (persists across steps)
+// σ_ref holds each face's largest singular value at the reference positions;
+// displacement since then bounds how far σ_max can have grown.
+struct StrainActiveSet {
+    uint64_t topology_version = 0;
+    std::vector<Vec3> reference_positions;
+    std::vector<Real> sigma_ref;        // σ_max per face at reference_positions
+    std::vector<Real> dm_inv_norm;      // ‖Dm⁻¹‖_F per face (Lipschitz factor)
+    std::vector<Index> candidates;      // Faces whose bound reached the limit last rebuild
+
+    bool valid() const { return !sigma_ref.empty(); }
+    void reset();
+};
+
+// Island sleeping bookkeeping (persists across steps)
+// Vertices are grouped into islands connected by mesh edges and contacts; an
+// island whose kinetic energy per unit mass stays below the sleep threshold
+// for SimParams::sleep_steps steps is put to sleep and drops out of the solve.
+struct IslandSleepState {
+    uint64_t topology_version = 0;
+    std::vector<int> quiet_steps;       // Consecutive quiet steps per vertex
+    std::vector<uint8_t> sleeping;      // 1 when the vertex is excluded from the solve
+    std::vector<uint8_t> face_awake;    // 1 when any vertex of the face is awake
+    std::vector<Index> island;          // Island id per vertex for the current step
+    int num_islands = 0;
+    int num_sleeping = 0;
+    std::vector<PinConstraint> pin_snapshot;  // Pins at the end of the last step
+    std::vector<Vec3> rest_positions;   // Positions at the end of the last step
+
+    bool any_sleeping() const { return num_sleeping > 0; }
+    bool all_sleeping() const { return num_sleeping > 0 && num_sleeping == static_cast<int>(sleeping.size()); }
+    void reset();
+};
+
 // Container for all constraints
 class Constraints {
 public:
@@ -50,6 +85,8 @@ public:
     std::vector<WallConstraint> walls;
     std::vector<ContactConstraint> contacts;  // Dynamic, rebuilt each step
     std::vector<StrainConstraint> strain_limits; // Dynamic, rebuilt each step
+    StrainActiveSet strain_active_set;
+    IslandSleepState island_sleep;
     
     Constraints() = default;
     
@@ -9,24 +9,27 @@ Real Elasticity::compute_energy(const Mesh& mesh, const State& state) {
     
     for (size_t i = 0; i < mesh.num_triangles(); ++i) {
         Mat2 F = mesh.compute_F(i);
-        energy += face_energy(F, mesh.material, mesh.rest_areas[i]);
+        energy += face_energy(F, mesh.face_material(i), mesh.rest_areas[i]);
     }
     
     return energy;
 }
 
-void Elasticity::compute_gradient(const Mesh& mesh, const State& state, VecX& gradient) {
+void Elasticity::compute_gradient(const Mesh& mesh, const State& state, VecX& gradient,
+                                  const std::vector<uint8_t>* face_mask) {
     gradient.setZero();
     
     for (size_t i = 0; i < mesh.num_triangles(); ++i) {
+        if (face_mask && !(*face_mask)[i]) continue;
         const Triangle& tri = mesh.triangles[i];
         
         // Get current F
         Mat2 F = mesh.compute_F(i);
         
         // Compute PK1 stress: P = k * 2 * (F - I)
-        Real mu = mesh.material.youngs_modulus / (2.0 * (1.0 + mesh.material.poisson_ratio));
-        Real k = mesh.rest_areas[i] * mesh.material.thickness * mu;
+        const Material& mat = mesh.face_material(i);
+        Real mu = mat.youngs_modulus / (2.0 * (1.0 + mat.poisson_ratio));
+        Real k = mesh.rest_areas[i] * mat.thickness * mu;
         Mat2 I = Mat2::Identity();
         Mat2 P = 2.0 * k * (F - I);
         
@@ -61,13 +64,15 @@ void Elasticity::compute_gradient(const Mesh& mesh, const State& state, VecX& gr
 }
 
 void Elasticity::compute_hessian(const Mesh& mesh, const State& state,
-                                 std::vector<Triplet>& triplets) {
+                                 std::vector<Triplet>& triplets,
+                                 const std::vector<uint8_t>* face_mask) {
     for (size_t i = 0; i < mesh.num_triangles(); ++i) {
+        if (face_mask && !(*face_mask)[i]) continue;
         const Triangle& tri = mesh.triangles[i];
         Mat2 F = mesh.compute_F(i);
         
         Mat3 H[3][3];
-        face_hessian(F, mesh.material, mesh.rest_areas[i], mesh.Dm_inv[i], H);
+        face_hessian(F, mesh.face_material(i), mesh.rest_areas[i], mesh.Dm_inv[i], H);
         
         // Add to triplet list
         for (int a = 0; a < 3; ++a) {
@@ -18,12 +18,15 @@ public:
     // Compute total elastic energy
     static Real compute_energy(const Mesh& mesh, const State& state);
     
-    // Compute elastic gradient (forces)
-    static void compute_gradient(const Mesh& mesh, const State& state, VecX& gradient);
+    // Compute elastic gradient (forces); faces with a zero entry in
+    // face_mask are skipped
+    static void compute_gradient(const Mesh& mesh, const State& state, VecX& gradient,
+                                 const std::vector<uint8_t>* face_mask = nullptr);
     
     // Compute elastic Hessian (explicit assembly)
     static void compute_hessian(const Mesh& mesh, const State& state, 
-                               std::vector<Triplet>& triplets);
+                               std::vector<Triplet>& triplets,
+                               const std::vector<uint8_t>* face_mask = nullptr);
     
 private:
     // Per-face energy and derivatives (ARAP-style)
@@ -7,6 +7,7 @@
 #include "line_search.h"
 #include "pcg_solver.h"
 #include "matrix_assembly.h"
+#include "sleeping.h"
 #include <iostream>
 #include <algorithm>
 
@@ -14,6 +15,18 @@ namespace ando_barrier {
 
 namespace {
 
+// Sleep state for the current step, or null when no vertex is excluded
+const IslandSleepState* frozen_vertices(const Constraints& constraints, const SimParams& params) {
+    if (!params.enable_sleeping || !constraints.island_sleep.any_sleeping()) {
+        return nullptr;
+    }
+    return &constraints.island_sleep;
+}
+
+bool is_frozen(const IslandSleepState* frozen, Index vertex) {
+    return frozen && frozen->sleeping[vertex];
+}
+
 // Helper struct to hold friction computation results for a single contact
 struct FrictionData {
     Vec3 tangential;
@@ -69,7 +82,29 @@ bool compute_friction_data(
 
 void Integrator::step(Mesh& mesh, State& state, Constraints& constraints,
                      const SimParams& params,
-                     std::vector<RigidBody>* rigid_bodies) {
+                     std::vector<RigidBody>* rigid_bodies,
+                     StepStats* stats) {
+
+    if (stats) {
+        stats->reset();
+    }
+    ScopedPhaseTimer total_timer(phase_ms(stats, &StepStats::total_ms));
+
+    if (params.enable_sleeping) {
+        IslandSleep::begin_step(mesh, state, constraints);
+        const IslandSleepState& sleep = constraints.island_sleep;
+        // Without rigid bodies only a pin change (handled above) can wake a
+        // fully sleeping mesh, so skip detection and the solve outright
+        if (sleep.all_sleeping() && (!rigid_bodies || rigid_bodies->empty())) {
+            IslandSleep::freeze_sleeping(state, sleep);
+            if (stats) {
+                stats->islands = sleep.num_islands;
+                stats->sleeping_vertices = sleep.num_sleeping;
+                stats->beta_reached = params.beta_max;
+            }
+            return;
+        }
+    }
 
     const int n = static_cast<int>(state.num_vertices());
     const Real dt = params.dt;
@@ -91,9 +126,38 @@ void Integrator::step(Mesh& mesh, State& state, Constraints& constraints,
     
     x_target += dt * v_flat;
     
-    // 2. Detect collisions
+    // 2. Detect collisions. Contacts are gathered once per step, so the query
+    // margin covers the barrier gap plus the distance two surfaces can close
+    // this step; otherwise separate bodies could pass through each other
+    // before they are ever paired.
+    Real max_speed = 0.0;
+    for (const Vec3& v : state.velocities) {
+        max_speed = std::max(max_speed, v.norm());
+    }
+    const Real query_margin = std::max(Collision::kDefaultQueryMargin,
+                                       params.contact_gap_max + Real(2.0) * dt * max_speed);
     std::vector<ContactPair> contacts;
-    detect_collisions(mesh, state, contacts, rigid_bodies);
+    detect_collisions(mesh, state, contacts, rigid_bodies, stats, query_margin);
+    if (stats) {
+        stats->contacts_found = static_cast<int>(contacts.size());
+    }
+
+    // Group vertices into contact islands; islands that stay asleep are put
+    // back at their rest pose (x_old = x̂ = x) and excluded from the Newton system
+    if (params.enable_sleeping) {
+        IslandSleepState& sleep = constraints.island_sleep;
+        IslandSleep::partition(mesh, state, contacts, rigid_bodies, params, sleep);
+        for (int i = 0; i < n; ++i) {
+            if (sleep.sleeping[i]) {
+                x_old.segment<3>(3 * i) = state.positions[i];
+                x_target.segment<3>(3 * i) = state.positions[i];
+            }
+        }
+        if (stats) {
+            stats->islands = sleep.num_islands;
+            stats->sleeping_vertices = sleep.num_sleeping;
+        }
+    }
     
     // 3. β accumulation loop (Section 3.6)
     Real beta = 0.0;
@@ -102,12 +166,15 @@ void Integrator::step(Mesh& mesh, State& state, Constraints& constraints,
     
     while (beta < params.beta_max && beta_iter < max_beta_iters) {
         Real alpha = inner_newton_step(mesh, state, x_target, contacts,
-                                      constraints, params, beta, rigid_bodies);
+                                      constraints, params, beta, rigid_bodies, stats);
         
         // Update β: β ← β + (1 - β) α
         beta = beta + (1.0 - beta) * alpha;
         
         beta_iter++;
+        if (stats) {
+            stats->beta_iterations = beta_iter;
+        }
         
         if (alpha < 1e-6) {
             std::cerr << "Line search failed, stopping β accumulation" << std::endl;
@@ -115,9 +182,13 @@ void Integrator::step(Mesh& mesh, State& state, Constraints& constraints,
         }
     }
     
+    if (stats) {
+        stats->beta_reached = beta;
+    }
+
     // 4. Error reduction pass with full β
     if (beta > 1e-6) {
-        inner_newton_step(mesh, state, x_target, contacts, constraints, params, beta, rigid_bodies);
+        inner_newton_step(mesh, state, x_target, contacts, constraints, params, beta, rigid_bodies, stats);
     }
     
     // 5. Update velocities: v = (x_new - x_old) / (β Δt) (Section 3.6)
@@ -140,13 +211,19 @@ void Integrator::step(Mesh& mesh, State& state, Constraints& constraints,
         }
 
         if (params.contact_restitution > 0.0) {
+            ScopedPhaseTimer timer(phase_ms(stats, &StepStats::restitution_ms));
             apply_contact_restitution(mesh, constraints, state, params, rigid_bodies);
         }
     }
 
     if (rigid_bodies && !rigid_bodies->empty()) {
+        ScopedPhaseTimer timer(phase_ms(stats, &StepStats::rigid_coupling_ms));
         apply_rigid_coupling(mesh, state, *rigid_bodies, constraints, params);
     }
+
+    if (params.enable_sleeping) {
+        IslandSleep::end_step(state, constraints, params, constraints.island_sleep);
+    }
 }
 
 Real Integrator::inner_newton_step(
@@ -157,7 +234,8 @@ Real Integrator::inner_newton_step(
     Constraints& constraints,
     const SimParams& params,
     Real beta,
-    std::vector<RigidBody>* rigid_bodies) {
+    std::vector<RigidBody>* rigid_bodies,
+    StepStats* stats) {
     
     const int n = static_cast<int>(state.num_vertices());
     
@@ -166,10 +244,32 @@ Real Integrator::inner_newton_step(
         max_newton_iters = std::max(max_newton_iters, params.friction_min_newton_steps);
     }
 
+    // Pairs are fixed for the step, but their gaps follow the iterate so the
+    // barrier engages on pairs gathered while still outside ḡ
+    std::vector<ContactPair> active_contacts = contacts;
+
+    const IslandSleepState* frozen = frozen_vertices(constraints, params);
+
     for (int newton_iter = 0; newton_iter < max_newton_iters; ++newton_iter) {
+        if (stats) {
+            stats->newton_iterations++;
+        }
+        Collision::update_contact_geometry(state, active_contacts);
+
         // Compute gradient: g = ∇E
         VecX gradient = VecX::Zero(3 * n);
-        compute_gradient(mesh, state, x_target, contacts, constraints, params, beta, gradient, rigid_bodies);
+        {
+            ScopedPhaseTimer timer(phase_ms(stats, &StepStats::gradient_ms));
+            compute_gradient(mesh, state, x_target, active_contacts, constraints, params, beta, gradient,
+                             rigid_bodies, stats);
+        }
+        if (frozen) {
+            for (int i = 0; i < n; ++i) {
+                if (frozen->sleeping[i]) {
+                    gradient.segment<3>(3 * i).setZero();
+                }
+            }
+        }
         
         // Check convergence
         VecX x_current;
@@ -181,13 +281,46 @@ Real Integrator::inner_newton_step(
         
         // Assemble Hessian: H = ∇²E
         SparseMatrix hessian;
-        assemble_system_matrix(mesh, state, contacts, constraints, params, beta, hessian, rigid_bodies);
+        {
+            ScopedPhaseTimer timer(phase_ms(stats, &StepStats::hessian_ms));
+            assemble_system_matrix(mesh, state, active_contacts, constraints, params, beta, hessian,
+                                   rigid_bodies, stats);
+        }
         
         // Solve: H d = -g
         VecX direction = VecX::Zero(3 * n);
         VecX neg_gradient = -gradient;
-        bool converged = PCGSolver::solve(hessian, neg_gradient, direction, 
-                                         params.pcg_tol, params.pcg_max_iters);
+        int pcg_iters = 0;
+        bool converged;
+        {
+            ScopedPhaseTimer timer(phase_ms(stats, &StepStats::pcg_ms));
+            if (frozen) {
+                // Solve only for awake DOFs; sleeping ones keep a zero step
+                SparseMatrix reduced_hessian;
+                VecX reduced_rhs;
+                std::vector<Index> dofs;
+                IslandSleep::reduce_system(hessian, neg_gradient, *frozen,
+                                           reduced_hessian, reduced_rhs, dofs);
+                VecX reduced_direction = VecX::Zero(reduced_rhs.size());
+                converged = PCGSolver::solve(reduced_hessian, reduced_rhs, reduced_direction,
+                                             params.pcg_tol, params.pcg_max_iters, &pcg_iters,
+                                             params.pcg_mixed_precision);
+                for (size_t k = 0; k < dofs.size(); ++k) {
+                    direction[dofs[k]] = reduced_direction[k];
+                }
+            } else {
+                converged = PCGSolver::solve(hessian, neg_gradient, direction,
+                                             params.pcg_tol, params.pcg_max_iters, &pcg_iters,
+                                             params.pcg_mixed_precision);
+            }
+        }
+        if (stats) {
+            stats->pcg_solves++;
+            stats->pcg_iterations += pcg_iters;
+            if (!converged) {
+                stats->pcg_failures++;
+            }
+        }
         
         if (!converged) {
             std::cerr << "PCG did not converge in Newton iteration " << newton_iter << std::endl;
@@ -213,11 +346,20 @@ Real Integrator::inner_newton_step(
         }
         
         // Line search with extended direction (Section 3.5)
-        Real alpha = LineSearch::search(
-            mesh, state, direction, contacts,
-            pins_for_search, wall_normal, wall_offset,
-            1.25
-        );
+        Real alpha;
+        {
+            ScopedPhaseTimer timer(phase_ms(stats, &StepStats::line_search_ms));
+            alpha = LineSearch::search(
+                mesh, state, direction, active_contacts,
+                pins_for_search, wall_normal, wall_offset,
+                1.25, 1e-6,
+                stats ? &stats->line_search_halvings : nullptr
+            );
+        }
+        if (stats) {
+            stats->line_search_calls++;
+            stats->min_alpha = std::min(stats->min_alpha, static_cast<double>(alpha));
+        }
         
         if (alpha < 1e-8) {
             return 0.0;
@@ -252,12 +394,15 @@ void Integrator::compute_gradient(
     const SimParams& params,
     Real beta,
     VecX& gradient,
-    std::vector<RigidBody>* rigid_bodies) {
+    std::vector<RigidBody>* rigid_bodies,
+    StepStats* stats) {
 
     const int n = static_cast<int>(state.num_vertices());
     const Real dt = params.dt;
 
     (void)rigid_bodies;
+    const IslandSleepState* frozen = frozen_vertices(constraints, params);
+    const std::vector<uint8_t>* face_mask = frozen ? &frozen->face_awake : nullptr;
     
     // Flatten current positions
     VecX x_current;
@@ -275,7 +420,7 @@ void Integrator::compute_gradient(
     
     // 2. Elastic forces: ∇E_elastic
     VecX elastic_gradient = VecX::Zero(3 * n);
-    Elasticity::compute_gradient(mesh, state, elastic_gradient);
+    Elasticity::compute_gradient(mesh, state, elastic_gradient, face_mask);
     gradient += elastic_gradient;
     
     // Assemble base elastic Hessian (mass + elasticity) for stiffness extraction
@@ -295,7 +440,7 @@ void Integrator::compute_gradient(
     
     // Elastic Hessian
     std::vector<Triplet> elastic_triplets;
-    Elasticity::compute_hessian(mesh, state, elastic_triplets);
+    Elasticity::compute_hessian(mesh, state, elastic_triplets, face_mask);
     base_triplets.insert(base_triplets.end(), elastic_triplets.begin(), elastic_triplets.end());
     H_total.setFromTriplets(base_triplets.begin(), base_triplets.end());
 
@@ -304,7 +449,13 @@ void Integrator::compute_gradient(
     H_elastic.setFromTriplets(elastic_triplets.begin(), elastic_triplets.end());
 
     if (params.enable_strain_limiting) {
-        StrainLimiting::rebuild_constraints(mesh, state, params, H_elastic, constraints);
+        {
+            ScopedPhaseTimer timer(phase_ms(stats, &StepStats::strain_limit_ms));
+            StrainLimiting::rebuild_constraints(mesh, state, params, H_elastic, constraints);
+        }
+        if (stats) {
+            stats->strain_limit_rebuilds++;
+        }
         StrainLimiting::accumulate_gradient(mesh, state, constraints, params, gradient);
     } else {
         constraints.clear_strain_limits();
@@ -340,7 +491,7 @@ void Integrator::compute_gradient(
     // 4. Pin and wall barrier gradients
     // Pins: gap = ||x_i - pin_target||
     for (const auto& pin : constraints.pins) {
-        if (!pin.active) continue;
+        if (!pin.active || is_frozen(frozen, pin.vertex_idx)) continue;
 
         Vec3 offset = state.positions[pin.vertex_idx] - pin.target_position;
         Mat3 H_block = Stiffness::extract_hessian_block(H_total, pin.vertex_idx);
@@ -359,6 +510,7 @@ void Integrator::compute_gradient(
 
         // For each vertex, compute wall stiffness and gradient contribution
         for (Index vi = 0; vi < static_cast<Index>(state.num_vertices()); ++vi) {
+            if (is_frozen(frozen, vi)) continue;
             Mat3 H_block = Stiffness::extract_hessian_block(H_total, vi);
             Real k_bar = Stiffness::compute_wall_stiffness(state.masses[vi], params.wall_gap,
                                                            wall.normal, H_block, params.min_gap);
@@ -403,12 +555,14 @@ void Integrator::assemble_system_matrix(
     const SimParams& params,
     Real beta,
     SparseMatrix& hessian,
-    std::vector<RigidBody>* rigid_bodies) {
+    std::vector<RigidBody>* rigid_bodies,
+    StepStats* stats) {
 
     const int n = static_cast<int>(state.num_vertices());
     const Real dt = params.dt;
 
     (void)rigid_bodies;
+    const IslandSleepState* frozen = frozen_vertices(constraints, params);
     
     // Initialize sparse matrix
     hessian.resize(3 * n, 3 * n);
@@ -425,7 +579,8 @@ void Integrator::assemble_system_matrix(
 
     // 2. Elastic Hessian: H_elastic
     std::vector<Triplet> elastic_triplets;
-    Elasticity::compute_hessian(mesh, state, elastic_triplets);
+    Elasticity::compute_hessian(mesh, state, elastic_triplets,
+                                frozen ? &frozen->face_awake : nullptr);
 
     assembly.append_elastic(elastic_triplets, triplets);
     
@@ -440,7 +595,11 @@ void Integrator::assemble_system_matrix(
 
     if (params.enable_strain_limiting) {
         if (constraints.strain_limits.empty()) {
+            ScopedPhaseTimer timer(phase_ms(stats, &StepStats::strain_limit_ms));
             StrainLimiting::rebuild_constraints(mesh, state, params, H_elastic, constraints);
+            if (stats) {
+                stats->strain_limit_rebuilds++;
+            }
         }
         StrainLimiting::accumulate_hessian(mesh, state, constraints, params, triplets);
     } else {
@@ -479,7 +638,7 @@ void Integrator::assemble_system_matrix(
     // 4. Pin and wall Hessians
     // Pins
     for (const auto& pin : constraints.pins) {
-        if (!pin.active) continue;
+        if (!pin.active || is_frozen(frozen, pin.vertex_idx)) continue;
 
         // Extract H_block from base Hessian
         Mat3 H_block = Stiffness::extract_hessian_block(H_base, pin.vertex_idx);
@@ -499,6 +658,7 @@ void Integrator::assemble_system_matrix(
         if (!wall.active) continue;
 
         for (Index vi = 0; vi < static_cast<Index>(state.num_vertices()); ++vi) {
+            if (is_frozen(frozen, vi)) continue;
             Mat3 H_block = Stiffness::extract_hessian_block(H_base, vi);
             Real k_bar = Stiffness::compute_wall_stiffness(state.masses[vi], params.wall_gap,
                                                            wall.normal, H_block, params.min_gap);
@@ -545,12 +705,18 @@ void Integrator::assemble_system_matrix(
 
 void Integrator::detect_collisions(const Mesh& mesh, const State& state,
                                   std::vector<ContactPair>& contacts,
-                                  const std::vector<RigidBody>* rigid_bodies) {
+                                  const std::vector<RigidBody>* rigid_bodies,
+                                  StepStats* stats,
+                                  Real margin) {
+    ScopedPhaseTimer timer(phase_ms(stats, &StepStats::collision_ms));
+    if (stats) {
+        stats->collision_calls++;
+    }
     contacts.clear();
     if (rigid_bodies) {
-        Collision::detect_all_collisions(mesh, state, *rigid_bodies, contacts);
+        Collision::detect_all_collisions(mesh, state, *rigid_bodies, contacts, stats, margin);
     } else {
-        Collision::detect_all_collisions(mesh, state, contacts);
+        Collision::detect_all_collisions(mesh, state, contacts, stats, margin);
     }
 }
 
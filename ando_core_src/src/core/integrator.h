@@ -6,6 +6,7 @@
 #include "constraints.h"
 #include "collision.h"
 #include "rigid_body.h"
+#include "step_stats.h"
 #include <vector>
 
 namespace ando_barrier {
@@ -29,10 +30,13 @@ public:
      * @param state Current state (positions, velocities, masses)
      * @param constraints Pin and wall constraints
      * @param params Simulation parameters
+     * @param rigid_bodies Optional rigid bodies for two-way coupling
+     * @param stats Optional per-phase profiling output (reset at step start)
      */
     static void step(Mesh& mesh, State& state, Constraints& constraints,
                     const SimParams& params,
-                    std::vector<RigidBody>* rigid_bodies = nullptr);
+                    std::vector<RigidBody>* rigid_bodies = nullptr,
+                    StepStats* stats = nullptr);
 
     /**
      * Collect current contact pairs using the same pipeline as the integrator.
@@ -66,7 +70,8 @@ private:
         Constraints& constraints,
         const SimParams& params,
         Real beta,
-        std::vector<RigidBody>* rigid_bodies
+        std::vector<RigidBody>* rigid_bodies,
+        StepStats* stats
     );
     
     /**
@@ -93,7 +98,8 @@ private:
         const SimParams& params,
         Real beta,
         VecX& gradient,
-        std::vector<RigidBody>* rigid_bodies
+        std::vector<RigidBody>* rigid_bodies,
+        StepStats* stats
     );
     
     /**
@@ -117,7 +123,8 @@ private:
         const SimParams& params,
         Real beta,
         SparseMatrix& hessian,
-        std::vector<RigidBody>* rigid_bodies
+        std::vector<RigidBody>* rigid_bodies,
+        StepStats* stats
     );
     
     /**
@@ -126,10 +133,13 @@ private:
      * @param mesh Mesh topology
      * @param state Current state
      * @param contacts Output contact pairs
+     * @param margin Broad-phase query distance (see Collision::detect_all_collisions)
      */
     static void detect_collisions(const Mesh& mesh, const State& state,
                                   std::vector<ContactPair>& contacts,
-                                  const std::vector<RigidBody>* rigid_bodies);
+                                  const std::vector<RigidBody>* rigid_bodies,
+                                  StepStats* stats = nullptr,
+                                  Real margin = Collision::kDefaultQueryMargin);
 
     static void apply_velocity_damping(State& state, Real damping_factor);
     static void apply_contact_restitution(const Mesh& mesh,
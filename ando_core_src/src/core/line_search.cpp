@@ -13,7 +13,8 @@ Real LineSearch::search(const Mesh& mesh,
                        const Vec3& wall_normal,
                        Real wall_offset,
                        Real extension,
-                       Real min_alpha) {
+                       Real min_alpha,
+                       int* halvings) {
     
     // Start with full extended step
     Real alpha = 1.0;
@@ -39,6 +40,9 @@ Real LineSearch::search(const Mesh& mesh,
         
         // Reduce step length geometrically
         alpha *= reduction_factor;
+        if (halvings) {
+            ++*halvings;
+        }
         
         // Give up if step becomes too small
         if (alpha < min_alpha) {
@@ -178,8 +182,29 @@ Real LineSearch::ccd_point_triangle(const Vec3& p0, const Vec3& p1,
         return 1.0;
     }
     
+    // Signed distance to the triangle plane; a sign change between samples
+    // means the point passed through the plane even if no sample landed on it
+    auto plane_distance = [](const Vec3& p, const Vec3& a, const Vec3& b, const Vec3& c) {
+        return (b - a).cross(c - a).dot(p - a);
+    };
+
+    // Whether p projects inside triangle abc (with a small tolerance)
+    auto projects_inside = [](const Vec3& p, const Vec3& a, const Vec3& b, const Vec3& c) {
+        Vec3 n = (b - a).cross(c - a);
+        Real area2 = n.squaredNorm();
+        if (area2 < 1e-20) {
+            return false;
+        }
+        const Real tol = -1e-4;
+        Real u = (c - b).cross(p - b).dot(n) / area2;
+        Real v = (a - c).cross(p - c).dot(n) / area2;
+        return u >= tol && v >= tol && (1.0 - u - v) >= tol;
+    };
+
     // Sample at multiple time points for conservative detection
     const int num_samples = 10;
+    Real t_prev = 0.0;
+    Real side_prev = plane_distance(p0, a0, b0, c0);
     for (int i = 1; i <= num_samples; ++i) {
         Real t = static_cast<Real>(i) / num_samples;
         
@@ -198,6 +223,19 @@ Real LineSearch::ccd_point_triangle(const Vec3& p0, const Vec3& p1,
                 return t;  // Collision detected at time t
             }
         }
+
+        // Plane crossing between samples: locate it linearly and report the
+        // last safe sample if the crossing point lies inside the triangle
+        Real side = plane_distance(p_t, a_t, b_t, c_t);
+        if ((side_prev > 0.0 && side < 0.0) || (side_prev < 0.0 && side > 0.0)) {
+            Real s = t_prev + (t - t_prev) * side_prev / (side_prev - side);
+            if (projects_inside(p0 + s * (p1 - p0), a0 + s * (a1 - a0),
+                                b0 + s * (b1 - b0), c0 + s * (c1 - c0))) {
+                return t_prev;
+            }
+        }
+        side_prev = side;
+        t_prev = t;
     }
     
     return 1.0;  // No collision detected
@@ -32,6 +32,7 @@ public:
      * @param wall_offset Wall plane offset (if wall constraint active)
      * @param extension Extended direction multiplier (default 1.25 per paper)
      * @param min_alpha Minimum step length to consider (default 1e-6)
+     * @param halvings Optional counter, incremented once per step reduction
      * @return Maximum feasible α ∈ [0,1]
      */
     static Real search(const Mesh& mesh,
@@ -42,7 +43,8 @@ public:
                       const Vec3& wall_normal = Vec3(0, 0, 1),
                       Real wall_offset = 0.0,
                       Real extension = 1.25,
-                      Real min_alpha = 1e-6);
+                      Real min_alpha = 1e-6,
+                      int* halvings = nullptr);
 
 private:
     /**
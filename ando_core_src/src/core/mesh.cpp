@@ -2,6 +2,7 @@
 #include <unordered_set>
 #include <algorithm>
 #include <cmath>
+#include <limits>
 
 namespace ando_barrier {
 
@@ -11,13 +12,89 @@ void Mesh::initialize(const std::vector<Vec3>& verts,
     vertices = verts;
     triangles = tris;
     material = mat;
+
+    BodyRange body;
+    body.vertex_count = static_cast<Index>(verts.size());
+    body.face_count = static_cast<Index>(tris.size());
+    body.material = mat;
+    bodies.assign(1, body);
     
     compute_rest_state();
 }
 
+Index Mesh::add_body(const std::vector<Vec3>& verts,
+                     const std::vector<Triangle>& tris,
+                     const Material& mat) {
+    if (vertices.empty() && triangles.empty()) {
+        bodies.clear();
+        material = mat;
+    } else if (bodies.empty()) {
+        // Geometry assigned directly: register it as the first body
+        BodyRange existing;
+        existing.vertex_count = static_cast<Index>(vertices.size());
+        existing.face_count = static_cast<Index>(triangles.size());
+        existing.material = material;
+        bodies.push_back(existing);
+    }
+
+    BodyRange body;
+    body.vertex_offset = static_cast<Index>(vertices.size());
+    body.vertex_count = static_cast<Index>(verts.size());
+    body.face_offset = static_cast<Index>(triangles.size());
+    body.face_count = static_cast<Index>(tris.size());
+    body.material = mat;
+
+    vertices.insert(vertices.end(), verts.begin(), verts.end());
+    triangles.reserve(triangles.size() + tris.size());
+    for (const Triangle& tri : tris) {
+        triangles.emplace_back(tri.v[0] + body.vertex_offset,
+                               tri.v[1] + body.vertex_offset,
+                               tri.v[2] + body.vertex_offset);
+    }
+    bodies.push_back(body);
+
+    compute_rest_state();
+    return static_cast<Index>(bodies.size() - 1);
+}
+
+const Material& Mesh::face_material(Index face_idx) const {
+    if (face_idx >= 0 && static_cast<size_t>(face_idx) < face_body_.size()) {
+        return bodies[face_body_[face_idx]].material;
+    }
+    return material;
+}
+
+Index Mesh::body_of_vertex(Index vertex_idx) const {
+    // Bodies are packed in order, so offsets are sorted
+    auto it = std::upper_bound(bodies.begin(), bodies.end(), vertex_idx,
+        [](Index v, const BodyRange& body) { return v < body.vertex_offset; });
+    if (it == bodies.begin()) {
+        return -1;
+    }
+    --it;
+    if (vertex_idx >= it->vertex_offset + it->vertex_count) {
+        return -1;
+    }
+    return static_cast<Index>(it - bodies.begin());
+}
+
 void Mesh::compute_rest_state() {
     compute_edges();
-    build_topology();
+    ++topology_version_;
+    cache_ = DerivedCache();
+
+    // Per-face body lookup; single-body meshes keep using `material`
+    face_body_.clear();
+    if (bodies.size() > 1) {
+        face_body_.assign(triangles.size(), 0);
+        for (size_t b = 0; b < bodies.size(); ++b) {
+            const BodyRange& body = bodies[b];
+            for (Index f = body.face_offset;
+                 f < body.face_offset + body.face_count && static_cast<size_t>(f) < triangles.size(); ++f) {
+                face_body_[f] = static_cast<Index>(b);
+            }
+        }
+    }
     
     // Compute per-face rest data
     Dm_inv.resize(triangles.size());
@@ -97,30 +174,146 @@ void Mesh::compute_edges() {
     }
 }
 
-void Mesh::build_topology() {
-    vertex_to_faces.clear();
-    vertex_to_faces.resize(vertices.size());
-    vertex_to_edges.clear();
-    vertex_to_edges.resize(vertices.size());
-    
-    // Build vertex-to-face connectivity
-    for (size_t i = 0; i < triangles.size(); ++i) {
-        const Triangle& tri = triangles[i];
-        for (int j = 0; j < 3; ++j) {
-            vertex_to_faces[tri.v[j]].push_back(i);
-        }
+void Mesh::set_positions(const std::vector<Vec3>& new_positions) {
+    vertices = new_positions;
+    invalidate_geometry();
+}
+
+void Mesh::invalidate_geometry() {
+    cache_.edge_lengths_valid = false;
+}
+
+const std::vector<Real>& Mesh::edge_lengths() const {
+    if (!cache_.edge_lengths_valid) {
+        build_edge_lengths();
     }
-    
-    // Build vertex-to-edge connectivity
+    return cache_.edge_lengths;
+}
+
+Real Mesh::min_edge_length() const {
+    if (!cache_.edge_lengths_valid) {
+        build_edge_lengths();
+    }
+    return cache_.min_edge_length;
+}
+
+const CSRAdjacency& Mesh::vertex_faces() const {
+    if (!cache_.adjacency_valid || cache_.vertex_faces.num_rows() != vertices.size()) {
+        build_adjacency();
+    }
+    return cache_.vertex_faces;
+}
+
+const CSRAdjacency& Mesh::vertex_edges() const {
+    if (!cache_.adjacency_valid || cache_.vertex_edges.num_rows() != vertices.size()) {
+        build_adjacency();
+    }
+    return cache_.vertex_edges;
+}
+
+const std::vector<Real>& Mesh::face_masses() const {
+    Real areal_density = material.thickness * material.density;
+    if (!cache_.masses_valid || cache_.areal_density != areal_density ||
+        cache_.lumped_masses.size() != vertices.size()) {
+        build_masses();
+    }
+    return cache_.face_masses;
+}
+
+const std::vector<Real>& Mesh::lumped_masses() const {
+    face_masses();
+    return cache_.lumped_masses;
+}
+
+void Mesh::build_edge_lengths() const {
+    const size_t n = vertices.size();
+    cache_.edge_lengths.assign(edges.size(), static_cast<Real>(0.0));
+
+    Real min_edge_sq = std::numeric_limits<Real>::max();
+    bool found_valid_edge = false;
+
     for (size_t i = 0; i < edges.size(); ++i) {
-        const Edge& edge = edges[i];
-        vertex_to_edges[edge.v[0]].push_back(i);
-        vertex_to_edges[edge.v[1]].push_back(i);
+        const Index v0 = edges[i].v[0];
+        const Index v1 = edges[i].v[1];
+
+        // Skip edges that reference invalid vertices
+        if (v0 < 0 || v1 < 0 || size_t(v0) >= n || size_t(v1) >= n) {
+            continue;
+        }
+
+        const Real length_sq = (vertices[v1] - vertices[v0]).squaredNorm();
+        if (!std::isfinite(length_sq)) {
+            continue;
+        }
+
+        cache_.edge_lengths[i] = std::sqrt(length_sq);
+        min_edge_sq = std::min(min_edge_sq, length_sq);
+        found_valid_edge = true;
     }
+
+    Real min_edge = found_valid_edge ? std::sqrt(std::max(min_edge_sq, static_cast<Real>(0.0)))
+                                     : static_cast<Real>(0.0);
+    cache_.min_edge_length = std::isfinite(min_edge) ? min_edge : static_cast<Real>(0.0);
+    cache_.edge_lengths_valid = true;
 }
 
-void Mesh::set_positions(const std::vector<Vec3>& new_positions) {
-    vertices = new_positions;
+void Mesh::build_adjacency() const {
+    const size_t n = vertices.size();
+
+    // Two-pass CSR build: count incidences, prefix-sum, then scatter
+    auto build = [n](CSRAdjacency& adj, size_t num_items, int arity, auto&& vertex_of) {
+        adj.offsets.assign(n + 1, 0);
+        for (size_t i = 0; i < num_items; ++i) {
+            for (int k = 0; k < arity; ++k) {
+                Index v = vertex_of(i, k);
+                if (v >= 0 && size_t(v) < n) {
+                    ++adj.offsets[v + 1];
+                }
+            }
+        }
+        for (size_t v = 0; v < n; ++v) {
+            adj.offsets[v + 1] += adj.offsets[v];
+        }
+        adj.indices.assign(size_t(adj.offsets[n]), 0);
+        std::vector<Index> cursor(adj.offsets.begin(), adj.offsets.end() - 1);
+        for (size_t i = 0; i < num_items; ++i) {
+            for (int k = 0; k < arity; ++k) {
+                Index v = vertex_of(i, k);
+                if (v >= 0 && size_t(v) < n) {
+                    adj.indices[cursor[v]++] = static_cast<Index>(i);
+                }
+            }
+        }
+    };
+
+    build(cache_.vertex_faces, triangles.size(), 3,
+          [this](size_t i, int k) { return triangles[i].v[k]; });
+    build(cache_.vertex_edges, edges.size(), 2,
+          [this](size_t i, int k) { return edges[i].v[k]; });
+    cache_.adjacency_valid = true;
+}
+
+void Mesh::build_masses() const {
+    const Real areal_density = material.thickness * material.density;
+    cache_.face_masses.resize(triangles.size());
+    cache_.lumped_masses.assign(vertices.size(), static_cast<Real>(0.0));
+
+    // Distribute face mass equally to three vertices
+    for (size_t i = 0; i < triangles.size(); ++i) {
+        const Material& mat = face_material(static_cast<Index>(i));
+        Real face_mass = (i < rest_areas.size() ? rest_areas[i] : static_cast<Real>(0.0)) *
+                         mat.thickness * mat.density;
+        cache_.face_masses[i] = face_mass;
+
+        Real vertex_mass = face_mass / 3.0;
+        const Triangle& tri = triangles[i];
+        cache_.lumped_masses[tri.v[0]] += vertex_mass;
+        cache_.lumped_masses[tri.v[1]] += vertex_mass;
+        cache_.lumped_masses[tri.v[2]] += vertex_mass;
+    }
+
+    cache_.areal_density = areal_density;
+    cache_.masses_valid = true;
 }
 
 Mat2 Mesh::compute_F(Index face_idx) const {
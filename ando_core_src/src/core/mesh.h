@@ -1,11 +1,36 @@
 #pragma once
 
 #include "types.h"
+#include <cstdint>
 #include <vector>
 
 namespace ando_barrier {
 
+// Compressed sparse row adjacency: items of row i are indices[offsets[i] .. offsets[i+1])
+struct CSRAdjacency {
+    std::vector<Index> offsets;
+    std::vector<Index> indices;
+
+    size_t num_rows() const { return offsets.empty() ? 0 : offsets.size() - 1; }
+    size_t degree(size_t row) const { return size_t(offsets[row + 1] - offsets[row]); }
+    const Index* begin(size_t row) const { return indices.data() + offsets[row]; }
+    const Index* end(size_t row) const { return indices.data() + offsets[row + 1]; }
+};
+
+// Contiguous vertex/face range of one deformable body packed into a Mesh
+struct BodyRange {
+    Index vertex_offset = 0;
+    Index vertex_count = 0;
+    Index face_offset = 0;
+    Index face_count = 0;
+    Material material;
+};
+
 // Shell/cloth mesh representation
+//
+// Several deformable bodies can share one Mesh (see add_body); their
+// vertices and faces are concatenated, so self-collision detection also
+// covers contact between bodies.
 class Mesh {
 public:
     // Geometry
@@ -13,16 +38,15 @@ public:
     std::vector<Triangle> triangles;    // Face connectivity (M×3)
     std::vector<Edge> edges;            // Edge connectivity for bending
     
-    // Rest-state data
+    // Rest-state data (rebuilt by compute_rest_state)
     std::vector<Mat2> Dm_inv;           // Per-face inverse rest-shape matrix
     std::vector<Real> rest_areas;       // Per-face rest areas
     
-    // Topology
-    std::vector<std::vector<Index>> vertex_to_faces;  // Incident faces per vertex
-    std::vector<std::vector<Index>> vertex_to_edges;  // Incident edges per vertex
-    
-    // Material
+    // Material (used for every face of a single-body mesh)
     Material material;
+
+    // Deformable bodies, in packing order (one entry after initialize)
+    std::vector<BodyRange> bodies;
     
     Mesh() = default;
     
@@ -31,23 +55,73 @@ public:
                    const std::vector<Triangle>& tris,
                    const Material& mat);
     
-    // Compute rest-state data (Dm_inv, areas, topology)
+    // Append a body; `tris` index into `verts`. Returns the new body index.
+    Index add_body(const std::vector<Vec3>& verts,
+                   const std::vector<Triangle>& tris,
+                   const Material& mat);
+
+    // Material of the body owning a face
+    const Material& face_material(Index face_idx) const;
+
+    // Body owning a vertex (-1 if outside every range)
+    Index body_of_vertex(Index vertex_idx) const;
+
+    // Compute rest-state data (Dm_inv, areas, edges) and bump topology_version
     void compute_rest_state();
     
-    // Update vertex positions
+    // Update vertex positions (invalidates edge lengths)
     void set_positions(const std::vector<Vec3>& new_positions);
+
+    // Call after editing `vertices` in place
+    void invalidate_geometry();
+
+    // Incremented whenever triangles/edges or rest data change; consumers
+    // holding per-topology state compare against it to detect rebuilds
+    uint64_t topology_version() const { return topology_version_; }
+
+    // Derived quantities, built lazily on first access and cached until
+    // the topology, vertex positions or areal density change.
+    // Lazy builds are not thread-safe; touch them before parallel regions.
+    const std::vector<Real>& edge_lengths() const;  // |v1 - v0| per edge from `vertices`
+    Real min_edge_length() const;                   // 0 when no valid edge exists
+    const CSRAdjacency& vertex_faces() const;       // Incident faces per vertex
+    const CSRAdjacency& vertex_edges() const;       // Incident edges per vertex
+    const std::vector<Real>& face_masses() const;   // area × thickness × ρ per face (per-body material)
+    const std::vector<Real>& lumped_masses() const; // Face mass split equally to vertices
     
     // Access
     size_t num_vertices() const { return vertices.size(); }
     size_t num_triangles() const { return triangles.size(); }
     size_t num_edges() const { return edges.size(); }
+    size_t num_bodies() const { return bodies.size(); }
     
     // Compute deformation gradient for a face
     Mat2 compute_F(Index face_idx) const;
     
 private:
-    void build_topology();
+    struct DerivedCache {
+        bool edge_lengths_valid = false;
+        std::vector<Real> edge_lengths;
+        Real min_edge_length = 0.0;
+
+        bool adjacency_valid = false;
+        CSRAdjacency vertex_faces;
+        CSRAdjacency vertex_edges;
+
+        bool masses_valid = false;
+        Real areal_density = 0.0;       // thickness × density the masses were built with
+        std::vector<Real> face_masses;
+        std::vector<Real> lumped_masses;
+    };
+
+    uint64_t topology_version_ = 0;
+    mutable DerivedCache cache_;
+    std::vector<Index> face_body_;      // Owning body per face (multi-body meshes only)
+
     void compute_edges();
+    void build_edge_lengths() const;
+    void build_adjacency() const;
+    void build_masses() const;
 };
 
 } // namespace ando_barrier
@@ -0,0 +1,92 @@
+#pragma once
+
+#include <algorithm>
+#include <atomic>
+#include <cstddef>
+#include <cstdlib>
+#include <thread>
+#include <vector>
+
+namespace ando_barrier {
+
+/**
+ * Minimal fork-join helpers for data-parallel loops in the core
+ *
+ * Worker count resolution: explicit set_worker_count() override, then the
+ * ANDO_NUM_THREADS / OMP_NUM_THREADS environment variables, then
+ * std::thread::hardware_concurrency().
+ */
+namespace parallel {
+
+inline std::atomic<int>& worker_override() {
+    static std::atomic<int> value{0};
+    return value;
+}
+
+/// Override the worker count (<= 0 restores automatic selection)
+inline void set_worker_count(int count) {
+    worker_override().store(count);
+}
+
+inline int worker_count() {
+    int forced = worker_override().load();
+    if (forced > 0) {
+        return forced;
+    }
+    for (const char* name : {"ANDO_NUM_THREADS", "OMP_NUM_THREADS"}) {
+        if (const char* env = std::getenv(name)) {
+            int value = std::atoi(env);
+            if (value > 0) {
+                return value;
+            }
+        }
+    }
+    unsigned hw = std::thread::hardware_concurrency();
+    return hw > 0 ? static_cast<int>(hw) : 1;
+}
+
+/**
+ * Split [0, n) into at most `workers` contiguous chunks and run
+ * fn(chunk, begin, end) on each
+ *
+ * Chunk boundaries depend only on n, min_chunk and workers, and chunk
+ * indices are dense and below workers, so callers can size per-chunk
+ * buffers from the same count and merge them in chunk order. Runs inline
+ * when one chunk suffices.
+ *
+ * @return Number of chunks used
+ */
+template <typename Fn>
+size_t for_chunks(size_t n, size_t min_chunk, size_t workers, Fn&& fn) {
+    if (n == 0) {
+        return 0;
+    }
+    workers = std::max<size_t>(1, workers);
+    size_t chunks = std::min(workers, std::max<size_t>(1, n / std::max<size_t>(1, min_chunk)));
+    if (chunks <= 1) {
+        fn(size_t(0), size_t(0), n);
+        return 1;
+    }
+
+    size_t per_chunk = (n + chunks - 1) / chunks;
+    std::vector<std::thread> threads;
+    threads.reserve(chunks - 1);
+    for (size_t c = 1; c < chunks; ++c) {
+        size_t begin = c * per_chunk;
+        size_t end = std::min(n, begin + per_chunk);
+        threads.emplace_back([&fn, c, begin, end]() {
+            if (begin < end) {
+                fn(c, begin, end);
+            }
+        });
+    }
+    fn(size_t(0), size_t(0), std::min(n, per_chunk));
+    for (auto& t : threads) {
+        t.join();
+    }
+    return chunks;
+}
+
+} // namespace parallel
+
+} // namespace ando_barrier
@@ -6,45 +6,70 @@
 namespace ando_barrier {
 
 bool PCGSolver::solve(const SparseMatrix& A, const VecX& b, VecX& x,
-                     Real tol, int max_iters) {
+                     Real tol, int max_iters, int* iterations,
+                     bool mixed_precision) {
     const int n = static_cast<int>(b.size());
+    if (iterations) {
+        *iterations = 0;
+    }
     const int num_vertices = n / 3;
     
     // Build block-Jacobi preconditioner
     std::vector<Mat3> precond;
     build_block_jacobi_preconditioner(A, num_vertices, precond);
+
+    if (mixed_precision) {
+        return iterate<HostScalar>(A, b, x, precond, tol, max_iters, iterations);
+    }
+    return iterate<Real>(A, b, x, precond, tol, max_iters, iterations);
+}
+
+template <typename Acc>
+bool PCGSolver::iterate(const SparseMatrix& A, const VecX& b_in, VecX& x_out,
+                        const std::vector<Mat3>& precond,
+                        Real tol, int max_iters, int* iterations) {
+    using AccVec = Eigen::Matrix<Acc, Eigen::Dynamic, 1>;
+    const int n = static_cast<int>(b_in.size());
+
+    const AccVec b = b_in.template cast<Acc>();
+    AccVec x = x_out.template cast<Acc>();
     
     // Initial residual: r = b - Ax
-    VecX r = b - A * x;
+    AccVec r = b - (A * x_out).template cast<Acc>();
     
     // Check initial convergence
-    Real rel_res = compute_relative_residual(r, b);
+    Acc rel_res = compute_relative_residual<Acc>(r, b);
     if (rel_res < tol) {
         return true;  // Already converged
     }
     
     // Apply preconditioner: z = P⁻¹ r
-    VecX z = VecX::Zero(n);
-    apply_preconditioner(precond, r, z);
+    AccVec z = AccVec::Zero(n);
+    apply_preconditioner<Acc>(precond, r, z);
     
     // Initial search direction: p = z
-    VecX p = z;
+    AccVec p = z;
     
     // rz = r^T z
-    Real rz_old = r.dot(z);
+    Acc rz_old = r.dot(z);
     
     // PCG iteration
     for (int iter = 0; iter < max_iters; ++iter) {
-        // Ap = A * p
-        VecX Ap = A * p;
+        if (iterations) {
+            *iterations = iter + 1;
+        }
+
+        // Ap = A * p (SpMV stays in Real)
+        AccVec Ap = (A * p.template cast<Real>()).template cast<Acc>();
         
         // alpha = (r^T z) / (p^T A p)
-        Real pAp = p.dot(Ap);
+        Acc pAp = p.dot(Ap);
         if (std::abs(pAp) < 1e-16) {
             std::cerr << "PCG: pAp near zero, matrix may not be SPD" << std::endl;
+            x_out = x.template cast<Real>();
             return false;
         }
-        Real alpha = rz_old / pAp;
+        Acc alpha = rz_old / pAp;
         
         // Update solution: x = x + alpha * p
         x += alpha * p;
@@ -53,23 +78,25 @@ bool PCGSolver::solve(const SparseMatrix& A, const VecX& b, VecX& x,
         r -= alpha * Ap;
         
         // Check convergence
-        rel_res = compute_relative_residual(r, b);
+        rel_res = compute_relative_residual<Acc>(r, b);
         if (rel_res < tol) {
+            x_out = x.template cast<Real>();
             return true;  // Converged
         }
         
         // Apply preconditioner: z = P⁻¹ r
-        apply_preconditioner(precond, r, z);
+        apply_preconditioner<Acc>(precond, r, z);
         
         // beta = (r_new^T z_new) / (r_old^T z_old)
-        Real rz_new = r.dot(z);
-        Real beta = rz_new / rz_old;
+        Acc rz_new = r.dot(z);
+        Acc beta = rz_new / rz_old;
         rz_old = rz_new;
         
         // Update search direction: p = z + beta * p
         p = z + beta * p;
     }
     
+    x_out = x.template cast<Real>();
     std::cerr << "PCG: Max iterations reached, residual = " << rel_res << std::endl;
     return false;  // Did not converge
 }
@@ -113,19 +140,21 @@ void PCGSolver::build_block_jacobi_preconditioner(
     }
 }
 
+template <typename Acc>
 void PCGSolver::apply_preconditioner(
     const std::vector<Mat3>& precond,
-    const VecX& r,
-    VecX& z) {
+    const Eigen::Matrix<Acc, Eigen::Dynamic, 1>& r,
+    Eigen::Matrix<Acc, Eigen::Dynamic, 1>& z) {
     
+    using AccVec3 = Eigen::Matrix<Acc, 3, 1>;
     const int num_vertices = static_cast<int>(precond.size());
     
     for (int i = 0; i < num_vertices; ++i) {
         // Extract 3-vector from r
-        Vec3 r_block(r[3*i], r[3*i+1], r[3*i+2]);
+        AccVec3 r_block(r[3*i], r[3*i+1], r[3*i+2]);
         
         // Apply preconditioner block: z_block = P_i⁻¹ * r_block
-        Vec3 z_block = precond[i] * r_block;
+        AccVec3 z_block = precond[i].template cast<Acc>() * r_block;
         
         // Store result
         z[3*i]   = z_block[0];
@@ -134,9 +163,11 @@ void PCGSolver::apply_preconditioner(
     }
 }
 
-Real PCGSolver::compute_relative_residual(const VecX& r, const VecX& b) {
-    Real r_inf = r.lpNorm<Eigen::Infinity>();
-    Real b_inf = b.lpNorm<Eigen::Infinity>();
+template <typename Acc>
+Acc PCGSolver::compute_relative_residual(const Eigen::Matrix<Acc, Eigen::Dynamic, 1>& r,
+                                         const Eigen::Matrix<Acc, Eigen::Dynamic, 1>& b) {
+    Acc r_inf = r.template lpNorm<Eigen::Infinity>();
+    Acc b_inf = b.template lpNorm<Eigen::Infinity>();
     
     if (b_inf < 1e-16) {
         return r_inf;  // Avoid division by zero
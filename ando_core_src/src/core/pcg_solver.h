@@ -21,12 +21,29 @@ public:
      * @param x Solution vector (input: initial guess, output: solution)
      * @param tol Relative residual tolerance (L∞ norm)
      * @param max_iters Maximum iterations
+     * @param iterations Optional output: iterations performed
+     * @param mixed_precision Keep A, SpMV and preconditioner blocks in Real
+     *        but hold x, r, p and accumulate dot products, residual norms
+     *        and α/β in HostScalar (double)
      * @return true if converged, false if max iterations reached
      */
     static bool solve(const SparseMatrix& A, const VecX& b, VecX& x,
-                     Real tol = 1e-3, int max_iters = 100);
+                     Real tol = 1e-3, int max_iters = 100,
+                     int* iterations = nullptr,
+                     bool mixed_precision = false);
 
 private:
+    /**
+     * PCG iteration with vectors and scalars in Acc
+     *
+     * Acc = Real reproduces the single-precision solver; Acc = HostScalar is
+     * the mixed mode. The matrix and preconditioner stay in Real either way.
+     */
+    template <typename Acc>
+    static bool iterate(const SparseMatrix& A, const VecX& b, VecX& x,
+                        const std::vector<Mat3>& precond,
+                        Real tol, int max_iters, int* iterations);
+
     /**
      * Build 3×3 block-Jacobi preconditioner
      * 
@@ -49,10 +66,11 @@ private:
      * @param r Residual vector
      * @param z Output: preconditioned residual
      */
+    template <typename Acc>
     static void apply_preconditioner(
         const std::vector<Mat3>& precond,
-        const VecX& r,
-        VecX& z
+        const Eigen::Matrix<Acc, Eigen::Dynamic, 1>& r,
+        Eigen::Matrix<Acc, Eigen::Dynamic, 1>& z
     );
     
     /**
@@ -62,7 +80,9 @@ private:
      * @param b Right-hand side
      * @return Relative residual in L∞ norm
      */
-    static Real compute_relative_residual(const VecX& r, const VecX& b);
+    template <typename Acc>
+    static Acc compute_relative_residual(const Eigen::Matrix<Acc, Eigen::Dynamic, 1>& r,
+                                         const Eigen::Matrix<Acc, Eigen::Dynamic, 1>& b);
 };
 
 } // namespace ando_barrier
@@ -0,0 +1,248 @@
+#include "sleeping.h"
+
+#include <algorithm>
+#include <climits>
+#include <cmath>
+#include <numeric>
+
+namespace ando_barrier {
+
+Index IslandSleep::find_root(std::vector<Index>& parent, Index v) {
+    while (parent[v] != v) {
+        parent[v] = parent[parent[v]];
+        v = parent[v];
+    }
+    return v;
+}
+
+void IslandSleep::unite(std::vector<Index>& parent, Index a, Index b) {
+    Index ra = find_root(parent, a);
+    Index rb = find_root(parent, b);
+    if (ra != rb) {
+        // Keep the smaller index as root so island ids follow vertex order
+        if (rb < ra) std::swap(ra, rb);
+        parent[rb] = ra;
+    }
+}
+
+bool IslandSleep::pins_equal(const PinConstraint& a, const PinConstraint& b) {
+    return a.vertex_idx == b.vertex_idx &&
+           a.active == b.active &&
+           a.target_position == b.target_position;
+}
+
+void IslandSleep::begin_step(const Mesh& mesh, const State& state, Constraints& constraints) {
+    IslandSleepState& sleep = constraints.island_sleep;
+    const size_t n = state.num_vertices();
+
+    if (sleep.topology_version != mesh.topology_version() || sleep.sleeping.size() != n) {
+        sleep.reset();
+        sleep.topology_version = mesh.topology_version();
+        sleep.quiet_steps.assign(n, 0);
+        sleep.sleeping.assign(n, 0);
+        sleep.pin_snapshot = constraints.pins;
+        return;
+    }
+
+    // Pin edits wake the pinned vertex; partition() then wakes its island
+    auto wake = [&](Index v) {
+        if (v >= 0 && static_cast<size_t>(v) < n) {
+            sleep.sleeping[v] = 0;
+            sleep.quiet_steps[v] = 0;
+        }
+    };
+    const std::vector<PinConstraint>& pins = constraints.pins;
+    const std::vector<PinConstraint>& previous = sleep.pin_snapshot;
+    if (pins.size() != previous.size()) {
+        for (const auto& pin : pins) wake(pin.vertex_idx);
+        for (const auto& pin : previous) wake(pin.vertex_idx);
+    } else {
+        for (size_t i = 0; i < pins.size(); ++i) {
+            if (!pins_equal(pins[i], previous[i])) {
+                wake(pins[i].vertex_idx);
+                wake(previous[i].vertex_idx);
+            }
+        }
+    }
+
+    sleep.num_sleeping = static_cast<int>(
+        std::count(sleep.sleeping.begin(), sleep.sleeping.end(), uint8_t(1)));
+}
+
+void IslandSleep::freeze_sleeping(State& state, const IslandSleepState& sleep) {
+    for (size_t v = 0; v < sleep.sleeping.size(); ++v) {
+        if (sleep.sleeping[v]) {
+            state.positions[v] = sleep.rest_positions[v];
+            state.velocities[v].setZero();
+        }
+    }
+}
+
+void IslandSleep::partition(const Mesh& mesh,
+                            State& state,
+                            const std::vector<ContactPair>& contacts,
+                            const std::vector<RigidBody>* rigid_bodies,
+                            const SimParams& params,
+                            IslandSleepState& sleep) {
+    const Index n = static_cast<Index>(state.num_vertices());
+
+    std::vector<Index> parent(n);
+    std::iota(parent.begin(), parent.end(), Index(0));
+    for (const Edge& edge : mesh.edges) {
+        unite(parent, edge.v[0], edge.v[1]);
+    }
+    for (const ContactPair& contact : contacts) {
+        if (contact.type != ContactType::POINT_TRIANGLE &&
+            contact.type != ContactType::EDGE_EDGE) {
+            continue;
+        }
+        const Index others[3] = {contact.idx1, contact.idx2, contact.idx3};
+        for (Index other : others) {
+            if (other >= 0 && other < n) {
+                unite(parent, contact.idx0, other);
+            }
+        }
+    }
+
+    // Compact root ids into 0..num_islands-1
+    sleep.island.assign(n, -1);
+    std::vector<Index> root_island(n, -1);
+    int num_islands = 0;
+    for (Index v = 0; v < n; ++v) {
+        Index root = find_root(parent, v);
+        if (root_island[root] < 0) {
+            root_island[root] = num_islands++;
+        }
+        sleep.island[v] = root_island[root];
+    }
+    sleep.num_islands = num_islands;
+
+    // An island sleeps only if every vertex in it was asleep
+    std::vector<uint8_t> island_awake(num_islands, 0);
+    for (Index v = 0; v < n; ++v) {
+        if (!sleep.sleeping[v]) {
+            island_awake[sleep.island[v]] = 1;
+        }
+    }
+
+    // Rigid bodies are not part of the islands; a moving one wakes what it touches
+    if (rigid_bodies) {
+        const Real wake_speed = std::sqrt(Real(2.0) * params.sleep_energy_threshold);
+        for (const ContactPair& contact : contacts) {
+            if (contact.type != ContactType::RIGID_POINT_TRIANGLE ||
+                contact.rigid_body_index < 0 ||
+                contact.rigid_body_index >= static_cast<int>(rigid_bodies->size())) {
+                continue;
+            }
+            const RigidBody& body = (*rigid_bodies)[contact.rigid_body_index];
+            if (body.velocity_at_point(contact.witness_q).norm() > wake_speed) {
+                island_awake[sleep.island[contact.idx0]] = 1;
+            }
+        }
+    }
+
+    int num_sleeping = 0;
+    for (Index v = 0; v < n; ++v) {
+        sleep.sleeping[v] = island_awake[sleep.island[v]] ? 0 : 1;
+        num_sleeping += sleep.sleeping[v];
+    }
+    sleep.num_sleeping = num_sleeping;
+
+    sleep.face_awake.assign(mesh.triangles.size(), 1);
+    if (num_sleeping > 0) {
+        for (size_t f = 0; f < mesh.triangles.size(); ++f) {
+            const Triangle& tri = mesh.triangles[f];
+            sleep.face_awake[f] = !(sleep.sleeping[tri.v[0]] &&
+                                    sleep.sleeping[tri.v[1]] &&
+                                    sleep.sleeping[tri.v[2]]);
+        }
+    }
+
+    freeze_sleeping(state, sleep);
+}
+
+void IslandSleep::end_step(const State& state,
+                           const Constraints& constraints,
+                           const SimParams& params,
+                           IslandSleepState& sleep) {
+    const size_t n = state.num_vertices();
+    const int num_islands = sleep.num_islands;
+    const double inv_dt = params.dt > Real(0.0) ? 1.0 / static_cast<double>(params.dt) : 0.0;
+    // Without a previous end-of-step pose there is nothing to compare against
+    const bool has_reference = sleep.rest_positions.size() == n;
+
+    std::vector<double> energy(num_islands, 0.0);
+    std::vector<double> mass(num_islands, 0.0);
+    std::vector<int> quiet(num_islands, INT_MAX);
+    for (size_t v = 0; v < n; ++v) {
+        const Index i = sleep.island[v];
+        const double m = state.masses[v];
+        // Judge motion by the displacement since the last step ended rather
+        // than by state.velocities: callers advance positions with gravity
+        // before each step, so a resting body always carries a g*dt impulse
+        if (has_reference) {
+            const Vec3 dx = state.positions[v] - sleep.rest_positions[v];
+            energy[i] += 0.5 * m * static_cast<double>(dx.squaredNorm()) * inv_dt * inv_dt;
+        }
+        mass[i] += m;
+        quiet[i] = std::min(quiet[i], sleep.quiet_steps[v]);
+    }
+
+    const int sleep_steps = std::max(1, params.sleep_steps);
+    for (int i = 0; i < num_islands; ++i) {
+        bool calm = has_reference && (mass[i] <= 0.0 ||
+                    energy[i] / mass[i] < static_cast<double>(params.sleep_energy_threshold));
+        quiet[i] = calm ? std::min(quiet[i] + 1, sleep_steps) : 0;
+    }
+
+    int num_sleeping = 0;
+    for (size_t v = 0; v < n; ++v) {
+        const int q = quiet[sleep.island[v]];
+        sleep.quiet_steps[v] = q;
+        sleep.sleeping[v] = q >= sleep_steps ? 1 : 0;
+        num_sleeping += sleep.sleeping[v];
+    }
+    sleep.num_sleeping = num_sleeping;
+    sleep.pin_snapshot = constraints.pins;
+    sleep.rest_positions = state.positions;
+}
+
+void IslandSleep::reduce_system(const SparseMatrix& hessian,
+                                const VecX& rhs,
+                                const IslandSleepState& sleep,
+                                SparseMatrix& reduced_hessian,
+                                VecX& reduced_rhs,
+                                std::vector<Index>& dofs) {
+    const Index n = static_cast<Index>(sleep.sleeping.size());
+
+    std::vector<Index> reduced_index(3 * n, -1);
+    dofs.clear();
+    dofs.reserve(3 * (n - sleep.num_sleeping));
+    for (Index v = 0; v < n; ++v) {
+        if (sleep.sleeping[v]) continue;
+        for (int k = 0; k < 3; ++k) {
+            reduced_index[3 * v + k] = static_cast<Index>(dofs.size());
+            dofs.push_back(3 * v + k);
+        }
+    }
+
+    const Index m = static_cast<Index>(dofs.size());
+    reduced_rhs.resize(m);
+    std::vector<Triplet> triplets;
+    triplets.reserve(hessian.nonZeros());
+    for (Index r = 0; r < m; ++r) {
+        const Index row = dofs[r];
+        reduced_rhs[r] = rhs[row];
+        for (SparseMatrix::InnerIterator it(hessian, row); it; ++it) {
+            const Index c = reduced_index[it.col()];
+            if (c >= 0) {
+                triplets.emplace_back(r, c, it.value());
+            }
+        }
+    }
+
+    reduced_hessian.resize(m, m);
+    reduced_hessian.setFromTriplets(triplets.begin(), triplets.end());
+}
+
+} // namespace ando_barrier
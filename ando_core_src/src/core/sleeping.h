@@ -0,0 +1,87 @@
+#pragma once
+
+#include "types.h"
+#include "mesh.h"
+#include "state.h"
+#include "constraints.h"
+#include "collision.h"
+#include "rigid_body.h"
+
+#include <vector>
+
+namespace ando_barrier {
+
+/**
+ * Island sleeping for settled regions
+ *
+ * Vertices are partitioned into islands connected by mesh edges and
+ * deformable contact pairs. An island whose kinetic energy per unit mass
+ * stays below SimParams::sleep_energy_threshold for SimParams::sleep_steps
+ * consecutive steps goes to sleep: it is held at its rest pose and its DOFs are
+ * dropped from the Newton system. A sleeping island wakes when it joins an
+ * island with an awake vertex (a moving body came into contact), touches a
+ * moving rigid body, or one of its pins changes. The bookkeeping lives in
+ * constraints.island_sleep.
+ */
+class IslandSleep {
+public:
+    /**
+     * Prepare the sleep state at the start of a step.
+     *
+     * Resets the bookkeeping after a topology change and wakes vertices whose
+     * pins were added, removed or moved.
+     */
+    static void begin_step(const Mesh& mesh, const State& state, Constraints& constraints);
+
+    /**
+     * Return sleeping vertices to their rest positions and zero their
+     * velocities, discarding external impulses such as the gravity applied
+     * before each step.
+     */
+    static void freeze_sleeping(State& state, const IslandSleepState& sleep);
+
+    /**
+     * Partition vertices into islands and wake islands that touch motion.
+     *
+     * Fills island ids, the per-vertex sleeping flags and the per-face awake
+     * mask for the step, then freezes the vertices that stay asleep.
+     */
+    static void partition(const Mesh& mesh,
+                          State& state,
+                          const std::vector<ContactPair>& contacts,
+                          const std::vector<RigidBody>* rigid_bodies,
+                          const SimParams& params,
+                          IslandSleepState& sleep);
+
+    /**
+     * Update quiet-step counters from the displacement since the previous
+     * step ended and put islands to sleep. Also snapshots the pins and
+     * positions for the next step.
+     */
+    static void end_step(const State& state,
+                         const Constraints& constraints,
+                         const SimParams& params,
+                         IslandSleepState& sleep);
+
+    /**
+     * Compact the Newton system onto the awake DOFs.
+     *
+     * Rows and columns of sleeping vertices are dropped from `hessian` and
+     * `rhs`; `dofs` receives the full-system index of each reduced DOF.
+     */
+    static void reduce_system(const SparseMatrix& hessian,
+                              const VecX& rhs,
+                              const IslandSleepState& sleep,
+                              SparseMatrix& reduced_hessian,
+                              VecX& reduced_rhs,
+                              std::vector<Index>& dofs);
+
+private:
+    // Union-find root lookup with path halving
+    static Index find_root(std::vector<Index>& parent, Index v);
+    static void unite(std::vector<Index>& parent, Index a, Index b);
+
+    static bool pins_equal(const PinConstraint& a, const PinConstraint& b);
+};
+
+} // namespace ando_barrier
@@ -17,19 +17,7 @@ void State::initialize(const Mesh& mesh) {
 }
 
 void State::compute_lumped_masses(const Mesh& mesh) {
-    masses.clear();
-    masses.resize(mesh.num_vertices(), 0.0);
-    
-    // Distribute face mass equally to three vertices
-    for (size_t i = 0; i < mesh.num_triangles(); ++i) {
-        const Triangle& tri = mesh.triangles[i];
-        Real face_mass = mesh.rest_areas[i] * mesh.material.thickness * mesh.material.density;
-        Real vertex_mass = face_mass / 3.0;
-        
-        masses[tri.v[0]] += vertex_mass;
-        masses[tri.v[1]] += vertex_mass;
-        masses[tri.v[2]] += vertex_mass;
-    }
+    masses = mesh.lumped_masses();
 }
 
 void State::update_positions(const std::vector<Vec3>& new_positions) {
@@ -44,6 +32,13 @@ void State::update_velocities(Real beta_dt) {
     }
 }
 
+void State::apply_gravity(const Vec3& gravity, Real dt) {
+    for (size_t i = 0; i < positions.size(); ++i) {
+        velocities[i] += gravity * dt;
+        positions[i] += velocities[i] * dt;
+    }
+}
+
 void State::flatten_positions(VecX& x) const {
     x.resize(positions.size() * 3);
     for (size_t i = 0; i < positions.size(); ++i) {
@@ -0,0 +1,111 @@
+#pragma once
+
+#include <algorithm>
+#include <chrono>
+
+namespace ando_barrier {
+
+/**
+ * Per-step profiling counters filled by Integrator::step
+ *
+ * Times are wall-clock milliseconds accumulated over one step. Callers that do
+ * not pass a StepStats pointer pay only a null check per scoped timer.
+ */
+struct StepStats {
+    // Phase times (ms)
+    double total_ms = 0.0;
+    double collision_ms = 0.0;       // Full detection pipeline (includes BVH build)
+    double bvh_build_ms = 0.0;       // Triangle + edge BVH construction
+    double gradient_ms = 0.0;        // compute_gradient (includes strain-limit rebuild)
+    double hessian_ms = 0.0;         // assemble_system_matrix
+    double pcg_ms = 0.0;
+    double line_search_ms = 0.0;
+    double strain_limit_ms = 0.0;    // StrainLimiting::rebuild_constraints
+    double rigid_coupling_ms = 0.0;
+    double restitution_ms = 0.0;
+
+    // Counters
+    int beta_iterations = 0;
+    int newton_iterations = 0;
+    int pcg_solves = 0;
+    int pcg_iterations = 0;
+    int pcg_failures = 0;
+    int line_search_calls = 0;
+    int line_search_halvings = 0;
+    int collision_calls = 0;
+    int contacts_found = 0;          // Contacts from the step's initial detection
+    int strain_limit_rebuilds = 0;
+    int islands = 0;                 // Contact islands (0 unless sleeping is enabled)
+    int sleeping_vertices = 0;       // Vertices excluded from this step's solve
+
+    // Convergence telemetry
+    double beta_reached = 0.0;       // Final β of the accumulation loop
+    double min_alpha = 1.0;          // Smallest line-search α taken this step
+
+    void reset() { *this = StepStats(); }
+
+    /// Fold another step's stats into this one: times and counters add,
+    /// islands/sleeping report the latest step and telemetry keeps the worst
+    void accumulate(const StepStats& other) {
+        total_ms += other.total_ms;
+        collision_ms += other.collision_ms;
+        bvh_build_ms += other.bvh_build_ms;
+        gradient_ms += other.gradient_ms;
+        hessian_ms += other.hessian_ms;
+        pcg_ms += other.pcg_ms;
+        line_search_ms += other.line_search_ms;
+        strain_limit_ms += other.strain_limit_ms;
+        rigid_coupling_ms += other.rigid_coupling_ms;
+        restitution_ms += other.restitution_ms;
+        beta_iterations += other.beta_iterations;
+        newton_iterations += other.newton_iterations;
+        pcg_solves += other.pcg_solves;
+        pcg_iterations += other.pcg_iterations;
+        pcg_failures += other.pcg_failures;
+        line_search_calls += other.line_search_calls;
+        line_search_halvings += other.line_search_halvings;
+        collision_calls += other.collision_calls;
+        contacts_found += other.contacts_found;
+        strain_limit_rebuilds += other.strain_limit_rebuilds;
+        islands = other.islands;
+        sleeping_vertices = other.sleeping_vertices;
+        beta_reached = other.beta_reached;
+        min_alpha = std::min(min_alpha, other.min_alpha);
+    }
+};
+
+/**
+ * RAII timer that adds its lifetime (ms) to a StepStats field
+ *
+ * A null target disables the timer without touching the clock.
+ */
+class ScopedPhaseTimer {
+public:
+    explicit ScopedPhaseTimer(double* target_ms)
+        : target_ms_(target_ms) {
+        if (target_ms_) {
+            start_ = std::chrono::steady_clock::now();
+        }
+    }
+
+    ~ScopedPhaseTimer() {
+        if (target_ms_) {
+            auto elapsed = std::chrono::steady_clock::now() - start_;
+            *target_ms_ += std::chrono::duration<double, std::milli>(elapsed).count();
+        }
+    }
+
+    ScopedPhaseTimer(const ScopedPhaseTimer&) = delete;
+    ScopedPhaseTimer& operator=(const ScopedPhaseTimer&) = delete;
+
+private:
+    double* target_ms_;
+    std::chrono::steady_clock::time_point start_;
+};
+
+/// Field pointer helper: `phase_ms(stats, &StepStats::pcg_ms)` is null when stats is null
+inline double* phase_ms(StepStats* stats, double StepStats::*field) {
+    return stats ? &(stats->*field) : nullptr;
+}
+
+} // namespace ando_barrier
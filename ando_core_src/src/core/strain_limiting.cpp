@@ -49,6 +49,16 @@ bool StrainLimiting::compute_svd(
     return std::isfinite(singular_values[0]) && std::isfinite(singular_values[1]);
 }
 
+Real StrainLimiting::sigma_max(const Mat32& F) {
+    // Eigenvalues of C = FᵀF are σ²; the larger one in closed form
+    Real a = F.col(0).squaredNorm();
+    Real b = F.col(0).dot(F.col(1));
+    Real d = F.col(1).squaredNorm();
+    Real half_diff = (a - d) * Real(0.5);
+    Real lambda_max = (a + d) * Real(0.5) + std::sqrt(half_diff * half_diff + b * b);
+    return std::sqrt(std::max(lambda_max, Real(0.0)));
+}
+
 StrainLimiting::Mat99 StrainLimiting::extract_face_hessian_block(
     const SparseMatrix& H,
     const Triangle& tri
@@ -56,34 +66,35 @@ StrainLimiting::Mat99 StrainLimiting::extract_face_hessian_block(
     Mat99 block = Mat99::Zero();
     std::array<Index, 3> verts = {tri.v[0], tri.v[1], tri.v[2]};
 
-    std::array<Index, 3> row_lookup = verts;
+    // Only the nine rows of the face's vertices can contribute
+    for (int local_row = 0; local_row < 3; ++local_row) {
+        bool repeated = false;
+        for (int i = 0; i < local_row; ++i) {
+            repeated = repeated || verts[i] == verts[local_row];
+        }
+        if (repeated || verts[local_row] < 0 ||
+            static_cast<Index>(verts[local_row] * 3 + 2) >= H.outerSize()) {
+            continue;
+        }
 
-    for (int outer = 0; outer < H.outerSize(); ++outer) {
-        for (SparseMatrix::InnerIterator it(H, outer); it; ++it) {
-            Index global_row = it.row() / 3;
-            Index global_col = it.col() / 3;
+        for (int row_component = 0; row_component < 3; ++row_component) {
+            Index row = verts[local_row] * 3 + row_component;
+            for (SparseMatrix::InnerIterator it(H, row); it; ++it) {
+                Index global_col = static_cast<Index>(it.col() / 3);
 
-            int local_row = -1;
-            int local_col = -1;
-            for (int i = 0; i < 3; ++i) {
-                if (row_lookup[i] == global_row) {
-                    local_row = i;
+                int local_col = -1;
+                for (int i = 0; i < 3; ++i) {
+                    if (verts[i] == global_col) {
+                        local_col = i;
+                    }
                 }
-                if (row_lookup[i] == global_col) {
-                    local_col = i;
+                if (local_col < 0) {
+                    continue;
                 }
-            }
 
-            if (local_row < 0 || local_col < 0) {
-                continue;
+                int col_component = static_cast<int>(it.col() % 3);
+                block(local_row * 3 + row_component, local_col * 3 + col_component) += it.value();
             }
-
-            int row_component = static_cast<int>(it.row() % 3);
-            int col_component = static_cast<int>(it.col() % 3);
-
-            int r = local_row * 3 + row_component;
-            int c = local_col * 3 + col_component;
-            block(r, c) += it.value();
         }
     }
 
@@ -110,6 +121,100 @@ Real StrainLimiting::to_fraction(Real value) {
     return value;
 }
 
+void StrainLimiting::refresh_active_set(
+    const Mesh& mesh,
+    const State& state,
+    StrainActiveSet& active_set
+) {
+    const size_t num_faces = mesh.num_triangles();
+    active_set.topology_version = mesh.topology_version();
+    active_set.reference_positions = state.positions;
+    active_set.sigma_ref.assign(num_faces, Real(0.0));
+    active_set.dm_inv_norm.assign(num_faces, Real(0.0));
+
+    for (size_t face = 0; face < num_faces; ++face) {
+        if (mesh.rest_areas[face] <= kTinyValue) {
+            continue; // Degenerate rest face, never constrained
+        }
+        const Triangle& tri = mesh.triangles[face];
+        const Mat2& Dm_inv = mesh.Dm_inv[face];
+        active_set.dm_inv_norm[face] = Dm_inv.norm();
+        active_set.sigma_ref[face] = sigma_max(compute_deformation_gradient(
+            state.positions[tri.v[0]],
+            state.positions[tri.v[1]],
+            state.positions[tri.v[2]],
+            Dm_inv
+        ));
+    }
+}
+
+void StrainLimiting::add_face_constraints(
+    const Mesh& mesh,
+    const State& state,
+    Index face,
+    Real tau,
+    Real epsilon,
+    Real min_gap,
+    const SparseMatrix& H_elastic,
+    Constraints& constraints
+) {
+    const Triangle& tri = mesh.triangles[face];
+    const Mat2& Dm_inv = mesh.Dm_inv[face];
+
+    Mat32 F = compute_deformation_gradient(
+        state.positions[tri.v[0]],
+        state.positions[tri.v[1]],
+        state.positions[tri.v[2]],
+        Dm_inv
+    );
+
+    Eigen::Matrix<Real, 3, 2> U;
+    Vec2 sigma;
+    Mat2 V;
+    if (!compute_svd(F, U, sigma, V)) {
+        return;
+    }
+
+    // Barrier domain is g <= ε, i.e. σ >= 1 + τ; σ₀ is the larger value
+    if (!Barrier::in_domain((Real(1.0) + tau + epsilon) - sigma[0], epsilon)) {
+        return;
+    }
+
+    Real face_mass = mesh.face_masses()[face];
+
+    Vec9 w_r = build_relative_direction(
+        state.positions[tri.v[0]],
+        state.positions[tri.v[1]],
+        state.positions[tri.v[2]]
+    );
+
+    Mat99 H_block = extract_face_hessian_block(H_elastic, tri);
+    Mat99 H_sym = (H_block + H_block.transpose()) * Real(0.5);
+    Real elastic_term = w_r.dot(H_sym * w_r);
+    elastic_term = std::max(elastic_term, Real(0.0));
+
+    for (int s = 0; s < 2; ++s) {
+        Real sigma_val = sigma[s];
+        Real gap = (Real(1.0) + tau + epsilon) - sigma_val;
+        if (!Barrier::in_domain(gap, epsilon)) {
+            continue;
+        }
+
+        Real gap_clamped = std::max(std::abs(gap), min_gap);
+        Real inertial_term = face_mass / (gap_clamped * gap_clamped);
+        Real stiffness = inertial_term + elastic_term;
+
+        StrainConstraint constraint;
+        constraint.face_idx = face;
+        constraint.sigma = sigma_val;
+        constraint.singular_index = s;
+        constraint.stiffness = stiffness;
+        constraint.active = true;
+
+        constraints.strain_limits.push_back(constraint);
+    }
+}
+
 void StrainLimiting::rebuild_constraints(
     const Mesh& mesh,
     const State& state,
@@ -132,63 +237,64 @@ void StrainLimiting::rebuild_constraints(
     }
 
     const Real min_gap = std::max(params.min_gap, Real(1e-8));
+    const size_t num_faces = mesh.num_triangles();
 
-    for (size_t face = 0; face < mesh.num_triangles(); ++face) {
-        const Triangle& tri = mesh.triangles[face];
-        const Mat2& Dm_inv = mesh.Dm_inv[face];
-
-        if (mesh.rest_areas[face] <= kTinyValue) {
-            continue; // Degenerate rest face
-        }
-
-        Mat32 F = compute_deformation_gradient(
-            state.positions[tri.v[0]],
-            state.positions[tri.v[1]],
-            state.positions[tri.v[2]],
-            Dm_inv
-        );
-
-        Eigen::Matrix<Real, 3, 2> U;
-        Vec2 sigma;
-        Mat2 V;
-        if (!compute_svd(F, U, sigma, V)) {
-            continue;
+    if (!params.strain_active_set) {
+        for (size_t face = 0; face < num_faces; ++face) {
+            if (mesh.rest_areas[face] <= kTinyValue) {
+                continue; // Degenerate rest face
+            }
+            add_face_constraints(mesh, state, static_cast<Index>(face), tau, epsilon, min_gap,
+                                 H_elastic, constraints);
         }
+        return;
+    }
 
-        Real face_mass = mesh.rest_areas[face] *
-            mesh.material.thickness * mesh.material.density;
-
-        Vec9 w_r = build_relative_direction(
-            state.positions[tri.v[0]],
-            state.positions[tri.v[1]],
-            state.positions[tri.v[2]]
-        );
+    StrainActiveSet& active_set = constraints.strain_active_set;
+    if (!active_set.valid() ||
+        active_set.topology_version != mesh.topology_version() ||
+        active_set.sigma_ref.size() != num_faces ||
+        active_set.reference_positions.size() != state.positions.size()) {
+        refresh_active_set(mesh, state, active_set);
+    }
 
-        Mat99 H_block = extract_face_hessian_block(H_elastic, tri);
-        Mat99 H_sym = (H_block + H_block.transpose()) * Real(0.5);
-        Real elastic_term = w_r.dot(H_sym * w_r);
-        elastic_term = std::max(elastic_term, Real(0.0));
+    // σ_max(F + ΔF) <= σ_max(F) + ‖ΔDs‖_F ‖Dm⁻¹‖_F, with each ΔDs column
+    // bounded by the endpoint displacements since the reference positions
+    std::vector<Real> displacement(state.positions.size());
+    for (size_t v = 0; v < displacement.size(); ++v) {
+        displacement[v] = (state.positions[v] - active_set.reference_positions[v]).norm();
+    }
 
-        for (int s = 0; s < 2; ++s) {
-            Real sigma_val = sigma[s];
-            Real gap = (Real(1.0) + tau + epsilon) - sigma_val;
-            if (!Barrier::in_domain(gap, epsilon)) {
+    const Real sigma_limit = Real(1.0) + tau;
+    auto collect_candidates = [&]() {
+        active_set.candidates.clear();
+        for (size_t face = 0; face < num_faces; ++face) {
+            if (mesh.rest_areas[face] <= kTinyValue) {
                 continue;
             }
-
-            Real gap_clamped = std::max(std::abs(gap), min_gap);
-            Real inertial_term = face_mass / (gap_clamped * gap_clamped);
-            Real stiffness = inertial_term + elastic_term;
-
-            StrainConstraint constraint;
-            constraint.face_idx = static_cast<Index>(face);
-            constraint.sigma = sigma_val;
-            constraint.singular_index = s;
-            constraint.stiffness = stiffness;
-            constraint.active = true;
-
-            constraints.strain_limits.push_back(constraint);
+            const Triangle& tri = mesh.triangles[face];
+            Real d0 = displacement[tri.v[0]];
+            Real d1 = displacement[tri.v[1]];
+            Real d2 = displacement[tri.v[2]];
+            Real ds_bound = std::sqrt((d0 + d1) * (d0 + d1) + (d0 + d2) * (d0 + d2));
+            Real upper = active_set.sigma_ref[face] + active_set.dm_inv_norm[face] * ds_bound;
+            if (upper >= sigma_limit) {
+                active_set.candidates.push_back(static_cast<Index>(face));
+            }
         }
+    };
+    collect_candidates();
+
+    // Motion has loosened the bound for too many faces: re-reference and retry
+    if (static_cast<Real>(active_set.candidates.size()) >
+        kActiveSetRefreshFraction * static_cast<Real>(num_faces)) {
+        refresh_active_set(mesh, state, active_set);
+        std::fill(displacement.begin(), displacement.end(), Real(0.0));
+        collect_candidates();
+    }
+
+    for (Index face : active_set.candidates) {
+        add_face_constraints(mesh, state, face, tau, epsilon, min_gap, H_elastic, constraints);
     }
 }
 
@@ -22,6 +22,11 @@ class StrainLimiting {
 public:
     /**
      * Rebuild the set of active strain constraints for the current state.
+     *
+     * With params.strain_active_set, faces whose σ_max upper bound (reference
+     * σ_max plus a displacement-based Lipschitz term) stays below 1 + τ are
+     * skipped without computing F or an SVD. The bookkeeping lives in
+     * constraints.strain_active_set and is refreshed when the bound gets loose.
      */
     static void rebuild_constraints(
         const Mesh& mesh,
@@ -56,6 +61,9 @@ public:
 private:
     static constexpr Real kDegenerateThreshold = static_cast<Real>(1e-6);
 
+    // Re-reference the active set once this fraction of faces needs an exact check
+    static constexpr Real kActiveSetRefreshFraction = static_cast<Real>(0.25);
+
     using Mat32 = Eigen::Matrix<Real, 3, 2>;
     using Vec9 = Eigen::Matrix<Real, 9, 1>;
     using Mat99 = Eigen::Matrix<Real, 9, 9>;
@@ -74,6 +82,26 @@ private:
         Mat2& V
     );
 
+    // Largest singular value of a 3×2 F from the closed-form 2×2 FᵀF eigenvalue
+    static Real sigma_max(const Mat32& F);
+
+    static void refresh_active_set(
+        const Mesh& mesh,
+        const State& state,
+        StrainActiveSet& active_set
+    );
+
+    static void add_face_constraints(
+        const Mesh& mesh,
+        const State& state,
+        Index face,
+        Real tau,
+        Real epsilon,
+        Real min_gap,
+        const SparseMatrix& H_elastic,
+        Constraints& constraints
+    );
+
     static Mat99 extract_face_hessian_block(
         const SparseMatrix& H,
         const Triangle& tri
@@ -69,6 +69,7 @@ struct SimParams {
     // PCG parameters
     Real pcg_tol = 1e-3;            // Relative L∞ tolerance
     int pcg_max_iters = 1000;
+    bool pcg_mixed_precision = false; // Real SpMV, HostScalar vectors/dots/α/β
 
     // Contact parameters
     Real contact_gap_max = 0.001;   // ḡ = 1 mm default
@@ -93,6 +94,13 @@ struct SimParams {
     Real strain_tau = 0.05;         // τ = strain_limit
     Real strain_epsilon = 0.0;      // ε (will be computed)
     Real strain_svd_epsilon = 1e-6; // SVD regularization threshold
+    bool strain_active_set = true;  // Only run SVDs for faces whose σ_max bound reaches 1 + τ
+
+    // Island sleeping (optional): settled islands leave the solve until a
+    // contact with a moving body or a pin change wakes them
+    bool enable_sleeping = false;
+    Real sleep_energy_threshold = 1e-6; // Island kinetic energy per unit mass (J/kg)
+    int sleep_steps = 10;               // Consecutive quiet steps before sleeping
 
     // Numerical safeguards
     Real hessian_epsilon = 1e-8;    // For SPD enforcement
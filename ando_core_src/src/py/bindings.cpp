@@ -20,10 +20,72 @@
 #include "collision_validator.h"
 #include "adaptive_timestep.h"
 #include "rigid_body.h"
+#include "step_stats.h"
+#include "parallel.h"
 
 namespace py = pybind11;
 using namespace ando_barrier;
 
+namespace {
+
+// Parse an (N, 3) array-like of vertex positions
+std::vector<Vec3> vertices_from_array(py::object vertices_obj) {
+    auto vertices = py::array_t<Real, py::array::c_style | py::array::forcecast>::ensure(vertices_obj);
+    if (!vertices || vertices.ndim() != 2 || vertices.shape(1) != 3) {
+        throw py::value_error("vertices must be an array of shape (N, 3)");
+    }
+
+    std::vector<Vec3> verts;
+    verts.reserve(vertices.shape(0));
+    auto verts_arr = vertices.unchecked<2>();
+    for (py::ssize_t i = 0; i < verts_arr.shape(0); ++i) {
+        verts.emplace_back(verts_arr(i, 0), verts_arr(i, 1), verts_arr(i, 2));
+    }
+    return verts;
+}
+
+// Parse a flat or (M, 3) array-like of triangle indices
+std::vector<Triangle> triangles_from_array(py::object triangles_obj) {
+    py::array triangles_array = py::array::ensure(triangles_obj);
+    if (!triangles_array) {
+        throw py::value_error("triangles must be array-like");
+    }
+
+    py::array reshaped;
+    if (triangles_array.ndim() == 1) {
+        if (triangles_array.shape(0) % 3 != 0) {
+            throw py::value_error("triangles must contain a multiple of 3 indices");
+        }
+        const py::array::ShapeContainer shape{
+            triangles_array.shape(0) / 3,
+            static_cast<py::ssize_t>(3)
+        };
+        reshaped = triangles_array.reshape(shape);
+    } else if (triangles_array.ndim() == 2) {
+        if (triangles_array.shape(1) != 3) {
+            throw py::value_error("triangles must have shape (M, 3)");
+        }
+        reshaped = triangles_array;
+    } else {
+        throw py::value_error("triangles must be a 1D or 2D array");
+    }
+
+    auto triangles = py::array_t<int32_t, py::array::c_style | py::array::forcecast>::ensure(reshaped);
+    if (!triangles) {
+        throw py::value_error("triangles must be convertible to int32");
+    }
+
+    std::vector<Triangle> tris;
+    tris.reserve(triangles.shape(0));
+    auto tris_arr = triangles.unchecked<2>();
+    for (py::ssize_t i = 0; i < tris_arr.shape(0); ++i) {
+        tris.emplace_back(Index(tris_arr(i, 0)), Index(tris_arr(i, 1)), Index(tris_arr(i, 2)));
+    }
+    return tris;
+}
+
+} // namespace
+
 PYBIND11_MODULE(ando_barrier_core, m) {
     m.doc() = "Ando 2024 Cubic Barrier with Elasticity-Inclusive Dynamic Stiffness";
     
@@ -34,6 +96,12 @@ PYBIND11_MODULE(ando_barrier_core, m) {
                std::to_string(VERSION_MINOR) + "." +
                std::to_string(VERSION_PATCH);
     }, "Get version string");
+
+    // Worker threads for the parallel collision narrow phase
+    m.def("set_num_threads", &parallel::set_worker_count, py::arg("count"),
+          "Set collision worker thread count (<= 0 restores ANDO_NUM_THREADS/OMP_NUM_THREADS/hardware default)");
+    m.def("get_num_threads", &parallel::worker_count,
+          "Get the collision worker thread count currently in effect");
     
     // Material class
     py::class_<Material>(m, "Material")
@@ -74,6 +142,7 @@ PYBIND11_MODULE(ando_barrier_core, m) {
         .def_readwrite("max_newton_steps", &SimParams::max_newton_steps)
         .def_readwrite("pcg_tol", &SimParams::pcg_tol)
         .def_readwrite("pcg_max_iters", &SimParams::pcg_max_iters)
+        .def_readwrite("pcg_mixed_precision", &SimParams::pcg_mixed_precision)
         .def_readwrite("contact_gap_max", &SimParams::contact_gap_max)
         .def_readwrite("wall_gap", &SimParams::wall_gap)
         .def_readwrite("enable_ccd", &SimParams::enable_ccd)
@@ -84,7 +153,11 @@ PYBIND11_MODULE(ando_barrier_core, m) {
         .def_readwrite("contact_restitution", &SimParams::contact_restitution)
         .def_readwrite("enable_strain_limiting", &SimParams::enable_strain_limiting)
         .def_readwrite("strain_limit", &SimParams::strain_limit)
-        .def_readwrite("strain_tau", &SimParams::strain_tau);
+        .def_readwrite("strain_tau", &SimParams::strain_tau)
+        .def_readwrite("strain_active_set", &SimParams::strain_active_set)
+        .def_readwrite("enable_sleeping", &SimParams::enable_sleeping)
+        .def_readwrite("sleep_energy_threshold", &SimParams::sleep_energy_threshold)
+        .def_readwrite("sleep_steps", &SimParams::sleep_steps);
     
     // Triangle class
     py::class_<Triangle>(m, "Triangle")
@@ -100,59 +173,50 @@ PYBIND11_MODULE(ando_barrier_core, m) {
     py::class_<Mesh>(m, "Mesh")
         .def(py::init<>())
         .def("initialize", [](Mesh& mesh, py::object vertices_obj, py::object triangles_obj, const Material& mat) {
-            auto vertices = py::array_t<Real, py::array::c_style | py::array::forcecast>::ensure(vertices_obj);
-            if (!vertices || vertices.ndim() != 2 || vertices.shape(1) != 3) {
-                throw py::value_error("vertices must be an array of shape (N, 3)");
-            }
-
-            std::vector<Vec3> verts;
-            verts.reserve(vertices.shape(0));
-            auto verts_arr = vertices.unchecked<2>();
-            for (py::ssize_t i = 0; i < verts_arr.shape(0); ++i) {
-                verts.emplace_back(verts_arr(i, 0), verts_arr(i, 1), verts_arr(i, 2));
-            }
-
-            py::array triangles_array = py::array::ensure(triangles_obj);
-            if (!triangles_array) {
-                throw py::value_error("triangles must be array-like");
-            }
-
-            py::array reshaped;
-            if (triangles_array.ndim() == 1) {
-                if (triangles_array.shape(0) % 3 != 0) {
-                    throw py::value_error("triangles must contain a multiple of 3 indices");
-                }
-                const py::array::ShapeContainer shape{
-                    triangles_array.shape(0) / 3,
-                    static_cast<py::ssize_t>(3)
-                };
-                reshaped = triangles_array.reshape(shape);
-            } else if (triangles_array.ndim() == 2) {
-                if (triangles_array.shape(1) != 3) {
-                    throw py::value_error("triangles must have shape (M, 3)");
-                }
-                reshaped = triangles_array;
-            } else {
-                throw py::value_error("triangles must be a 1D or 2D array");
-            }
-
-            auto triangles = py::array_t<int32_t, py::array::c_style | py::array::forcecast>::ensure(reshaped);
-            if (!triangles) {
-                throw py::value_error("triangles must be convertible to int32");
-            }
-
-            std::vector<Triangle> tris;
-            tris.reserve(triangles.shape(0));
-            auto tris_arr = triangles.unchecked<2>();
-            for (py::ssize_t i = 0; i < tris_arr.shape(0); ++i) {
-                tris.emplace_back(Index(tris_arr(i, 0)), Index(tris_arr(i, 1)), Index(tris_arr(i, 2)));
-            }
-
+            std::vector<Vec3> verts = vertices_from_array(vertices_obj);
+            std::vector<Triangle> tris = triangles_from_array(triangles_obj);
             mesh.initialize(verts, tris, mat);
         }, py::arg("vertices"), py::arg("triangles"), py::arg("material"),
            "Initialize mesh from array-like vertex and triangle data")
+        .def("add_body", [](Mesh& mesh, py::object vertices_obj, py::object triangles_obj, const Material& mat) {
+            std::vector<Vec3> verts = vertices_from_array(vertices_obj);
+            std::vector<Triangle> tris = triangles_from_array(triangles_obj);
+            for (const Triangle& tri : tris) {
+                for (Index v : tri.v) {
+                    if (v < 0 || static_cast<size_t>(v) >= verts.size()) {
+                        throw py::value_error("triangle index out of range for this body");
+                    }
+                }
+            }
+            return mesh.add_body(verts, tris, mat);
+        }, py::arg("vertices"), py::arg("triangles"), py::arg("material"),
+           "Append a deformable body (triangles index its own vertices); returns the body index")
+        .def("num_bodies", &Mesh::num_bodies)
+        .def("get_body_ranges", [](const Mesh& mesh) {
+            py::list ranges;
+            for (const BodyRange& body : mesh.bodies) {
+                py::dict entry;
+                entry["vertex_offset"] = body.vertex_offset;
+                entry["vertex_count"] = body.vertex_count;
+                entry["face_offset"] = body.face_offset;
+                entry["face_count"] = body.face_count;
+                ranges.append(entry);
+            }
+            return ranges;
+        }, "Per-body vertex/face offsets and counts in packing order")
+        .def("body_of_vertex", &Mesh::body_of_vertex)
         .def("num_vertices", &Mesh::num_vertices)
         .def("num_triangles", &Mesh::num_triangles)
+        .def_property_readonly("topology_version", &Mesh::topology_version,
+            "Counter bumped whenever triangles or rest-state data are rebuilt")
+        .def("min_edge_length", &Mesh::min_edge_length,
+            "Shortest edge length (cached until topology or positions change)")
+        .def("get_lumped_masses", [](const Mesh& mesh) {
+            const std::vector<Real>& masses = mesh.lumped_masses();
+            py::array_t<Real> result(masses.size());
+            std::copy(masses.begin(), masses.end(), result.mutable_data());
+            return result;
+        }, "Per-vertex lumped masses (cached until topology or material change)")
         .def("get_vertices", [](const Mesh& mesh) {
             py::array_t<Real> result({mesh.num_vertices(), size_t(3)});
             auto r = result.mutable_unchecked<2>();
@@ -189,6 +253,7 @@ PYBIND11_MODULE(ando_barrier_core, m) {
                     mesh.vertices[i][1] = pos(i, 1);
                     mesh.vertices[i][2] = pos(i, 2);
                 }
+                mesh.invalidate_geometry();
             })
         .def_property("triangles",
             [](const Mesh& mesh) {
@@ -292,11 +357,7 @@ PYBIND11_MODULE(ando_barrier_core, m) {
             }
 
             auto g = gravity.unchecked<1>();
-            Vec3 grav(g(0), g(1), g(2));
-            for (size_t i = 0; i < state.num_vertices(); ++i) {
-                state.velocities[i] += grav * dt;
-                state.positions[i] += state.velocities[i] * dt;
-            }
+            state.apply_gravity(Vec3(g(0), g(1), g(2)), dt);
         }, "Apply gravity acceleration to all vertices");
     
     // Constraints class
@@ -322,6 +383,8 @@ PYBIND11_MODULE(ando_barrier_core, m) {
         .def("num_active_contacts", [](const Constraints& c) {
             return c.num_active_contacts() + c.num_active_walls();
         })
+        .def("wake_all", [](Constraints& c) { c.island_sleep.reset(); },
+             "Wake every sleeping island (e.g. after editing velocities directly)")
         .def_property_readonly("_pins", [](const Constraints& c) {
             py::dict result;
             for (const auto& pin : c.pins) {
@@ -430,8 +493,9 @@ PYBIND11_MODULE(ando_barrier_core, m) {
                 grad(i) = grad_vec(i);
             }
         }, "Compute elastic gradient (forces)")
-        .def_static("compute_hessian", &Elasticity::compute_hessian,
-             "Compute elastic Hessian (explicit assembly)");
+        .def_static("compute_hessian", [](const Mesh& mesh, const State& state, std::vector<Triplet>& triplets) {
+            Elasticity::compute_hessian(mesh, state, triplets);
+        }, "Compute elastic Hessian (explicit assembly)");
     
     // Barrier energy functions
     m.def("barrier_energy", &Barrier::compute_energy, 
@@ -463,13 +527,71 @@ PYBIND11_MODULE(ando_barrier_core, m) {
         },
         "Create mesh from numpy arrays (vertices Nx3, triangles Mx3)");
     
+    // StepStats struct (per-phase profiling for Integrator.step)
+    py::class_<StepStats>(m, "StepStats")
+        .def(py::init<>())
+        .def_readonly("total_ms", &StepStats::total_ms)
+        .def_readonly("collision_ms", &StepStats::collision_ms)
+        .def_readonly("bvh_build_ms", &StepStats::bvh_build_ms)
+        .def_readonly("gradient_ms", &StepStats::gradient_ms)
+        .def_readonly("hessian_ms", &StepStats::hessian_ms)
+        .def_readonly("pcg_ms", &StepStats::pcg_ms)
+        .def_readonly("line_search_ms", &StepStats::line_search_ms)
+        .def_readonly("strain_limit_ms", &StepStats::strain_limit_ms)
+        .def_readonly("rigid_coupling_ms", &StepStats::rigid_coupling_ms)
+        .def_readonly("restitution_ms", &StepStats::restitution_ms)
+        .def_readonly("beta_iterations", &StepStats::beta_iterations)
+        .def_readonly("newton_iterations", &StepStats::newton_iterations)
+        .def_readonly("pcg_solves", &StepStats::pcg_solves)
+        .def_readonly("pcg_iterations", &StepStats::pcg_iterations)
+        .def_readonly("pcg_failures", &StepStats::pcg_failures)
+        .def_readonly("line_search_calls", &StepStats::line_search_calls)
+        .def_readonly("line_search_halvings", &StepStats::line_search_halvings)
+        .def_readonly("collision_calls", &StepStats::collision_calls)
+        .def_readonly("contacts_found", &StepStats::contacts_found)
+        .def_readonly("strain_limit_rebuilds", &StepStats::strain_limit_rebuilds)
+        .def_readonly("islands", &StepStats::islands)
+        .def_readonly("sleeping_vertices", &StepStats::sleeping_vertices)
+        .def_readonly("beta_reached", &StepStats::beta_reached)
+        .def_readonly("min_alpha", &StepStats::min_alpha)
+        .def("reset", &StepStats::reset)
+        .def("as_dict", [](const StepStats& s) {
+            py::dict d;
+            d["total_ms"] = s.total_ms;
+            d["collision_ms"] = s.collision_ms;
+            d["bvh_build_ms"] = s.bvh_build_ms;
+            d["gradient_ms"] = s.gradient_ms;
+            d["hessian_ms"] = s.hessian_ms;
+            d["pcg_ms"] = s.pcg_ms;
+            d["line_search_ms"] = s.line_search_ms;
+            d["strain_limit_ms"] = s.strain_limit_ms;
+            d["rigid_coupling_ms"] = s.rigid_coupling_ms;
+            d["restitution_ms"] = s.restitution_ms;
+            d["beta_iterations"] = s.beta_iterations;
+            d["newton_iterations"] = s.newton_iterations;
+            d["pcg_solves"] = s.pcg_solves;
+            d["pcg_iterations"] = s.pcg_iterations;
+            d["pcg_failures"] = s.pcg_failures;
+            d["line_search_calls"] = s.line_search_calls;
+            d["line_search_halvings"] = s.line_search_halvings;
+            d["collision_calls"] = s.collision_calls;
+            d["contacts_found"] = s.contacts_found;
+            d["strain_limit_rebuilds"] = s.strain_limit_rebuilds;
+            d["islands"] = s.islands;
+            d["sleeping_vertices"] = s.sleeping_vertices;
+            d["beta_reached"] = s.beta_reached;
+            d["min_alpha"] = s.min_alpha;
+            return d;
+        }, "Counters and phase times as a plain dict");
+
     // Integrator class (static methods for simulation)
     py::class_<Integrator>(m, "Integrator")
         .def(py::init<>())
         .def_static("step",
-            [](Mesh& mesh, State& state, Constraints& constraints, const SimParams& params, py::object rigid_list) {
+            [](Mesh& mesh, State& state, Constraints& constraints, const SimParams& params, py::object rigid_list,
+               StepStats* stats) {
                 if (rigid_list.is_none()) {
-                    Integrator::step(mesh, state, constraints, params, nullptr);
+                    Integrator::step(mesh, state, constraints, params, nullptr, stats);
                     return;
                 }
 
@@ -484,14 +606,16 @@ PYBIND11_MODULE(ando_barrier_core, m) {
                     storage.push_back(body);
                 }
 
-                Integrator::step(mesh, state, constraints, params, &storage);
+                Integrator::step(mesh, state, constraints, params, &storage, stats);
 
                 for (size_t i = 0; i < handles.size(); ++i) {
                     *handles[i] = storage[i];
                 }
             },
             py::arg("mesh"), py::arg("state"), py::arg("constraints"), py::arg("params"), py::arg("rigid_bodies") = py::none(),
-            "Take one simulation step using Newton integrator with β accumulation")
+            py::arg("stats") = py::none(),
+            "Take one simulation step using Newton integrator with β accumulation "
+            "(pass a StepStats to receive per-phase timings and counters)")
         .def_static("compute_contacts",
             [](const Mesh& mesh, const State& state, py::object rigid_list) {
                 if (rigid_list.is_none()) {
@@ -630,5 +754,60 @@ PYBIND11_MODULE(ando_barrier_core, m) {
         .def_static("compute_max_velocity",
             &AdaptiveTimestep::compute_max_velocity,
             py::arg("velocities"),
-            "Compute maximum velocity magnitude");
+            "Compute maximum velocity magnitude")
+        .def_static("convergence_scale",
+            [](const StepStats& stats, const SimParams& params) {
+                bool reject = false;
+                const Real scale = AdaptiveTimestep::convergence_scale(stats, params, &reject);
+                return py::make_tuple(scale, reject);
+            },
+            py::arg("stats"), py::arg("params"),
+            "Rate a finished step's solve; returns (dt scale, reject)")
+        .def_static("advance",
+            [](Mesh& mesh, State& state, Constraints& constraints, const SimParams& params,
+               double duration, py::object gravity_obj, double dt_min, double dt_max, double safety,
+               py::object rigid_list, StepStats* stats) {
+                auto gravity = py::array_t<Real, py::array::forcecast>::ensure(gravity_obj);
+                if (!gravity || gravity.ndim() != 1 || gravity.shape(0) != 3) {
+                    throw py::value_error("Gravity must be a 3D vector");
+                }
+                auto g = gravity.unchecked<1>();
+                const Vec3 grav(g(0), g(1), g(2));
+
+                std::vector<RigidBody*> handles;
+                std::vector<RigidBody> storage;
+                if (!rigid_list.is_none()) {
+                    handles.reserve(py::len(rigid_list));
+                    storage.reserve(py::len(rigid_list));
+                    for (auto item : rigid_list) {
+                        RigidBody& body = item.cast<RigidBody&>();
+                        handles.push_back(&body);
+                        storage.push_back(body);
+                    }
+                }
+
+                AdaptiveAdvanceReport report = AdaptiveTimestep::advance(
+                    mesh, state, constraints, params,
+                    static_cast<Real>(duration), grav,
+                    static_cast<Real>(dt_min), static_cast<Real>(dt_max), static_cast<Real>(safety),
+                    rigid_list.is_none() ? nullptr : &storage, stats);
+
+                for (size_t i = 0; i < handles.size(); ++i) {
+                    *handles[i] = storage[i];
+                }
+
+                py::dict d;
+                d["steps"] = report.steps;
+                d["rejected"] = report.rejected;
+                d["smallest_dt"] = report.smallest_dt;
+                d["largest_dt"] = report.largest_dt;
+                d["elapsed"] = report.elapsed;
+                d["next_dt"] = report.next_dt;
+                d["failed"] = report.failed;
+                return d;
+            },
+            py::arg("mesh"), py::arg("state"), py::arg("constraints"), py::arg("params"),
+            py::arg("duration"), py::arg("gravity"), py::arg("dt_min"), py::arg("dt_max"),
+            py::arg("safety") = 0.5, py::arg("rigid_bodies") = py::none(), py::arg("stats") = nullptr,
+            "Integrate exactly `duration` seconds with convergence-controlled substeps and rollback");
 }
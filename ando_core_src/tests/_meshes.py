@@ -0,0 +1,54 @@
+"""Grid sheets and skip markers shared by the compiled-core tests.
+
+The pure-Python fallback implements none of the solver features these tests
+cover, so each module skips itself through :func:`requires_core` when the
+loaded core lacks the feature.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, "build")
+
+import ando_barrier_core as abc  # type: ignore  # noqa: E402  # pylint: disable=import-error,wrong-import-position
+
+
+def requires_core(available: bool, feature: str) -> pytest.MarkDecorator:
+    """Module-level ``pytestmark`` skipping unless the core provides ``feature``."""
+
+    return pytest.mark.skipif(not available, reason=f"core module built without {feature}")
+
+
+def sheet(resolution: int, z: float, offset: float = 0.0, size: float = 0.3):
+    """Square grid of ``resolution``² vertices at height ``z``, shifted by ``offset`` in x and y.
+
+    Returns ``(vertices[N, 3] float32, triangles[M, 3] int32)``.
+    """
+
+    xs = np.linspace(0.0, size, resolution)
+    vertices = np.array([[x + offset, y + offset, z] for y in xs for x in xs], dtype=np.float32)
+    triangles = []
+    for j in range(resolution - 1):
+        for i in range(resolution - 1):
+            v0 = j * resolution + i
+            triangles.append([v0, v0 + 1, v0 + resolution])
+            triangles.append([v0 + 1, v0 + resolution + 1, v0 + resolution])
+    return vertices, np.array(triangles, dtype=np.int32)
+
+
+def sheet_mesh(resolution: int, z: float, size: float = 0.3, material: "abc.Material | None" = None):
+    """One-body ``Mesh`` of :func:`sheet` with an initialized ``State``.
+
+    Returns ``(mesh, state, vertices)``.
+    """
+
+    vertices, triangles = sheet(resolution, z, size=size)
+    mesh = abc.Mesh()
+    mesh.initialize(vertices, triangles, material if material is not None else abc.Material())
+    state = abc.State()
+    state.initialize(mesh)
+    return mesh, state, vertices
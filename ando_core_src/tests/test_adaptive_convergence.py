@@ -0,0 +1,87 @@
+"""Convergence-driven substepping in ``AdaptiveTimestep.advance``."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from _meshes import abc, requires_core, sheet_mesh
+
+pytestmark = requires_core(hasattr(abc.AdaptiveTimestep, "advance"), "convergence-driven substepping")
+
+GRAVITY = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+FRAME = 1.0 / 24.0
+
+
+def _sheet(resolution: int = 8, youngs_modulus: float = 1e5):
+    mesh, state, _vertices = sheet_mesh(resolution, 0.2, size=0.5, material=abc.Material(youngs_modulus=youngs_modulus))
+    return mesh, state
+
+
+def test_untouched_step_stats_are_rejected() -> None:
+    scale, reject = abc.AdaptiveTimestep.convergence_scale(abc.StepStats(), abc.SimParams())
+    assert reject
+    assert scale < 1.0
+
+
+def test_calm_fall_grows_dt_and_lands_on_frame_boundary() -> None:
+    mesh, state = _sheet()
+    constraints = abc.Constraints()
+    params = abc.SimParams()
+    params.dt = 0.001
+    stats = abc.StepStats()
+
+    report = abc.AdaptiveTimestep.advance(mesh, state, constraints, params, FRAME, GRAVITY,
+                                          0.001, 0.02, stats=stats)
+
+    assert report["elapsed"] == pytest.approx(FRAME, rel=1e-6)
+    assert report["rejected"] == 0
+    assert not report["failed"]
+    assert report["next_dt"] > params.dt
+    assert 0.001 <= report["smallest_dt"] <= report["largest_dt"] <= 0.02
+    scale, reject = abc.AdaptiveTimestep.convergence_scale(stats, params)
+    assert not reject and scale > 1.0
+
+
+def test_impact_rolls_back_and_keeps_sheet_above_floor() -> None:
+    """Large steps into a floor are rejected, retried smaller, and never tunnel."""
+
+    mesh, state = _sheet()
+    constraints = abc.Constraints()
+    constraints.add_wall(np.array([0.0, 0.0, 1.0], dtype=np.float32), 0.0, 0.001)
+    params = abc.SimParams()
+    params.dt = 0.02
+
+    rejected = 0
+    for _ in range(8):
+        report = abc.AdaptiveTimestep.advance(mesh, state, constraints, params, FRAME, GRAVITY,
+                                              0.0005, 0.04)
+        assert report["elapsed"] == pytest.approx(FRAME, rel=1e-6)
+        params.dt = report["next_dt"]
+        rejected += report["rejected"]
+
+    assert rejected > 0
+    positions = state.get_positions()
+    assert np.isfinite(positions).all()
+    assert positions[:, 2].min() > 0.0
+
+
+def test_non_finite_step_at_dt_min_rolls_back_and_fails() -> None:
+    """A blow-up with no smaller dt left is rolled back and reported, not accepted."""
+
+    mesh, state = _sheet(resolution=4, youngs_modulus=1e38)
+    constraints = abc.Constraints()
+    params = abc.SimParams()
+    params.dt = 0.001
+    positions = state.get_positions().copy()
+    velocities = state.get_velocities().copy()
+
+    report = abc.AdaptiveTimestep.advance(mesh, state, constraints, params, FRAME, GRAVITY,
+                                          0.001, 0.001)
+
+    assert report["failed"]
+    assert report["steps"] == 0
+    assert report["rejected"] == 1
+    assert report["elapsed"] < FRAME
+    np.testing.assert_array_equal(state.get_positions(), positions)
+    np.testing.assert_array_equal(state.get_velocities(), velocities)
@@ -0,0 +1,90 @@
+#include "../src/core/line_search.h"
+#include <cassert>
+#include <iostream>
+#include <vector>
+
+using namespace ando_barrier;
+
+namespace {
+
+// Vertex 0 is a free point above the unit right triangle (1, 2, 3) in z = 0
+void initialize_point_and_triangle(Mesh& mesh, State& state, const Vec3& point) {
+    std::vector<Vec3> vertices = {
+        point,
+        Vec3(0.0, 0.0, 0.0),
+        Vec3(1.0, 0.0, 0.0),
+        Vec3(0.0, 1.0, 0.0)
+    };
+    std::vector<Triangle> triangles = {Triangle(1, 2, 3)};
+
+    Material material;
+    mesh.initialize(vertices, triangles, material);
+    state.initialize(mesh);
+}
+
+ContactPair point_triangle_contact() {
+    ContactPair contact;
+    contact.type = ContactType::POINT_TRIANGLE;
+    contact.idx0 = 0;
+    contact.idx1 = 1;
+    contact.idx2 = 2;
+    contact.idx3 = 3;
+    return contact;
+}
+
+// Largest feasible step when vertex 0 moves by `motion` (triangle fixed, no wall)
+Real search_point_motion(const Vec3& point, const Vec3& motion) {
+    Mesh mesh;
+    State state;
+    initialize_point_and_triangle(mesh, state, point);
+
+    VecX direction = VecX::Zero(12);
+    direction.segment<3>(0) = motion;
+    std::vector<ContactPair> contacts = {point_triangle_contact()};
+    std::vector<Pin> pins;
+    return LineSearch::search(mesh, state, direction, contacts, pins, Vec3::Zero(), 0.0);
+}
+
+void test_crossing_between_samples() {
+    std::cout << "Testing a point crossing the triangle between CCD samples..." << std::endl;
+
+    // With the 1.25 extension the full step crosses z = 0 at t = 0.42; the
+    // samples at t = 0.4 and 0.5 sit 2.5 cm above and 10 cm below the plane,
+    // so only the sign change between them reveals the crossing
+    const Real extension = 1.25;
+    Vec3 point(0.2, 0.2, 0.525);
+    Real alpha = search_point_motion(point, Vec3(0.0, 0.0, -1.0));
+    assert(point.z() - alpha * extension > 0.0);
+
+    std::cout << "  ✓ Crossing between samples passed" << std::endl;
+}
+
+void test_crossing_beside_triangle() {
+    std::cout << "Testing a plane crossing outside the triangle..." << std::endl;
+
+    // Passes through z = 0 at (0.8, 0.8), outside the triangle
+    Real alpha = search_point_motion(Vec3(0.8, 0.8, 0.525), Vec3(0.0, 0.0, -1.0));
+    assert(alpha == 1.0);
+
+    std::cout << "  ✓ Crossing beside triangle passed" << std::endl;
+}
+
+void test_one_sided_motion() {
+    std::cout << "Testing motion that stays above the triangle..." << std::endl;
+
+    Real alpha = search_point_motion(Vec3(0.2, 0.2, 0.5), Vec3(0.0, 0.0, -0.3));
+    assert(alpha == 1.0);
+
+    std::cout << "  ✓ One-sided motion passed" << std::endl;
+}
+
+} // namespace
+
+int main() {
+    std::cout << "\n========= CCD Tests =========\n" << std::endl;
+    test_crossing_between_samples();
+    test_crossing_beside_triangle();
+    test_one_sided_motion();
+    std::cout << "\n========= All CCD Tests Passed =========\n" << std::endl;
+    return 0;
+}
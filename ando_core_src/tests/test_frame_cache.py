@@ -0,0 +1,63 @@
+"""Binary frame cache used by the demos (``demos/frame_cache.py``)."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "demos"))
+
+from frame_cache import CACHE_FILENAME, FrameCache, has_frame_cache, write_frame_cache  # noqa: E402
+
+
+def _frames(num_frames: int = 12, resolution: int = 6):
+    xs = np.linspace(0.0, 1.0, resolution)
+    rest = np.array([[x, y, 0.0] for y in xs for x in xs], dtype=np.float32)
+    triangles = []
+    for j in range(resolution - 1):
+        for i in range(resolution - 1):
+            v0 = j * resolution + i
+            triangles.append([v0, v0 + 1, v0 + resolution])
+            triangles.append([v0 + 1, v0 + resolution + 1, v0 + resolution])
+    frames = [rest + np.array([0.0, 0.0, -0.05 * k * k], dtype=np.float32) for k in range(num_frames)]
+    return np.array(triangles, dtype=np.int32), frames
+
+
+def test_raw_cache_round_trip(tmp_path) -> None:
+    triangles, frames = _frames()
+    path = write_frame_cache(str(tmp_path), triangles, frames)
+
+    assert os.path.basename(path) == CACHE_FILENAME
+    assert has_frame_cache(str(tmp_path))
+    with FrameCache(str(tmp_path)) as cache:
+        assert len(cache) == len(frames)
+        np.testing.assert_array_equal(cache.triangles, triangles)
+        np.testing.assert_array_equal(cache[5], frames[5])
+        np.testing.assert_array_equal(cache[-1], frames[-1])
+        np.testing.assert_allclose(cache.bounds[0], np.min(frames, axis=(0, 1)))
+        with pytest.raises(IndexError):
+            cache[len(frames)]
+
+
+def test_quantized_cache_is_smaller_and_within_step(tmp_path) -> None:
+    """Offsets past the int16 range start a new keyframe instead of clipping."""
+
+    triangles, frames = _frames()
+    step = 1e-5
+    raw = write_frame_cache(str(tmp_path / "raw"), triangles, frames)
+    quantized = write_frame_cache(str(tmp_path / "q"), triangles, frames, quantize=step)
+
+    assert os.path.getsize(quantized) < os.path.getsize(raw)
+    with FrameCache(quantized) as cache:
+        assert cache.quantized
+        for expected, decoded in zip(frames, cache):
+            np.testing.assert_allclose(decoded, expected, atol=step)
+
+
+def test_rejects_mismatched_vertex_counts(tmp_path) -> None:
+    triangles, frames = _frames()
+    with pytest.raises(ValueError):
+        write_frame_cache(str(tmp_path), triangles, [frames[0], frames[1][:-1]])
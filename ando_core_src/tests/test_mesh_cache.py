@@ -0,0 +1,73 @@
+"""Topology-derived quantities cached on ``Mesh``.
+
+Only the compiled core exposes ``topology_version``; the pure-Python fallback
+keeps no derived data, so these tests skip there.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, "build")
+
+import ando_barrier_core as abc  # type: ignore  # pylint: disable=import-error
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(abc.Mesh(), "topology_version"), reason="core module built without mesh cache"
+)
+
+
+def _square(size: float = 0.1):
+    vertices = np.array(
+        [[0.0, 0.0, 0.0], [size, 0.0, 0.0], [size, size, 0.0], [0.0, size, 0.0]],
+        dtype=np.float32,
+    )
+    triangles = np.array([[0, 1, 2], [0, 2, 3]], dtype=np.int32)
+    mesh = abc.Mesh()
+    mesh.initialize(vertices, triangles, abc.Material())
+    return mesh
+
+
+def test_topology_version_bumps_on_rebuild() -> None:
+    """Replacing triangles rebuilds rest data and advances the version."""
+
+    mesh = _square()
+    version = mesh.topology_version
+    assert version >= 1
+
+    mesh.set_positions(mesh.get_vertices() * 2.0)
+    assert mesh.topology_version == version
+
+    mesh.triangles = np.array([[0, 1, 2]], dtype=np.int32)
+    assert mesh.topology_version == version + 1
+
+
+def test_min_edge_length_tracks_positions() -> None:
+    """Cached edge lengths are invalidated by position updates."""
+
+    mesh = _square(0.1)
+    assert mesh.min_edge_length() == pytest.approx(0.1)
+    assert abc.AdaptiveTimestep.compute_min_edge_length(mesh) == pytest.approx(0.1)
+
+    mesh.set_positions(mesh.get_vertices() * 0.5)
+    assert mesh.min_edge_length() == pytest.approx(0.05)
+
+    mesh.vertices = mesh.get_vertices() * 4.0
+    assert abc.AdaptiveTimestep.compute_min_edge_length(mesh) == pytest.approx(0.2)
+
+
+def test_lumped_masses_match_state() -> None:
+    """State masses come from the mesh cache and sum to the total sheet mass."""
+
+    mesh = _square(0.1)
+    masses = mesh.get_lumped_masses()
+    material = abc.Material()
+    expected_total = 0.01 * material.thickness * material.density
+    assert masses.sum() == pytest.approx(expected_total, rel=1e-5)
+
+    state = abc.State()
+    state.initialize(mesh)
+    np.testing.assert_allclose(state.get_masses(), masses, rtol=1e-6)
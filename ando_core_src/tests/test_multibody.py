@@ -0,0 +1,66 @@
+"""Several deformable bodies packed into one ``Mesh`` and solved together."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from _meshes import abc, requires_core, sheet
+
+pytestmark = requires_core(hasattr(abc.Mesh(), "add_body"), "multi-body meshes")
+
+
+def test_body_ranges_and_materials() -> None:
+    """Bodies get contiguous slices and their own density."""
+
+    resolution = 5
+    mesh = abc.Mesh()
+    first = mesh.add_body(*sheet(resolution, 0.0), abc.Material(density=1000.0))
+    second = mesh.add_body(*sheet(resolution, 0.1), abc.Material(density=250.0))
+
+    count = resolution * resolution
+    assert (first, second) == (0, 1)
+    assert mesh.num_bodies() == 2
+    ranges = mesh.get_body_ranges()
+    assert ranges[1]["vertex_offset"] == count
+    assert ranges[1]["face_offset"] == ranges[0]["face_count"]
+    assert mesh.body_of_vertex(count - 1) == 0
+    assert mesh.body_of_vertex(count) == 1
+
+    state = abc.State()
+    state.initialize(mesh)
+    masses = state.get_masses()
+    assert masses[count:].sum() == pytest.approx(0.25 * masses[:count].sum(), rel=1e-5)
+
+
+def test_add_body_rejects_out_of_range_indices() -> None:
+    vertices, triangles = sheet(3, 0.0)
+    mesh = abc.Mesh()
+    with pytest.raises(ValueError):
+        mesh.add_body(vertices, triangles + len(vertices), abc.Material())
+
+
+def test_bodies_collide_instead_of_passing_through() -> None:
+    """A sheet thrown at another stays on its side of it."""
+
+    resolution = 8
+    mesh = abc.Mesh()
+    mesh.add_body(*sheet(resolution, 0.0), abc.Material())
+    mesh.add_body(*sheet(resolution, 0.01, offset=0.013), abc.Material(density=500.0))
+    count = resolution * resolution
+
+    state = abc.State()
+    state.initialize(mesh)
+    velocities = np.zeros((2 * count, 3), dtype=np.float32)
+    velocities[count:, 2] = -3.0
+    state.set_velocities(velocities)
+
+    params = abc.SimParams()
+    params.dt = 0.004
+    params.contact_gap_max = 0.002
+    constraints = abc.Constraints()
+    for _ in range(10):
+        abc.Integrator.step(mesh, state, constraints, params)
+
+    positions = state.get_positions()
+    assert positions[count:, 2].mean() > positions[:count, 2].mean()
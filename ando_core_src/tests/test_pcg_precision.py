@@ -0,0 +1,44 @@
+"""Mixed-precision PCG (float SpMV, double accumulation)."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from _meshes import abc, requires_core, sheet_mesh
+
+pytestmark = requires_core(
+    hasattr(abc, "StepStats") and hasattr(abc.SimParams(), "pcg_mixed_precision"),
+    "mixed-precision PCG",
+)
+
+
+def _simulate(mixed: bool, steps: int = 10, resolution: int = 10):
+    mesh, state, vertices = sheet_mesh(resolution, 0.05)
+    constraints = abc.Constraints()
+    constraints.add_pin(0, vertices[0])
+    constraints.add_wall(np.array([0.0, 0.0, 1.0], dtype=np.float32), 0.0, 0.002)
+
+    params = abc.SimParams()
+    params.dt = 0.005
+    params.pcg_tol = 1e-5
+    params.pcg_mixed_precision = mixed
+
+    stats = abc.StepStats()
+    gravity = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+    failures = 0
+    for _ in range(steps):
+        state.apply_gravity(gravity, params.dt)
+        abc.Integrator.step(mesh, state, constraints, params, stats=stats)
+        failures += stats.pcg_failures
+    return state.get_positions(), failures
+
+
+def test_mixed_precision_tracks_float_solution() -> None:
+    """Both modes converge and land on the same trajectory within float noise."""
+
+    float_positions, _ = _simulate(False)
+    mixed_positions, mixed_failures = _simulate(True)
+
+    assert np.all(np.isfinite(mixed_positions))
+    assert mixed_failures == 0
+    np.testing.assert_allclose(mixed_positions, float_positions, atol=1e-4)
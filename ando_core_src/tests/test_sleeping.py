@@ -0,0 +1,91 @@
+"""Island sleeping must freeze settled regions and wake them on disturbance."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from _meshes import abc, requires_core, sheet
+
+pytestmark = requires_core(hasattr(abc.SimParams(), "enable_sleeping"), "island sleeping")
+
+GRAVITY = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+
+
+def _params() -> "abc.SimParams":
+    params = abc.SimParams()
+    params.dt = 0.004
+    params.enable_sleeping = True
+    params.sleep_steps = 5
+    return params
+
+
+def _floor() -> "abc.Constraints":
+    constraints = abc.Constraints()
+    constraints.add_wall(np.array([0.0, 0.0, 1.0], dtype=np.float32), 0.0, 0.001)
+    return constraints
+
+
+def _run(mesh, state, constraints, params, steps: int) -> "abc.StepStats":
+    stats = abc.StepStats()
+    for _ in range(steps):
+        state.apply_gravity(GRAVITY, params.dt)
+        abc.Integrator.step(mesh, state, constraints, params, stats=stats)
+    return stats
+
+
+def test_resting_sheet_falls_asleep_and_stays_put() -> None:
+    vertices, triangles = sheet(8, 0.005)
+    mesh = abc.Mesh()
+    mesh.initialize(vertices, triangles, abc.Material(youngs_modulus=1e5))
+    state = abc.State()
+    state.initialize(mesh)
+    constraints = _floor()
+    params = _params()
+
+    stats = _run(mesh, state, constraints, params, 80)
+    assert stats.sleeping_vertices == len(vertices)
+    assert stats.islands == 1
+
+    settled = state.get_positions().copy()
+    stats = _run(mesh, state, constraints, params, 10)
+    assert stats.sleeping_vertices == len(vertices)
+    np.testing.assert_array_equal(state.get_positions(), settled)
+    assert not np.any(state.get_velocities())
+
+
+def test_pin_change_wakes_island() -> None:
+    vertices, triangles = sheet(8, 0.005)
+    mesh = abc.Mesh()
+    mesh.initialize(vertices, triangles, abc.Material(youngs_modulus=1e5))
+    state = abc.State()
+    state.initialize(mesh)
+    constraints = _floor()
+    params = _params()
+
+    stats = _run(mesh, state, constraints, params, 80)
+    assert stats.sleeping_vertices == len(vertices)
+
+    constraints.add_pin(0, state.get_positions()[0] + np.array([0.0, 0.0, 0.05], dtype=np.float32))
+    stats = _run(mesh, state, constraints, params, 1)
+    assert stats.sleeping_vertices == 0
+
+
+@pytest.mark.skipif(not hasattr(abc.Mesh(), "add_body"), reason="core module built without multi-body meshes")
+def test_separate_islands_sleep_independently() -> None:
+    """A settled sheet sleeps while a falling one beside it stays awake."""
+
+    resolution = 6
+    mesh = abc.Mesh()
+    mesh.add_body(*sheet(resolution, 0.005), abc.Material(youngs_modulus=1e5))
+    mesh.add_body(*sheet(resolution, 1.0, offset=0.5), abc.Material(youngs_modulus=1e5))
+    count = resolution * resolution
+    state = abc.State()
+    state.initialize(mesh)
+    constraints = _floor()
+    params = _params()
+
+    stats = _run(mesh, state, constraints, params, 80)
+    assert stats.islands == 2
+    assert stats.sleeping_vertices == count
+    assert state.get_positions()[count:, 2].max() < 1.0
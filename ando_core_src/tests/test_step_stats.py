@@ -0,0 +1,60 @@
+"""Per-phase profiling counters returned by ``Integrator.step``."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from _meshes import abc, requires_core, sheet_mesh
+
+pytestmark = requires_core(hasattr(abc, "StepStats"), "StepStats")
+
+
+def _pinned_sheet(resolution: int = 6):
+    mesh, state, vertices = sheet_mesh(resolution, 0.1, size=0.2)
+
+    constraints = abc.Constraints()
+    constraints.add_pin(0, vertices[0])
+    constraints.add_wall(np.array([0.0, 0.0, 1.0], dtype=np.float32), 0.0, 0.002)
+
+    params = abc.SimParams()
+    params.dt = 0.005
+    return mesh, state, constraints, params
+
+
+def test_step_fills_phase_times_and_counters() -> None:
+    """A step with stats reports non-negative phase times that fit in the total."""
+
+    mesh, state, constraints, params = _pinned_sheet()
+    stats = abc.StepStats()
+
+    state.apply_gravity(np.array([0.0, 0.0, -9.81], dtype=np.float32), params.dt)
+    abc.Integrator.step(mesh, state, constraints, params, stats=stats)
+
+    assert stats.total_ms > 0.0
+    assert stats.collision_calls >= 1
+    assert 0.0 <= stats.bvh_build_ms <= stats.collision_ms
+    assert stats.newton_iterations >= 1
+    assert stats.pcg_solves == stats.line_search_calls
+    assert stats.pcg_iterations >= 0
+
+    phases = stats.gradient_ms + stats.hessian_ms + stats.pcg_ms + stats.line_search_ms
+    assert phases <= stats.total_ms + 1e-6
+
+    as_dict = stats.as_dict()
+    assert as_dict["newton_iterations"] == stats.newton_iterations
+    assert as_dict["total_ms"] == pytest.approx(stats.total_ms)
+
+
+def test_stats_reset_between_steps() -> None:
+    """Counters describe the latest step only, not a running total."""
+
+    mesh, state, constraints, params = _pinned_sheet()
+    stats = abc.StepStats()
+
+    abc.Integrator.step(mesh, state, constraints, params, stats=stats)
+    abc.Integrator.step(mesh, state, constraints, params, stats=stats)
+
+    # One detection pass per step; a running total would report two.
+    assert stats.collision_calls == 1
+    assert 1 <= stats.beta_iterations <= 20
@@ -70,6 +70,7 @@ def get_backend(ctx) -> str:
     return getattr(addon.preferences, "solver_backend", _BACKEND_PPF)
 
 
+from . import ppf_export
 from . import ui_unified
 
 from .ando import properties as ando_properties
@@ -104,6 +105,7 @@ def register():
     bpy.types.Object.andosim_artezbuild = bpy.props.PointerProperty(type=AndoSimArtezbuildObjectSettings)
 
     ui_unified.register()
+    ppf_export.register_update_tracking()
 
     # Register vendored AndoSim functionality under its original property names.
     ando_properties.register()
@@ -148,6 +150,10 @@ def unregister():
             pass
     _addon_keymaps.clear()
 
+    try:
+        ppf_export.unregister_update_tracking()
+    except Exception:
+        pass
     try:
         ui_unified.unregister()
     except Exception:
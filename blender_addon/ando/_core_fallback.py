@@ -44,6 +44,7 @@ class SimParams:
     max_newton_steps: int = 8
     pcg_tol: float = 1e-3
     pcg_max_iters: int = 1000
+    pcg_mixed_precision: bool = False
     contact_gap_max: float = 1e-3
     wall_gap: float = 1e-3
     enable_ccd: bool = True
@@ -55,6 +56,9 @@ class SimParams:
     enable_strain_limiting: bool = False
     strain_limit: float = 0.05
     strain_tau: float = 0.05
+    enable_sleeping: bool = False
+    sleep_energy_threshold: float = 1e-6
+    sleep_steps: int = 10
 
 
 class Mesh:
@@ -1,3 +1,5 @@
+import math
+
 import bpy
 from bpy.types import Operator
 import numpy as np
@@ -132,9 +134,57 @@ def _default_stats():
         'has_tunneling': False,
         'has_major_penetration': False,
         'num_rigid_bodies': 0,
+        # Per-step averages of the core's StepStats (phase times in ms, counters)
+        'step_profile': {},
     }
 
 
+def _accumulate_step_profile(profile, step_stats):
+    """Add one step's StepStats counters into ``profile`` (a plain dict)."""
+    for key, value in step_stats.as_dict().items():
+        profile[key] = profile.get(key, 0) + value
+
+
+def _record_dt_history(dt_seconds):
+    """Append a step size (stored in ms) to the bounded diagnostics history."""
+    history = _sim_state['stats'].setdefault('dt_history', [])
+    history.append(dt_seconds * 1000.0)
+    if len(history) > 100:
+        history.pop(0)
+
+
+# Bakes and real-time stepping advance the simulation at 24 fps
+_FRAME_DURATION = 1.0 / 24.0
+
+
+def _fixed_substeps(dt_ms):
+    """Return ``(steps, dt_seconds)`` tiling one frame exactly with steps no longer than ``dt_ms``."""
+    steps = max(1, int(math.ceil(_FRAME_DURATION / (dt_ms / 1000.0) - 1e-6)))
+    return steps, _FRAME_DURATION / steps
+
+
+def _use_convergence_substepping(abc, props):
+    """Adaptive Δt runs through ``AdaptiveTimestep.advance`` when the core provides it."""
+    return props.enable_adaptive_dt and hasattr(abc.AdaptiveTimestep, 'advance')
+
+
+def _advance_frame(abc, mesh, state, constraints, params, props, gravity, rigid_bodies, step_stats=None):
+    """Integrate one frame with convergence-controlled substeps.
+
+    Rejected substeps are rolled back inside the core. ``params.dt`` carries the
+    controller's proposal into the next frame. Returns the core's report dict;
+    ``report.get('failed')`` is set when a substep at dt_min went non-finite and
+    the state was left at the last finite substep.
+    """
+    report = abc.AdaptiveTimestep.advance(
+        mesh, state, constraints, params, _FRAME_DURATION, gravity,
+        props.dt_min / 1000.0, props.dt_max / 1000.0, props.cfl_safety_factor,
+        rigid_bodies or None, stats=step_stats,
+    )
+    params.dt = report['next_dt']
+    return report
+
+
 def _init_material_from_props(abc, props):
     """Initialize a Material object from Blender scene properties.
     
@@ -145,7 +195,19 @@ def _init_material_from_props(abc, props):
     Returns:
         Initialized Material object
     """
-    mat_props = props.material_properties
+    return _material_from_settings(abc, props.material_properties)
+
+
+def _init_body_material(abc, props, obj):
+    """Material for one deformable body: the object's own settings when it
+    opts in with ``use_object_material``, otherwise the scene material."""
+    body_props = getattr(obj, "ando_barrier_body", None)
+    if body_props and getattr(body_props, "use_object_material", False):
+        return _material_from_settings(abc, body_props.material_properties)
+    return _init_material_from_props(abc, props)
+
+
+def _material_from_settings(abc, mat_props):
     material = abc.Material()
     material.youngs_modulus = mat_props.youngs_modulus
     material.poisson_ratio = mat_props.poisson_ratio
@@ -171,6 +233,8 @@ def _init_params_from_props(abc, props):
     params.max_newton_steps = props.max_newton_steps
     params.pcg_tol = props.pcg_tol
     params.pcg_max_iters = props.pcg_max_iters
+    if hasattr(params, 'pcg_mixed_precision'):
+        params.pcg_mixed_precision = props.pcg_mixed_precision
     params.contact_gap_max = props.contact_gap_max
     params.wall_gap = props.wall_gap
     params.enable_ccd = props.enable_ccd
@@ -182,6 +246,10 @@ def _init_params_from_props(abc, props):
     params.enable_strain_limiting = props.enable_strain_limiting
     params.strain_limit = props.strain_limit
     params.strain_tau = props.strain_tau
+    if hasattr(params, 'enable_sleeping'):
+        params.enable_sleeping = props.enable_sleeping
+        params.sleep_energy_threshold = props.sleep_energy_threshold
+        params.sleep_steps = props.sleep_steps
     return params
 
 
@@ -252,6 +320,53 @@ def _collect_rigid_bodies(context, exclude_obj=None, reporter=None):
     return rigid_entries
 
 
+def _collect_deformable_bodies(context, active_obj, mesh_supports_bodies, reporter=None):
+    """Gather world-space triangle data for every deformable mesh in the bake.
+
+    The active object always comes first. Other meshes tagged as deformable
+    bodies join it when the core can pack several bodies into one ``Mesh``;
+    older cores only simulate the active object.
+    """
+
+    candidates = [active_obj]
+    if mesh_supports_bodies:
+        for obj in context.scene.objects:
+            if obj.type != 'MESH' or obj is active_obj:
+                continue
+            obj_props = getattr(obj, "ando_barrier_body", None)
+            if obj_props and obj_props.enabled and obj_props.role == 'DEFORMABLE':
+                candidates.append(obj)
+
+    bodies = []
+    for obj in candidates:
+        mesh_data = obj.data
+        # Ensure we have triangulated connectivity without modifying the source mesh.
+        mesh_data.calc_loop_triangles()
+        loop_tris = getattr(mesh_data, "loop_triangles", ())
+        if not loop_tris:
+            if reporter and obj is not active_obj:
+                reporter({'WARNING'}, f"Deformable body '{obj.name}' has no triangles; skipped")
+            if obj is active_obj:
+                return []
+            continue
+
+        matrix_world = obj.matrix_world.copy()
+        polygon_sides = Counter(len(poly.vertices) for poly in mesh_data.polygons)
+        bodies.append({
+            'object': obj,
+            'vertices': np.array(
+                [tuple(matrix_world @ v.co) for v in mesh_data.vertices],
+                dtype=np.float32,
+            ),
+            'triangles': np.array([tri.vertices for tri in loop_tris], dtype=np.int32),
+            'matrix_world': matrix_world,
+            'matrix_world_inv': matrix_world.inverted_safe(),
+            'non_tri_faces': sum(count for sides, count in polygon_sides.items() if sides != 3),
+        })
+
+    return bodies
+
+
 def _compute_rigid_transform(rest_vertices, new_vertices):
     """Find best-fit rigid transform that maps rest vertices to new vertices."""
 
@@ -368,72 +483,78 @@ class ANDO_OT_bake_simulation(Operator):
         if obj_role and (not obj_role.enabled or obj_role.role != 'DEFORMABLE'):
             self.report({'WARNING'}, "Active mesh is not tagged as a deformable body in Simulation Setup panel.")
 
-        self.report({'INFO'}, f"Baking simulation: {obj.name}")
-        
-        # Get mesh data
-        mesh_data = obj.data
-        matrix_world = obj.matrix_world.copy()
-        matrix_world_inv = matrix_world.inverted_safe()
-        # Ensure we have triangulated connectivity without modifying the source mesh.
-        mesh_data.calc_loop_triangles()
-        loop_tris = getattr(mesh_data, "loop_triangles", ())
+        # Simulation parameters are scene-wide; each body brings its own material
+        params = _init_params_from_props(abc, props)
 
-        if not loop_tris:
+        mesh = abc.Mesh()
+        bodies = _collect_deformable_bodies(
+            context, obj, hasattr(mesh, 'add_body'), reporter=self.report
+        )
+        if not bodies:
             self.report({'ERROR'}, "Mesh has no triangles. Add faces or apply modifiers before baking.")
             return {'CANCELLED'}
 
-        triangles = np.array([tri.vertices for tri in loop_tris], dtype=np.int32)
-        vertices = np.array(
-            [tuple(matrix_world @ v.co) for v in mesh_data.vertices],
-            dtype=np.float32,
-        )
+        body_names = ", ".join(body['object'].name for body in bodies)
+        self.report({'INFO'}, f"Baking simulation: {body_names}")
 
-        polygon_sides = Counter(len(poly.vertices) for poly in mesh_data.polygons)
-        non_tri_faces = sum(count for sides, count in polygon_sides.items() if sides != 3)
-        if non_tri_faces:
+        # Pack every deformable body into one mesh so they share a single solve
+        # and collide with each other through the self-collision broad phase
+        if len(bodies) == 1:
+            material = _init_body_material(abc, props, bodies[0]['object'])
+            mesh.initialize(bodies[0]['vertices'], bodies[0]['triangles'], material)
+            bodies[0]['vertex_offset'] = 0
+        else:
+            for body in bodies:
+                material = _init_body_material(abc, props, body['object'])
+                mesh.add_body(body['vertices'], body['triangles'], material)
+            for body, body_range in zip(bodies, mesh.get_body_ranges()):
+                body['vertex_offset'] = body_range['vertex_offset']
+
+        for body in bodies:
+            if body['non_tri_faces']:
+                self.report(
+                    {'INFO'},
+                    f"{body['object'].name}: auto-triangulated {body['non_tri_faces']} non-tri faces "
+                    f"into {len(body['triangles'])} triangles for baking.",
+                )
             self.report(
                 {'INFO'},
-                f"Auto-triangulated {non_tri_faces} non-tri faces into {len(triangles)} triangles for baking.",
+                f"{body['object'].name}: {len(body['vertices'])} vertices, {len(body['triangles'])} triangles",
             )
-        
-        self.report({'INFO'}, f"Mesh: {len(vertices)} vertices, {len(triangles)} triangles")
-        
-        # Initialize material and simulation parameters using shared helpers
-        material = _init_material_from_props(abc, props)
-        params = _init_params_from_props(abc, props)
-        
-        # Initialize mesh and state
-        mesh = abc.Mesh()
-        mesh.initialize(vertices, triangles, material)
-        
+
         state = abc.State()
         state.initialize(mesh)
         
         # Set up constraints from Blender data
         constraints = abc.Constraints()
         
-        # Extract pin constraints from vertex group
+        # Extract pin constraints from each body's vertex group
         pin_group_name = "ando_pins"
         num_pins_added = 0
         pin_positions_world = []  # Store for later reference
-        if pin_group_name in obj.vertex_groups:
-            pin_group = obj.vertex_groups[pin_group_name]
-            for i, v in enumerate(mesh_data.vertices):
+        for body in bodies:
+            body_obj = body['object']
+            if pin_group_name not in body_obj.vertex_groups:
+                if body_obj is obj:
+                    self.report({'WARNING'}, "No 'ando_pins' vertex group found. Use 'Add Pin Constraint' button to create pins.")
+                continue
+            pin_group = body_obj.vertex_groups[pin_group_name]
+            offset = body['vertex_offset']
+            for i, v in enumerate(body_obj.data.vertices):
                 try:
                     weight = pin_group.weight(i)
                     if weight > 0.5:  # Threshold for pinning
                         # Use world-space coordinates for physics
-                        pin_pos_world = matrix_world @ v.co
-                        constraints.add_pin(i, np.array(pin_pos_world, dtype=np.float32))
+                        pin_pos_world = body['matrix_world'] @ v.co
+                        constraints.add_pin(offset + i, np.array(pin_pos_world, dtype=np.float32))
                         # Keep world-space copies for optional debug/visualization
                         pin_positions_world.append(tuple(pin_pos_world))
                         num_pins_added += 1
                 except RuntimeError:
                     pass  # Vertex not in group
-            
+        
+        if num_pins_added:
             self.report({'INFO'}, f"Added {num_pins_added} pin constraints")
-        else:
-            self.report({'WARNING'}, "No 'ando_pins' vertex group found. Use 'Add Pin Constraint' button to create pins.")
         
         # Collect hybrid rigid bodies for collision coupling
         rigid_entries = _collect_rigid_bodies(context, exclude_obj=obj, reporter=self.report)
@@ -450,24 +571,35 @@ class ANDO_OT_bake_simulation(Operator):
             constraints.add_wall(ground_normal, props.ground_plane_height, params.wall_gap)
             self.report({'INFO'}, f"Added ground plane at Z={props.ground_plane_height}")
         
-        # Baking loop
+        # Baking loop. Every frame ends exactly on its boundary: fixed steps are
+        # sized to tile the frame, adaptive substeps are balanced by the core
         start_frame = props.cache_start
         end_frame = props.cache_end
-        steps_per_frame = max(1, int(1.0 / (props.dt / 1000.0) / 24.0))  # Aim for 24 fps
-        
-        # Create shape keys for animation
-        if not obj.data.shape_keys:
-            obj.shape_key_add(name='Basis', from_mix=False)
+        adaptive = _use_convergence_substepping(abc, props)
+        if adaptive:
+            params.dt = min(max(props.dt / 1000.0, props.dt_min / 1000.0), props.dt_max / 1000.0)
+            steps_per_frame = 0
         else:
-            # Clear existing simulation shape keys (keep Basis)
-            keys_to_remove = [k for k in obj.data.shape_keys.key_blocks if k.name.startswith('frame_')]
-            for key in keys_to_remove:
-                obj.shape_key_remove(key)
-            self.report({'INFO'}, f"Cleared {len(keys_to_remove)} existing frame keys")
+            steps_per_frame, params.dt = _fixed_substeps(props.dt)
+        total_substeps = 0
+        total_rejected = 0
         
-        basis = obj.data.shape_keys.key_blocks['Basis']
+        # Create shape keys for animation
+        for body in bodies:
+            body_obj = body['object']
+            if not body_obj.data.shape_keys:
+                body_obj.shape_key_add(name='Basis', from_mix=False)
+            else:
+                # Clear existing simulation shape keys (keep Basis)
+                keys_to_remove = [k for k in body_obj.data.shape_keys.key_blocks if k.name.startswith('frame_')]
+                for key in keys_to_remove:
+                    body_obj.shape_key_remove(key)
+                self.report({'INFO'}, f"Cleared {len(keys_to_remove)} existing frame keys on {body_obj.name}")
         
-        self.report({'INFO'}, f"Baking frames {start_frame} to {end_frame} ({steps_per_frame} substeps/frame at {props.dt}ms)")
+        if adaptive:
+            self.report({'INFO'}, f"Baking frames {start_frame} to {end_frame} (adaptive substeps, {props.dt_min}-{props.dt_max}ms)")
+        else:
+            self.report({'INFO'}, f"Baking frames {start_frame} to {end_frame} ({steps_per_frame} substeps/frame at {params.dt * 1000.0:.3f}ms)")
         
         # Gravity vector (Blender Z-up)
         gravity = np.array([0.0, 0.0, -9.81], dtype=np.float32)
@@ -489,10 +621,14 @@ class ANDO_OT_bake_simulation(Operator):
                     self.report({'WARNING'}, "Baking cancelled by user")
                     return {'CANCELLED'}
                 
-                # Create shape key for this frame
-                shape_key = obj.shape_key_add(name=f'frame_{frame:04d}', from_mix=False)
-                
                 # Simulate steps for this frame
+                if adaptive:
+                    report = _advance_frame(abc, mesh, state, constraints, params, props, gravity, rigid_bodies)
+                    total_substeps += report['steps']
+                    total_rejected += report['rejected']
+                    if report.get('failed'):
+                        self.report({'ERROR'}, f"Simulation diverged at frame {frame} even at the minimum Δt ({props.dt_min}ms); baked up to frame {frame - 1}")
+                        return {'CANCELLED'}
                 for step in range(steps_per_frame):
                     # Apply gravity acceleration
                     state.apply_gravity(gravity, params.dt)
@@ -503,20 +639,23 @@ class ANDO_OT_bake_simulation(Operator):
                     else:
                         abc.Integrator.step(mesh, state, constraints, params)
                 
-                # Update shape key with new positions
+                # Write each body's slice of the positions into its own frame shape key
                 positions_world = state.get_positions()
-                for i in range(len(positions_world)):
-                    world_vec = Vector(positions_world[i].tolist())
-                    local_vec = matrix_world_inv @ world_vec
-                    shape_key.data[i].co = local_vec
-                
-                # Set keyframe for shape key animation
-                shape_key.value = 0.0
-                shape_key.keyframe_insert(data_path='value', frame=frame-1)
-                shape_key.value = 1.0
-                shape_key.keyframe_insert(data_path='value', frame=frame)
-                shape_key.value = 0.0
-                shape_key.keyframe_insert(data_path='value', frame=frame+1)
+                for body in bodies:
+                    shape_key = body['object'].shape_key_add(name=f'frame_{frame:04d}', from_mix=False)
+                    offset = body['vertex_offset']
+                    matrix_world_inv = body['matrix_world_inv']
+                    for i in range(len(body['vertices'])):
+                        world_vec = Vector(positions_world[offset + i].tolist())
+                        shape_key.data[i].co = matrix_world_inv @ world_vec
+                    
+                    # Set keyframe for shape key animation
+                    shape_key.value = 0.0
+                    shape_key.keyframe_insert(data_path='value', frame=frame-1)
+                    shape_key.value = 1.0
+                    shape_key.keyframe_insert(data_path='value', frame=frame)
+                    shape_key.value = 0.0
+                    shape_key.keyframe_insert(data_path='value', frame=frame+1)
                 
                 # Progress report every 10 frames or at 25%, 50%, 75%, 100%
                 progress_pct = (frame_idx + 1) * 100 // total_frames
@@ -528,7 +667,9 @@ class ANDO_OT_bake_simulation(Operator):
         
         # Final report with statistics
         num_pins = constraints.num_active_pins()
-        self.report({'INFO'}, f"✓ Baking complete! {total_frames} frames with {num_pins} pins and {num_pins_added} pinned vertices")
+        self.report({'INFO'}, f"✓ Baking complete! {total_frames} frames for {len(bodies)} bodies with {num_pins} pins and {num_pins_added} pinned vertices")
+        if adaptive:
+            self.report({'INFO'}, f"Adaptive substeps: {total_substeps} accepted, {total_rejected} rolled back")
         
         return {'FINISHED'}
 
@@ -867,8 +1008,9 @@ class ANDO_OT_step_simulation(Operator):
 
         # Adaptive timestepping (if enabled)
         props = context.scene.ando_barrier
-        if props.enable_adaptive_dt:
-            # Compute next timestep using CFL condition
+        convergence_substepping = _use_convergence_substepping(abc, props)
+        if props.enable_adaptive_dt and not convergence_substepping:
+            # Older cores: compute next timestep using the CFL condition only
             velocities = state.get_velocities()
             current_dt_sec = params.dt  # In seconds
             dt_min_sec = props.dt_min / 1000.0  # Convert ms to seconds
@@ -882,27 +1024,43 @@ class ANDO_OT_step_simulation(Operator):
             # Update params
             params.dt = new_dt_sec
             
-            # Store dt history for diagnostics
-            if 'dt_history' not in _sim_state['stats']:
-                _sim_state['stats']['dt_history'] = []
-            _sim_state['stats']['dt_history'].append(new_dt_sec * 1000.0)  # Store as ms
-            if len(_sim_state['stats']['dt_history']) > 100:
-                _sim_state['stats']['dt_history'].pop(0)
-        
-        # Calculate steps per frame (aiming for 24 fps)
-        steps_per_frame = max(1, int(1.0 / (props.dt / 1000.0) / 24.0))
+            _record_dt_history(new_dt_sec)
+            steps_per_frame = max(1, int(1.0 / (props.dt / 1000.0) / 24.0))
+        elif not convergence_substepping:
+            # Fixed steps sized to end exactly on the frame boundary
+            steps_per_frame, params.dt = _fixed_substeps(props.dt)
         
         # Gravity vector (Blender Z-up)
         gravity = np.array([0.0, 0.0, -9.81], dtype=np.float32)
         
-        # Simulate steps for this frame (with timing)
+        # Simulate steps for this frame (with timing). Older core builds have no
+        # StepStats, in which case only the wall-clock step time is reported.
+        step_stats = abc.StepStats() if hasattr(abc, 'StepStats') else None
+        step_profile = {}
         start_time = time.time()
-        for step in range(steps_per_frame):
-            state.apply_gravity(gravity, params.dt)
-            if rigid_bodies:
-                abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
-            else:
-                abc.Integrator.step(mesh, state, constraints, params)
+        if convergence_substepping:
+            # The controller sizes, rejects and rolls back substeps in the core;
+            # step_stats comes back holding totals over the accepted substeps
+            report = _advance_frame(abc, mesh, state, constraints, params, props, gravity,
+                                    rigid_bodies, step_stats)
+            if report.get('failed'):
+                _sim_state['playing'] = False
+                self.report({'ERROR'}, f"Simulation diverged even at the minimum Δt ({props.dt_min}ms); state kept at the last finite substep")
+                return {'CANCELLED'}
+            steps_per_frame = max(1, report['steps'])
+            if step_stats is not None:
+                _accumulate_step_profile(step_profile, step_stats)
+            _record_dt_history(params.dt)
+        else:
+            for step in range(steps_per_frame):
+                state.apply_gravity(gravity, params.dt)
+                if step_stats is not None:
+                    abc.Integrator.step(mesh, state, constraints, params, rigid_bodies or None, stats=step_stats)
+                    _accumulate_step_profile(step_profile, step_stats)
+                elif rigid_bodies:
+                    abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
+                else:
+                    abc.Integrator.step(mesh, state, constraints, params)
         end_time = time.time()
 
         # Compute energy diagnostics
@@ -961,6 +1119,9 @@ class ANDO_OT_step_simulation(Operator):
         # Update statistics
         step_time_ms = (end_time - start_time) * 1000.0 / steps_per_frame
         _sim_state['stats']['last_step_time'] = step_time_ms
+        _sim_state['stats']['step_profile'] = {
+            key: value / steps_per_frame for key, value in step_profile.items()
+        }
         _sim_state['stats']['num_pins'] = len(_sim_state['debug_pins'])
         
         # Collect contact data for visualization and statistics
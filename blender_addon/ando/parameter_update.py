@@ -54,6 +54,8 @@ class ANDO_OT_update_parameters(Operator):
         params.max_newton_steps = props.max_newton_steps
         params.pcg_tol = props.pcg_tol
         params.pcg_max_iters = props.pcg_max_iters
+        if hasattr(params, 'pcg_mixed_precision'):
+            params.pcg_mixed_precision = props.pcg_mixed_precision
         params.contact_gap_max = props.contact_gap_max
         params.wall_gap = props.wall_gap
         params.enable_ccd = props.enable_ccd
@@ -65,6 +67,10 @@ class ANDO_OT_update_parameters(Operator):
         params.enable_strain_limiting = props.enable_strain_limiting
         params.strain_limit = props.strain_limit
         params.strain_tau = props.strain_tau
+        if hasattr(params, 'enable_sleeping'):
+            params.enable_sleeping = props.enable_sleeping
+            params.sleep_energy_threshold = props.sleep_energy_threshold
+            params.sleep_steps = props.sleep_steps
         
         # Update material properties on the mesh
         mesh = sim_state['mesh']
@@ -227,6 +227,7 @@ class PPFSession:
             "session": session,
             "fixed": fixed,
             "outdir": Path(fixed.info.path) / "output",
+            "frames": fixed.get.frames,
             "last_frame": -1,
             "target_obj": PPFSession._pick_first_cloth_obj(context)
         }
@@ -252,18 +253,16 @@ class PPFSession:
         if not outdir.exists():
             return {'PASS_THROUGH'}
 
-        # Find latest vert_*.bin
-        files = sorted(outdir.glob("vert_*.bin"))
-        if not files:
-            return {'PASS_THROUGH'}
-
-        latest = files[-1]
-        frame = int(latest.stem.split("_")[1])
+        # Latest complete vert_*.bin, tracked incrementally by the frame store
+        store = info["frames"]
+        frame = store.latest()
         if frame == info["last_frame"]:
             return {'PASS_THROUGH'}
 
         # Load verts and write into Blender mesh
-        verts = np.fromfile(latest, dtype=np.float32).reshape(-1, 3)
+        verts = store.get(frame)
+        if verts is None:
+            return {'PASS_THROUGH'}
         target = info["target_obj"]
         if target is None or target.type != 'MESH':
             op.report({'WARNING'}, "No target cloth object to update")
@@ -303,4 +302,5 @@ class PPFSession:
             info["mgr"].clear(force=True)
         except Exception:
             pass
+        info["frames"].close()
         op._ppf = None
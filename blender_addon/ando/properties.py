@@ -360,7 +360,7 @@ class AndoBarrierSceneProperties(PropertyGroup):
     # Adaptive timestepping
     enable_adaptive_dt: BoolProperty(
         name="Enable Adaptive Timestep",
-        description="Dynamically adjust timestep based on CFL condition",
+        description="Size substeps from solver convergence and the CFL condition, rolling back failed steps; frames still end exactly on their boundaries",
         default=False,
     )
     
@@ -432,6 +432,36 @@ class AndoBarrierSceneProperties(PropertyGroup):
         min=10,
         max=10000,
     )
+
+    pcg_mixed_precision: BoolProperty(
+        name="Mixed Precision PCG",
+        description="Accumulate PCG dot products and residuals in double while keeping the matrix in float",
+        default=False,
+    )
+
+    # Island sleeping
+    enable_sleeping: BoolProperty(
+        name="Sleep Settled Islands",
+        description="Freeze groups of vertices that have come to rest and skip them in the solve until something disturbs them",
+        default=False,
+    )
+
+    sleep_energy_threshold: FloatProperty(
+        name="Sleep Energy Threshold",
+        description="Kinetic energy per unit mass (J/kg) below which an island counts as at rest",
+        default=1e-6,
+        min=0.0,
+        max=1.0,
+        precision=7,
+    )
+
+    sleep_steps: IntProperty(
+        name="Sleep Steps",
+        description="Consecutive resting steps before an island goes to sleep",
+        default=10,
+        min=1,
+        max=1000,
+    )
     
     # Contact parameters
     contact_gap_max: FloatProperty(
@@ -622,6 +652,18 @@ class AndoBarrierObjectProperties(PropertyGroup):
         default='DEFORMABLE',
     )
 
+    use_object_material: BoolProperty(
+        name="Own Material",
+        description="Bake this deformable with its own material instead of the scene material",
+        default=False,
+    )
+
+    material_properties: PointerProperty(
+        type=AndoBarrierMaterialProperties,
+        name="Material",
+        description="Material properties for this deformable body",
+    )
+
     rigid_density: FloatProperty(
         name="Rigid Density",
         description=(
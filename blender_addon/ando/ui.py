@@ -325,6 +325,16 @@ class ANDO_PT_main_panel(Panel):
         pcg.label(text="PCG", icon='SETTINGS')
         pcg.prop(props, "pcg_tol", text="Tolerance")
         pcg.prop(props, "pcg_max_iters", text="Max Iterations")
+        pcg.prop(props, "pcg_mixed_precision", text="Mixed Precision")
+
+        solver_col.separator()
+
+        sleep = solver_col.column(align=True)
+        sleep.label(text="Sleeping", icon='SORTTIME')
+        sleep.prop(props, "enable_sleeping", text="Sleep Settled Islands")
+        if props.enable_sleeping:
+            sleep.prop(props, "sleep_energy_threshold", text="Energy Threshold")
+            sleep.prop(props, "sleep_steps", text="Steps")
 
 
 class ANDO_PT_scene_setup_panel(Panel):
@@ -366,6 +376,15 @@ class ANDO_PT_scene_setup_panel(Panel):
                     role.prop(body_props, "role", expand=True)
                     if body_props.role == 'RIGID':
                         box.prop(body_props, "rigid_density", text="Density")
+                    else:
+                        box.prop(body_props, "use_object_material")
+                        if body_props.use_object_material:
+                            mat_props = body_props.material_properties
+                            col = box.column(align=True)
+                            col.prop(mat_props, "youngs_modulus")
+                            col.prop(mat_props, "poisson_ratio")
+                            col.prop(mat_props, "density")
+                            col.prop(mat_props, "thickness")
                 else:
                     info = box.row()
                     info.label(text="Mesh excluded from the solver.", icon='INFO')
@@ -703,6 +722,26 @@ class ANDO_PT_debug_panel(Panel):
                     fps = 1000.0 / stats['last_step_time'] if stats['last_step_time'] > 0 else 0
                     col.label(text=f"FPS: {fps:.1f}")
 
+                profile = stats.get('step_profile', {})
+                if profile:
+                    box.separator()
+                    box.label(text="Step Breakdown (avg per step)", icon='SORTTIME')
+                    col = box.column(align=True)
+                    for key, label in (
+                        ('collision_ms', "Collision"),
+                        ('gradient_ms', "Gradient"),
+                        ('hessian_ms', "Hessian"),
+                        ('pcg_ms', "PCG"),
+                        ('line_search_ms', "Line search"),
+                        ('rigid_coupling_ms', "Rigid coupling"),
+                    ):
+                        if profile.get(key, 0.0) > 0.0:
+                            col.label(text=f"{label}: {profile[key]:.2f} ms")
+                    col.label(
+                        text=f"Newton: {profile.get('newton_iterations', 0):.1f} | "
+                             f"PCG iters: {profile.get('pcg_iterations', 0):.1f}"
+                    )
+
                 counts = stats.get('contact_counts', {})
                 if counts:
                     box.separator()
@@ -1,6 +1,12 @@
 import bpy
 
 
+def _pin_targets_changed(_self, _context):
+    from . import operators
+
+    operators.ppf_pin_targets_changed()
+
+
 class AndoSimArtezbuildObjectSettings(bpy.types.PropertyGroup):
     enabled: bpy.props.BoolProperty(
         name="Enable PPF",
@@ -74,18 +80,21 @@ class AndoSimArtezbuildObjectSettings(bpy.types.PropertyGroup):
         name="Attach to Mesh",
         description="Attach vertices (from a separate vertex group) to a target mesh surface",
         default=False,
+        update=_pin_targets_changed,
     )
 
     attach_target_object: bpy.props.PointerProperty(
         name="Attach Target",
         description="Target mesh object to attach to",
         type=bpy.types.Object,
+        update=_pin_targets_changed,
     )
 
     attach_vertex_group: bpy.props.StringProperty(
         name="Attach Vertex Group",
         description="Vertex group name to use for attach pins (weight > 0)",
         default="PPF_ATTACH",
+        update=_pin_targets_changed,
     )
 
     attach_pull_strength: bpy.props.FloatProperty(
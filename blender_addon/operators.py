@@ -7,6 +7,8 @@ import bmesh
 import math
 from array import array
 from pathlib import Path
+
+import numpy as np
 from bpy_extras import view3d_utils
 from mathutils.bvhtree import BVHTree
 
@@ -20,11 +22,27 @@ _PPF_PIN_HANDLE_VIDX = "andosim_ppf_pin_vidx"
 # Legacy grab-pin interaction state (still referenced by clear/delete operators).
 _ACTIVE_PPF_GRABS: dict[str, dict] = {}
 
+# Bumped whenever pin handles or attach settings may have changed; running pin plans
+# only re-collect their targets when this (or the object count) moves.
+_PPF_PIN_TARGETS_VERSION: int = 0
+
 _PPF_BACKEND_VERSION: str = "?"
 _PPF_BACKEND_FILE: str = "?"
 _PPF_BACKEND_VERSION_PRINTED: bool = False
 
 
+def ppf_pin_targets_changed() -> None:
+    """Make running pin plans re-collect their handles and attach settings on the next tick."""
+
+    global _PPF_PIN_TARGETS_VERSION
+    _PPF_PIN_TARGETS_VERSION += 1
+
+
+def _ppf_pin_targets_key() -> tuple[int, int]:
+    # Handles removed or duplicated in the viewport bypass our operators but change the count.
+    return _PPF_PIN_TARGETS_VERSION, len(bpy.data.objects)
+
+
 def _ppf_scene_counts(scene_path: str) -> dict[str, int] | None:
     """Read solver vertex counts from the exported scene's info.toml.
 
@@ -81,6 +99,12 @@ def _ppf_scene_counts(scene_path: str) -> dict[str, int] | None:
 
 
 def _ppf_finite_floats(values, label: str) -> None:
+    if isinstance(values, np.ndarray):
+        finite = np.isfinite(values.ravel())
+        if finite.all():
+            return
+        i = int(np.flatnonzero(~finite)[0])
+        raise RuntimeError(f"Non-finite {label}[{i}]={values.ravel()[i]}")
     for i, v in enumerate(values):
         if not math.isfinite(float(v)):
             raise RuntimeError(f"Non-finite {label}[{i}]={v}")
@@ -90,6 +114,8 @@ def _ppf_as_f32(values, *, label: str) -> array:
     """Convert a float sequence to a contiguous float32 array with validation."""
     _ppf_finite_floats(values, label)
     try:
+        if isinstance(values, np.ndarray):
+            return array("f", np.ascontiguousarray(values, dtype=np.float32).tobytes())
         return array("f", (float(x) for x in values))
     except Exception as exc:
         raise RuntimeError(f"Failed to build float32 buffer for {label}: {exc}")
@@ -97,6 +123,8 @@ def _ppf_as_f32(values, *, label: str) -> array:
 
 def _ppf_as_u64(values, *, label: str) -> array:
     try:
+        if isinstance(values, np.ndarray):
+            return array("Q", np.ascontiguousarray(values, dtype=np.uint64).tobytes())
         return array("Q", (int(x) for x in values))
     except Exception as exc:
         raise RuntimeError(f"Failed to build u64 buffer for {label}: {exc}")
@@ -1037,7 +1065,9 @@ class _PPFState:
         self.deformable_slices = []  # list[(name, start, count)]
         # list[(global_vidx, target_obj_name, (i0,i1,i2), (w0,w1,w2))]
         self.attach_bindings = []
+        self.pin_plan: _PPFPinPlan | None = None
         self.collider_object_names = []  # stable export order for collision mesh updates
+        self.collider_stream: _PPFColliderStream | None = None
         self.expected_verts = None
         self.expected_static_verts = None
 
@@ -1164,173 +1194,381 @@ def _compute_attach_bindings(
     return out
 
 
-def _ppf_build_pin_targets(
-    context,
-    objs: list[tuple[bpy.types.Object, int, int]],
+class _PPFPinPlan:
+    """Pin target sources resolved once per run.
+
+    Handle empties are kept as object references next to their global vertex index, and
+    attach bindings are grouped per target mesh as index/weight arrays. The plan is only
+    recompiled after `ppf_pin_targets_changed()` or when objects are added or removed. Per tick, a handle
+    costs one `matrix_world` read, and an attach group whose target neither moved nor
+    deforms reuses its cached barycentric blend instead of re-reading the mesh.
+    """
+
+    def __init__(self, deformable_slices: list[tuple[str, int, int]], expected_verts: int | None = None):
+        self.deformable_slices = [(str(name), int(start), int(count)) for name, start, count in deformable_slices]
+        self.expected_verts = expected_verts
+        self.targets_key: tuple[int, int] | None = None
+
+        self.handle_key: tuple = ()
+        self.handle_objs: list[bpy.types.Object] = []
+        self.handle_indices = np.zeros(0, dtype=np.uint64)
+
+        self.attach_key: tuple = ()
+        # list[(target_obj_name, global_indices[K], tri_verts[K, 3], weights[K, 3])]
+        self.attach_groups: list[tuple[str, np.ndarray, np.ndarray, np.ndarray]] = []
+
+        # Last evaluated sources: handle world positions, and per attach target its matrix
+        # key, kept global indices, target-local blended points and world points.
+        self._handle_world: np.ndarray | None = None
+        self._attach_cache: dict[str, tuple[tuple[float, ...], np.ndarray, np.ndarray, np.ndarray]] = {}
+
+        # Last payload pushed to the backend (dirty check).
+        self._sent_indices: np.ndarray | None = None
+        self._sent_positions: np.ndarray | None = None
+
+    @property
+    def empty(self) -> bool:
+        return not self.handle_objs and not self.attach_groups
+
+    def mark_dirty(self) -> None:
+        """Force the next sync to re-send (e.g. after the backend targets were cleared)."""
+        self._sent_indices = None
+        self._sent_positions = None
+
+    def in_range(self, gidx: int) -> bool:
+        # Clamp invalid indices once here to avoid native crashes later.
+        return gidx >= 0 and (self.expected_verts is None or gidx < int(self.expected_verts))
+
+
+def _ppf_pin_handle_targets(plan: _PPFPinPlan) -> list[tuple[int, bpy.types.Object]]:
+    """Collect (global vertex index, handle) for every pin handle of the plan's deformables."""
+
+    slices = {name: (start, count) for name, start, count in plan.deformable_slices}
+    out: list[tuple[int, bpy.types.Object]] = []
+    for h in bpy.data.objects:
+        if h is None or h.type != "EMPTY":
+            continue
+        if not bool(h.get(_PPF_PIN_HANDLE_TAG, 0)):
+            continue
+        entry = slices.get(str(h.get(_PPF_PIN_HANDLE_OBJ, "")))
+        if entry is None:
+            continue
+        try:
+            vidx = int(h.get(_PPF_PIN_HANDLE_VIDX, -1))
+        except Exception:
+            continue
+        start, count = entry
+        if vidx < 0 or vidx >= count:
+            continue
+        gidx = start + vidx
+        if plan.in_range(gidx):
+            out.append((gidx, h))
+    out.sort(key=lambda item: (item[0], item[1].name))
+    return out
+
+
+def _ppf_attach_key(deformable_slices: list[tuple[str, int, int]]) -> tuple:
+    """Attach settings of the deformables; bindings are recomputed when this changes."""
+
+    key = []
+    for name, _start, _count in deformable_slices:
+        obj = bpy.data.objects.get(name)
+        oprops = getattr(obj, "andosim_artezbuild", None) if obj is not None else None
+        if not (oprops and bool(getattr(oprops, "attach_enabled", False))):
+            continue
+        target_obj = getattr(oprops, "attach_target_object", None)
+        key.append(
+            (
+                name,
+                getattr(target_obj, "name", ""),
+                (getattr(oprops, "attach_vertex_group", "") or "").strip(),
+            )
+        )
+    return tuple(key)
+
+
+def _ppf_compile_pin_handles(plan: _PPFPinPlan, targets: list[tuple[int, bpy.types.Object]]) -> None:
+    plan.handle_key = tuple((gidx, h.name) for gidx, h in targets)
+    plan.handle_objs = [h for _gidx, h in targets]
+    plan.handle_indices = np.asarray([gidx for gidx, _h in targets], dtype=np.uint64)
+    plan._handle_world = None
+
+
+def _ppf_compile_attach_groups(plan: _PPFPinPlan, attach_bindings) -> None:
+    grouped: dict[str, tuple[list[int], list[tuple[int, int, int]], list[tuple[float, float, float]]]] = {}
+    for gidx, target_name, tri, weights in attach_bindings or []:
+        if not plan.in_range(int(gidx)) or min(int(i) for i in tri) < 0:
+            continue
+        idx, tris, ws = grouped.setdefault(str(target_name), ([], [], []))
+        idx.append(int(gidx))
+        tris.append(tuple(int(i) for i in tri))
+        ws.append(tuple(float(w) for w in weights))
+    plan.attach_groups = [
+        (
+            target_name,
+            np.asarray(idx, dtype=np.uint64),
+            np.asarray(tris, dtype=np.int64).reshape(-1, 3),
+            np.asarray(ws, dtype=np.float64).reshape(-1, 3),
+        )
+        for target_name, (idx, tris, ws) in grouped.items()
+    ]
+    plan._attach_cache.clear()
+
+
+def _ppf_compile_pin_plan(
+    deformable_slices: list[tuple[str, int, int]],
     attach_bindings,
-) -> tuple[list[int], list[float]]:
-    indices: list[int] = []
-    positions_flat: list[float] = []
+    *,
+    expected_verts: int | None = None,
+) -> _PPFPinPlan:
+    plan = _PPFPinPlan(deformable_slices, expected_verts)
+    plan.targets_key = _ppf_pin_targets_key()
 
     # 1) User-created pin handles (absolute world positions)
-    for obj, start, count in objs:
-        for vidx, h in _iter_ppf_pin_handles_for_obj(obj):
-            if vidx < 0 or vidx >= int(count):
-                continue
-            w = h.matrix_world.translation
-            sx, sy, sz = ppf_export.blender_to_solver_xyz(float(w.x), float(w.y), float(w.z))
-            j = int(start) + int(vidx)
-            indices.append(j)
-            positions_flat.extend([float(sx), float(sy), float(sz)])
+    _ppf_compile_pin_handles(plan, _ppf_pin_handle_targets(plan))
 
-    # 2) Attach bindings (target-local points transformed each frame)
-    depsgraph = context.evaluated_depsgraph_get()
-    mesh_cache: dict[str, tuple[bpy.types.Object, bpy.types.Mesh]] = {}
-    try:
-        for gidx, target_name, (i0, i1, i2), (w0, w1, w2) in attach_bindings or []:
-            target_obj = bpy.data.objects.get(str(target_name))
-            if target_obj is None or target_obj.type != "MESH":
+    # 2) Attach bindings (target-local points transformed each frame), grouped per target.
+    plan.attach_key = _ppf_attach_key(plan.deformable_slices)
+    _ppf_compile_attach_groups(plan, attach_bindings)
+
+    return plan
+
+
+def _ppf_refresh_pin_plan(context, plan: _PPFPinPlan) -> None:
+    """Recompile the parts of the plan whose targets were added, removed or re-bound mid-run."""
+
+    targets_key = _ppf_pin_targets_key()
+    if targets_key == plan.targets_key:
+        return
+    plan.targets_key = targets_key
+
+    targets = _ppf_pin_handle_targets(plan)
+    if tuple((gidx, h.name) for gidx, h in targets) != plan.handle_key:
+        _ppf_compile_pin_handles(plan, targets)
+        plan.mark_dirty()
+
+    attach_key = _ppf_attach_key(plan.deformable_slices)
+    if attach_key != plan.attach_key:
+        try:
+            bindings = _compute_attach_bindings(context, list(plan.deformable_slices))
+        except Exception:
+            bindings = []
+        plan.attach_key = attach_key
+        _ppf_compile_attach_groups(plan, bindings)
+        plan.mark_dirty()
+
+
+def _ppf_eval_pin_plan(context, plan: _PPFPinPlan) -> tuple[np.ndarray, np.ndarray, bool]:
+    """Evaluate pin targets for the current frame.
+
+    Returns (indices[N] uint64, positions[N, 3] float32, changed) in solver coordinates, where
+    `changed` is False when no handle moved and no attach target moved or deformed since the
+    previous evaluation.
+    """
+
+    idx_parts: list[np.ndarray] = []
+    pos_parts: list[np.ndarray] = []
+    changed = False
+
+    if plan.handle_objs:
+        keep: list[int] = []
+        world: list[tuple[float, float, float]] = []
+        for k, h in enumerate(plan.handle_objs):
+            try:
+                w = h.matrix_world.translation
+            except ReferenceError:
+                # Handle was deleted mid-run (e.g. Clear Grab).
                 continue
+            keep.append(k)
+            world.append((float(w.x), float(w.y), float(w.z)))
+        handle_world = np.asarray(world, dtype=np.float64).reshape(-1, 3)
+        if plan._handle_world is None or not np.array_equal(handle_world, plan._handle_world):
+            changed = True
+            plan._handle_world = handle_world
+        if keep:
+            idx_parts.append(plan.handle_indices[keep])
+            pos_parts.append(handle_world)
+
+    depsgraph = None
+    for target_name, gidx, tris, weights in plan.attach_groups:
+        target_obj = bpy.data.objects.get(target_name)
+        if target_obj is None or target_obj.type != "MESH":
+            if plan._attach_cache.pop(target_name, None) is not None:
+                changed = True
+            continue
 
-            cached = mesh_cache.get(target_obj.name)
-            if cached is None:
-                eval_obj = target_obj.evaluated_get(depsgraph)
-                eval_mesh = None
-                try:
-                    eval_mesh = eval_obj.to_mesh()
-                except Exception:
-                    eval_mesh = None
-                if eval_mesh is None:
+        key = tuple(float(x) for row in target_obj.matrix_world for x in row)
+        deforms = ppf_export.object_may_deform(target_obj)
+        cached = plan._attach_cache.get(target_name)
+        if cached is None or deforms or cached[0] != key:
+            if cached is None or deforms:
+                # The barycentric blend only needs redoing when the target mesh may differ.
+                if depsgraph is None:
+                    depsgraph = context.evaluated_depsgraph_get()
+                co = _ppf_collider_local_coords(target_obj, depsgraph)
+                if co is None:
                     continue
-                mesh_cache[target_obj.name] = (eval_obj, eval_mesh)
-                cached = mesh_cache[target_obj.name]
+                valid = tris.max(axis=1) < len(co)
+                local_idx = gidx[valid]
+                local = np.einsum("kj,kjd->kd", weights[valid], co[tris[valid]])
+            else:
+                _key, local_idx, local, _world = cached
+            mw = np.array(target_obj.matrix_world, dtype=np.float64)
+            world_pos = local @ mw[:3, :3].T + mw[:3, 3]
+            if cached is None or not np.array_equal(world_pos, cached[3]):
+                changed = True
+            cached = (key, local_idx, local, world_pos)
+            plan._attach_cache[target_name] = cached
+        _key, local_idx, _local, world_pos = cached
+        if local_idx.size:
+            idx_parts.append(local_idx)
+            pos_parts.append(world_pos)
 
-            _eval_obj, eval_mesh = cached
-            if i0 < 0 or i1 < 0 or i2 < 0:
-                continue
-            if i0 >= len(eval_mesh.vertices) or i1 >= len(eval_mesh.vertices) or i2 >= len(eval_mesh.vertices):
-                continue
+    if not idx_parts:
+        return np.zeros(0, dtype=np.uint64), np.zeros((0, 3), dtype=np.float32), changed
 
-            p_local = (
-                (float(w0) * eval_mesh.vertices[int(i0)].co)
-                + (float(w1) * eval_mesh.vertices[int(i1)].co)
-                + (float(w2) * eval_mesh.vertices[int(i2)].co)
-            )
-            world = target_obj.matrix_world @ p_local
-            sx, sy, sz = ppf_export.blender_to_solver_xyz(float(world.x), float(world.y), float(world.z))
-            indices.append(int(gidx))
-            positions_flat.extend([float(sx), float(sy), float(sz)])
-    finally:
-        for _name, (eobj, _emesh) in mesh_cache.items():
-            try:
-                eobj.to_mesh_clear()
-            except Exception:
-                pass
+    positions = ppf_export.blender_to_solver_array(np.concatenate(pos_parts)).astype(np.float32)
+    return np.concatenate(idx_parts), positions, changed
 
-    return indices, positions_flat
 
+def _sync_ppf_pin_targets_to_backend(context, session, plan: _PPFPinPlan | None) -> bool:
+    """Push handle + attach pin targets into the backend when they changed since the last sync."""
 
-def _ppf_apply_pin_targets(session, indices: list[int], positions_flat: list[float]) -> bool:
-    if session is None:
+    if session is None or plan is None:
         return False
     set_fn = getattr(session, "set_pin_targets", None)
     if set_fn is None:
         return False
 
     try:
-        if indices:
-            if len(positions_flat) != 3 * len(indices):
-                raise RuntimeError(
-                    f"Pin payload mismatch: {len(indices)} indices but {len(positions_flat)} position floats"
-                )
-            idx_buf = _ppf_as_u64(indices, label="pin_indices")
-            pos_buf = _ppf_as_f32(positions_flat, label="pin_positions")
-            set_fn(idx_buf, pos_buf)
+        _ppf_refresh_pin_plan(context, plan)
+        indices, positions, changed = _ppf_eval_pin_plan(context, plan)
+        if plan._sent_indices is not None and (
+            not changed
+            or (np.array_equal(indices, plan._sent_indices) and np.array_equal(positions, plan._sent_positions))
+        ):
+            return True
+
+        if indices.size:
+            set_fn(
+                _ppf_as_u64(indices, label="pin_indices"),
+                _ppf_as_f32(positions, label="pin_positions"),
+            )
         else:
             clear_fn = getattr(session, "clear_pin_targets", None)
             if clear_fn is not None:
                 clear_fn()
+        plan._sent_indices = indices
+        plan._sent_positions = positions
         return True
     except Exception:
         return False
 
 
-def _sync_ppf_pin_targets_to_backend(
-    context,
-    session,
-    objs: list[tuple[bpy.types.Object, int, int]],
-    attach_bindings,
-    *,
-    expected_verts: int | None = None,
-) -> bool:
-    indices, positions_flat = _ppf_build_pin_targets(context, objs, attach_bindings)
-    if expected_verts is not None:
-        # Clamp invalid indices early to avoid native crashes.
-        filtered_idx: list[int] = []
-        filtered_pos: list[float] = []
-        for k, idx in enumerate(indices):
-            if 0 <= int(idx) < int(expected_verts):
-                filtered_idx.append(int(idx))
-                base = 3 * int(k)
-                filtered_pos.extend(
-                    [
-                        float(positions_flat[base + 0]),
-                        float(positions_flat[base + 1]),
-                        float(positions_flat[base + 2]),
-                    ]
-                )
-        indices, positions_flat = filtered_idx, filtered_pos
-    return _ppf_apply_pin_targets(session, indices, positions_flat)
+def _ppf_collider_local_coords(obj: bpy.types.Object, depsgraph) -> np.ndarray | None:
+    eval_obj = obj.evaluated_get(depsgraph)
+    try:
+        eval_mesh = eval_obj.to_mesh()
+    except Exception:
+        return None
+    if eval_mesh is None:
+        return None
+    try:
+        co = np.empty(len(eval_mesh.vertices) * 3, dtype=np.float32)
+        eval_mesh.vertices.foreach_get("co", co)
+        return co.reshape(-1, 3).astype(np.float64)
+    finally:
+        try:
+            eval_obj.to_mesh_clear()
+        except Exception:
+            pass
 
 
-def _ppf_build_collision_mesh_vertices_flat(context, names: list[str]) -> list[float] | None:
-    if not names:
-        return None
+class _PPFColliderStream:
+    """Solver-space copy of the exported collision mesh, refreshed per collider.
 
-    depsgraph = context.evaluated_depsgraph_get()
-    verts_flat: list[float] = []
+    Colliders are exported concatenated in `collider_slices` order. On update, a collider is
+    only re-gathered when its transform changed or when its mesh can deform (modifiers, shape
+    keys, animated data) and the evaluated coordinates actually differ. Rigid colliders keep
+    their local coordinates cached, so a moved rigid collider costs one matmul.
+    """
 
-    for name in names:
-        obj = bpy.data.objects.get(str(name))
-        if obj is None or obj.type != "MESH":
-            return None
+    def __init__(self, collider_slices: list[tuple[str, int, int]]):
+        self.slices = [(str(name), int(start), int(count)) for name, start, count in collider_slices or []]
+        self.vert_count = max((start + count for _name, start, count in self.slices), default=0)
+        self.world = np.zeros((self.vert_count, 3), dtype=np.float32)
+        self._local: dict[str, np.ndarray] = {}
+        self._matrix: dict[str, tuple[float, ...]] = {}
 
-        eval_obj = obj.evaluated_get(depsgraph)
-        eval_mesh = None
-        try:
-            eval_mesh = eval_obj.to_mesh()
-        except Exception:
-            eval_mesh = None
-        if eval_mesh is None:
-            return None
+    def mark_dirty(self) -> None:
+        """Force every collider to be re-gathered and re-sent on the next update."""
+        self._local.clear()
+        self._matrix.clear()
 
-        try:
-            mw = eval_obj.matrix_world
-            for v in eval_mesh.vertices:
-                w = mw @ v.co
-                sx, sy, sz = ppf_export.blender_to_solver_xyz(float(w.x), float(w.y), float(w.z))
-                verts_flat.extend([float(sx), float(sy), float(sz)])
-        finally:
-            try:
-                eval_obj.to_mesh_clear()
-            except Exception:
-                pass
+    def update(self, context) -> list[tuple[int, int]] | None:
+        """Refresh `world` and return the (start, count) ranges that changed.
 
-    if not verts_flat:
-        return None
+        Returns None when a collider is missing or its vertex count no longer matches the export.
+        """
 
-    return verts_flat
+        depsgraph = None
+        changed: list[tuple[int, int]] = []
+        for name, start, count in self.slices:
+            obj = bpy.data.objects.get(name)
+            if obj is None or obj.type != "MESH":
+                return None
 
+            key = tuple(float(x) for row in obj.matrix_world for x in row)
+            deforms = ppf_export.object_may_deform(obj)
+            known = name in self._matrix
+            if known and not deforms and self._matrix[name] == key:
+                continue
 
-def _ppf_apply_collision_mesh_vertices(session, verts_flat: list[float] | None) -> bool:
-    if session is None or not verts_flat:
-        return False
-    set_fn = getattr(session, "set_collision_mesh_vertices", None)
-    if set_fn is None:
+            local = None if deforms else self._local.get(name)
+            if local is None:
+                if depsgraph is None:
+                    depsgraph = context.evaluated_depsgraph_get()
+                local = _ppf_collider_local_coords(obj, depsgraph)
+                if local is None or len(local) != count:
+                    # Mismatch usually means topology-modifying modifiers are active on a collider.
+                    try:
+                        got = "?" if local is None else len(local)
+                        print(f"[PPF] Skipping collider mesh update: '{name}' has {got} verts, expected {count}")
+                    except Exception:
+                        pass
+                    return None
+                if not deforms:
+                    self._local[name] = local
+
+            mw = np.array(obj.matrix_world, dtype=np.float64)
+            world = ppf_export.blender_to_solver_array(local @ mw[:3, :3].T + mw[:3, 3]).astype(np.float32)
+            if known and deforms and np.array_equal(world, self.world[start : start + count]):
+                continue
+
+            self.world[start : start + count] = world
+            self._matrix[name] = key
+            changed.append((start, count))
+
+        return changed
+
+
+def _ppf_apply_collision_mesh_ranges(session, stream: _PPFColliderStream, ranges: list[tuple[int, int]]) -> bool:
+    if session is None:
         return False
+    if not ranges:
+        return True
+
     try:
-        vbuf = _ppf_as_f32(verts_flat, label="collision_vertices")
-        set_fn(vbuf)
+        range_fn = getattr(session, "set_collision_mesh_vertices_range", None)
+        if range_fn is None or sum(count for _start, count in ranges) >= stream.vert_count:
+            set_fn = getattr(session, "set_collision_mesh_vertices", None)
+            if set_fn is None:
+                return False
+            set_fn(_ppf_as_f32(stream.world, label="collision_vertices"))
+            return True
+
+        for start, count in ranges:
+            range_fn(int(start), _ppf_as_f32(stream.world[start : start + count], label="collision_vertices"))
         return True
     except Exception:
         return False
@@ -1339,31 +1577,37 @@ def _ppf_apply_collision_mesh_vertices(session, verts_flat: list[float] | None)
 def _sync_ppf_collision_mesh_to_backend(
     context,
     session,
-    collider_object_names: list[str],
+    stream: _PPFColliderStream | None,
     *,
     expected_static_verts: int | None = None,
 ) -> bool:
     """If the backend supports it, push animated/static-collider mesh vertices each tick.
 
     The solver scene is exported with static colliders concatenated into a single collision mesh.
-    For animated colliders, we rebuild that concatenated vertex buffer in the exact same order
-    (by `state.collider_object_names`) and send it to the backend.
+    `stream` tracks each collider's range in that mesh; only colliders that moved since the
+    last sync are re-gathered and sent (via `set_collision_mesh_vertices_range` when available).
     """
 
-    verts_flat = _ppf_build_collision_mesh_vertices_flat(context, list(collider_object_names or []))
-    if expected_static_verts is not None and verts_flat is not None:
-        if len(verts_flat) != 3 * int(expected_static_verts):
-            # Mismatch usually means topology-modifying modifiers are active on a collider.
-            # Skip the update to avoid native out-of-bounds access.
-            try:
-                print(
-                    f"[PPF] Skipping collider mesh update: got {len(verts_flat)//3} verts, "
-                    f"expected {int(expected_static_verts)}"
-                )
-            except Exception:
-                pass
-            return False
-    return _ppf_apply_collision_mesh_vertices(session, verts_flat)
+    if session is None or stream is None or not stream.slices:
+        return False
+    if expected_static_verts is not None and stream.vert_count != int(expected_static_verts):
+        try:
+            print(
+                f"[PPF] Skipping collider mesh update: tracking {stream.vert_count} verts, "
+                f"expected {int(expected_static_verts)}"
+            )
+        except Exception:
+            pass
+        return False
+
+    ranges = stream.update(context)
+    if ranges is None:
+        return False
+    ok = _ppf_apply_collision_mesh_ranges(session, stream, ranges)
+    if not ok:
+        # The backend may hold stale positions; resend everything next time.
+        stream.mark_dirty()
+    return ok
 
 
 class ANDOSIM_ARTEZBUILD_OT_ppf_run(bpy.types.Operator):
@@ -1414,8 +1658,6 @@ class ANDOSIM_ARTEZBUILD_OT_ppf_run(bpy.types.Operator):
                         ]
                     export = ppf_export.export_ppf_scene(context, settings, obj, colliders)
 
-                    state.collider_object_names = list(getattr(export, "collider_object_names", []) or [])
-
                 for w in getattr(export, "warnings", []) or []:
                     self.report({"WARNING"}, str(w))
 
@@ -1423,6 +1665,7 @@ class ANDOSIM_ARTEZBUILD_OT_ppf_run(bpy.types.Operator):
                 settings.scene_path = scene_path
                 state.deformable_slices = list(export.deformable_slices)
                 state.collider_object_names = list(getattr(export, "collider_object_names", []) or [])
+                state.collider_stream = _PPFColliderStream(list(getattr(export, "collider_slices", []) or []))
 
             if not scene_path:
                 self.report({"ERROR"}, "No PPF scene path")
@@ -1477,6 +1720,13 @@ class ANDOSIM_ARTEZBUILD_OT_ppf_run(bpy.types.Operator):
                 state.attach_bindings = _compute_attach_bindings(context, list(state.deformable_slices))
             except Exception:
                 state.attach_bindings = []
+
+            total_verts = max((int(start) + int(count) for _name, start, count in state.deformable_slices), default=0)
+            state.pin_plan = _ppf_compile_pin_plan(
+                list(state.deformable_slices),
+                state.attach_bindings,
+                expected_verts=(state.expected_verts or int(total_verts)),
+            )
         except Exception as exc:
             self.report({"ERROR"}, f"Failed to create Session(): {exc}")
             return {"CANCELLED"}
@@ -1527,18 +1777,13 @@ class ANDOSIM_ARTEZBUILD_OT_ppf_run(bpy.types.Operator):
             objs.append((obj, int(start), int(count)))
             total_verts = max(total_verts, int(start) + int(count))
 
-        # Push handle + attach pin targets (if any) into the backend.
-        _sync_ppf_pin_targets_to_backend(
-            context,
-            state.session,
-            objs,
-            getattr(state, "attach_bindings", []) or [],
-            expected_verts=(getattr(state, "expected_verts", None) or int(total_verts)),
-        )
+        # Push handle + attach pin targets (if any) into the backend. Targets persist in the
+        # session, so this is a no-op when nothing moved since the last tick.
+        _sync_ppf_pin_targets_to_backend(context, state.session, getattr(state, "pin_plan", None))
         _sync_ppf_collision_mesh_to_backend(
             context,
             state.session,
-            list(getattr(state, "collider_object_names", []) or []),
+            getattr(state, "collider_stream", None),
             expected_static_verts=getattr(state, "expected_static_verts", None),
         )
 
@@ -1582,15 +1827,6 @@ class ANDOSIM_ARTEZBUILD_OT_ppf_run(bpy.types.Operator):
                     v.co.z = float(local.z)
                 mesh.update()
                 obj.update_tag()
-
-            # Ensure we clear targets when nothing drives pins.
-            _sync_ppf_pin_targets_to_backend(
-                context,
-                state.session,
-                objs,
-                getattr(state, "attach_bindings", []) or [],
-                expected_verts=getattr(state, "expected_verts", None),
-            )
         except Exception as exc:
             details = _ppf_failure_details(getattr(_get_settings(context), "output_dir", ""))
             self.report({"ERROR"}, f"PPF step failed: {exc}. {details}")
@@ -1794,6 +2030,7 @@ class ANDOSIM_ARTEZBUILD_OT_ppf_create_pin_handle(bpy.types.Operator):
         handle[_PPF_PIN_HANDLE_TAG] = 1
         handle[_PPF_PIN_HANDLE_OBJ] = obj.name
         handle[_PPF_PIN_HANDLE_VIDX] = vidx
+        ppf_pin_targets_changed()
 
         # Keep it static in viewport (do NOT parent to the cloth vertex).
         # It will only move if the user moves it.
@@ -2042,6 +2279,7 @@ class ANDOSIM_ARTEZBUILD_OT_ppf_clear_grab(bpy.types.Operator):
                 bpy.data.objects.remove(h, do_unlink=True)
             except Exception:
                 pass
+        ppf_pin_targets_changed()
 
         state = getattr(ANDOSIM_ARTEZBUILD_OT_ppf_run, "_ppf", None)
         if state is not None and getattr(state, "session", None) is not None:
@@ -2051,6 +2289,8 @@ class ANDOSIM_ARTEZBUILD_OT_ppf_clear_grab(bpy.types.Operator):
                     clear_fn()
             except Exception:
                 pass
+            if getattr(state, "pin_plan", None) is not None:
+                state.pin_plan.mark_dirty()
 
         handle_name = f"{obj.name}_PPF_GRAB"
         handle = bpy.data.objects.get(handle_name)
@@ -2157,7 +2397,9 @@ class _PPFBakeState:
         # Optional streaming
         self.deformable_slices: list[tuple[str, int, int]] = []
         self.attach_bindings = []
+        self.pin_plan: _PPFPinPlan | None = None
         self.collider_object_names: list[str] = []
+        self.collider_stream: _PPFColliderStream | None = None
 
         self.next_frame = 0
         self.progress_i = 0
@@ -2279,6 +2521,7 @@ class ANDOSIM_ARTEZBUILD_OT_ppf_bake_cache(bpy.types.Operator):
 
             state.deformable_slices = list(slices)
             state.collider_object_names = list(getattr(export, "collider_object_names", []) or [])
+            state.collider_stream = _PPFColliderStream(list(getattr(export, "collider_slices", []) or []))
 
             # Precompute attach bindings once at start (stable attachment).
             try:
@@ -2332,6 +2575,12 @@ class ANDOSIM_ARTEZBUILD_OT_ppf_bake_cache(bpy.types.Operator):
                     f"Vertex count mismatch: deformables have {int(state.total_verts)} verts, scene expects {int(state.expected_verts)}"
                 )
 
+            state.pin_plan = _ppf_compile_pin_plan(
+                list(state.deformable_slices),
+                state.attach_bindings,
+                expected_verts=(state.expected_verts or int(state.total_verts)),
+            )
+
             state.curr = array("f", [0.0]) * (int(state.total_verts) * 3)
             for obj, start, _count, _writer, _pc2_path in state.writers:
                 mw = obj.matrix_world
@@ -2410,62 +2659,15 @@ class ANDOSIM_ARTEZBUILD_OT_ppf_bake_cache(bpy.types.Operator):
             except Exception:
                 pass
 
-            # Build pin/collider payloads once per Blender frame.
-            # We still apply them every solver substep (below) to satisfy the
-            # "update colliders every substep" requirement; within a single Blender
-            # frame these payloads are typically constant.
-            objs = [(obj, int(start), int(count)) for obj, start, count, _writer, _pc2_path in state.writers]
-            attach_bindings = list(getattr(state, "attach_bindings", []) or [])
-            pin_indices, pin_positions_flat = _ppf_build_pin_targets(context, objs, attach_bindings)
-            collider_names = list(getattr(state, "collider_object_names", []) or [])
-            collider_verts_flat = _ppf_build_collision_mesh_vertices_flat(context, collider_names)
-
-            # Validate/convert payloads once per Blender frame (then reuse per substep).
-            exp_verts = getattr(state, "expected_verts", None)
-            if exp_verts is None:
-                try:
-                    exp_verts = int(getattr(state, "total_verts", 0) or 0)
-                except Exception:
-                    exp_verts = None
-            if exp_verts is not None:
-                filtered_idx: list[int] = []
-                filtered_pos: list[float] = []
-                for k, idx in enumerate(pin_indices):
-                    if 0 <= int(idx) < int(exp_verts):
-                        filtered_idx.append(int(idx))
-                        base = 3 * int(k)
-                        filtered_pos.extend(
-                            [
-                                float(pin_positions_flat[base + 0]),
-                                float(pin_positions_flat[base + 1]),
-                                float(pin_positions_flat[base + 2]),
-                            ]
-                        )
-                pin_indices, pin_positions_flat = filtered_idx, filtered_pos
-
-            pin_idx_buf = None
-            pin_pos_buf = None
-            if pin_indices:
-                if len(pin_positions_flat) != 3 * len(pin_indices):
-                    raise RuntimeError(
-                        f"Pin payload mismatch: {len(pin_indices)} indices but {len(pin_positions_flat)} position floats"
-                    )
-                pin_idx_buf = _ppf_as_u64(pin_indices, label="pin_indices")
-                pin_pos_buf = _ppf_as_f32(pin_positions_flat, label="pin_positions")
-
-            collider_buf = None
-            exp_static = getattr(state, "expected_static_verts", None)
-            if collider_verts_flat is not None:
-                if exp_static is not None and len(collider_verts_flat) != 3 * int(exp_static):
-                    try:
-                        print(
-                            f"[PPF] Skipping collider mesh update during bake: got {len(collider_verts_flat)//3} verts, "
-                            f"expected {int(exp_static)}"
-                        )
-                    except Exception:
-                        pass
-                else:
-                    collider_buf = _ppf_as_f32(collider_verts_flat, label="collision_vertices")
+            # Pin targets and collider overrides persist in the session across substeps, so they
+            # are pushed once per Blender frame, and only for whatever changed since the last frame.
+            _sync_ppf_pin_targets_to_backend(context, state.sess, state.pin_plan)
+            _sync_ppf_collision_mesh_to_backend(
+                context,
+                state.sess,
+                state.collider_stream,
+                expected_static_verts=getattr(state, "expected_static_verts", None),
+            )
 
             curr = state.curr
             if curr is None:
@@ -2478,26 +2680,6 @@ class ANDOSIM_ARTEZBUILD_OT_ppf_bake_cache(bpy.types.Operator):
                     self.report({"INFO"}, "Bake cancelled")
                     return {"CANCELLED"}
 
-                # Accuracy-first: apply pins/colliders every substep.
-                if pin_idx_buf is not None and pin_pos_buf is not None:
-                    try:
-                        getattr(state.sess, "set_pin_targets")(pin_idx_buf, pin_pos_buf)
-                    except Exception:
-                        pass
-                else:
-                    try:
-                        clear_fn = getattr(state.sess, "clear_pin_targets", None)
-                        if clear_fn is not None:
-                            clear_fn()
-                    except Exception:
-                        pass
-
-                if collider_buf is not None:
-                    try:
-                        getattr(state.sess, "set_collision_mesh_vertices")(collider_buf)
-                    except Exception:
-                        pass
-
                 _ppf_finite_floats(curr, "bake_curr")
                 out = state.sess.step(curr)
                 if len(out) != len(curr):
@@ -1,9 +1,12 @@
+import functools
+import hashlib
 import os
 import tempfile
-from array import array
 from dataclasses import dataclass, field
 
 import bpy
+import numpy as np
+from bpy.app.handlers import persistent
 
 
 # PPF uses Y as the gravity axis by default. Blender is Z-up.
@@ -19,66 +22,272 @@ def solver_to_blender_xyz(x: float, y: float, z: float) -> tuple[float, float, f
     return (x, z, y)
 
 
-def _write_f64_colmajor_vec3(path: str, verts_xyz: list[tuple[float, float, float]]):
+def blender_to_solver_array(xyz: np.ndarray) -> np.ndarray:
+    """Array form of `blender_to_solver_xyz` for an (N, 3) block of points."""
+    return xyz[:, [0, 2, 1]]
+
+
+def solver_to_blender_array(xyz: np.ndarray) -> np.ndarray:
+    """Array form of `solver_to_blender_xyz` for an (N, 3) block of points."""
+    return xyz[:, [0, 2, 1]]
+
+
+class _BinBlockCache:
+    """Content-addressed reuse of .bin files between consecutive exports.
+
+    Every block written during an export is keyed by a digest of its bytes. When the next export
+    produces a block with the same digest, the previous file is hardlinked into the new scene
+    folder instead of being serialized again (falling back to a normal write when linking fails,
+    e.g. across filesystems or after the old folder was removed).
+
+    Blocks derived from tracked object state can also pass a `key` describing their inputs. A key
+    seen in the previous export links that block straight away, without building or hashing it.
+    """
+
+    def __init__(self):
+        self._prev: dict[str, str] = {}
+        self._cur: dict[str, str] = {}
+        self._prev_keys: dict[tuple, tuple[str, str]] = {}
+        self._cur_keys: dict[tuple, tuple[str, str]] = {}
+        self.reused = 0
+        self.written = 0
+
+    def begin(self) -> None:
+        self._cur = {}
+        self._cur_keys = {}
+        self.reused = 0
+        self.written = 0
+
+    def commit(self) -> None:
+        self._prev, self._prev_keys = self._cur, self._cur_keys
+        self._cur, self._cur_keys = {}, {}
+
+    def clear(self) -> None:
+        self._prev, self._prev_keys = {}, {}
+
+    def _link(self, src: str | None, path: str) -> bool:
+        if src is None or not os.path.isfile(src):
+            return False
+        try:
+            os.link(src, path)
+        except OSError:
+            return False
+        self.reused += 1
+        return True
+
+    def write(self, path: str, build, key: tuple | None = None) -> None:
+        """Write the array returned by `build()`, or link an earlier block with the same key or bytes."""
+        if key is not None:
+            hit = self._prev_keys.get(key) or self._cur_keys.get(key)
+            if hit is not None and self._link(hit[0], path):
+                self._cur_keys[key] = (path, hit[1])
+                self._cur.setdefault(hit[1], path)
+                return
+        arr = build()
+        digest = hashlib.blake2b(memoryview(arr).cast("B"), digest_size=16).hexdigest()
+        if not self._link(self._prev.get(digest) or self._cur.get(digest), path):
+            arr.tofile(path)
+            self.written += 1
+        self._cur[digest] = path
+        if key is not None:
+            self._cur_keys[key] = (path, digest)
+
+
+_bin_cache = _BinBlockCache()
+
+
+class _ObjectCache:
+    """Per-object export data reused while the object is unchanged.
+
+    Entries are keyed on cheap object state: the depsgraph update counters recorded by
+    `_on_depsgraph_update`, the world matrix and the mesh element counts. A hit skips mesh
+    evaluation, transforms and vertex group scans. Without the update handler, nothing is cached.
+    Entries not used by an export are dropped when it commits.
+    """
+
+    def __init__(self):
+        self._prev: dict[tuple[str, str], tuple[tuple, object]] = {}
+        self._cur: dict[tuple[str, str], tuple[tuple, object]] = {}
+        self.reused = 0
+        self.evaluated = 0
+
+    def begin(self) -> None:
+        self._cur = {}
+        self.reused = 0
+        self.evaluated = 0
+
+    def commit(self) -> None:
+        self._prev = self._cur
+        self._cur = {}
+
+    def clear(self) -> None:
+        self._prev = {}
+        self._cur = {}
+
+    def get(self, obj: bpy.types.Object, tag: str, extra: tuple, compute):
+        """`compute()` for `obj`, memoized on its update state plus `extra`."""
+        state = _object_state_key(obj)
+        if state is None:
+            self.evaluated += 1
+            return compute()
+        key = state + extra
+        slot = (tag, obj.name)
+        entry = self._cur.get(slot) or self._prev.get(slot)
+        if entry is not None and entry[0] == key:
+            self.reused += 1
+            self._cur[slot] = entry
+            return entry[1]
+        self.evaluated += 1
+        value = compute()
+        self._cur[slot] = (key, value)
+        return value
+
+
+_object_cache = _ObjectCache()
+
+# Depsgraph update counts per ("OB" | "ME", name), recorded while the handler is registered.
+_update_counts: dict[tuple[str, str], int] = {}
+_tracking_updates = False
+
+
+@persistent
+def _on_depsgraph_update(_scene, depsgraph) -> None:
+    for update in depsgraph.updates:
+        id_data = getattr(update.id, "original", update.id)
+        if isinstance(id_data, bpy.types.Object):
+            if not (update.is_updated_geometry or update.is_updated_transform):
+                continue
+            key = ("OB", id_data.name)
+        elif isinstance(id_data, bpy.types.Mesh):
+            key = ("ME", id_data.name)
+        else:
+            continue
+        _update_counts[key] = _update_counts.get(key, 0) + 1
+
+
+@persistent
+def _on_data_reload(*_args) -> None:
+    # Names no longer identify the same data after a file load or undo step.
+    global _coincident_cache
+    _update_counts.clear()
+    _coincident_cache = (None, [])
+    _object_cache.clear()
+    _bin_cache.clear()
+
+
+_RELOAD_HANDLERS = ("load_post", "undo_post", "redo_post")
+
+
+def register_update_tracking() -> None:
+    """Start recording object updates so unchanged objects can skip re-export."""
+    global _tracking_updates
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    for name in _RELOAD_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if _on_data_reload not in handlers:
+            handlers.append(_on_data_reload)
+    _tracking_updates = True
+
+
+def unregister_update_tracking() -> None:
+    global _tracking_updates
+    _tracking_updates = False
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    for name in _RELOAD_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if _on_data_reload in handlers:
+            handlers.remove(_on_data_reload)
+    _on_data_reload()
+
+
+def object_may_deform(obj: bpy.types.Object) -> bool:
+    """Whether the evaluated mesh can change without `matrix_world` changing."""
+    if any(bool(getattr(mod, "show_viewport", True)) for mod in obj.modifiers):
+        return True
+    data = getattr(obj, "data", None)
+    if getattr(data, "shape_keys", None) is not None:
+        return True
+    return getattr(data, "animation_data", None) is not None
+
+
+def _object_state_key(obj: bpy.types.Object) -> tuple | None:
+    """Cheap fingerprint of an object's exported state, or None while updates are not tracked.
+
+    A frame change fires no depsgraph update, so objects whose evaluated mesh may deform
+    (modifiers, shape keys, animated mesh data) also key on the current frame.
+    """
+    if not _tracking_updates:
+        return None
+    data = obj.data
+    frame = None
+    if object_may_deform(obj):
+        scene = bpy.context.scene
+        frame = (scene.frame_current, float(scene.frame_subframe))
+    return (
+        frame,
+        obj.name,
+        data.name,
+        _update_counts.get(("OB", obj.name), 0),
+        _update_counts.get(("ME", data.name), 0),
+        tuple(float(x) for row in obj.matrix_world for x in row),
+        len(data.vertices),
+        len(data.polygons),
+        tuple((mod.name, mod.type, bool(mod.show_viewport)) for mod in obj.modifiers),
+    )
+
+
+def _objects_key(objs: list[bpy.types.Object]) -> tuple | None:
+    """Combined state key of `objs`, or None when any of them is untracked."""
+    keys = [_object_state_key(obj) for obj in objs]
+    if any(k is None for k in keys):
+        return None
+    return tuple(keys)
+
+
+def _tagged(tag: str, key: tuple | None) -> tuple | None:
+    return None if key is None else (tag, key)
+
+
+def _write_f64_colmajor_vec3(path: str, verts_xyz, key: tuple | None = None):
     # Store a 3xN matrix as interleaved columns:
     # [x0, y0, z0, x1, y1, z1, ...]
-    buff = array("d")
-    for x, y, z in verts_xyz:
-        buff.append(float(x))
-        buff.append(float(y))
-        buff.append(float(z))
-    with open(path, "wb") as f:
-        buff.tofile(f)
+    _bin_cache.write(path, lambda: np.ascontiguousarray(_value(verts_xyz), dtype=np.float64).reshape(-1, 3), _tagged("f64x3", key))
 
 
-def _write_f32_colmajor_vec3(path: str, verts_xyz: list[tuple[float, float, float]]):
-    buff = array("f")
-    for x, y, z in verts_xyz:
-        buff.append(float(x))
-        buff.append(float(y))
-        buff.append(float(z))
-    with open(path, "wb") as f:
-        buff.tofile(f)
+def _write_f32_colmajor_vec3(path: str, verts_xyz, key: tuple | None = None):
+    _bin_cache.write(path, lambda: np.ascontiguousarray(_value(verts_xyz), dtype=np.float32).reshape(-1, 3), _tagged("f32x3", key))
 
 
-def _write_f32_colmajor_vec2(path: str, vec2: list[tuple[float, float]]):
-    buff = array("f")
-    for a, b in vec2:
-        buff.append(float(a))
-        buff.append(float(b))
-    with open(path, "wb") as f:
-        buff.tofile(f)
+def _write_f32_colmajor_vec2(path: str, vec2, key: tuple | None = None):
+    _bin_cache.write(path, lambda: np.ascontiguousarray(_value(vec2), dtype=np.float32).reshape(-1, 2), _tagged("f32x2", key))
 
 
-def _write_u32(path: str, values: list[int]):
-    with open(path, "wb") as f:
-        array("I", (int(v) for v in values)).tofile(f)
+def _write_u32(path: str, values, key: tuple | None = None):
+    _bin_cache.write(path, lambda: np.ascontiguousarray(_value(values), dtype=np.uint32), _tagged("u32", key))
 
 
-def _write_u64(path: str, values: list[int]):
-    with open(path, "wb") as f:
-        array("Q", (int(v) for v in values)).tofile(f)
+def _write_u64(path: str, values, key: tuple | None = None):
+    _bin_cache.write(path, lambda: np.ascontiguousarray(_value(values), dtype=np.uint64), _tagged("u64", key))
 
 
-def _write_u64_colmajor_tris(path: str, tris: list[tuple[int, int, int]]):
+def _write_u64_colmajor_tris(path: str, tris, key: tuple | None = None):
     # Store a 3xN matrix as interleaved columns (triangle index triplets).
-    buff = array("Q")
-    for a, b, c in tris:
-        buff.append(int(a))
-        buff.append(int(b))
-        buff.append(int(c))
-    with open(path, "wb") as f:
-        buff.tofile(f)
+    _bin_cache.write(path, lambda: np.ascontiguousarray(_value(tris), dtype=np.uint64).reshape(-1, 3), _tagged("u64x3", key))
 
 
-def _write_u8(path: str, values: list[int]):
-    with open(path, "wb") as f:
-        array("B", (int(v) for v in values)).tofile(f)
+def _write_u8(path: str, values, key: tuple | None = None):
+    _bin_cache.write(path, lambda: np.ascontiguousarray(_value(values), dtype=np.uint8), _tagged("u8", key))
 
 
-def _write_f32(path: str, values: list[float]):
-    with open(path, "wb") as f:
-        array("f", (float(v) for v in values)).tofile(f)
+def _write_f32(path: str, values, key: tuple | None = None):
+    _bin_cache.write(path, lambda: np.ascontiguousarray(_value(values), dtype=np.float32), _tagged("f32", key))
+
+
+def _value(values):
+    """Block contents given directly or as a zero-argument callable (built only when needed)."""
+    return values() if callable(values) else values
 
 
 @dataclass
@@ -88,9 +297,32 @@ class ExportResult:
     collider_object_names: list[str]
     deformable_slices: list[tuple[str, int, int]]
     warnings: list[str] = field(default_factory=list)
+    # (name, start, count) of each collider inside the concatenated static mesh.
+    collider_slices: list[tuple[str, int, int]] = field(default_factory=list)
+
+
+# Blender -> solver axis mapping as a 4x4 matrix, so it folds into matrix_world and each
+# mesh is transformed with a single matmul.
+_BLENDER_TO_SOLVER_4X4 = np.array(
+    [
+        [1.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+        [0.0, 1.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ],
+    dtype=np.float64,
+)
+
 
+def _mesh_solver_coords(mesh, matrix_world) -> np.ndarray:
+    """Vertex positions of `mesh` under `matrix_world`, in solver coordinates, as (N, 3) float64."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    T = _BLENDER_TO_SOLVER_4X4 @ np.array(matrix_world, dtype=np.float64)
+    return co.reshape(-1, 3).astype(np.float64) @ T[:3, :3].T + T[:3, 3]
 
-def _mesh_eval_to_world_tris(obj: bpy.types.Object, depsgraph) -> tuple[list[tuple[float, float, float]], list[tuple[int, int, int]]]:
+
+def _mesh_eval_to_solver_tris(obj: bpy.types.Object, depsgraph) -> tuple[np.ndarray, np.ndarray]:
     obj_eval = obj.evaluated_get(depsgraph)
     mesh_eval = obj_eval.to_mesh()
     if mesh_eval is None:
@@ -98,153 +330,450 @@ def _mesh_eval_to_world_tris(obj: bpy.types.Object, depsgraph) -> tuple[list[tup
 
     try:
         mesh_eval.calc_loop_triangles()
-        if not getattr(mesh_eval, "loop_triangles", None):
+        n_tri = len(mesh_eval.loop_triangles)
+        if n_tri == 0:
             raise ValueError(f"Object '{obj.name}' has no triangles")
 
-        M = obj_eval.matrix_world
-        verts = [(float((M @ v.co).x), float((M @ v.co).y), float((M @ v.co).z)) for v in mesh_eval.vertices]
-        tris = [tuple(int(i) for i in tri.vertices) for tri in mesh_eval.loop_triangles]
-        return verts, tris
+        verts = _mesh_solver_coords(mesh_eval, obj_eval.matrix_world)
+        tris = np.empty(n_tri * 3, dtype=np.int32)
+        mesh_eval.loop_triangles.foreach_get("vertices", tris)
+        return verts, tris.reshape(-1, 3).astype(np.int64)
     finally:
         obj_eval.to_mesh_clear()
 
 
-def _mesh_eval_to_world_edges(obj: bpy.types.Object, depsgraph) -> tuple[list[tuple[float, float, float]], list[tuple[int, int]]]:
+def _mesh_eval_to_solver_edges(obj: bpy.types.Object, depsgraph) -> tuple[np.ndarray, np.ndarray]:
     obj_eval = obj.evaluated_get(depsgraph)
     mesh_eval = obj_eval.to_mesh()
     if mesh_eval is None:
         raise ValueError(f"Object '{obj.name}' has no mesh")
 
     try:
-        M = obj_eval.matrix_world
-        verts = [(float((M @ v.co).x), float((M @ v.co).y), float((M @ v.co).z)) for v in mesh_eval.vertices]
-        edges = [(int(e.vertices[0]), int(e.vertices[1])) for e in mesh_eval.edges]
-        return verts, edges
+        verts = _mesh_solver_coords(mesh_eval, obj_eval.matrix_world)
+        edges = np.empty(len(mesh_eval.edges) * 2, dtype=np.int32)
+        mesh_eval.edges.foreach_get("vertices", edges)
+        return verts, edges.reshape(-1, 2).astype(np.int64)
     finally:
         obj_eval.to_mesh_clear()
 
 
-def _point_segment_closest(p, a, b):
-    # Returns (dist2, t) where closest point is a + t*(b-a), clamped to [0,1]
-    ax, ay, az = a
-    bx, by, bz = b
-    px, py, pz = p
-    abx = bx - ax
-    aby = by - ay
-    abz = bz - az
-    apx = px - ax
-    apy = py - ay
-    apz = pz - az
-    denom = abx * abx + aby * aby + abz * abz
-    if denom <= 1e-20:
-        t = 0.0
+def _vertex_group_indices(obj: bpy.types.Object, vg_name: str) -> np.ndarray | None:
+    """Indices of `obj` vertices with a positive weight in `vg_name` (None if there is no such group)."""
+    vg_name = (vg_name or "").strip()
+    if not vg_name or vg_name not in obj.vertex_groups:
+        return None
+    vg_index = obj.vertex_groups[vg_name].index
+
+    out: list[int] = []
+    for v in obj.data.vertices:
+        w = 0.0
+        for g in v.groups:
+            if g.group == vg_index:
+                w = float(g.weight)
+                break
+        if w > 0.0:
+            out.append(int(v.index))
+    return np.asarray(out, dtype=np.int64)
+
+
+def _cached_solver_tris(obj: bpy.types.Object, depsgraph) -> tuple[np.ndarray, np.ndarray]:
+    return _object_cache.get(obj, "tris", (), lambda: _mesh_eval_to_solver_tris(obj, depsgraph))
+
+
+def _cached_solver_edges(obj: bpy.types.Object, depsgraph) -> tuple[np.ndarray, np.ndarray]:
+    return _object_cache.get(obj, "edges", (), lambda: _mesh_eval_to_solver_edges(obj, depsgraph))
+
+
+def _cached_solver_coords(obj: bpy.types.Object) -> np.ndarray:
+    return _object_cache.get(obj, "coords", (), lambda: _mesh_solver_coords(obj.data, obj.matrix_world))
+
+
+def _cached_vertex_group_indices(obj: bpy.types.Object, vg_name: str) -> np.ndarray | None:
+    extra = (vg_name, tuple(vg.name for vg in obj.vertex_groups))
+    return _object_cache.get(obj, f"group:{vg_name}", extra, lambda: _vertex_group_indices(obj, vg_name))
+
+
+# Point/segment pairs evaluated per batch in `_closest_segments`; bounds its temporaries.
+_SEGMENT_PAIR_CHUNK = 1 << 18
+
+# Segments whose bounds cover more grid cells than this are tested against every point.
+_SEGMENT_LARGE_CELLS = 64
+
+
+def _ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Concatenation of arange(start, start + count) for each (start, count)."""
+    return np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(int(counts.sum()))
+
+
+def _batches(sizes: np.ndarray, limit: int):
+    """Split consecutive items into (start, stop) runs whose sizes sum to about `limit`."""
+    end = np.cumsum(sizes)
+    start = 0
+    while start < len(sizes):
+        stop = int(np.searchsorted(end, end[start] - sizes[start] + limit, side="right"))
+        stop = max(stop, start + 1)
+        yield start, stop
+        start = stop
+
+
+def _box_cells(lo: np.ndarray, span: np.ndarray, dims: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(owner, linear cell key) for every grid cell of each box given by its lowest cell and span."""
+    n_cell = span.prod(axis=1)
+    owner = np.repeat(np.arange(len(lo)), n_cell)
+    local = _ranges(np.zeros(len(lo), dtype=np.int64), n_cell)
+    s = span[owner]
+    cell = lo[owner] + np.stack([local // (s[:, 1] * s[:, 2]), local // s[:, 2] % s[:, 1], local % s[:, 2]], axis=1)
+    return owner, (cell[:, 0] * dims[1] + cell[:, 1]) * dims[2] + cell[:, 2]
+
+
+def _closest_segments(points: np.ndarray, seg_a: np.ndarray, seg_b: np.ndarray, max_dist: float = 0.0):
+    """Nearest segment for each point.
+
+    Returns (dist2, seg_index, t) arrays where the closest point is a + t*(b-a), t clamped to [0,1].
+    Segments are binned into a uniform grid whose cell size is their median length. Each point
+    searches the cells within one cell size of it, and points whose nearest hit lies beyond the
+    searched radius retry with the radius doubled. With `max_dist > 0` the radius stops at
+    `max_dist`, and points with no segment that close get dist2 = inf. Ties go to the lowest
+    segment index.
+    """
+    n, m = len(points), len(seg_a)
+    best_d2 = np.full(n, np.inf, dtype=np.float64)
+    best_i = np.zeros(n, dtype=np.int64)
+    best_t = np.zeros(n, dtype=np.float64)
+    if not n or not m:
+        return best_d2, best_i, best_t
+
+    ab = seg_b - seg_a
+    denom = np.einsum("ij,ij->i", ab, ab)
+    degenerate = denom <= 1e-20
+    inv_denom = np.where(degenerate, 0.0, 1.0 / np.where(degenerate, 1.0, denom))
+    seg_lo = np.minimum(seg_a, seg_b)
+    seg_hi = np.maximum(seg_a, seg_b)
+
+    def _update(pt: np.ndarray, seg: np.ndarray) -> None:
+        ap = points[pt] - seg_a[seg]
+        t = np.clip(np.einsum("ij,ij->i", ap, ab[seg]) * inv_denom[seg], 0.0, 1.0)
+        d = ap - t[:, None] * ab[seg]
+        d2 = np.einsum("ij,ij->i", d, d)
+        order = np.lexsort((seg, d2, pt))
+        first = order[np.flatnonzero(np.diff(pt[order], prepend=-1))]
+        pt, seg, d2, t = pt[first], seg[first], d2[first], t[first]
+        better = (d2 < best_d2[pt]) | ((d2 == best_d2[pt]) & (seg < best_i[pt]))
+        pt = pt[better]
+        best_d2[pt], best_i[pt], best_t[pt] = d2[better], seg[better], t[better]
+
+    def _brute(pt: np.ndarray, seg: np.ndarray) -> None:
+        for lo, hi in _batches(np.full(len(pt), len(seg)), _SEGMENT_PAIR_CHUNK):
+            _update(np.repeat(pt[lo:hi], len(seg)), np.tile(seg, hi - lo))
+
+    cell = float(np.median(np.sqrt(denom)))
+    if not cell > 0.0:
+        cell = max(float(np.ptp(np.concatenate([seg_lo, points]), axis=0).max()), 1e-6)
+    origin = seg_lo.min(axis=0)
+    cell_lo = np.floor((seg_lo - origin) / cell).astype(np.int64)
+    span = np.floor((seg_hi - origin) / cell).astype(np.int64) - cell_lo + 1
+    dims = (cell_lo + span).max(axis=0)
+
+    # Long segments would flood the grid, so every point tests them directly.
+    large = span.prod(axis=1) > _SEGMENT_LARGE_CELLS
+    if large.any():
+        _brute(np.arange(n), np.flatnonzero(large))
+    small = np.flatnonzero(~large)
+    owner, entry_key = _box_cells(cell_lo[small], span[small], dims)
+    order = np.argsort(entry_key, kind="stable")
+    entry_key, entry_seg = entry_key[order], small[owner[order]]
+
+    pending = np.arange(n)
+    radius = cell if max_dist <= 0.0 else min(cell, max_dist)
+    while len(pending):
+        p = points[pending]
+        lo = np.floor((p - radius - origin) / cell).astype(np.int64)
+        hi = np.floor((p + radius - origin) / cell).astype(np.int64)
+        exhaustive = np.all((lo <= 0) & (hi >= dims - 1), axis=1)
+        lo, hi = np.maximum(lo, 0), np.minimum(hi, dims - 1)
+        box = np.maximum(hi - lo + 1, 0)
+        n_cell = box.prod(axis=1)
+
+        # Once a search box holds more cells than there are segments, testing every segment
+        # is cheaper and settles the point.
+        brute = n_cell > len(small)
+        if brute.any():
+            _brute(pending[brute], small)
+        search = np.flatnonzero(~brute & (n_cell > 0))
+        for lo_b, hi_b in _batches(n_cell[search], _SEGMENT_PAIR_CHUNK):
+            rows = search[lo_b:hi_b]
+            cell_owner, key = _box_cells(lo[rows], box[rows], dims)
+            first = np.searchsorted(entry_key, key, side="left")
+            count = np.searchsorted(entry_key, key, side="right") - first
+            for lo_p, hi_p in _batches(count, _SEGMENT_PAIR_CHUNK):
+                c = count[lo_p:hi_p]
+                pt = pending[rows[np.repeat(cell_owner[lo_p:hi_p], c)]]
+                _update(pt, entry_seg[_ranges(first[lo_p:hi_p], c)])
+
+        if max_dist > 0.0 and radius >= max_dist:
+            break
+        # A hit within the searched radius is exact: any closer segment overlaps the box.
+        done = brute | exhaustive | (best_d2[pending] <= radius * radius)
+        pending = pending[~done]
+        radius = radius * 2.0 if max_dist <= 0.0 else min(radius * 2.0, max_dist)
+
+    if max_dist > 0.0:
+        best_d2[best_d2 > max_dist * max_dist] = np.inf
+    return best_d2, best_i, best_t
+
+
+_TRI_MODEL_MAP = {"arap": 0, "stvk": 1, "baraff-witkin": 2, "snhk": 3}
+
+# Per-triangle parameter files, in the column order used by `_tri_params`.
+_TRI_PARAM_FILES = (
+    "tri-density.bin",
+    "tri-young-mod.bin",
+    "tri-poiss-rat.bin",
+    "tri-bend.bin",
+    "tri-shrink.bin",
+    "tri-contact-gap.bin",
+    "tri-contact-offset.bin",
+    "tri-strain-limit.bin",
+    "tri-friction.bin",
+)
+
+_STATIC_PARAM_FILES = (
+    "static-contact-gap.bin",
+    "static-contact-offset.bin",
+    "static-friction.bin",
+)
+
+
+def _match_stitches(obj: bpy.types.Object, target_obj: bpy.types.Object, oprops, depsgraph):
+    """Source vertices of `obj` stitched to their closest `target_obj` edges, in local indices.
+
+    Returns `(src_vidx, e0, e1, t)` or None when there is nothing to match.
+    """
+    max_dist = float(getattr(oprops, "stitch_max_distance", 0.0))
+    max_dist2 = max_dist * max_dist
+
+    src_members = _cached_vertex_group_indices(obj, getattr(oprops, "stitch_source_vertex_group", ""))
+    if src_members is None:
+        return None
+    tgt_members = _cached_vertex_group_indices(target_obj, getattr(oprops, "stitch_target_vertex_group", ""))
+
+    # Distances are invariant under the axis swap, so matching runs in solver space.
+    tgt_verts, tgt_edges = _cached_solver_edges(target_obj, depsgraph)
+
+    if tgt_members is not None:
+        in_group = np.zeros(len(target_obj.data.vertices), dtype=bool)
+        in_group[tgt_members] = True
+        candidate_edges = tgt_edges[in_group[tgt_edges[:, 0]] & in_group[tgt_edges[:, 1]]]
     else:
-        t = (apx * abx + apy * aby + apz * abz) / denom
-        if t < 0.0:
-            t = 0.0
-        elif t > 1.0:
-            t = 1.0
-    cx = ax + t * abx
-    cy = ay + t * aby
-    cz = az + t * abz
-    dx = px - cx
-    dy = py - cy
-    dz = pz - cz
-    return (dx * dx + dy * dy + dz * dz, t)
+        candidate_edges = tgt_edges
+
+    if not len(candidate_edges):
+        return None
+
+    src_points = _cached_solver_coords(obj)[src_members]
+    seg_a = tgt_verts[candidate_edges[:, 0]]
+    seg_b = tgt_verts[candidate_edges[:, 1]]
+
+    dist2, best, t = _closest_segments(src_points, seg_a, seg_b, max_dist if max_dist2 > 0.0 else 0.0)
+    keep = np.isfinite(dist2) if max_dist2 <= 0.0 else dist2 <= max_dist2
+    edges = candidate_edges[best[keep]]
+    return src_members[keep], edges[:, 0], edges[:, 1], t[keep].astype(np.float64)
+
+
+def _cached_stitches(obj: bpy.types.Object, target_obj: bpy.types.Object, oprops, depsgraph):
+    extra = (
+        _object_state_key(target_obj),
+        float(getattr(oprops, "stitch_max_distance", 0.0)),
+        getattr(oprops, "stitch_source_vertex_group", ""),
+        getattr(oprops, "stitch_target_vertex_group", ""),
+        tuple(vg.name for vg in obj.vertex_groups),
+        tuple(vg.name for vg in target_obj.vertex_groups),
+    )
+    return _object_cache.get(obj, "stitch", extra, lambda: _match_stitches(obj, target_obj, oprops, depsgraph))
+
+
+def _tri_params(src) -> tuple[int, tuple[float, ...]]:
+    """(model, float params in `_TRI_PARAM_FILES` order) read from settings or object props."""
+    model = _TRI_MODEL_MAP.get(getattr(src, "tri_model", "baraff-witkin"), 2)
+    return int(model), (
+        float(getattr(src, "tri_density", 1.0)),
+        float(getattr(src, "tri_young_mod", 100.0)),
+        float(getattr(src, "tri_poiss_rat", 0.35)),
+        float(getattr(src, "tri_bend", 2.0)),
+        float(getattr(src, "tri_shrink", 1.0)),
+        float(getattr(src, "tri_contact_gap", 1e-3)),
+        float(getattr(src, "tri_contact_offset", 0.0)),
+        float(getattr(src, "tri_strain_limit", 0.0)),
+        float(getattr(src, "tri_friction", 0.0)),
+    )
+
+
+def _static_params(src) -> tuple[float, ...]:
+    return (
+        float(getattr(src, "static_contact_gap", 1e-3)),
+        float(getattr(src, "static_contact_offset", 0.0)),
+        float(getattr(src, "static_friction", 0.0)),
+    )
+
+
+def _write_tri_params(param_dir: str, model_rows: list[int], param_rows: list[tuple[float, ...]], counts: list[int]) -> None:
+    """Per-triangle material files, expanded from one row per object covering `counts` triangles.
+
+    Each file is keyed on its rows and counts, so unchanged materials are linked without
+    expanding them again.
+    """
+    counts = [int(c) for c in counts]
+    models = tuple(int(m) for m in model_rows)
+    _write_u8(
+        os.path.join(param_dir, "tri-model.bin"),
+        lambda: np.repeat(np.asarray(models, dtype=np.uint8), counts),
+        ("tri-model", models, tuple(counts)),
+    )
+    for col, name in enumerate(_TRI_PARAM_FILES):
+        values = tuple(float(row[col]) for row in param_rows)
+        _write_f32(
+            os.path.join(param_dir, name),
+            lambda values=values: np.repeat(np.asarray(values, dtype=np.float32), counts),
+            (name, values, tuple(counts)),
+        )
+
+
+def _write_static_params(param_dir: str, param_rows: list[tuple[float, ...]], counts: list[int]) -> None:
+    counts = [int(c) for c in counts]
+    for col, name in enumerate(_STATIC_PARAM_FILES):
+        values = tuple(float(row[col]) for row in param_rows)
+        _write_f32(
+            os.path.join(param_dir, name),
+            lambda values=values: np.repeat(np.asarray(values, dtype=np.float32), counts),
+            (name, values, tuple(counts)),
+        )
+
+
+class _ConcatMeshes:
+    """(verts, tris) blocks concatenated on first use, with triangle indices offset per block."""
+
+    def __init__(self, parts: list[tuple[np.ndarray, np.ndarray]]):
+        self.parts = parts
+        self.offsets: list[int] = []
+        base = 0
+        for verts, _tris in parts:
+            self.offsets.append(base)
+            base += len(verts)
+        self.n_vert = base
+        self.n_tri = sum(len(t) for _v, t in parts)
+
+    @functools.cached_property
+    def verts(self) -> np.ndarray:
+        if not self.parts:
+            return np.zeros((0, 3), dtype=np.float64)
+        return np.concatenate([v for v, _t in self.parts])
+
+    @functools.cached_property
+    def tris(self) -> np.ndarray:
+        if not self.parts:
+            return np.zeros((0, 3), dtype=np.int64)
+        return np.concatenate([t + off for (_v, t), off in zip(self.parts, self.offsets)])
+
+
+# Last coincident-vertex check, keyed on the deformables' update state.
+_coincident_cache: tuple[tuple | None, list[str]] = (None, [])
+
+
+def _coincident_warnings(defs: _ConcatMeshes, deformable_slices: list[tuple[str, int, int]], key: tuple | None) -> list[str]:
+    """Warn about vertices shared between deformables; upstream CUDA contact code can assert on them."""
+    global _coincident_cache
+    if key is not None and _coincident_cache[0] == key:
+        return list(_coincident_cache[1])
+
+    warnings: list[str] = []
+    if len(deformable_slices) > 1 and defs.n_vert > 0:
+        eps = 1e-9
+        keys = np.round(defs.verts / eps).astype(np.int64)
+        body = np.repeat(np.arange(len(deformable_slices)), [count for _n, _s, count in deformable_slices])
+        _uniq, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        ref = first[inverse.reshape(-1)]
+        hits = np.flatnonzero(body[ref] != body)
+
+        if len(hits) > 0:
+            gi = int(hits[0])
+            gj = int(ref[gi])
+            a, a_start, _ac = deformable_slices[int(body[gj])]
+            b, b_start, _bc = deformable_slices[int(body[gi])]
+            example = f" (e.g. {a}[{gj - a_start}] and {b}[{gi - b_start}] share the same position)"
+            warnings.append(
+                "PPF export warning: detected coincident vertices between deformables"
+                f"{example}. This can trigger an upstream CUDA contact assertion; separate meshes slightly."
+            )
+
+    _coincident_cache = (key, warnings)
+    return list(warnings)
 
 
 def export_ppf_scene(context, settings, target_obj: bpy.types.Object, collider_objs: list[bpy.types.Object]) -> ExportResult:
     depsgraph = context.evaluated_depsgraph_get()
+    _object_cache.begin()
 
-    target_world_verts, target_tris = _mesh_eval_to_world_tris(target_obj, depsgraph)
-    if len(target_world_verts) == 0 or len(target_tris) == 0:
+    target_solver_verts, target_tris = _cached_solver_tris(target_obj, depsgraph)
+    if len(target_solver_verts) == 0 or len(target_tris) == 0:
         raise ValueError("Target mesh must have vertices and triangles")
+    target_key = _objects_key([target_obj])
 
-    static_world_verts: list[tuple[float, float, float]] = []
-    static_tris: list[tuple[int, int, int]] = []
+    static_parts: list[tuple[np.ndarray, np.ndarray]] = []
+    static_objs: list[bpy.types.Object] = []
     collider_names: list[str] = []
 
     for obj in collider_objs:
         if obj is None or obj.type != "MESH" or obj.name == target_obj.name:
             continue
-        v, t = _mesh_eval_to_world_tris(obj, depsgraph)
-        if not v or not t:
+        static_objs.append(obj)
+        v, t = _cached_solver_tris(obj, depsgraph)
+        if not len(v) or not len(t):
             continue
-        offset = len(static_world_verts)
-        static_world_verts.extend(v)
-        static_tris.extend([(a + offset, b + offset, c + offset) for (a, b, c) in t])
+        static_parts.append((v, t))
         collider_names.append(obj.name)
 
-    # Apply axis mapping into solver coordinate system.
-    target_solver_verts = [blender_to_solver_xyz(*v) for v in target_world_verts]
-    static_solver_verts = [blender_to_solver_xyz(*v) for v in static_world_verts]
+    static = _ConcatMeshes(static_parts)
+    static_key = _objects_key(static_objs)
+    collider_slices = [
+        (name, off, len(v)) for name, off, (v, _t) in zip(collider_names, static.offsets, static_parts)
+    ]
 
     # Create a temp scene folder.
     root = tempfile.mkdtemp(prefix="ppf_scene_", dir=bpy.app.tempdir)
+    _bin_cache.begin()
     bin_dir = os.path.join(root, "bin")
     param_dir = os.path.join(bin_dir, "param")
     os.makedirs(param_dir, exist_ok=True)
 
     n_vert = len(target_solver_verts)
     n_tri = len(target_tris)
-    n_static_vert = len(static_solver_verts)
-    n_static_tri = len(static_tris)
+    n_static_vert = static.n_vert
+    n_static_tri = static.n_tri
 
     # Displacement map: use one entry (0,0,0) and map all verts to it.
-    _write_f64_colmajor_vec3(os.path.join(bin_dir, "displacement.bin"), [(0.0, 0.0, 0.0)])
-    _write_u32(os.path.join(bin_dir, "vert_dmap.bin"), [0] * n_vert)
+    _write_f64_colmajor_vec3(os.path.join(bin_dir, "displacement.bin"), lambda: np.zeros((1, 3)), ("zeros", 1))
+    _write_u32(os.path.join(bin_dir, "vert_dmap.bin"), lambda: np.zeros(n_vert, dtype=np.uint32), ("zeros", n_vert))
 
     # Core geometry
-    _write_f64_colmajor_vec3(os.path.join(bin_dir, "vert.bin"), target_solver_verts)
-    _write_f32_colmajor_vec3(os.path.join(bin_dir, "vel.bin"), [(0.0, 0.0, 0.0)] * n_vert)
-    _write_f32_colmajor_vec3(os.path.join(bin_dir, "color.bin"), [(0.0, 0.0, 0.0)] * n_vert)
+    _write_f64_colmajor_vec3(os.path.join(bin_dir, "vert.bin"), target_solver_verts, _tagged("vert", target_key))
+    _write_f32_colmajor_vec3(os.path.join(bin_dir, "vel.bin"), lambda: np.zeros((n_vert, 3)), ("zeros", n_vert))
+    _write_f32_colmajor_vec3(os.path.join(bin_dir, "color.bin"), lambda: np.zeros((n_vert, 3)), ("zeros", n_vert))
 
-    _write_u64_colmajor_tris(os.path.join(bin_dir, "tri.bin"), target_tris)
+    _write_u64_colmajor_tris(os.path.join(bin_dir, "tri.bin"), target_tris, _tagged("tri", target_key))
 
     # Optional static collision mesh
     if n_static_vert > 0 and n_static_tri > 0:
-        _write_u32(os.path.join(bin_dir, "static_vert_dmap.bin"), [0] * n_static_vert)
-        _write_f64_colmajor_vec3(os.path.join(bin_dir, "static_vert.bin"), static_solver_verts)
-        _write_u64_colmajor_tris(os.path.join(bin_dir, "static_tri.bin"), static_tris)
-        _write_f32_colmajor_vec3(os.path.join(bin_dir, "static_color.bin"), [(0.0, 0.0, 0.0)] * n_static_vert)
+        _write_u32(os.path.join(bin_dir, "static_vert_dmap.bin"), lambda: np.zeros(n_static_vert, dtype=np.uint32), ("zeros", n_static_vert))
+        _write_f64_colmajor_vec3(os.path.join(bin_dir, "static_vert.bin"), lambda: static.verts, _tagged("vert", static_key))
+        _write_u64_colmajor_tris(os.path.join(bin_dir, "static_tri.bin"), lambda: static.tris, _tagged("tri", static_key))
+        _write_f32_colmajor_vec3(os.path.join(bin_dir, "static_color.bin"), lambda: np.zeros((n_static_vert, 3)), ("zeros", n_static_vert))
 
     # Element material parameters (constant arrays for now)
-    model_map = {
-        "arap": 0,
-        "stvk": 1,
-        "baraff-witkin": 2,
-        "snhk": 3,
-    }
-    tri_model = model_map.get(getattr(settings, "tri_model", "baraff-witkin"), 2)
-
-    tri_density = float(getattr(settings, "tri_density", 1.0))
-    tri_young = float(getattr(settings, "tri_young_mod", 100.0))
-    tri_poiss = float(getattr(settings, "tri_poiss_rat", 0.35))
-    tri_bend = float(getattr(settings, "tri_bend", 2.0))
-    tri_shrink = float(getattr(settings, "tri_shrink", 1.0))
-    tri_gap = float(getattr(settings, "tri_contact_gap", 1e-3))
-    tri_offset = float(getattr(settings, "tri_contact_offset", 0.0))
-    tri_strain = float(getattr(settings, "tri_strain_limit", 0.0))
-    tri_friction = float(getattr(settings, "tri_friction", 0.0))
-
-    _write_u8(os.path.join(param_dir, "tri-model.bin"), [tri_model] * n_tri)
-    _write_f32(os.path.join(param_dir, "tri-density.bin"), [tri_density] * n_tri)
-    _write_f32(os.path.join(param_dir, "tri-young-mod.bin"), [tri_young] * n_tri)
-    _write_f32(os.path.join(param_dir, "tri-poiss-rat.bin"), [tri_poiss] * n_tri)
-    _write_f32(os.path.join(param_dir, "tri-bend.bin"), [tri_bend] * n_tri)
-    _write_f32(os.path.join(param_dir, "tri-shrink.bin"), [tri_shrink] * n_tri)
-    _write_f32(os.path.join(param_dir, "tri-contact-gap.bin"), [tri_gap] * n_tri)
-    _write_f32(os.path.join(param_dir, "tri-contact-offset.bin"), [tri_offset] * n_tri)
-    _write_f32(os.path.join(param_dir, "tri-strain-limit.bin"), [tri_strain] * n_tri)
-    _write_f32(os.path.join(param_dir, "tri-friction.bin"), [tri_friction] * n_tri)
+    tri_model, tri_values = _tri_params(settings)
+    _write_tri_params(param_dir, [tri_model], [tri_values], [n_tri])
 
     if n_static_tri > 0:
-        static_gap = float(getattr(settings, "static_contact_gap", 1e-3))
-        static_offset = float(getattr(settings, "static_contact_offset", 0.0))
-        static_friction = float(getattr(settings, "static_friction", 0.0))
-        _write_f32(os.path.join(param_dir, "static-contact-gap.bin"), [static_gap] * n_static_tri)
-        _write_f32(os.path.join(param_dir, "static-contact-offset.bin"), [static_offset] * n_static_tri)
-        _write_f32(os.path.join(param_dir, "static-friction.bin"), [static_friction] * n_static_tri)
+        _write_static_params(param_dir, [_static_params(settings)], [n_static_tri])
 
     # Pins
     # We export separate pin blocks so pin handles and attach-to-mesh can have different strength/mode.
@@ -256,38 +785,17 @@ def export_ppf_scene(context, settings, target_obj: bpy.types.Object, collider_o
     pull_strength_1 = 0.0
     props = getattr(target_obj, "andosim_artezbuild", None)
     if props and bool(getattr(props, "pin_enabled", False)):
-        vg_name = (getattr(props, "pin_vertex_group", "") or "").strip()
-        if vg_name and vg_name in target_obj.vertex_groups:
-            vg_index = target_obj.vertex_groups[vg_name].index
-            for v in target_obj.data.vertices:
-                w = 0.0
-                for g in v.groups:
-                    if g.group == vg_index:
-                        w = float(g.weight)
-                        break
-                if w > 0.0:
-                    pin_indices_0.append(int(v.index))
+        members = _cached_vertex_group_indices(target_obj, getattr(props, "pin_vertex_group", ""))
+        if members is not None:
+            pin_indices_0 = np.unique(members).tolist()
             pull_strength_0 = float(getattr(props, "pin_pull_strength", 0.0))
 
     if props and bool(getattr(props, "attach_enabled", False)):
-        vg_name = (getattr(props, "attach_vertex_group", "") or "").strip()
-        if vg_name and vg_name in target_obj.vertex_groups:
-            vg_index = target_obj.vertex_groups[vg_name].index
-            for v in target_obj.data.vertices:
-                w = 0.0
-                for g in v.groups:
-                    if g.group == vg_index:
-                        w = float(g.weight)
-                        break
-                if w > 0.0:
-                    pin_indices_1.append(int(v.index))
+        members = _cached_vertex_group_indices(target_obj, getattr(props, "attach_vertex_group", ""))
+        if members is not None:
+            pin_indices_1 = np.unique(members).tolist()
             pull_strength_1 = float(getattr(props, "attach_pull_strength", 0.0))
 
-    if pin_indices_0:
-        pin_indices_0 = sorted(set(int(i) for i in pin_indices_0))
-    if pin_indices_1:
-        pin_indices_1 = sorted(set(int(i) for i in pin_indices_1))
-
     pin_blocks: list[tuple[list[int], float]] = []
     if pin_indices_0:
         pin_blocks.append((pin_indices_0, float(pull_strength_0)))
@@ -369,11 +877,14 @@ def export_ppf_scene(context, settings, target_obj: bpy.types.Object, collider_o
     for bi, (inds, _pull) in enumerate(pin_blocks):
         _write_u64(os.path.join(bin_dir, f"pin-ind-{bi}.bin"), inds)
 
+    _bin_cache.commit()
+    _object_cache.commit()
     return ExportResult(
         scene_path=root,
         deformable_object_names=[target_obj.name],
         collider_object_names=collider_names,
         deformable_slices=[(target_obj.name, 0, n_vert)],
+        collider_slices=collider_slices,
     )
 
 
@@ -385,6 +896,7 @@ def export_ppf_scene_from_roles(context, settings) -> ExportResult:
     """
 
     depsgraph = context.evaluated_depsgraph_get()
+    _object_cache.begin()
 
     deformables: list[bpy.types.Object] = []
     colliders: list[bpy.types.Object] = []
@@ -410,108 +922,58 @@ def export_ppf_scene_from_roles(context, settings) -> ExportResult:
     colliders = sorted(colliders, key=lambda o: o.name)
 
     deformable_slices: list[tuple[str, int, int]] = []
-    all_def_verts: list[tuple[float, float, float]] = []
-    all_def_tris: list[tuple[int, int, int]] = []
+    def_parts: list[tuple[np.ndarray, np.ndarray]] = []
     deformable_names: list[str] = []
 
-    # Per-triangle material arrays (match upstream naming: tri-*.bin)
-    tri_model_arr: list[int] = []
-    tri_density_arr: list[float] = []
-    tri_young_arr: list[float] = []
-    tri_poiss_arr: list[float] = []
-    tri_bend_arr: list[float] = []
-    tri_shrink_arr: list[float] = []
-    tri_gap_arr: list[float] = []
-    tri_offset_arr: list[float] = []
-    tri_strain_arr: list[float] = []
-    tri_friction_arr: list[float] = []
+    # Per-object material rows (match upstream naming: tri-*.bin), expanded per triangle below.
+    tri_model_rows: list[int] = []
+    tri_param_rows: list[tuple[float, ...]] = []
 
     # Pins aggregated across deformables.
     # Block 0: pin group (handles)
     # Block 1: attach group (attach-to-mesh)
-    pin_indices_0: list[int] = []
+    pin_parts_0: list[np.ndarray] = []
     pin_pull_strength_0 = 0.0
-    pin_indices_1: list[int] = []
+    pin_parts_1: list[np.ndarray] = []
     pin_pull_strength_1 = 0.0
 
     # Stitches: list of (src, e0, e1) + (unused, weight)
     stitch_ind: list[tuple[int, int, int]] = []
     stitch_w: list[tuple[float, float]] = []
 
+    base = 0
     for obj in deformables:
-        world_verts, tris = _mesh_eval_to_world_tris(obj, depsgraph)
-        if not world_verts or not tris:
+        solver_verts, tris = _cached_solver_tris(obj, depsgraph)
+        if not len(solver_verts) or not len(tris):
             raise ValueError(f"Deformable '{obj.name}' has no triangles")
-        base = len(all_def_verts)
-        all_def_verts.extend(world_verts)
-        all_def_tris.extend([(a + base, b + base, c + base) for (a, b, c) in tris])
+        def_parts.append((solver_verts, tris))
 
         # Per-object params override.
         oprops = getattr(obj, "andosim_artezbuild", None)
         use_obj = bool(oprops and getattr(oprops, "use_object_params", False))
-        model_map = {"arap": 0, "stvk": 1, "baraff-witkin": 2, "snhk": 3}
-        tri_model = model_map.get(
-            (getattr(oprops, "tri_model", None) if use_obj else getattr(settings, "tri_model", "baraff-witkin")),
-            2,
-        )
-        tri_density = float(getattr(oprops, "tri_density", 1.0) if use_obj else getattr(settings, "tri_density", 1.0))
-        tri_young = float(getattr(oprops, "tri_young_mod", 100.0) if use_obj else getattr(settings, "tri_young_mod", 100.0))
-        tri_poiss = float(getattr(oprops, "tri_poiss_rat", 0.35) if use_obj else getattr(settings, "tri_poiss_rat", 0.35))
-        tri_bend = float(getattr(oprops, "tri_bend", 2.0) if use_obj else getattr(settings, "tri_bend", 2.0))
-        tri_shrink = float(getattr(oprops, "tri_shrink", 1.0) if use_obj else getattr(settings, "tri_shrink", 1.0))
-        tri_gap = float(getattr(oprops, "tri_contact_gap", 1e-3) if use_obj else getattr(settings, "tri_contact_gap", 1e-3))
-        tri_offset = float(getattr(oprops, "tri_contact_offset", 0.0) if use_obj else getattr(settings, "tri_contact_offset", 0.0))
-        tri_strain = float(getattr(oprops, "tri_strain_limit", 0.0) if use_obj else getattr(settings, "tri_strain_limit", 0.0))
-        tri_friction = float(getattr(oprops, "tri_friction", 0.0) if use_obj else getattr(settings, "tri_friction", 0.0))
-
-        for _ in range(len(tris)):
-            tri_model_arr.append(int(tri_model))
-            tri_density_arr.append(float(tri_density))
-            tri_young_arr.append(float(tri_young))
-            tri_poiss_arr.append(float(tri_poiss))
-            tri_bend_arr.append(float(tri_bend))
-            tri_shrink_arr.append(float(tri_shrink))
-            tri_gap_arr.append(float(tri_gap))
-            tri_offset_arr.append(float(tri_offset))
-            tri_strain_arr.append(float(tri_strain))
-            tri_friction_arr.append(float(tri_friction))
+        tri_model, tri_values = _tri_params(oprops if use_obj else settings)
+        tri_model_rows.append(tri_model)
+        tri_param_rows.append(tri_values)
 
         # Pins (vertex groups) -> global indices
         if oprops and bool(getattr(oprops, "pin_enabled", False)):
-            vg_name = (getattr(oprops, "pin_vertex_group", "") or "").strip()
-            if vg_name and vg_name in obj.vertex_groups:
-                vg_index = obj.vertex_groups[vg_name].index
-                for v in obj.data.vertices:
-                    w = 0.0
-                    for g in v.groups:
-                        if g.group == vg_index:
-                            w = float(g.weight)
-                            break
-                    if w > 0.0:
-                        pin_indices_0.append(int(base + v.index))
+            members = _cached_vertex_group_indices(obj, getattr(oprops, "pin_vertex_group", ""))
+            if members is not None:
+                pin_parts_0.append(members + base)
                 pin_pull_strength_0 = max(pin_pull_strength_0, float(getattr(oprops, "pin_pull_strength", 0.0)))
 
         if oprops and bool(getattr(oprops, "attach_enabled", False)):
-            vg_name = (getattr(oprops, "attach_vertex_group", "") or "").strip()
-            if vg_name and vg_name in obj.vertex_groups:
-                vg_index = obj.vertex_groups[vg_name].index
-                for v in obj.data.vertices:
-                    w = 0.0
-                    for g in v.groups:
-                        if g.group == vg_index:
-                            w = float(g.weight)
-                            break
-                    if w > 0.0:
-                        pin_indices_1.append(int(base + v.index))
+            members = _cached_vertex_group_indices(obj, getattr(oprops, "attach_vertex_group", ""))
+            if members is not None:
+                pin_parts_1.append(members + base)
                 pin_pull_strength_1 = max(pin_pull_strength_1, float(getattr(oprops, "attach_pull_strength", 0.0)))
 
-        deformable_slices.append((obj.name, base, len(world_verts)))
+        deformable_slices.append((obj.name, base, len(solver_verts)))
         deformable_names.append(obj.name)
+        base += len(solver_verts)
 
-    if pin_indices_0:
-        pin_indices_0 = sorted(set(int(i) for i in pin_indices_0))
-    if pin_indices_1:
-        pin_indices_1 = sorted(set(int(i) for i in pin_indices_1))
+    pin_indices_0 = np.unique(np.concatenate(pin_parts_0)).tolist() if pin_parts_0 else []
+    pin_indices_1 = np.unique(np.concatenate(pin_parts_1)).tolist() if pin_parts_1 else []
 
     pin_blocks: list[tuple[list[int], float]] = []
     if pin_indices_0:
@@ -539,190 +1001,74 @@ def export_ppf_scene_from_roles(context, settings) -> ExportResult:
         if src_offset is None or tgt_offset is None:
             continue
 
-        src_group = (getattr(oprops, "stitch_source_vertex_group", "") or "").strip()
-        tgt_group = (getattr(oprops, "stitch_target_vertex_group", "") or "").strip()
-        max_dist = float(getattr(oprops, "stitch_max_distance", 0.0))
-        max_dist2 = max_dist * max_dist
-
-        src_vg_index = None
-        if src_group and src_group in obj.vertex_groups:
-            src_vg_index = obj.vertex_groups[src_group].index
-
-        tgt_vg_index = None
-        if tgt_group and tgt_group in target_obj.vertex_groups:
-            tgt_vg_index = target_obj.vertex_groups[tgt_group].index
-
-        if src_vg_index is None:
-            continue
-
-        tgt_world_verts, tgt_edges = _mesh_eval_to_world_edges(target_obj, depsgraph)
-
-        if tgt_vg_index is not None:
-            in_group = [False] * len(target_obj.data.vertices)
-            for v in target_obj.data.vertices:
-                w = 0.0
-                for g in v.groups:
-                    if g.group == tgt_vg_index:
-                        w = float(g.weight)
-                        break
-                if w > 0.0:
-                    in_group[int(v.index)] = True
-            candidate_edges = [e for e in tgt_edges if in_group[e[0]] and in_group[e[1]]]
-        else:
-            candidate_edges = tgt_edges
-
-        if not candidate_edges:
+        matched = _cached_stitches(obj, target_obj, oprops, depsgraph)
+        if matched is None:
             continue
+        src_vidx, e0, e1, t = matched
+        stitch_ind.extend(zip((src_vidx + src_offset).tolist(), (e0 + tgt_offset).tolist(), (e1 + tgt_offset).tolist()))
+        stitch_w.extend((0.0, tt) for tt in t.tolist())
 
-        mw = obj.matrix_world
-        for v in obj.data.vertices:
-            w = 0.0
-            for g in v.groups:
-                if g.group == src_vg_index:
-                    w = float(g.weight)
-                    break
-            if w <= 0.0:
-                continue
-
-            p = mw @ v.co
-            p = (float(p.x), float(p.y), float(p.z))
-
-            best = None
-            for e0, e1 in candidate_edges:
-                dist2, t = _point_segment_closest(p, tgt_world_verts[e0], tgt_world_verts[e1])
-                if best is None or dist2 < best[0]:
-                    best = (dist2, int(e0), int(e1), float(t))
-            if best is None:
-                continue
-            dist2, e0, e1, t = best
-            if max_dist2 > 0.0 and dist2 > max_dist2:
-                continue
-
-            stitch_ind.append((int(src_offset + v.index), int(tgt_offset + e0), int(tgt_offset + e1)))
-            stitch_w.append((0.0, float(t)))
-
-    static_world_verts: list[tuple[float, float, float]] = []
-    static_tris: list[tuple[int, int, int]] = []
-    static_gap_arr: list[float] = []
-    static_offset_arr: list[float] = []
-    static_friction_arr: list[float] = []
+    static_parts: list[tuple[np.ndarray, np.ndarray]] = []
+    static_param_rows: list[tuple[float, ...]] = []
     collider_names: list[str] = []
     for obj in colliders:
-        world_verts, tris = _mesh_eval_to_world_tris(obj, depsgraph)
-        if not world_verts or not tris:
+        solver_verts, tris = _cached_solver_tris(obj, depsgraph)
+        if not len(solver_verts) or not len(tris):
             continue
-        base = len(static_world_verts)
-        static_world_verts.extend(world_verts)
-        static_tris.extend([(a + base, b + base, c + base) for (a, b, c) in tris])
+        static_parts.append((solver_verts, tris))
 
         oprops = getattr(obj, "andosim_artezbuild", None)
         use_obj = bool(oprops and getattr(oprops, "use_object_params", False))
-        gap = float(getattr(oprops, "static_contact_gap", 1e-3) if use_obj else getattr(settings, "static_contact_gap", 1e-3))
-        offset = float(getattr(oprops, "static_contact_offset", 0.0) if use_obj else getattr(settings, "static_contact_offset", 0.0))
-        friction = float(getattr(oprops, "static_friction", 0.0) if use_obj else getattr(settings, "static_friction", 0.0))
-        for _ in range(len(tris)):
-            static_gap_arr.append(float(gap))
-            static_offset_arr.append(float(offset))
-            static_friction_arr.append(float(friction))
+        static_param_rows.append(_static_params(oprops if use_obj else settings))
 
         collider_names.append(obj.name)
 
-    # Export using the same low-level writer, but with concatenated arrays.
-    target_solver_verts = [blender_to_solver_xyz(*v) for v in all_def_verts]
-    target_tris = all_def_tris
-    static_solver_verts = [blender_to_solver_xyz(*v) for v in static_world_verts]
+    # Export using the same low-level writer, but with concatenated arrays. Blocks built from
+    # tracked objects are keyed on their state, so unchanged geometry is never concatenated.
+    target = _ConcatMeshes(def_parts)
+    static = _ConcatMeshes(static_parts)
+    target_key = _objects_key(deformables)
+    static_key = _objects_key(colliders)
+    collider_slices = [
+        (name, off, len(v)) for name, off, (v, _t) in zip(collider_names, static.offsets, static_parts)
+    ]
 
-    warnings: list[str] = []
-    # Guard/warning: upstream CUDA contact code can assert if two deformables start with
-    # perfectly coincident points (distance == 0). Detect likely cases and warn early.
-    if len(deformable_slices) > 1 and len(target_solver_verts) > 0:
-        eps = 1e-9
-        key_to_ref: dict[tuple[int, int, int], tuple[str, int]] = {}
-        coincident = 0
-        samples: list[tuple[str, int, str, int]] = []
-        early_stop = False
-        for obj_name, start, count in deformable_slices:
-            if early_stop:
-                break
-            for local_i in range(int(count)):
-                gi = int(start) + int(local_i)
-                sx, sy, sz = target_solver_verts[gi]
-                key = (int(round(sx / eps)), int(round(sy / eps)), int(round(sz / eps)))
-                ref = key_to_ref.get(key)
-                if ref is None:
-                    key_to_ref[key] = (obj_name, int(local_i))
-                else:
-                    other_name, other_local_i = ref
-                    if other_name != obj_name:
-                        coincident += 1
-                        if len(samples) < 3:
-                            samples.append((other_name, other_local_i, obj_name, int(local_i)))
-                        if coincident >= 1000 and len(samples) >= 3:
-                            early_stop = True
-                            break
-
-        if coincident > 0:
-            example = ""
-            if samples:
-                a, ai, b, bi = samples[0]
-                example = f" (e.g. {a}[{ai}] and {b}[{bi}] share the same position)"
-            tail = " (scan stopped early)" if early_stop else ""
-            warnings.append(
-                "PPF export warning: detected coincident vertices between deformables"
-                f"{example}. This can trigger an upstream CUDA contact assertion; separate meshes slightly." + tail
-            )
+    warnings = _coincident_warnings(target, deformable_slices, target_key)
 
     root = tempfile.mkdtemp(prefix="ppf_scene_", dir=bpy.app.tempdir)
+    _bin_cache.begin()
     bin_dir = os.path.join(root, "bin")
     param_dir = os.path.join(bin_dir, "param")
     os.makedirs(param_dir, exist_ok=True)
 
-    n_vert = len(target_solver_verts)
-    n_tri = len(target_tris)
-    n_static_vert = len(static_solver_verts)
-    n_static_tri = len(static_tris)
+    n_vert = target.n_vert
+    n_tri = target.n_tri
+    n_static_vert = static.n_vert
+    n_static_tri = static.n_tri
     n_stitch = len(stitch_ind)
 
-    _write_f64_colmajor_vec3(os.path.join(bin_dir, "displacement.bin"), [(0.0, 0.0, 0.0)])
-    _write_u32(os.path.join(bin_dir, "vert_dmap.bin"), [0] * n_vert)
+    _write_f64_colmajor_vec3(os.path.join(bin_dir, "displacement.bin"), lambda: np.zeros((1, 3)), ("zeros", 1))
+    _write_u32(os.path.join(bin_dir, "vert_dmap.bin"), lambda: np.zeros(n_vert, dtype=np.uint32), ("zeros", n_vert))
 
-    _write_f64_colmajor_vec3(os.path.join(bin_dir, "vert.bin"), target_solver_verts)
-    _write_f32_colmajor_vec3(os.path.join(bin_dir, "vel.bin"), [(0.0, 0.0, 0.0)] * n_vert)
-    _write_f32_colmajor_vec3(os.path.join(bin_dir, "color.bin"), [(0.0, 0.0, 0.0)] * n_vert)
-    _write_u64_colmajor_tris(os.path.join(bin_dir, "tri.bin"), target_tris)
+    _write_f64_colmajor_vec3(os.path.join(bin_dir, "vert.bin"), lambda: target.verts, _tagged("vert", target_key))
+    _write_f32_colmajor_vec3(os.path.join(bin_dir, "vel.bin"), lambda: np.zeros((n_vert, 3)), ("zeros", n_vert))
+    _write_f32_colmajor_vec3(os.path.join(bin_dir, "color.bin"), lambda: np.zeros((n_vert, 3)), ("zeros", n_vert))
+    _write_u64_colmajor_tris(os.path.join(bin_dir, "tri.bin"), lambda: target.tris, _tagged("tri", target_key))
 
     if n_static_vert > 0 and n_static_tri > 0:
-        _write_u32(os.path.join(bin_dir, "static_vert_dmap.bin"), [0] * n_static_vert)
-        _write_f64_colmajor_vec3(os.path.join(bin_dir, "static_vert.bin"), static_solver_verts)
-        _write_u64_colmajor_tris(os.path.join(bin_dir, "static_tri.bin"), static_tris)
-        _write_f32_colmajor_vec3(
-            os.path.join(bin_dir, "static_color.bin"),
-            [(0.0, 0.0, 0.0)] * n_static_vert,
-        )
+        _write_u32(os.path.join(bin_dir, "static_vert_dmap.bin"), lambda: np.zeros(n_static_vert, dtype=np.uint32), ("zeros", n_static_vert))
+        _write_f64_colmajor_vec3(os.path.join(bin_dir, "static_vert.bin"), lambda: static.verts, _tagged("vert", static_key))
+        _write_u64_colmajor_tris(os.path.join(bin_dir, "static_tri.bin"), lambda: static.tris, _tagged("tri", static_key))
+        _write_f32_colmajor_vec3(os.path.join(bin_dir, "static_color.bin"), lambda: np.zeros((n_static_vert, 3)), ("zeros", n_static_vert))
 
     if n_stitch > 0:
         _write_u64_colmajor_tris(os.path.join(bin_dir, "stitch_ind.bin"), stitch_ind)
         _write_f32_colmajor_vec2(os.path.join(bin_dir, "stitch_w.bin"), stitch_w)
 
-    if len(tri_model_arr) != n_tri:
-        raise RuntimeError("Internal error: tri param arrays length mismatch")
-    _write_u8(os.path.join(param_dir, "tri-model.bin"), tri_model_arr)
-    _write_f32(os.path.join(param_dir, "tri-density.bin"), tri_density_arr)
-    _write_f32(os.path.join(param_dir, "tri-young-mod.bin"), tri_young_arr)
-    _write_f32(os.path.join(param_dir, "tri-poiss-rat.bin"), tri_poiss_arr)
-    _write_f32(os.path.join(param_dir, "tri-bend.bin"), tri_bend_arr)
-    _write_f32(os.path.join(param_dir, "tri-shrink.bin"), tri_shrink_arr)
-    _write_f32(os.path.join(param_dir, "tri-contact-gap.bin"), tri_gap_arr)
-    _write_f32(os.path.join(param_dir, "tri-contact-offset.bin"), tri_offset_arr)
-    _write_f32(os.path.join(param_dir, "tri-strain-limit.bin"), tri_strain_arr)
-    _write_f32(os.path.join(param_dir, "tri-friction.bin"), tri_friction_arr)
+    _write_tri_params(param_dir, tri_model_rows, tri_param_rows, [len(t) for _v, t in def_parts])
 
     if n_static_tri > 0:
-        if len(static_gap_arr) != n_static_tri:
-            raise RuntimeError("Internal error: static param arrays length mismatch")
-        _write_f32(os.path.join(param_dir, "static-contact-gap.bin"), static_gap_arr)
-        _write_f32(os.path.join(param_dir, "static-contact-offset.bin"), static_offset_arr)
-        _write_f32(os.path.join(param_dir, "static-friction.bin"), static_friction_arr)
+        _write_static_params(param_dir, static_param_rows, [len(t) for _v, t in static_parts])
 
     info_path = os.path.join(root, "info.toml")
     with open(info_path, "w", encoding="utf-8") as f:
@@ -797,10 +1143,13 @@ def export_ppf_scene_from_roles(context, settings) -> ExportResult:
     for bi, (inds, _pull) in enumerate(pin_blocks):
         _write_u64(os.path.join(bin_dir, f"pin-ind-{bi}.bin"), inds)
 
+    _bin_cache.commit()
+    _object_cache.commit()
     return ExportResult(
         scene_path=root,
         deformable_object_names=deformable_names,
         collider_object_names=collider_names,
         deformable_slices=deformable_slices,
         warnings=warnings,
+        collider_slices=collider_slices,
     )
@@ -37,6 +37,8 @@ __all__ = [
     "SessionExport",
     "SessionOutput",
     "SessionGet",
+    "FrameStore",
+    "ScenePack",
     "CppRustDocStringParser",
     "ParamManager",
     "Utils",
@@ -49,7 +51,9 @@ from ._app_ import App
 from ._asset_ import AssetFetcher, AssetManager, AssetUploader
 from ._decoder_ import BlenderApp, ParamDecoder, SceneDecoder
 from ._extra_ import Extra
+from ._frame_ import FrameStore
 from ._mesh_ import CreateManager, MeshManager, Rod, TetMesh, TriMesh
+from ._pack_ import ScenePack
 from ._parse_ import CppRustDocStringParser
 from ._plot_ import Plot, PlotManager
 from ._scene_ import (
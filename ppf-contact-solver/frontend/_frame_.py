@@ -0,0 +1,360 @@
+# File: _frame_.py
+# Code: Claude Code and Codex
+# Review: Ryoichi Ando (ryoichi.ando@zozo.com)
+# License: Apache v2.0
+
+import ctypes
+import ctypes.util
+import functools
+import os
+import struct
+import sys
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+
+class FrameStore:
+    """Cached reader for the vertex frames of a session output directory.
+
+    Each frame file is read whole into memory rather than mapped, so no file
+    stays open while the solver renames over it or removes old frames. The most
+    recently used ``capacity`` frames are kept decoded, and ``prefetch`` loads
+    upcoming frames on a background thread so scrubbing does not wait on disk.
+    A cached frame is reloaded when its file changes on disk.
+    """
+
+    def __init__(self, path: str, capacity: int = 64):
+        """Initialize the frame store.
+
+        Args:
+            path (str): The session output directory holding ``vert_{n}.bin``.
+            capacity (int, optional): The number of decoded frames to keep. Defaults to 64.
+        """
+        self.path = path
+        self._capacity = max(1, capacity)
+        self._init()
+
+    def _init(self):
+        self._index = _FrameIndex(self.path)
+        self._cache: OrderedDict[int, tuple[tuple[int, int], np.ndarray]] = (
+            OrderedDict()
+        )
+        self._pending: dict[int, Future] = {}
+        self._lock = threading.RLock()
+        self._reader: Optional[ThreadPoolExecutor] = None
+
+    def __getstate__(self) -> dict:
+        return {"path": self.path, "capacity": self._capacity}
+
+    def __setstate__(self, state: dict):
+        self.path = state["path"]
+        self._capacity = state["capacity"]
+        self._init()
+
+    def latest(self) -> int:
+        """Get the latest vertex frame number, or 0 if there is none."""
+        return self._index.latest()
+
+    def saved(self) -> list[int]:
+        """Get the sorted frame numbers of the saved states."""
+        return self._index.saved()
+
+    def get(self, frame: int) -> Optional[np.ndarray]:
+        """Get the vertices of a frame.
+
+        Args:
+            frame (int): The frame number.
+
+        Returns:
+            Optional[np.ndarray]: The read-only (N, 3) vertices, or None if the frame is missing or incomplete.
+        """
+        with self._lock:
+            future = self._pending.get(frame)
+        if future is not None:
+            future.result()
+        return self._load(frame)
+
+    def prefetch(self, start: int, count: int) -> "FrameStore":
+        """Load frames ``start`` to ``start + count - 1`` in the background.
+
+        Args:
+            start (int): The first frame to load.
+            count (int): The number of frames to load, capped at the capacity.
+
+        Returns:
+            FrameStore: The frame store.
+        """
+        with self._lock:
+            if self._reader is None:
+                self._reader = ThreadPoolExecutor(max_workers=1)
+            for frame in range(start, start + min(count, self._capacity)):
+                if frame in self._pending or frame in self._cache:
+                    continue
+                future = self._reader.submit(self._load, frame)
+                self._pending[frame] = future
+                future.add_done_callback(functools.partial(self._settle, frame))
+        return self
+
+    def _settle(self, frame: int, future: Future):
+        with self._lock:
+            if self._pending.get(frame) is future:
+                del self._pending[frame]
+
+    def clear(self) -> "FrameStore":
+        """Drop all decoded frames."""
+        with self._lock:
+            self._cache.clear()
+        return self
+
+    def close(self):
+        """Stop the prefetch thread and release the directory watch."""
+        with self._lock:
+            if self._reader is not None:
+                self._reader.shutdown(wait=False, cancel_futures=True)
+                self._reader = None
+            self._pending.clear()
+        self._index.close()
+
+    def _load(self, frame: int) -> Optional[np.ndarray]:
+        path = os.path.join(self.path, f"vert_{frame}.bin")
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._cache.pop(frame, None)
+            return None
+        key = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._cache.get(frame)
+            if entry is not None and entry[0] == key:
+                self._cache.move_to_end(frame)
+                return entry[1]
+        vert = self._read(path, st.st_size)
+        if vert is not None:
+            with self._lock:
+                self._cache[frame] = (key, vert)
+                self._cache.move_to_end(frame)
+                while len(self._cache) > self._capacity:
+                    self._cache.popitem(last=False)
+        return vert
+
+    @staticmethod
+    def _read(path: str, size: int) -> Optional[np.ndarray]:
+        if size % 12:
+            return None
+        try:
+            vert = np.fromfile(path, dtype=np.float32)
+        except (OSError, ValueError):
+            return None
+        if len(vert) != size // 4:
+            # Replaced while reading
+            return None
+        vert = vert.reshape(-1, 3)
+        vert.flags.writeable = False
+        return vert
+
+
+class _Inotify:
+    """Non-blocking inotify watch on a single directory (Linux only)."""
+
+    _IN_MOVED_FROM = 0x40
+    _IN_MOVED_TO = 0x80
+    _IN_CREATE = 0x100
+    _IN_DELETE = 0x200
+    _IN_DELETE_SELF = 0x400
+    _IN_MOVE_SELF = 0x800
+    _IN_Q_OVERFLOW = 0x4000
+    _IN_IGNORED = 0x8000
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, path: str):
+        self._fd = -1
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = (
+            self._IN_CREATE
+            | self._IN_MOVED_TO
+            | self._IN_DELETE
+            | self._IN_MOVED_FROM
+            | self._IN_DELETE_SELF
+            | self._IN_MOVE_SELF
+        )
+        if libc.inotify_add_watch(self._fd, os.fsencode(path), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed for {path}")
+
+    def read(self) -> Optional[list[tuple[str, bool]]]:
+        """Drain pending events as ``(name, removed)`` pairs.
+
+        Returns None when events were lost or the directory itself went away.
+        """
+        events = []
+        while True:
+            try:
+                buf = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(buf):
+                _, mask, _, length = self._EVENT.unpack_from(buf, offset)
+                offset += self._EVENT.size
+                name = buf[offset : offset + length].split(b"\0", 1)[0]
+                offset += length
+                if mask & (
+                    self._IN_Q_OVERFLOW
+                    | self._IN_IGNORED
+                    | self._IN_DELETE_SELF
+                    | self._IN_MOVE_SELF
+                ):
+                    return None
+                removed = bool(mask & (self._IN_DELETE | self._IN_MOVED_FROM))
+                events.append((os.fsdecode(name), removed))
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __del__(self):
+        self.close()
+
+
+class _FrameIndex:
+    """Cached index of the frames in a session output directory.
+
+    The solver writes ``vert_{n}.bin`` in increasing order (via a rename) and
+    ``state_{n}.bin.gz`` when it saves. On Linux the index follows the
+    directory through inotify. Elsewhere it re-stats the directory and, when
+    it changed, probes forward from the highest known frame. A full listing is
+    only needed when the directory is replaced or the latest frame disappears.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._reset()
+
+    def _reset(self):
+        self._watch: Optional[_Inotify] = None
+        self._watch_failed = not sys.platform.startswith("linux")
+        self._stat: Optional[tuple[int, int]] = None
+        self._latest = 0
+        self._saved: Optional[set[int]] = None
+
+    def __getstate__(self) -> dict:
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict):
+        self.path = state["path"]
+        self._reset()
+
+    def close(self):
+        if self._watch is not None:
+            self._watch.close()
+            self._watch = None
+
+    def latest(self) -> int:
+        """Return the highest vertex frame number, or 0 if there is none."""
+        self._refresh()
+        return self._latest
+
+    def saved(self) -> list[int]:
+        """Return the sorted frame numbers of the saved states."""
+        self._refresh()
+        if self._saved is None:
+            self._saved = set()
+            if os.path.isdir(self.path):
+                for file in os.listdir(self.path):
+                    entry = self._parse(file)
+                    if entry is not None and entry[0] == "state":
+                        self._saved.add(entry[1])
+        return sorted(self._saved)
+
+    @staticmethod
+    def _parse(file: str) -> Optional[tuple[str, int]]:
+        if file.startswith("vert") and file.endswith(".bin"):
+            return "vert", int(file.split("_")[1].split(".")[0])
+        elif file.startswith("state_") and file.endswith(".bin.gz"):
+            return "state", int(file.split("_")[1].split(".")[0])
+        return None
+
+    def _vert_path(self, frame: int) -> str:
+        return os.path.join(self.path, f"vert_{frame}.bin")
+
+    def _scan(self):
+        self._latest = 0
+        self._saved = None
+        if os.path.isdir(self.path):
+            for file in os.listdir(self.path):
+                entry = self._parse(file)
+                if entry is not None and entry[0] == "vert":
+                    self._latest = max(self._latest, entry[1])
+
+    def _refresh(self):
+        if self._watch is not None:
+            events = self._watch.read()
+            if events is not None:
+                rescan = False
+                for file, removed in events:
+                    entry = self._parse(file)
+                    if entry is None:
+                        continue
+                    kind, frame = entry
+                    if kind == "vert":
+                        if not removed:
+                            self._latest = max(self._latest, frame)
+                        elif frame == self._latest:
+                            rescan = True
+                    elif self._saved is not None:
+                        if removed:
+                            self._saved.discard(frame)
+                        else:
+                            self._saved.add(frame)
+                if rescan:
+                    self._scan()
+                return
+            self.close()
+            self._stat = None
+
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self._stat = None
+            self._latest = 0
+            self._saved = set()
+            return
+        stat = (st.st_ino, st.st_mtime_ns)
+        if stat == self._stat:
+            # Directory timestamps can be coarse; a new frame may share one
+            while os.path.exists(self._vert_path(self._latest + 1)):
+                self._latest += 1
+            return
+
+        if not self._watch_failed:
+            # Watch before scanning so no event between the two is lost
+            try:
+                self._watch = _Inotify(self.path)
+            except (OSError, AttributeError):
+                self._watch_failed = True
+
+        if (
+            self._watch is None
+            and self._stat is not None
+            and self._stat[0] == stat[0]
+            and (self._latest == 0 or os.path.exists(self._vert_path(self._latest)))
+        ):
+            while os.path.exists(self._vert_path(self._latest + 1)):
+                self._latest += 1
+            if self._latest == 0:
+                self._scan()
+            self._saved = None
+        else:
+            self._scan()
+        self._stat = stat
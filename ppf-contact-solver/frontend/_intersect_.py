@@ -0,0 +1,246 @@
+# File: _intersect_.py
+# Code: Claude Code and Codex
+# Review: Ryoichi Ando (ryoichi.ando@zozo.com)
+# License: Apache v2.0
+
+from typing import Optional
+
+import numpy as np
+
+# Candidate pairs handled per narrow-phase batch
+PAIR_CHUNK = 1 << 20
+
+
+def find_intersections(
+    vert: np.ndarray,
+    tri: np.ndarray,
+    other_vert: Optional[np.ndarray] = None,
+    other_tri: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Find pairs of intersecting triangles.
+
+    Without a second mesh, the triangles of the first mesh are tested against
+    each other, skipping pairs that share a vertex. With a second mesh, only
+    pairs across the two meshes are tested. Candidate pairs come from a
+    uniform grid over the triangle bounding boxes and are confirmed with
+    segment-triangle tests, so coplanar overlaps are not reported.
+
+    Args:
+        vert (np.ndarray): The (N, 3) vertex positions.
+        tri (np.ndarray): The (M, 3) triangle indices.
+        other_vert (Optional[np.ndarray]): The vertex positions of the second mesh. Defaults to None.
+        other_tri (Optional[np.ndarray]): The triangle indices of the second mesh. Defaults to None.
+
+    Returns:
+        np.ndarray: The (K, 2) sorted pairs of intersecting triangle indices. With a second mesh, the second column indexes its triangles.
+    """
+    tri_pos = _triangles(vert, tri)
+    cross = other_vert is not None and other_tri is not None
+    if cross:
+        other_pos = _triangles(other_vert, other_tri)
+        if not len(tri_pos) or not len(other_pos):
+            return np.zeros((0, 2), dtype=np.int64)
+        split = len(tri_pos)
+        tri_pos = np.concatenate([tri_pos, other_pos])
+    elif len(tri_pos) < 2:
+        return np.zeros((0, 2), dtype=np.int64)
+    else:
+        split = None
+
+    lo, hi = tri_pos.min(axis=1), tri_pos.max(axis=1)
+    first, second = _candidates(lo, hi, split)
+    ind = np.asarray(tri, dtype=np.int64).reshape(-1, 3)
+
+    hit = np.zeros(len(first), dtype=bool)
+    for start in range(0, len(first), PAIR_CHUNK):
+        chunk = slice(start, start + PAIR_CHUNK)
+        i, j = first[chunk], second[chunk]
+        if split is None:
+            # Triangles sharing a vertex touch by construction
+            shared = (ind[i][:, :, None] == ind[j][:, None, :]).any(axis=(1, 2))
+            hit[chunk][~shared] = _intersect(tri_pos[i[~shared]], tri_pos[j[~shared]])
+        else:
+            hit[chunk] = _intersect(tri_pos[i], tri_pos[j])
+    pairs = np.stack([first[hit], second[hit]], axis=1)
+    if split is not None:
+        pairs[:, 1] -= split
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def _triangles(vert: np.ndarray, tri: np.ndarray) -> np.ndarray:
+    tri = np.asarray(tri, dtype=np.int64).reshape(-1, 3)
+    return np.asarray(vert, dtype=np.float64)[tri]
+
+
+def _candidates(
+    lo: np.ndarray, hi: np.ndarray, split: Optional[int]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the triangle pairs whose bounding boxes overlap.
+
+    Triangles are sorted into a hierarchy of grids whose cells double in size
+    from the median triangle extent, each triangle on the finest level whose
+    cells are at least as large as its box. A level pairs its own triangles
+    with each other and with the smaller triangles of the levels below, so a
+    coarse collider next to a fine cloth costs a few cells per triangle.
+
+    With ``split``, only pairs with one triangle on each side of it are kept,
+    ordered so that the first index is below ``split``.
+    """
+    extent = (hi - lo).max(axis=1)
+    base = np.median(extent)
+    if not base > 0.0:
+        base = max(extent.max(), 1.0)
+    ratio = np.maximum(extent / base, 1.0)
+    level = np.ceil(np.log2(ratio)).astype(np.int64)
+    # Rounding in log2 must not leave a box wider than its cells
+    level += extent > base * np.exp2(level)
+    side = np.zeros(len(lo), dtype=np.int8)
+    if split is not None:
+        side[split:] = 1
+
+    origin = lo.min(axis=0)
+    first, second = [], []
+    for k in np.unique(level):
+        member = np.flatnonzero(level <= k)
+        pair = _grid_pairs(
+            lo, hi, origin, base * 2.0**k, member, level[member] == k, side, split
+        )
+        first.append(pair[0])
+        second.append(pair[1])
+    first, second = np.concatenate(first), np.concatenate(second)
+    if split is None:
+        first, second = np.minimum(first, second), np.maximum(first, second)
+    return first, second
+
+
+def _grid_pairs(
+    lo: np.ndarray,
+    hi: np.ndarray,
+    origin: np.ndarray,
+    cell: float,
+    member: np.ndarray,
+    owner: np.ndarray,
+    side: np.ndarray,
+    split: Optional[int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pair the owners of one grid level with each other and with the guests.
+
+    Guests are the smaller triangles of the levels below; pairs of two guests
+    are found on their own levels and never enumerated here.
+    """
+    cell_lo = np.floor((lo[member] - origin) / cell).astype(np.int64)
+    cell_hi = np.floor((hi[member] - origin) / cell).astype(np.int64)
+    span = cell_hi - cell_lo + 1
+    n_cell = span.prod(axis=1)
+
+    # One grid entry per covered cell, enumerated without a Python loop
+    entry = np.repeat(np.arange(len(member)), n_cell)
+    local = np.arange(len(entry)) - np.repeat(np.cumsum(n_cell) - n_cell, n_cell)
+    entry_span = span[entry]
+    entry_cell = cell_lo[entry] + np.stack(
+        [
+            local // (entry_span[:, 1] * entry_span[:, 2]),
+            local // entry_span[:, 2] % entry_span[:, 1],
+            local % entry_span[:, 2],
+        ],
+        axis=1,
+    )
+
+    # Within a cell, owners pair with a contiguous run of entries: the owners
+    # after them and the guests, or across meshes with the run ordered as
+    # first-mesh guests, first-mesh owners, second-mesh owners, second-mesh guests
+    entry_owner = owner[entry]
+    if split is None:
+        kind = np.where(entry_owner, 0, 1)
+    else:
+        entry_side = side[member[entry]]
+        kind = np.where(entry_owner, 1 + entry_side, 3 * entry_side)
+    order = np.lexsort((kind, entry_cell[:, 2], entry_cell[:, 1], entry_cell[:, 0]))
+    entry, entry_cell, kind = entry[order], entry_cell[order], kind[order]
+    boundary = np.ones(len(entry), dtype=bool)
+    boundary[1:] = np.any(entry_cell[1:] != entry_cell[:-1], axis=1)
+    group = np.cumsum(boundary) - 1
+    group_start = np.flatnonzero(boundary)
+    group_end = np.append(group_start[1:], len(entry))
+
+    position = np.arange(len(entry))
+    if split is None:
+        range_start = np.where(kind == 0, position + 1, group_end[group])
+        range_end = group_end[group]
+    else:
+        count = np.bincount(group * 4 + kind, minlength=4 * len(group_start))
+        count = count.reshape(-1, 4)
+        second_owner = group_start + count[:, 0] + count[:, 1]
+        first_owner = group_start + count[:, 0]
+        range_start = np.choose(
+            kind, [position, second_owner[group], group_start[group], position]
+        )
+        range_end = np.choose(
+            kind, [position, group_end[group], first_owner[group], position]
+        )
+    n_pair = range_end - range_start
+    first = np.repeat(position, n_pair)
+    second = np.repeat(range_start, n_pair) + (
+        np.arange(len(first)) - np.repeat(np.cumsum(n_pair) - n_pair, n_pair)
+    )
+    owner_cell = entry_cell[first]
+    first, second = entry[first], entry[second]
+
+    # A pair sharing several cells is kept only in the cell holding the lower
+    # corner of the boxes' overlap, so no deduplication pass is needed
+    keep = np.all(
+        (np.maximum(cell_lo[first], cell_lo[second]) == owner_cell)
+        & (
+            np.maximum(lo[member[first]], lo[member[second]])
+            <= np.minimum(hi[member[first]], hi[member[second]])
+        ),
+        axis=1,
+    )
+    first, second = member[first[keep]], member[second[keep]]
+    if split is not None:
+        # Second-mesh owners were paired with first-mesh guests
+        swap = first >= split
+        first, second = np.where(swap, second, first), np.where(swap, first, second)
+    return first, second
+
+
+def _intersect(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Test (P, 3, 3) triangle pairs for intersection by their edges."""
+    # Pairs with one triangle strictly on one side of the other's plane cannot meet
+    straddle = _straddles(a, b) & _straddles(b, a)
+    a, b = a[straddle], b[straddle]
+    hit = np.zeros(len(a), dtype=bool)
+    for tri, other in ((a, b), (b, a)):
+        for i in range(3):
+            hit |= _segment_hits(tri[:, i], tri[:, (i + 1) % 3], other)
+    result = np.zeros(len(straddle), dtype=bool)
+    result[straddle] = hit
+    return result
+
+
+def _straddles(tri: np.ndarray, other: np.ndarray) -> np.ndarray:
+    normal = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    side = np.einsum("pij,pj->pi", other - tri[:, :1], normal)
+    return (side.min(axis=1) <= 0.0) & (side.max(axis=1) >= 0.0)
+
+
+def _segment_hits(p: np.ndarray, q: np.ndarray, tri: np.ndarray) -> np.ndarray:
+    """Moller-Trumbore test of (P, 3) segments against (P, 3, 3) triangles."""
+    d = q - p
+    e1 = tri[:, 1] - tri[:, 0]
+    e2 = tri[:, 2] - tri[:, 0]
+    h = np.cross(d, e2)
+    det = np.einsum("ij,ij->i", e1, h)
+    scale = (
+        np.linalg.norm(d, axis=1)
+        * np.linalg.norm(e1, axis=1)
+        * np.linalg.norm(e2, axis=1)
+    )
+    valid = np.abs(det) > 1e-12 * scale
+    inv = np.divide(1.0, det, out=np.zeros_like(det), where=valid)
+    s = p - tri[:, 0]
+    u = inv * np.einsum("ij,ij->i", s, h)
+    qv = np.cross(s, e1)
+    v = inv * np.einsum("ij,ij->i", d, qv)
+    t = inv * np.einsum("ij,ij->i", e2, qv)
+    return valid & (u >= 0.0) & (v >= 0.0) & (u + v <= 1.0) & (t >= 0.0) & (t <= 1.0)
@@ -0,0 +1,195 @@
+# File: _pack_.py
+# Code: Claude Code and Codex
+# Review: Ryoichi Ando (ryoichi.ando@zozo.com)
+# License: Apache v2.0
+
+"""Single-file container for exported scenes.
+
+A pack holds the same named entries as the directory layout (``info.toml``,
+``map.pickle``, ``bin/*.bin`` and ``bin/param/*.bin``) in one file:
+
+    header   magic, version, entry count, table offset, table size (64 bytes)
+    data     one section per entry, each starting on a 64-byte boundary
+    table    per entry: name length (u32), codec (u8), 3 padding bytes,
+             offset (u64), stored size (u64), raw size (u64), then the UTF-8
+             name padded to 8 bytes
+
+All integers are little-endian. Codec 0 stores raw bytes, which load as
+zero-copy views of a memory map; codec 1 stores zlib-compressed bytes.
+"""
+
+import io
+import os
+import struct
+import zlib
+
+from typing import Optional
+
+import numpy as np
+
+PACK_NAME = "scene.pack"
+
+_MAGIC = b"PPFSCENE"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQ")
+_HEADER_SIZE = 64
+_ENTRY = struct.Struct("<IB3xQQQ")
+_ALIGN = 64
+_RAW = 0
+_ZLIB = 1
+
+
+def _padding(offset: int, align: int) -> int:
+    return -offset % align
+
+
+class ScenePackWriter:
+    """Write scene entries into a pack in a single pass.
+
+    The pack is written to a temporary file and moved into place on close,
+    so readers never see a partial pack.
+    """
+
+    def __init__(self, path: str, compress: bool = False):
+        """Initialize the pack writer.
+
+        Args:
+            path (str): The path of the pack file.
+            compress (bool, optional): Whether to zlib-compress entries that shrink. Defaults to False.
+        """
+        self._path = path
+        self._compress = compress
+        self._entries: list[tuple[str, int, int, int, int]] = []
+        self._file: Optional[io.BufferedWriter] = open(path + ".tmp", "wb")
+        self._file.write(bytes(_HEADER_SIZE))
+
+    def add(self, name: str, data) -> "ScenePackWriter":
+        """Add an entry.
+
+        Args:
+            name (str): The entry name, a path relative to the scene directory.
+            data (bytes | np.ndarray): The entry contents. Arrays are stored as their raw bytes.
+
+        Returns:
+            ScenePackWriter: The pack writer.
+        """
+        assert self._file is not None
+        if isinstance(data, np.ndarray):
+            data = np.ascontiguousarray(data).tobytes()
+        codec, stored = _RAW, data
+        if self._compress and len(data):
+            packed = zlib.compress(data, 1)
+            if len(packed) < len(data):
+                codec, stored = _ZLIB, packed
+        offset = self._file.tell()
+        offset += self._write(bytes(_padding(offset, _ALIGN)))
+        self._write(stored)
+        self._entries.append((name, codec, offset, len(stored), len(data)))
+        return self
+
+    def close(self):
+        """Write the table of contents and move the pack into place."""
+        if self._file is None:
+            return
+        table = bytearray()
+        for name, codec, offset, stored, raw in self._entries:
+            encoded = name.encode()
+            table += _ENTRY.pack(len(encoded), codec, offset, stored, raw)
+            table += encoded + bytes(_padding(len(encoded), 8))
+        offset = self._file.tell()
+        offset += self._write(bytes(_padding(offset, _ALIGN)))
+        self._write(bytes(table))
+        self._file.seek(0)
+        self._write(
+            _HEADER.pack(_MAGIC, _VERSION, len(self._entries), offset, len(table))
+        )
+        self._file.close()
+        self._file = None
+        os.replace(self._path + ".tmp", self._path)
+
+    def _write(self, data: bytes) -> int:
+        assert self._file is not None
+        self._file.write(data)
+        return len(data)
+
+    def __enter__(self) -> "ScenePackWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._file is not None:
+            self._file.close()
+            self._file = None
+            os.remove(self._path + ".tmp")
+
+
+class ScenePack:
+    """Read-only view of a scene pack backed by a memory map."""
+
+    def __init__(self, path: str):
+        """Open a scene pack.
+
+        Args:
+            path (str): The pack file, or a scene directory holding one.
+        """
+        if os.path.isdir(path):
+            path = os.path.join(path, PACK_NAME)
+        self.path = path
+        self._data = np.memmap(path, dtype=np.uint8, mode="r")
+        if len(self._data) < _HEADER_SIZE:
+            raise Exception(f"{path} is not a scene pack")
+        magic, version, count, offset, size = _HEADER.unpack_from(self._data, 0)
+        if magic != _MAGIC:
+            raise Exception(f"{path} is not a scene pack")
+        if version != _VERSION:
+            raise Exception(f"unsupported scene pack version {version}: {path}")
+        table = self._data[offset : offset + size].tobytes()
+        self._entries: dict[str, tuple[int, int, int, int]] = {}
+        pos = 0
+        for _ in range(count):
+            length, codec, start, stored, raw = _ENTRY.unpack_from(table, pos)
+            pos += _ENTRY.size
+            name = table[pos : pos + length].decode()
+            pos += length + _padding(length, 8)
+            self._entries[name] = (codec, start, stored, raw)
+
+    def names(self) -> list[str]:
+        """Get the entry names in the order they were written."""
+        return list(self._entries.keys())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def array(self, name: str, dtype) -> np.ndarray:
+        """Get an entry as a flat array.
+
+        Raw entries are zero-copy views of the memory map.
+
+        Args:
+            name (str): The entry name.
+            dtype (np.dtype): The element type.
+
+        Returns:
+            np.ndarray: The read-only entry contents.
+        """
+        codec, start, stored, raw = self._entries[name]
+        if codec == _RAW:
+            return self._data[start : start + stored].view(dtype)
+        elif codec == _ZLIB:
+            data = zlib.decompress(self._data[start : start + stored].tobytes())
+            assert len(data) == raw
+            return np.frombuffer(data, dtype=dtype)
+        else:
+            raise Exception(f"unknown codec {codec} for {name}")
+
+    def read(self, name: str) -> bytes:
+        """Get an entry as bytes.
+
+        Args:
+            name (str): The entry name.
+
+        Returns:
+            bytes: The entry contents.
+        """
+        return self.array(name, np.uint8).tobytes()
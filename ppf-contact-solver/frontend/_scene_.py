@@ -3,13 +3,15 @@
 # Review: Ryoichi Ando (ryoichi.ando@zozo.com)
 # License: Apache v2.0
 
-import builtins
 import colorsys
+import contextlib
+import io
+import itertools
 import os
 import pickle
 import shutil
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
 
@@ -17,9 +19,12 @@ import numpy as np
 import pandas as pd
 
 from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 from tqdm import tqdm
 
 from ._asset_ import AssetManager
+from ._intersect_ import find_intersections
+from ._pack_ import PACK_NAME, ScenePackWriter
 from ._param_ import ParamHolder, object_param
 from ._plot_ import Plot, PlotManager
 from ._render_ import MitsubaRenderer, OpenGLRenderer
@@ -558,6 +563,12 @@ class PinData:
     unpin_time: Optional[float] = None
     transition: str = "linear"
     pull_strength: float = 0.0
+    version: int = field(default=0, compare=False)
+
+    def modified(self) -> "PinData":
+        """Mark the index or operations as edited so cached schedules are rebuilt."""
+        self.version += 1
+        return self
 
 
 class PinHolder:
@@ -633,6 +644,7 @@ class PinHolder:
                 transition=self._data.transition,
             )
         )
+        self._data.modified()
         return self
 
     def move_to(
@@ -669,6 +681,7 @@ class PinHolder:
                 transition=self._data.transition,
             )
         )
+        self._data.modified()
         return self
 
     def scale(
@@ -702,6 +715,7 @@ class PinHolder:
                 transition=self._data.transition,
             )
         )
+        self._data.modified()
         return self
 
     def pull(self, strength: float = 1.0) -> "PinHolder":
@@ -750,6 +764,7 @@ class PinHolder:
                 t_end=t_end,
             )
         )
+        self._data.modified()
         return self
 
     @property
@@ -787,6 +802,131 @@ class PinHolder:
         return self._data.transition
 
 
+class _PinSchedule:
+    """Pin operations compiled into per-vertex parameter arrays.
+
+    Operations of the same kind and position in their pin's sequence are
+    fused into one group holding concatenated vertex indices and per-vertex
+    parameters, so evaluating a batch of times costs one array pass per
+    group instead of one call per pin and operation. Pins that share
+    vertices keep one group per operation to preserve their order.
+    """
+
+    def __init__(self, pins: list[PinData]):
+        pins = [pin for pin in pins if len(pin.index) and pin.operations]
+        index = [np.asarray(pin.index, dtype=np.int64) for pin in pins]
+        self.groups: list[tuple[type, np.ndarray, dict[str, np.ndarray]]] = []
+        if len(index) and len(np.unique(np.concatenate(index))) == sum(
+            len(ind) for ind in index
+        ):
+            for stage in range(max(len(pin.operations) for pin in pins)):
+                batch: dict[type, list[tuple[np.ndarray, Operation]]] = {}
+                for ind, pin in zip(index, pins):
+                    if stage < len(pin.operations):
+                        op = pin.operations[stage]
+                        batch.setdefault(type(op), []).append((ind, op))
+                for kind, entries in batch.items():
+                    self.groups.append(self._compile(kind, entries))
+        else:
+            for ind, pin in zip(index, pins):
+                for op in pin.operations:
+                    self.groups.append(self._compile(type(op), [(ind, op)]))
+
+    @staticmethod
+    def _compile(
+        kind: type, entries: list[tuple[np.ndarray, Operation]]
+    ) -> tuple[type, np.ndarray, dict[str, np.ndarray]]:
+        count = [len(ind) for ind, _ in entries]
+
+        def scalar(get) -> np.ndarray:
+            return np.repeat(np.array([get(op) for _, op in entries], dtype=float), count)
+
+        def vector(get) -> np.ndarray:
+            return np.concatenate(
+                [
+                    np.broadcast_to(np.asarray(get(op), dtype=float), (len(ind), 3))
+                    for ind, op in entries
+                ]
+            )
+
+        param = {
+            "t_start": scalar(lambda op: op.t_start),
+            "t_end": scalar(lambda op: op.t_end),
+        }
+        if kind is SpinOperation:
+            param["center"] = vector(lambda op: op.center)
+            param["axis"] = vector(lambda op: op.axis / np.linalg.norm(op.axis))
+            param["radian_velocity"] = scalar(
+                lambda op: op.angular_velocity / 180.0 * np.pi
+            )
+        else:
+            param["smooth"] = np.repeat(
+                np.array([op.transition == "smooth" for _, op in entries]), count
+            )
+            if kind is MoveByOperation:
+                param["delta"] = vector(lambda op: op.delta)
+            elif kind is MoveToOperation:
+                param["target"] = vector(lambda op: op.target)
+            elif kind is ScaleOperation:
+                param["center"] = vector(lambda op: op.center)
+                param["factor"] = scalar(lambda op: op.factor)
+            else:
+                raise Exception(f"unsupported pin operation {kind.__name__}")
+        return kind, np.concatenate([ind for ind, _ in entries]), param
+
+    def apply(self, vert: np.ndarray, time: np.ndarray):
+        """Apply the pin operations to a batch of vertex positions in place.
+
+        Args:
+            vert (np.ndarray): The (T, N, 3) vertex positions.
+            time (np.ndarray): The (T,) times.
+        """
+        time = time[:, None]
+        for kind, index, param in self.groups:
+            t_start, t_end = param["t_start"], param["t_end"]
+            points = vert[:, index]
+            if kind is SpinOperation:
+                t = np.minimum(time, t_end) - t_start
+                angle = param["radian_velocity"] * t
+                cos_theta = np.cos(angle)[..., None]
+                sin_theta = np.sin(angle)[..., None]
+                axis, center = param["axis"], param["center"]
+                local = points - center
+                rotated = (
+                    local * cos_theta
+                    + np.cross(axis, local) * sin_theta
+                    + np.einsum("tki,ki->tk", local, axis)[..., None]
+                    * axis
+                    * (1.0 - cos_theta)
+                )
+                result = np.where((t > 0)[..., None], rotated + center, points)
+            else:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    progress = (time - t_start) / (t_end - t_start)
+                progress = np.where(
+                    param["smooth"], progress * progress * (3.0 - 2.0 * progress), progress
+                )
+                done = time >= t_end
+                progress = np.where(done, 1.0, progress)
+                if kind is MoveByOperation:
+                    result = points + param["delta"] * progress[..., None]
+                elif kind is MoveToOperation:
+                    progress = progress[..., None]
+                    result = np.where(
+                        done[..., None],
+                        param["target"],
+                        points * (1 - progress) + param["target"] * progress,
+                    )
+                else:
+                    factor = np.where(
+                        done, param["factor"], 1.0 + (param["factor"] - 1.0) * progress
+                    )
+                    center = param["center"]
+                    result = (points - center) * factor[..., None] + center
+                result = np.where((time < t_start)[..., None], points, result)
+            vert[:, index] = result
+
+
 class EnumColor(Enum):
     """Dynamic face color enumeration."""
 
@@ -819,6 +959,106 @@ def _compute_area_change(
     rat[:] = current_areas / init_area
 
 
+def _hsv_to_rgb(h: np.ndarray, s: float, v: float) -> np.ndarray:
+    """Vectorized ``colorsys.hsv_to_rgb`` over an array of hues."""
+    h6 = np.asarray(h, dtype=np.float64) * 6.0
+    i = np.trunc(h6)
+    f = h6 - i
+    sector = i.astype(np.int64) % 6
+    p = np.full_like(f, v * (1.0 - s))
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    vv = np.full_like(f, v)
+    r = np.choose(sector, [vv, q, p, p, t, vv])
+    g = np.choose(sector, [t, vv, vv, q, p, p])
+    b = np.choose(sector, [p, p, t, vv, vv, q])
+    return np.stack([r, g, b], axis=-1)
+
+
+def _face_to_vert_matrix(tri: np.ndarray, num_vert: int) -> csr_matrix:
+    """Build the vertex-by-face matrix that averages face values onto vertices."""
+    index = np.asarray(tri, dtype=np.int64).ravel()
+    weight = 1.0 / (np.bincount(index, minlength=num_vert) + 0.0001)
+    indptr = np.arange(0, len(index) + 1, tri.shape[1])
+    return csr_matrix(
+        (weight[index], index, indptr), shape=(len(tri), num_vert)
+    ).T.tocsr()
+
+
+def _edge_lengths(pos: np.ndarray, elm: np.ndarray) -> np.ndarray:
+    """Compute the lengths of all edges around the elements."""
+    if not len(elm):
+        return np.zeros(0)
+    elm = np.asarray(elm, dtype=np.int64)
+    if elm.shape[1] == 2:
+        edge = elm
+    else:
+        edge = np.stack([elm, np.roll(elm, -1, axis=1)], axis=2).reshape(-1, 2)
+    return np.linalg.norm(pos[edge[:, 1]] - pos[edge[:, 0]], axis=1)
+
+
+def _duplicate_representatives(
+    pos: np.ndarray, candidate: np.ndarray, epsilon: float, scale_factor: float
+) -> tuple[np.ndarray, int]:
+    """Map every vertex to the lowest-index vertex it is merged with.
+
+    Candidate vertices sharing a cell of the `scale_factor` grid are merged.
+    Cells are `epsilon` wide except the one straddling zero on each axis,
+    which truncation makes twice as wide; vertices sharing such a cell are
+    only merged when they are connected through pairs within `epsilon`.
+
+    Returns the representative of each vertex and the number of groups with
+    more than one vertex.
+    """
+    num_vert = len(pos)
+    representative = np.arange(num_vert)
+    if not len(candidate):
+        return representative, 0
+    cell = np.trunc(pos[candidate] * scale_factor).astype(np.int64)
+    cells, group, group_size = np.unique(
+        cell, axis=0, return_inverse=True, return_counts=True
+    )
+    group = group.ravel()
+
+    # Split the shared zero-straddling cells into components of close pairs
+    straddle = (group_size > 1) & np.any(cells == 0, axis=1)
+    if straddle.any():
+        order = np.argsort(group, kind="stable")
+        start = np.cumsum(group_size) - group_size
+        rows, cols = [], []
+        for size in np.unique(group_size[straddle]):
+            first = start[straddle & (group_size == size)]
+            members = order[first[:, None] + np.arange(size)]
+            i, j = np.triu_indices(size, 1)
+            rows.append(members[:, i].ravel())
+            cols.append(members[:, j].ravel())
+        row, col = np.concatenate(rows), np.concatenate(cols)
+        delta = np.abs(pos[candidate[row]] - pos[candidate[col]])
+        close = np.all(delta <= epsilon, axis=1)
+        graph = csr_matrix(
+            (np.ones(np.count_nonzero(close)), (row[close], col[close])),
+            shape=(len(candidate), len(candidate)),
+        )
+        _, component = connected_components(graph, directed=False)
+        split = straddle[group]
+        group = group.copy()
+        group[split] = len(group_size) + component[split]
+        _, group = np.unique(group, return_inverse=True)
+        group = group.ravel()
+
+    group_min = np.full(group.max() + 1, num_vert)
+    np.minimum.at(group_min, group, candidate)
+    representative[candidate] = group_min[group]
+    merged = np.bincount(group)
+    return representative, int(np.count_nonzero(merged > 1))
+
+
+def _distinct_rows(elm: np.ndarray) -> np.ndarray:
+    """Return a mask of the elements whose vertex indices are all different."""
+    elm = np.sort(elm, axis=1)
+    return np.all(elm[:, 1:] != elm[:, :-1], axis=1)
+
+
 class FixedScene:
     """A fixed scene class."""
 
@@ -826,7 +1066,7 @@ class FixedScene:
         self,
         plot: PlotManager | None,
         name: str,
-        map_by_name: dict[str, list[int]],
+        map_by_name: dict[str, np.ndarray],
         displacement: np.ndarray,
         vert: tuple[np.ndarray, np.ndarray],
         color: np.ndarray,
@@ -892,6 +1132,9 @@ class FixedScene:
         self._tri_param = tri_param
         self._tet_param = tet_param
         self._pin: list[PinData] = []
+        self._schedule: Optional[
+            tuple[list[PinData], list[int], _PinSchedule]
+        ] = None
         self._spin: list[SpinData] = []
         self._static_vert = (np.zeros(0, dtype=np.uint32), np.zeros(0))
         self._static_color = np.zeros((0, 0))
@@ -905,7 +1148,12 @@ class FixedScene:
         self._shell_vert_range = shell_vert_range
         self._rod_count = rod_count
         self._shell_count = shell_count
-        self._has_dyn_color = any(entry != EnumColor.NONE for entry in dyn_face_color)
+        self._dyn_face_mask = np.fromiter(
+            (entry != EnumColor.NONE for entry in dyn_face_color),
+            dtype=bool,
+            count=len(dyn_face_color),
+        )
+        self._has_dyn_color = bool(self._dyn_face_mask.any())
 
         assert len(self._vert[0]) == len(self._color)
         assert len(self._vert[1]) == len(self._color)
@@ -913,17 +1161,17 @@ class FixedScene:
         assert len(self._uv) == shell_count
 
         for key, value in self._rod_param.items():
-            if value:
+            if len(value):
                 assert len(value) == len(self._rod), (
                     f"{key} has {len(value)} entries, but rod has {len(self._rod)} rods"
                 )
         for key, value in self._tri_param.items():
-            if value:
+            if len(value):
                 assert len(value) == len(self._tri), (
                     f"{key} has {len(value)} entries, but tri has {len(self._tri)} faces"
                 )
         for key, value in self._tet_param.items():
-            if value:
+            if len(value):
                 assert len(value) == len(self._tet), (
                     f"{key} has {len(value)} entries, but tet has {len(self._tet)} tets"
                 )
@@ -935,273 +1183,127 @@ class FixedScene:
             self._area = np.zeros(0)
 
         if self._has_dyn_color:
-            sum = np.zeros(len(self._vert[0])) + 0.0001
-            rows, cols, vals = [], [], []
-            for i, f in enumerate(self._tri):
-                for j in f:
-                    rows.append(j)
-                    cols.append(i)
-                    vals.append(1.0)
-                    sum[j] += 1
-            self._face_to_vert_mat = csr_matrix(
-                (vals, (rows, cols)), shape=(len(sum), len(self._tri))
+            self._face_to_vert_mat = _face_to_vert_matrix(
+                self._tri, len(self._vert[0])
             )
-            self._face_to_vert_mat = self._face_to_vert_mat.multiply(1.0 / sum[:, None])
         else:
             self._face_to_vert_mat = None
 
-        # Detect and merge duplicate vertices using hash-based approach
+        # Detect and merge duplicate vertices by quantizing their positions
         if merge:
-            vertex_hash_map = {}
+            num_vert = len(self._vert[0])
+            pos = self._vert[1] + self._displacement[self._vert[0]]
 
             # Compute minimal edge length from triangles and edges
-            min_edge_length = float("inf")
-
-            # Check edges from rods
-            for edge in self._rod:
-                v0 = self._vert[1][edge[0]] + self._displacement[self._vert[0][edge[0]]]
-                v1 = self._vert[1][edge[1]] + self._displacement[self._vert[0][edge[1]]]
-                edge_length = np.linalg.norm(v1 - v0)
-                if edge_length > 0:
-                    min_edge_length = min(min_edge_length, edge_length)
-
-            # Check edges from triangles
-            for tri in self._tri:
-                for i in range(3):
-                    v0 = (
-                        self._vert[1][tri[i]]
-                        + self._displacement[self._vert[0][tri[i]]]
-                    )
-                    v1 = (
-                        self._vert[1][tri[(i + 1) % 3]]
-                        + self._displacement[self._vert[0][tri[(i + 1) % 3]]]
-                    )
-                    edge_length = np.linalg.norm(v1 - v0)
-                    if edge_length > 0:
-                        min_edge_length = min(min_edge_length, edge_length)
+            edge_length = np.concatenate(
+                [_edge_lengths(pos, self._rod), _edge_lengths(pos, self._tri)]
+            )
+            edge_length = edge_length[edge_length > 0]
 
             # Set epsilon based on minimal edge length
-            if min_edge_length == float("inf"):
+            if not len(edge_length):
                 # No edges found, use default epsilon
                 epsilon = 1e-5
                 scale_factor = 1e5
             else:
-                epsilon = float(0.1 * min_edge_length)
+                epsilon = float(0.1 * edge_length.min())
                 scale_factor = 1.0 / epsilon
 
-            # Build set of vertices used in tetrahedra to exclude them
-            tet_vertices = set()
-            for tet in self._tet:
-                tet_vertices.update(tet)
-
-            # Calculate actual positions and hash them (excluding tetrahedra vertices)
-            for i in range(len(self._vert[0])):
-                # Skip vertices that belong to tetrahedra
-                if i in tet_vertices:
-                    continue
-
-                actual_pos = self._vert[1][i] + self._displacement[self._vert[0][i]]
+            # Vertices used in tetrahedra are never merged
+            candidate = np.ones(num_vert, dtype=bool)
+            if len(self._tet):
+                candidate[np.asarray(self._tet, dtype=np.int64).ravel()] = False
+            candidate = np.flatnonzero(candidate)
 
-                # Create hash from scaled coordinates using large prime numbers
-                hash_val = (
-                    int(actual_pos[0] * scale_factor) * 73856093
-                    + int(actual_pos[1] * scale_factor) * 19349663
-                    + int(actual_pos[2] * scale_factor) * 83492791
-                )
-
-                if hash_val not in vertex_hash_map:
-                    vertex_hash_map[hash_val] = []
-                vertex_hash_map[hash_val].append((i, actual_pos))
-
-            # Find duplicate groups (handles transitive duplicates)
-            duplicate_groups = []  # List of sets of duplicate vertex indices
-            vertex_to_group = {}  # Map vertex index to its duplicate group
-
-            for _, vertices in vertex_hash_map.items():
-                if len(vertices) > 1:
-                    # Check all pairs in this hash bucket
-                    for i in range(len(vertices)):
-                        for j in range(i + 1, len(vertices)):
-                            idx1, pos1 = vertices[i]
-                            idx2, pos2 = vertices[j]
-
-                            # Check if positions are exactly the same (within epsilon)
-                            if np.allclose(pos1, pos2, rtol=0, atol=epsilon):
-                                # Find or create groups for these vertices
-                                group1 = vertex_to_group.get(idx1)
-                                group2 = vertex_to_group.get(idx2)
-
-                                if group1 is None and group2 is None:
-                                    # Create new group
-                                    new_group = {idx1, idx2}
-                                    duplicate_groups.append(new_group)
-                                    vertex_to_group[idx1] = new_group
-                                    vertex_to_group[idx2] = new_group
-                                elif group1 is None:
-                                    # Add idx1 to group2
-                                    assert group2 is not None  # Type hint for pyright
-                                    group2.add(idx1)
-                                    vertex_to_group[idx1] = group2
-                                elif group2 is None:
-                                    # Add idx2 to group1
-                                    group1.add(idx2)
-                                    vertex_to_group[idx2] = group1
-                                elif group1 is not group2:
-                                    # Merge two groups
-                                    group1.update(group2)
-                                    duplicate_groups.remove(group2)
-                                    for v in group2:
-                                        vertex_to_group[v] = group1
+            # Each duplicate group is represented by its lowest vertex index
+            representative, num_groups = _duplicate_representatives(
+                pos, candidate, epsilon, scale_factor
+            )
 
             # Build merge mapping and perform merging
-            if duplicate_groups:
-                print(
-                    f"Found {len(duplicate_groups)} groups of duplicate vertices to merge:"
-                )
-                total_duplicates = builtins.sum(
-                    len(group) - 1 for group in duplicate_groups
-                )
+            keep = representative == np.arange(num_vert)
+            total_duplicates = num_vert - int(np.count_nonzero(keep))
+            if total_duplicates:
+                print(f"Found {num_groups} groups of duplicate vertices to merge:")
                 print(f"  Total duplicate vertices to remove: {total_duplicates}")
 
-                # Create old to new index mapping
-                old_to_new = {}
-                new_index = 0
-
-                # First pass: assign new indices to kept vertices
-                for i in range(len(self._vert[0])):
-                    group = vertex_to_group.get(i)
-                    if group is None:
-                        # Not a duplicate, keep it
-                        old_to_new[i] = new_index
-                        new_index += 1
+                # Kept vertices retain their order; duplicates map to their representative
+                old_to_new = (np.cumsum(keep) - 1)[representative]
+
+                def remap(
+                    elm: np.ndarray, param: dict[str, Any], width: int
+                ) -> tuple[np.ndarray, dict[str, Any], np.ndarray]:
+                    if not len(elm):
+                        mask = np.zeros(0, dtype=bool)
+                        elm = np.zeros((0, width), dtype=np.uint64)
                     else:
-                        # Part of a duplicate group
-                        representative = min(group)
-                        if i == representative:
-                            # This is the representative, keep it
-                            old_to_new[i] = new_index
-                            new_index += 1
-
-                # Second pass: map duplicates to their representatives
-                for i in range(len(self._vert[0])):
-                    if i not in old_to_new:
-                        # This is a duplicate, find its representative
-                        group = vertex_to_group[i]
-                        representative = min(group)
-                        old_to_new[i] = old_to_new[representative]
-
-                # Create new vertex arrays
-                new_vert_dmap = []
-                new_vert = []
-                new_color = []
-                new_vel = []
-
-                for i in range(len(self._vert[0])):
-                    if vertex_to_group.get(i) is None or i == min(vertex_to_group[i]):
-                        # Keep this vertex
-                        new_vert_dmap.append(self._vert[0][i])
-                        new_vert.append(self._vert[1][i])
-                        new_color.append(self._color[i])
-                        new_vel.append(self._vel[i])
+                        elm = old_to_new[np.asarray(elm, dtype=np.int64)]
+                        mask = _distinct_rows(elm)
+                        elm = elm[mask]
+                        if not len(elm):
+                            elm = np.zeros((0, width), dtype=np.uint64)
+                    param = {
+                        key: np.asarray(values)[mask] if len(values) else []
+                        for key, values in param.items()
+                    }
+                    return elm, param, mask
 
                 # Update map_by_name
                 for name, indices in self._map_by_name.items():
-                    self._map_by_name[name] = [old_to_new[i] for i in indices]
-
-                # Update rods
-                new_rod = []
-                new_rod_param = {key: [] for key in self._rod_param}
-                removed_rods = 0
-
-                for i, edge in enumerate(self._rod):
-                    remapped = [old_to_new[v] for v in edge]
-                    if remapped[0] != remapped[1]:  # Not degenerate
-                        new_rod.append(remapped)
-                        for key, values in self._rod_param.items():
-                            if values:
-                                new_rod_param[key].append(values[i])
-                    else:
-                        removed_rods += 1
-
-                # Update triangles
-                new_tri = []
-                new_tri_param = {key: [] for key in self._tri_param}
-                new_dyn_face_color = []
-                new_dyn_face_intensity = []
-                removed_tris = 0
-
-                for i, tri in enumerate(self._tri):
-                    remapped = [old_to_new[v] for v in tri]
-                    if len(set(remapped)) == 3:  # All vertices are different
-                        new_tri.append(remapped)
-                        for key, values in self._tri_param.items():
-                            if values:
-                                new_tri_param[key].append(values[i])
-                        new_dyn_face_color.append(self._dyn_face_color[i])
-                        new_dyn_face_intensity.append(self._dyn_face_intensity[i])
-                    else:
-                        removed_tris += 1
-
-                # Update tetrahedra
-                new_tet = []
-                new_tet_param = {key: [] for key in self._tet_param}
-                removed_tets = 0
-
-                for i, tet in enumerate(self._tet):
-                    remapped = [old_to_new[v] for v in tet]
-                    if len(set(remapped)) == 4:  # All vertices are different
-                        new_tet.append(remapped)
-                        for key, values in self._tet_param.items():
-                            if values:
-                                new_tet_param[key].append(values[i])
-                    else:
-                        removed_tets += 1
+                    self._map_by_name[name] = old_to_new[np.asarray(indices)]
+
+                # Drop elements that collapsed onto fewer vertices
+                new_rod, new_rod_param, rod_mask = remap(
+                    self._rod, self._rod_param, 2
+                )
+                new_tri, new_tri_param, tri_mask = remap(
+                    self._tri, self._tri_param, 3
+                )
+                new_tet, new_tet_param, tet_mask = remap(
+                    self._tet, self._tet_param, 4
+                )
+                removed_rods = len(rod_mask) - len(new_rod)
+                removed_tris = len(tri_mask) - len(new_tri)
+                removed_tets = len(tet_mask) - len(new_tet)
 
                 # Update pin data
                 for pin in self._pin:
-                    pin.index = list({old_to_new[i] for i in pin.index})
+                    pin.index = list(set(old_to_new[pin.index].tolist()))
+                    pin.modified()
 
                 # Update stitch data
-                new_stitch_ind = []
-                new_stitch_w = []
-                for ind, w in zip(self._stitch_ind, self._stitch_w, strict=False):
-                    remapped = [old_to_new[v] for v in ind]
-                    if len(set(remapped)) == len(remapped):
-                        new_stitch_ind.append(remapped)
-                        new_stitch_w.append(w)
+                if len(self._stitch_ind) and len(self._stitch_w):
+                    stitch_ind = old_to_new[np.asarray(self._stitch_ind, dtype=np.int64)]
+                    stitch_mask = _distinct_rows(stitch_ind)
+                    if stitch_mask.any():
+                        self._stitch_ind = stitch_ind[stitch_mask]
+                        self._stitch_w = np.asarray(self._stitch_w)[stitch_mask]
 
                 # Replace data with merged versions
                 self._vert = (
-                    np.array(new_vert_dmap, dtype=np.uint32),
-                    np.array(new_vert),
-                )
-                self._color = np.array(new_color)
-                self._vel = np.array(new_vel)
-                self._rod = (
-                    np.array(new_rod) if new_rod else np.zeros((0, 2), dtype=np.uint64)
-                )
-                self._tri = (
-                    np.array(new_tri) if new_tri else np.zeros((0, 3), dtype=np.uint64)
-                )
-                self._tet = (
-                    np.array(new_tet) if new_tet else np.zeros((0, 4), dtype=np.uint64)
+                    self._vert[0][keep].astype(np.uint32),
+                    self._vert[1][keep],
                 )
+                self._color = self._color[keep]
+                self._vel = self._vel[keep]
+                self._rod = new_rod
+                self._tri = new_tri
+                self._tet = new_tet
                 self._rod_param = new_rod_param
                 self._tri_param = new_tri_param
                 self._tet_param = new_tet_param
-                self._dyn_face_color = new_dyn_face_color
-                self._dyn_face_intensity = new_dyn_face_intensity
-                self._stitch_ind = (
-                    np.array(new_stitch_ind) if new_stitch_ind else self._stitch_ind
-                )
-                self._stitch_w = (
-                    np.array(new_stitch_w) if new_stitch_w else self._stitch_w
+                self._dyn_face_color = list(
+                    itertools.compress(self._dyn_face_color, tri_mask)
                 )
+                self._dyn_face_mask = self._dyn_face_mask[tri_mask]
+                self._dyn_face_intensity = np.asarray(self._dyn_face_intensity)[
+                    tri_mask
+                ]
 
                 # Report results
                 print("Vertex merge complete:")
                 print(
-                    f"  Vertices: {len(old_to_new)} -> {len(new_vert)} (removed {total_duplicates})"
+                    f"  Vertices: {num_vert} -> {len(self._vert[0])} (removed {total_duplicates})"
                 )
                 if removed_rods > 0:
                     print(f"  Removed {removed_rods} degenerate edges")
@@ -1216,19 +1318,8 @@ class FixedScene:
                     _compute_area(self._vert[1], self._tri, self._area)
 
                     if self._has_dyn_color:
-                        sum = np.zeros(len(self._vert[0])) + 0.0001
-                        rows, cols, vals = [], [], []
-                        for i, f in enumerate(self._tri):
-                            for j in f:
-                                rows.append(j)
-                                cols.append(i)
-                                vals.append(1.0)
-                                sum[j] += 1
-                        self._face_to_vert_mat = csr_matrix(
-                            (vals, (rows, cols)), shape=(len(sum), len(self._tri))
-                        )
-                        self._face_to_vert_mat = self._face_to_vert_mat.multiply(
-                            1.0 / sum[:, None]
+                        self._face_to_vert_mat = _face_to_vert_matrix(
+                            self._tri, len(self._vert[0])
                         )
 
     @property
@@ -1297,12 +1388,13 @@ class FixedScene:
             intensity = np.zeros(len(self._tri))
             _compute_area_change(vert, self._tri, self._area, rat)
 
-            for i in range(len(face_color)):
-                if self._dyn_face_color[i] != EnumColor.NONE:
-                    val = max(0.0, min(1.0, (rat[i] - 1.0) / (max_area - 1.0)))
-                    intensity[i] = self._dyn_face_intensity[i]
-                    hue = 240.0 * (1.0 - val) / 360.0
-                    face_color[i] = np.array(colorsys.hsv_to_rgb(hue, 0.75, 1.0))
+            dyn = self._dyn_face_mask
+            # Degenerate rest faces (NaN ratio) saturate like fully stretched ones
+            val = np.clip(
+                np.nan_to_num((rat[dyn] - 1.0) / (max_area - 1.0), nan=1.0), 0.0, 1.0
+            )
+            intensity[dyn] = np.asarray(self._dyn_face_intensity)[dyn]
+            face_color[dyn] = _hsv_to_rgb(240.0 * (1.0 - val) / 360.0, 0.75, 1.0)
             intensity = self._face_to_vert_mat.dot(intensity)
             color = (1.0 - intensity[:, None]) * self._color + intensity[
                 :, None
@@ -1333,6 +1425,7 @@ class FixedScene:
         include_static: bool = True,
         args: Optional[dict] = None,
         delete_exist: bool = False,
+        renderer: OpenGLRenderer | MitsubaRenderer | None = None,
     ) -> "FixedScene":
         """Export the scene to a mesh file.
 
@@ -1345,6 +1438,7 @@ class FixedScene:
             include_static (bool, optional): Whether to include the static mesh. Defaults to True.
             args (dict, optional): Additional arguments passed to a renderer.
             delete_exist (bool, optional): Whether to delete the existing file. Defaults to False.
+            renderer (optional): A renderer to reuse. If not provided, one is created from `args` when an image is rendered.
 
         Returns:
             FixedScene: The fixed scene.
@@ -1364,18 +1458,7 @@ class FixedScene:
 
         seg, tri = self._rod, None
         if not os.path.exists(path) or not os.path.exists(image_path):
-            if include_static and len(self._static_vert) and len(self._static_tri):
-                static_vert = (
-                    self._static_vert[1] + self._displacement[self._static_vert[0]]
-                )
-                tri = np.concatenate([self._tri, self._static_tri + len(vert)])
-                vert = np.concatenate([vert, static_vert], axis=0)
-                color = np.concatenate([color, self._static_color], axis=0)
-            else:
-                tri = self._tri
-
-        if tri is not None and len(tri) == 0:
-            tri = np.array([[0, 0, 0]])
+            vert, color, tri = self._export_mesh(vert, color, include_static)
 
         # Check if rendering should be skipped (e.g., on Windows headless)
         skip_render = args.get("skip_render", False)
@@ -1391,19 +1474,8 @@ class FixedScene:
 
         # Skip rendering on Windows (pyrender doesn't work in headless mode)
         if not skip_render and not os.path.exists(image_path):
-            if Utils.ci_name() is not None:
-                args["width"] = 320
-                args["height"] = 240
-            if "renderer" in args:
-                if args["renderer"] == "mitsuba":
-                    assert shutil.which("mitsuba") is not None
-                    renderer = MitsubaRenderer(args)
-                elif args["renderer"] == "opengl":
-                    renderer = OpenGLRenderer(args)
-                else:
-                    raise Exception("unsupported renderer")
-            else:
-                renderer = OpenGLRenderer(args)
+            if renderer is None:
+                renderer = self.renderer(args)
 
             assert tri is not None
             assert color is not None
@@ -1411,12 +1483,93 @@ class FixedScene:
 
         return self
 
-    def export_fixed(self, path: str, delete_exist: bool) -> "FixedScene":
+    def render(
+        self,
+        vert: np.ndarray,
+        color: np.ndarray,
+        include_static: bool = True,
+        args: Optional[dict] = None,
+        renderer: OpenGLRenderer | MitsubaRenderer | None = None,
+        path: Optional[str] = None,
+    ) -> Optional[np.ndarray]:
+        """Render the scene into an image.
+
+        Args:
+            vert (np.ndarray): The vertices of the scene.
+            color (np.ndarray): The colors of the vertices.
+            include_static (bool, optional): Whether to include the static mesh. Defaults to True.
+            args (dict, optional): Additional arguments passed to a renderer.
+            renderer (optional): A renderer to reuse. If not provided, one is created from `args`.
+            path (str, optional): The image file to write. Required for the Mitsuba renderer.
+
+        Returns:
+            Optional[np.ndarray]: The rendered (height, width, 3) uint8 image, or None if the renderer only writes files.
+        """
+        if args is None:
+            args = {}
+        if renderer is None:
+            renderer = self.renderer(args)
+        vert, color, tri = self._export_mesh(vert, color, include_static)
+        image = renderer.render(vert, color, self._rod, tri, path)
+        if image is None:
+            return None
+        return np.asarray(image.convert("RGB"))
+
+    def renderer(self, args: dict) -> OpenGLRenderer | MitsubaRenderer:
+        """Create the renderer selected by the render options.
+
+        Args:
+            args (dict): The render options. `renderer` selects "opengl" (default) or "mitsuba".
+
+        Returns:
+            The renderer.
+        """
+        args = self._render_args(args)
+        if "renderer" in args:
+            if args["renderer"] == "mitsuba":
+                assert shutil.which("mitsuba") is not None
+                return MitsubaRenderer(args)
+            elif args["renderer"] == "opengl":
+                return OpenGLRenderer(args)
+            else:
+                raise Exception("unsupported renderer")
+        else:
+            return OpenGLRenderer(args)
+
+    def _render_args(self, args: dict) -> dict:
+        if Utils.ci_name() is not None:
+            args["width"] = 320
+            args["height"] = 240
+        return args
+
+    def _export_mesh(
+        self, vert: np.ndarray, color: np.ndarray, include_static: bool
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if include_static and len(self._static_vert) and len(self._static_tri):
+            static_vert = self._static_vert[1] + self._displacement[self._static_vert[0]]
+            tri = np.concatenate([self._tri, self._static_tri + len(vert)])
+            vert = np.concatenate([vert, static_vert], axis=0)
+            color = np.concatenate([color, self._static_color], axis=0)
+        else:
+            tri = self._tri
+        if len(tri) == 0:
+            tri = np.array([[0, 0, 0]])
+        return vert, color, tri
+
+    def export_fixed(
+        self,
+        path: str,
+        delete_exist: bool,
+        pack: bool = False,
+        compress: bool = False,
+    ) -> "FixedScene":
         """Export the fixed scene into a set of data files that are read by the simulator.
 
         Args:
             path (str): The path to the output directory.
             delete_exist (bool): Whether to delete the existing directory.
+            pack (bool, optional): Whether to write all files into a single scene.pack instead. Defaults to False.
+            compress (bool, optional): Whether to compress the entries of the scene.pack. Defaults to False.
 
         Returns:
             FixedScene: The fixed scene.
@@ -1439,222 +1592,224 @@ class FixedScene:
             os.makedirs(path)
         pbar.update(1)
 
-        map_path = os.path.join(path, "map.pickle")
-        with open(map_path, "wb") as f:
-            pickle.dump(self._map_by_name, f)
-        pbar.update(1)
-
-        info_path = os.path.join(path, "info.toml")
-        with open(info_path, "w") as f:
-            f.write("[count]\n")
-            f.write(f"vert = {len(self._vert[1])}\n")
-            f.write(f"rod = {len(self._rod)}\n")
-            f.write(f"tri = {len(self._tri)}\n")
-            f.write(f"tet = {len(self._tet)}\n")
-            f.write(f"static_vert = {len(self._static_vert[1])}\n")
-            f.write(f"static_tri = {len(self._static_tri)}\n")
-            f.write(f"pin_block = {len(self._pin)}\n")
-            f.write(f"wall = {len(self._wall)}\n")
-            f.write(f"sphere = {len(self._sphere)}\n")
-            f.write(f"stitch = {len(self._stitch_ind)}\n")
-            f.write(f"rod_vert_start = {self._rod_vert_range[0]}\n")
-            f.write(f"rod_vert_end = {self._rod_vert_range[1]}\n")
-            f.write(f"shell_vert_start = {self._shell_vert_range[0]}\n")
-            f.write(f"shell_vert_end = {self._shell_vert_range[1]}\n")
-            f.write(f"rod_count = {self._rod_count}\n")
-            f.write(f"shell_count = {self._shell_count}\n")
-            f.write("\n")
-
-            for i, pin in enumerate(self._pin):
-                f.write(f"[pin-{i}]\n")
-                f.write(f"operation_count = {len(pin.operations)}\n")
-                f.write(f"pin = {len(pin.index)}\n")
-                f.write(f"pull = {float(pin.pull_strength)}\n")
-                if pin.unpin_time is not None:
-                    f.write(f"unpin_time = {float(pin.unpin_time)}\n")
+        # A failed export leaves no partial pack behind
+        if pack:
+            target = ScenePackWriter(os.path.join(path, PACK_NAME), compress)
+        else:
+            target = contextlib.nullcontext()
+        with target as writer:
+
+            def put(name: str, data):
+                """Write an entry to the pack or to a file under the scene directory."""
+                if writer is not None:
+                    writer.add(name, data)
+                elif isinstance(data, np.ndarray):
+                    data.tofile(os.path.join(path, name))
+                else:
+                    with open(os.path.join(path, name), "wb") as f:
+                        f.write(data)
+
+            put("map.pickle", pickle.dumps(self._map_by_name))
+            pbar.update(1)
+
+            with io.StringIO() as f:
+                f.write("[count]\n")
+                f.write(f"vert = {len(self._vert[1])}\n")
+                f.write(f"rod = {len(self._rod)}\n")
+                f.write(f"tri = {len(self._tri)}\n")
+                f.write(f"tet = {len(self._tet)}\n")
+                f.write(f"static_vert = {len(self._static_vert[1])}\n")
+                f.write(f"static_tri = {len(self._static_tri)}\n")
+                f.write(f"pin_block = {len(self._pin)}\n")
+                f.write(f"wall = {len(self._wall)}\n")
+                f.write(f"sphere = {len(self._sphere)}\n")
+                f.write(f"stitch = {len(self._stitch_ind)}\n")
+                f.write(f"rod_vert_start = {self._rod_vert_range[0]}\n")
+                f.write(f"rod_vert_end = {self._rod_vert_range[1]}\n")
+                f.write(f"shell_vert_start = {self._shell_vert_range[0]}\n")
+                f.write(f"shell_vert_end = {self._shell_vert_range[1]}\n")
+                f.write(f"rod_count = {self._rod_count}\n")
+                f.write(f"shell_count = {self._shell_count}\n")
                 f.write("\n")
 
-                # Write operation metadata
-                for j, op in enumerate(pin.operations):
-                    f.write(f"[pin-{i}-op-{j}]\n")
-                    if isinstance(op, MoveByOperation):
-                        f.write('type = "move_by"\n')
-                        f.write(f"t_start = {float(op.t_start)}\n")
-                        f.write(f"t_end = {float(op.t_end)}\n")
-                        f.write(f'transition = "{op.transition}"\n')
-                    elif isinstance(op, MoveToOperation):
-                        f.write('type = "move_to"\n')
-                        f.write(f"t_start = {float(op.t_start)}\n")
-                        f.write(f"t_end = {float(op.t_end)}\n")
-                        f.write(f'transition = "{op.transition}"\n')
-                    elif isinstance(op, SpinOperation):
-                        f.write('type = "spin"\n')
-                        f.write(f"center_x = {float(op.center[0])}\n")
-                        f.write(f"center_y = {float(op.center[1])}\n")
-                        f.write(f"center_z = {float(op.center[2])}\n")
-                        f.write(f"axis_x = {float(op.axis[0])}\n")
-                        f.write(f"axis_y = {float(op.axis[1])}\n")
-                        f.write(f"axis_z = {float(op.axis[2])}\n")
-                        f.write(f"angular_velocity = {float(op.angular_velocity)}\n")
-                        f.write(f"t_start = {float(op.t_start)}\n")
-                        f.write(f"t_end = {float(op.t_end)}\n")
-                    elif isinstance(op, ScaleOperation):
-                        f.write('type = "scale"\n')
-                        f.write(f"center_x = {float(op.center[0])}\n")
-                        f.write(f"center_y = {float(op.center[1])}\n")
-                        f.write(f"center_z = {float(op.center[2])}\n")
-                        f.write(f"factor = {float(op.factor)}\n")
-                        f.write(f"t_start = {float(op.t_start)}\n")
-                        f.write(f"t_end = {float(op.t_end)}\n")
-                        f.write(f'transition = "{op.transition}"\n')
+                for i, pin in enumerate(self._pin):
+                    f.write(f"[pin-{i}]\n")
+                    f.write(f"operation_count = {len(pin.operations)}\n")
+                    f.write(f"pin = {len(pin.index)}\n")
+                    f.write(f"pull = {float(pin.pull_strength)}\n")
+                    if pin.unpin_time is not None:
+                        f.write(f"unpin_time = {float(pin.unpin_time)}\n")
                     f.write("\n")
 
-            for i, wall in enumerate(self._wall):
-                normal = wall.normal
-                f.write(f"[wall-{i}]\n")
-                f.write(f"keyframe = {len(wall.entry)}\n")
-                f.write(f"nx = {float(normal[0])}\n")
-                f.write(f"ny = {float(normal[1])}\n")
-                f.write(f"nz = {float(normal[2])}\n")
-                f.write(f'transition = "{wall.transition}"\n')
-                for key, value in wall.param.list().items():
-                    f.write(f"{key} = {value}\n")
-                f.write("\n")
-
-            for i, sphere in enumerate(self._sphere):
-                f.write(f"[sphere-{i}]\n")
-                f.write(f"keyframe = {len(sphere.entry)}\n")
-                f.write(f"hemisphere = {'true' if sphere.is_hemisphere else 'false'}\n")
-                f.write(f"invert = {'true' if sphere.is_inverted else 'false'}\n")
-                f.write(f'transition = "{sphere.transition}"\n')
-                for key, value in sphere.param.list().items():
-                    f.write(f"{key} = {value}\n")
-                f.write("\n")
-        pbar.update(1)
-
-        bin_path = os.path.join(path, "bin")
-        os.makedirs(bin_path)
-        param_path = os.path.join(bin_path, "param")
-        os.makedirs(param_path)
-        pbar.update(1)
-
-        def export_param(param: dict[str, list[Any]], basepath: str, name: str):
-            """Export parameters to a binary file."""
-            for key, value in param.items():
-                if value:
-                    filepath = os.path.join(basepath, f"{name}-{key}.bin")
-                    if key == "model":
-                        model_map = {
-                            "arap": 0,
-                            "stvk": 1,
-                            "baraff-witkin": 2,
-                            "snhk": 3,
-                        }
-                        assert all(name in model_map for name in value)
-                        np.array(
-                            [model_map[name] for name in value], dtype=np.uint8
-                        ).tofile(filepath)
-                    else:
-                        np.array(value, dtype=np.float32).tofile(filepath)
-
-        self._displacement.astype(np.float64).tofile(
-            os.path.join(bin_path, "displacement.bin")
-        )
-        self._vert[0].astype(np.uint32).tofile(os.path.join(bin_path, "vert_dmap.bin"))
-        self._vert[1].astype(np.float64).tofile(os.path.join(bin_path, "vert.bin"))
-        self._color.astype(np.float32).tofile(os.path.join(bin_path, "color.bin"))
-        self._vel.astype(np.float32).tofile(os.path.join(bin_path, "vel.bin"))
-        pbar.update(1)
-
-        if self._uv:
-            with open(os.path.join(bin_path, "uv.bin"), "wb") as f:
-                for uv in self._uv:
-                    uv.astype(np.float32).tofile(f)
-        pbar.update(1)
-
-        if len(self._rod):
-            self._rod.astype(np.uint64).tofile(os.path.join(bin_path, "rod.bin"))
-            export_param(self._rod_param, param_path, "rod")
-        pbar.update(1)
-
-        if len(self._tri):
-            self._tri.astype(np.uint64).tofile(os.path.join(bin_path, "tri.bin"))
-            export_param(self._tri_param, param_path, "tri")
-        pbar.update(1)
+                    # Write operation metadata
+                    for j, op in enumerate(pin.operations):
+                        f.write(f"[pin-{i}-op-{j}]\n")
+                        if isinstance(op, MoveByOperation):
+                            f.write('type = "move_by"\n')
+                            f.write(f"t_start = {float(op.t_start)}\n")
+                            f.write(f"t_end = {float(op.t_end)}\n")
+                            f.write(f'transition = "{op.transition}"\n')
+                        elif isinstance(op, MoveToOperation):
+                            f.write('type = "move_to"\n')
+                            f.write(f"t_start = {float(op.t_start)}\n")
+                            f.write(f"t_end = {float(op.t_end)}\n")
+                            f.write(f'transition = "{op.transition}"\n')
+                        elif isinstance(op, SpinOperation):
+                            f.write('type = "spin"\n')
+                            f.write(f"center_x = {float(op.center[0])}\n")
+                            f.write(f"center_y = {float(op.center[1])}\n")
+                            f.write(f"center_z = {float(op.center[2])}\n")
+                            f.write(f"axis_x = {float(op.axis[0])}\n")
+                            f.write(f"axis_y = {float(op.axis[1])}\n")
+                            f.write(f"axis_z = {float(op.axis[2])}\n")
+                            f.write(f"angular_velocity = {float(op.angular_velocity)}\n")
+                            f.write(f"t_start = {float(op.t_start)}\n")
+                            f.write(f"t_end = {float(op.t_end)}\n")
+                        elif isinstance(op, ScaleOperation):
+                            f.write('type = "scale"\n')
+                            f.write(f"center_x = {float(op.center[0])}\n")
+                            f.write(f"center_y = {float(op.center[1])}\n")
+                            f.write(f"center_z = {float(op.center[2])}\n")
+                            f.write(f"factor = {float(op.factor)}\n")
+                            f.write(f"t_start = {float(op.t_start)}\n")
+                            f.write(f"t_end = {float(op.t_end)}\n")
+                            f.write(f'transition = "{op.transition}"\n')
+                        f.write("\n")
+
+                for i, wall in enumerate(self._wall):
+                    normal = wall.normal
+                    f.write(f"[wall-{i}]\n")
+                    f.write(f"keyframe = {len(wall.entry)}\n")
+                    f.write(f"nx = {float(normal[0])}\n")
+                    f.write(f"ny = {float(normal[1])}\n")
+                    f.write(f"nz = {float(normal[2])}\n")
+                    f.write(f'transition = "{wall.transition}"\n')
+                    for key, value in wall.param.list().items():
+                        f.write(f"{key} = {value}\n")
+                    f.write("\n")
 
-        if len(self._tet):
-            self._tet.astype(np.uint64).tofile(os.path.join(bin_path, "tet.bin"))
-            export_param(self._tet_param, param_path, "tet")
-        pbar.update(1)
+                for i, sphere in enumerate(self._sphere):
+                    f.write(f"[sphere-{i}]\n")
+                    f.write(f"keyframe = {len(sphere.entry)}\n")
+                    f.write(f"hemisphere = {'true' if sphere.is_hemisphere else 'false'}\n")
+                    f.write(f"invert = {'true' if sphere.is_inverted else 'false'}\n")
+                    f.write(f'transition = "{sphere.transition}"\n')
+                    for key, value in sphere.param.list().items():
+                        f.write(f"{key} = {value}\n")
+                    f.write("\n")
+                put("info.toml", f.getvalue().encode())
+            pbar.update(1)
+
+            bin_path = "bin"
+            param_path = f"{bin_path}/param"
+            if writer is None:
+                os.makedirs(os.path.join(path, param_path))
+            pbar.update(1)
+
+            def export_param(param: dict[str, list[Any]], basepath: str, name: str):
+                """Export parameters to a binary file."""
+                for key, value in param.items():
+                    if len(value):
+                        filepath = f"{basepath}/{name}-{key}.bin"
+                        if key == "model":
+                            model_map = {
+                                "arap": 0,
+                                "stvk": 1,
+                                "baraff-witkin": 2,
+                                "snhk": 3,
+                            }
+                            assert all(name in model_map for name in value)
+                            put(
+                                filepath,
+                                np.array(
+                                    [model_map[name] for name in value], dtype=np.uint8
+                                ),
+                            )
+                        else:
+                            put(filepath, np.array(value, dtype=np.float32))
+
+            put(f"{bin_path}/displacement.bin", self._displacement.astype(np.float64))
+            put(f"{bin_path}/vert_dmap.bin", self._vert[0].astype(np.uint32))
+            put(f"{bin_path}/vert.bin", self._vert[1].astype(np.float64))
+            put(f"{bin_path}/color.bin", self._color.astype(np.float32))
+            put(f"{bin_path}/vel.bin", self._vel.astype(np.float32))
+            pbar.update(1)
+
+            if self._uv:
+                put(
+                    f"{bin_path}/uv.bin",
+                    np.concatenate([uv.astype(np.float32).ravel() for uv in self._uv]),
+                )
+            pbar.update(1)
+
+            if len(self._rod):
+                put(f"{bin_path}/rod.bin", self._rod.astype(np.uint64))
+                export_param(self._rod_param, param_path, "rod")
+            pbar.update(1)
+
+            if len(self._tri):
+                put(f"{bin_path}/tri.bin", self._tri.astype(np.uint64))
+                export_param(self._tri_param, param_path, "tri")
+            pbar.update(1)
+
+            if len(self._tet):
+                put(f"{bin_path}/tet.bin", self._tet.astype(np.uint64))
+                export_param(self._tet_param, param_path, "tet")
+            pbar.update(1)
+
+            if len(self._static_vert[0]):
+                put(
+                    f"{bin_path}/static_vert_dmap.bin",
+                    self._static_vert[0].astype(np.uint32),
+                )
+                put(
+                    f"{bin_path}/static_vert.bin", self._static_vert[1].astype(np.float64)
+                )
+                put(f"{bin_path}/static_tri.bin", self._static_tri.astype(np.uint64))
+                put(
+                    f"{bin_path}/static_color.bin", self._static_color.astype(np.float32)
+                )
+                export_param(self._static_param, param_path, "static")
+            pbar.update(1)
 
-        if len(self._static_vert[0]):
-            self._static_vert[0].astype(np.uint32).tofile(
-                os.path.join(bin_path, "static_vert_dmap.bin")
-            )
-            self._static_vert[1].astype(np.float64).tofile(
-                os.path.join(bin_path, "static_vert.bin")
-            )
-            self._static_tri.astype(np.uint64).tofile(
-                os.path.join(bin_path, "static_tri.bin")
-            )
-            self._static_color.astype(np.float32).tofile(
-                os.path.join(bin_path, "static_color.bin")
-            )
-            export_param(self._static_param, param_path, "static")
-        pbar.update(1)
+            if len(self._stitch_ind) and len(self._stitch_w):
+                put(f"{bin_path}/stitch_ind.bin", self._stitch_ind.astype(np.uint64))
+                put(f"{bin_path}/stitch_w.bin", self._stitch_w.astype(np.float32))
+            pbar.update(1)
 
-        if len(self._stitch_ind) and len(self._stitch_w):
-            self._stitch_ind.astype(np.uint64).tofile(
-                os.path.join(bin_path, "stitch_ind.bin")
-            )
-            self._stitch_w.astype(np.float32).tofile(
-                os.path.join(bin_path, "stitch_w.bin")
-            )
-        pbar.update(1)
+            for i, pin in enumerate(self._pin):
+                # Write pin indices
+                put(f"{bin_path}/pin-ind-{i}.bin", np.array(pin.index, dtype=np.uint64))
 
-        for i, pin in enumerate(self._pin):
-            # Write pin indices
-            with open(os.path.join(bin_path, f"pin-ind-{i}.bin"), "wb") as f:
-                np.array(pin.index, dtype=np.uint64).tofile(f)
-
-            # Write operation data
-            for j, op in enumerate(pin.operations):
-                if isinstance(op, MoveByOperation):
-                    # MoveBy operations need to write position delta to binary file
-                    op_path = os.path.join(bin_path, f"pin-{i}-op-{j}.bin")
-                    with open(op_path, "wb") as f:
-                        np.array(op.delta, dtype=np.float64).tofile(f)
-                elif isinstance(op, MoveToOperation):
-                    # MoveTo operations need to write target positions to binary file
-                    op_path = os.path.join(bin_path, f"pin-{i}-op-{j}.bin")
-                    with open(op_path, "wb") as f:
-                        np.array(op.target, dtype=np.float64).tofile(f)
-                # Spin and Scale operations have all data in info.toml
-        pbar.update(1)
+                # Write operation data
+                for j, op in enumerate(pin.operations):
+                    if isinstance(op, MoveByOperation):
+                        # MoveBy operations need to write position delta to binary file
+                        op_path = f"{bin_path}/pin-{i}-op-{j}.bin"
+                        put(op_path, np.array(op.delta, dtype=np.float64))
+                    elif isinstance(op, MoveToOperation):
+                        # MoveTo operations need to write target positions to binary file
+                        op_path = f"{bin_path}/pin-{i}-op-{j}.bin"
+                        put(op_path, np.array(op.target, dtype=np.float64))
+                    # Spin and Scale operations have all data in info.toml
+            pbar.update(1)
 
-        for i, wall in enumerate(self._wall):
-            with open(os.path.join(bin_path, f"wall-pos-{i}.bin"), "wb") as f:
-                pos = np.array(
-                    [p for pos, _ in wall.entry for p in pos], dtype=np.float64
-                )
-                pos.tofile(f)
-            with open(os.path.join(bin_path, f"wall-timing-{i}.bin"), "wb") as f:
+            for i, wall in enumerate(self._wall):
+                pos = np.array([p for pos, _ in wall.entry for p in pos], dtype=np.float64)
+                put(f"{bin_path}/wall-pos-{i}.bin", pos)
                 timing = np.array([t for _, t in wall.entry], dtype=np.float64)
-                timing.tofile(f)
-        pbar.update(1)
+                put(f"{bin_path}/wall-timing-{i}.bin", timing)
+            pbar.update(1)
 
-        for i, sphere in enumerate(self._sphere):
-            with open(os.path.join(bin_path, f"sphere-pos-{i}.bin"), "wb") as f:
+            for i, sphere in enumerate(self._sphere):
                 pos = np.array(
                     [p for pos, _, _ in sphere.entry for p in pos], dtype=np.float64
                 )
-                pos.tofile(f)
-            with open(os.path.join(bin_path, f"sphere-radius-{i}.bin"), "wb") as f:
+                put(f"{bin_path}/sphere-pos-{i}.bin", pos)
                 radius = np.array([r for _, r, _ in sphere.entry], dtype=np.float32)
-                radius.tofile(f)
-            with open(os.path.join(bin_path, f"sphere-timing-{i}.bin"), "wb") as f:
+                put(f"{bin_path}/sphere-radius-{i}.bin", radius)
                 timing = np.array([t for _, _, t in sphere.entry], dtype=np.float64)
-                timing.tofile(f)
+                put(f"{bin_path}/sphere-timing-{i}.bin", timing)
         pbar.update(1)
         pbar.close()
         return self
@@ -1753,16 +1908,65 @@ class FixedScene:
         Returns:
             np.ndarray: The vertex positions at the specified time.
         """
-        vert = self._vert[1].copy()
+        return self.times([time])[0]
+
+    def times(self, times, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Compute the vertex positions at a batch of times.
+
+        Args:
+            times (list[float]): The times to compute the vertex positions.
+            out (Optional[np.ndarray]): A (T, N, 3) buffer to write the positions into. Defaults to None.
+
+        Returns:
+            np.ndarray: The (T, N, 3) vertex positions at the specified times.
+        """
+        times = np.asarray(times, dtype=float).reshape(-1)
+        vert = self._vert[1]
+        shape = (len(times),) + vert.shape
+        if out is None:
+            out = np.empty(shape, dtype=vert.dtype)
+        elif out.shape != shape:
+            raise Exception(f"out must have shape {shape}")
+        out[:] = vert
+        self._pin_schedule().apply(out, times)
+        out += times[:, None, None] * self._vel
+        out += self._displacement[self._vert[0]]
+        return out
+
+    def _pin_schedule(self) -> _PinSchedule:
+        # Recompile whenever a pin is replaced or reports an edit; the cache
+        # holds the pins themselves so a freed pin's id cannot alias a new one
+        versions = [pin.version for pin in self._pin]
+        cached = getattr(self, "_schedule", None)
+        if (
+            cached is None
+            or len(cached[0]) != len(self._pin)
+            or any(old is not pin for old, pin in zip(cached[0], self._pin))
+            or cached[1] != versions
+        ):
+            schedule = _PinSchedule(self._pin)
+            cached = self._schedule = (list(self._pin), versions, schedule)
+        return cached[2]
 
-        for pin in self._pin:
-            # Apply all operations in strict order
-            for op in pin.operations:
-                vert[pin.index] = op.apply(vert[pin.index], time)
+    def intersections(self) -> dict[str, np.ndarray]:
+        """Find intersecting triangle pairs in the scene.
 
-        vert += time * self._vel
-        vert += self._displacement[self._vert[0]]
-        return vert
+        Returns:
+            dict[str, np.ndarray]: The (K, 2) intersecting triangle index pairs, keyed by "dynamic" for the dynamic mesh, "static" for the static mesh and "dynamic-static" for dynamic against static triangles.
+        """
+        result = {}
+        if len(self._tri):
+            vert = self.vertex(True)
+            result["dynamic"] = find_intersections(vert, self._tri)
+            if len(self._static_vert[1]) and len(self._static_tri):
+                static_vert = (
+                    self._static_vert[1] + self._displacement[self._static_vert[0]]
+                )
+                result["static"] = find_intersections(static_vert, self._static_tri)
+                result["dynamic-static"] = find_intersections(
+                    vert, self._tri, static_vert, self._static_tri
+                )
+        return result
 
     def check_intersection(self) -> "FixedScene":
         """Check for self-intersections and intersections with the static mesh.
@@ -1770,24 +1974,17 @@ class FixedScene:
         Returns:
             FixedScene: The fixed scene.
         """
-        import open3d as o3d
-
-        if len(self._vert) and len(self._tri):
-            o3d_mesh = o3d.geometry.TriangleMesh(
-                o3d.utility.Vector3dVector(self._vert),
-                o3d.utility.Vector3iVector(self._tri),
-            )
-            if o3d_mesh.is_self_intersecting():
-                print("WARNING: mesh is self-intersecting")
-            if len(self._static_vert) and len(self._static_tri):
-                o3d_static = o3d.geometry.TriangleMesh(
-                    o3d.utility.Vector3dVector(self._static_vert),
-                    o3d.utility.Vector3iVector(self._static_tri),
+        messages = {
+            "dynamic": "mesh is self-intersecting",
+            "static": "static mesh is self-intersecting",
+            "dynamic-static": "mesh is intersecting with static mesh",
+        }
+        for key, pairs in self.intersections().items():
+            if len(pairs):
+                print(
+                    f"WARNING: {messages[key]} ({len(pairs)} triangle pairs, "
+                    f"first {pairs[0].tolist()})"
                 )
-                if o3d_static.is_self_intersecting():
-                    print("WARNING: static mesh is self-intersecting")
-                if o3d_static.is_intersecting(o3d_mesh):
-                    print("WARNING: mesh is intersecting with static mesh")
         return self
 
     def preview(
@@ -2086,21 +2283,24 @@ class Scene:
                 obj.default_color(r, g, b)
 
         def add_entry(
-            map,
-            entry,
+            map: np.ndarray,
+            entry: np.ndarray,
         ):
+            # Number unmapped vertices in order of first appearance
             nonlocal concat_count
-            for e in entry:
-                for vi in e:
-                    if map[vi] == -1:
-                        map[vi] = concat_count
-                        concat_count += 1
+            index = np.asarray(entry, dtype=np.int64).ravel()
+            index = index[map[index] == -1]
+            if len(index):
+                unique, first = np.unique(index, return_index=True)
+                unique = unique[np.argsort(first)]
+                map[unique] = np.arange(concat_count, concat_count + len(unique))
+                concat_count += len(unique)
 
         map_by_name = {}
         for name, obj in dyn_objects:
             vert = obj.get("V")
             if vert is not None:
-                map_by_name[name] = [-1] * len(vert)
+                map_by_name[name] = np.full(len(vert), -1, dtype=np.int64)
 
         pbar.update(1)
         for name, obj in dyn_objects:
@@ -2138,10 +2338,9 @@ class Scene:
             vert = obj.get("V")
             if vert is not None:
                 map = map_by_name[name]
-                for i in range(len(vert)):
-                    if map[i] == -1:
-                        map[i] = concat_count
-                        concat_count += 1
+                unmapped = np.flatnonzero(map == -1)
+                map[unmapped] = np.arange(concat_count, concat_count + len(unmapped))
+                concat_count += len(unmapped)
 
         dmap = {}
         concat_displacement = []
@@ -2167,11 +2366,11 @@ class Scene:
         concat_tet_param = {}
         concat_static_param = {}
 
-        def vec_map(map, elm):
-            result = elm.copy()
-            for i in range(len(elm)):
-                result[i] = [map[vi] for vi in elm[i]]
-            return result
+        def vec_map(map: np.ndarray, elm: np.ndarray) -> np.ndarray:
+            return map[np.asarray(elm, dtype=np.int64)]
+
+        def concat(chunks: list[np.ndarray]) -> np.ndarray:
+            return np.concatenate(chunks) if chunks else np.array([])
 
         def extend_param(
             param: ParamHolder,
@@ -2185,7 +2384,7 @@ class Scene:
             for key, value in param.items():
                 if key not in concat_param:
                     concat_param[key] = []
-                concat_param[key].extend([value] * count)
+                concat_param[key].append(np.full(count, value))
 
         for name, obj in self._object.items():
             dmap[name] = len(concat_displacement)
@@ -2198,7 +2397,7 @@ class Scene:
             vert = obj.vertex(False)
             if vert is not None:
                 concat_vert[map] = vert
-                concat_vert_dmap[map] = [dmap[name]] * len(map)
+                concat_vert_dmap[map] = dmap[name]
                 concat_vel[map] = obj.object_velocity
                 concat_color[map] = obj.get("color")
 
@@ -2208,8 +2407,9 @@ class Scene:
             if obj.obj_type == "rod":
                 edge = obj.get("E")
                 t = vec_map(map, edge)
-                concat_rod.extend(t)
+                concat_rod.append(t)
                 extend_param(obj.param, concat_rod_param, len(t))
+        concat_rod = concat(concat_rod)
         rod_count = len(concat_rod)
 
         pbar.update(1)
@@ -2218,7 +2418,7 @@ class Scene:
             tet, tri = obj.get("T"), obj.get("F")
             if tri is not None and tet is None:
                 t = vec_map(map, tri)
-                concat_tri.extend(t)
+                concat_tri.append(t)
                 if obj.uv_coords is not None:
                     concat_uv.extend(obj.uv_coords)
                 else:
@@ -2226,7 +2426,7 @@ class Scene:
                 concat_dyn_tri_color.extend([obj.dynamic_color] * len(t))
                 concat_dyn_tri_intensity.extend([obj.dynamic_intensity] * len(t))
                 extend_param(obj.param, concat_tri_param, len(t))
-        shell_count = len(concat_tri)
+        shell_count = sum(len(t) for t in concat_tri)
 
         pbar.update(1)
         for name, obj in dyn_objects:
@@ -2234,7 +2434,7 @@ class Scene:
             tet, tri = obj.get("T"), obj.get("F")
             if tet is not None and tri is not None:
                 t = vec_map(map, tri)
-                concat_tri.extend(t)
+                concat_tri.append(t)
                 concat_dyn_tri_color.extend([obj.dynamic_color] * len(t))
                 concat_dyn_tri_intensity.extend([obj.dynamic_intensity] * len(t))
                 extend_param(
@@ -2242,6 +2442,7 @@ class Scene:
                     concat_tri_param,
                     len(t),
                 )
+        concat_tri = concat(concat_tri)
 
         pbar.update(1)
         for name, obj in dyn_objects:
@@ -2249,12 +2450,13 @@ class Scene:
             tet = obj.get("T")
             if tet is not None:
                 t = vec_map(map, tet)
-                concat_tet.extend(t)
+                concat_tet.append(t)
                 extend_param(
                     obj.param,
                     concat_tet_param,
                     len(t),
                 )
+        concat_tet = concat(concat_tet)
 
         pbar.update(1)
         for name, obj in dyn_objects:
@@ -2262,8 +2464,8 @@ class Scene:
             for p in obj.pin_list:
                 concat_pin.append(
                     PinData(
-                        index=[map[vi] for vi in p.index],
-                        operations=p.operations,
+                        index=vec_map(map, p.index).tolist(),
+                        operations=list(p.operations),
                         unpin_time=p.unpin_time,
                         pull_strength=p.pull_strength,
                         transition=p.transition,
@@ -2272,20 +2474,21 @@ class Scene:
             stitch_ind = obj.get("Ind")
             stitch_w = obj.get("W")
             if stitch_ind is not None and stitch_w is not None:
-                concat_stitch_ind.extend(vec_map(map, stitch_ind))
-                concat_stitch_w.extend(stitch_w)
+                concat_stitch_ind.append(vec_map(map, stitch_ind))
+                concat_stitch_w.append(np.asarray(stitch_w))
 
         pbar.update(1)
+        static_vert_count = 0
         for name, obj in self._object.items():
             if obj.static:
                 color = obj.get("color")
-                offset = len(concat_static_vert)
                 tri, vert = obj.get("F"), obj.get("V")
                 if tri is not None and vert is not None:
-                    concat_static_tri.extend(tri + offset)
-                    concat_static_vert.extend(obj.apply_transform(vert, False))
-                    concat_static_color.extend([color] * len(vert))
-                    concat_static_vert_dmap.extend([dmap[name]] * len(vert))
+                    concat_static_tri.append(np.asarray(tri) + static_vert_count)
+                    concat_static_vert.append(obj.apply_transform(vert, False))
+                    concat_static_color.append(np.tile(color, (len(vert), 1)))
+                    concat_static_vert_dmap.append(np.full(len(vert), dmap[name]))
+                    static_vert_count += len(vert)
                     extend_param(
                         obj.param,
                         concat_static_param,
@@ -2293,6 +2496,15 @@ class Scene:
                     )
         pbar.update(1)
 
+        for concat_param in [
+            concat_rod_param,
+            concat_tri_param,
+            concat_tet_param,
+            concat_static_param,
+        ]:
+            for key, chunks in concat_param.items():
+                concat_param[key] = np.concatenate(chunks)
+
         for key in ["model"]:
             concat_rod_param[key] = []
             concat_static_param[key] = []
@@ -2327,9 +2539,9 @@ class Scene:
             concat_dyn_tri_intensity,
             concat_vel,
             concat_uv,
-            np.array(concat_rod),
-            np.array(concat_tri),
-            np.array(concat_tet),
+            concat_rod,
+            concat_tri,
+            concat_tet,
             concat_rod_param,
             concat_tri_param,
             concat_tet_param,
@@ -2345,18 +2557,18 @@ class Scene:
         if len(concat_pin):
             fixed.set_pin(concat_pin)
 
-        if len(concat_static_vert):
+        if static_vert_count:
             fixed.set_static(
-                (np.array(concat_static_vert_dmap), np.array(concat_static_vert)),
-                np.array(concat_static_tri),
-                np.array(concat_static_color),
+                (concat(concat_static_vert_dmap), concat(concat_static_vert)),
+                concat(concat_static_tri),
+                concat(concat_static_color),
                 concat_static_param,
             )
 
         if len(concat_stitch_ind) and len(concat_stitch_w):
             fixed.set_stitch(
-                np.array(concat_stitch_ind),
-                np.array(concat_stitch_w),
+                concat(concat_stitch_ind),
+                concat(concat_stitch_w),
             )
 
         pbar.close()
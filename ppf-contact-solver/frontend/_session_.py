@@ -5,21 +5,29 @@
 
 import asyncio
 import copy
+import hashlib
+import itertools
+import json
+import multiprocessing
 import os
 import pickle
 import shutil
 import subprocess
 import sys
+import tempfile
 import threading
 import time
 
-from typing import TYPE_CHECKING, Any, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
 import numpy as np
 import pandas as pd
 
 from tqdm import tqdm
 
+from ._frame_ import FrameStore
 from ._param_ import ParamHolder, app_param
 from ._parse_ import CppRustDocStringParser
 from ._scene_ import FixedScene
@@ -463,15 +471,25 @@ fi
         include_static: bool = True,
         clear: bool = False,
         options: Optional[dict] = None,
+        workers: int = 1,
+        video_only: bool = False,
     ) -> Zippable:
         """Export the animation frames.
 
+        Frames whose outputs are newer than their simulation output and were
+        exported with the same options are skipped, so re-exporting a growing
+        run only exports the new frames. With several workers, frames are
+        exported by spawned processes, each holding its own renderer; scripts
+        using them must guard their entry point with ``if __name__ == "__main__"``.
+
         Args:
             path (str): The path to the export directory. If set empty, it will use the default path.
             ext (str, optional): The file extension. Defaults to "ply".
             include_static (bool, optional): Whether to include the static mesh.
             options (dict, optional): Additional arguments passed to a renderer.
             clear (bool, optional): Whether to clear the existing files.
+            workers (int, optional): The number of export processes. Defaults to 1, which exports in this process.
+            video_only (bool, optional): Only produce the video. With the OpenGL renderer, frames are streamed to ffmpeg without writing mesh or image files.
         """
         if options is None:
             options = {}
@@ -523,6 +541,7 @@ fi
         if os.path.exists(path):
             if clear:
                 shutil.rmtree(path)
+                os.makedirs(path)
         else:
             os.makedirs(path)
 
@@ -531,29 +550,99 @@ fi
         if is_windows:
             options["skip_render"] = True
 
-        for i in tqdm(range(latest_frame), desc="export", ncols=70):
-            self.frame(
-                os.path.join(path, f"frame_{i}.{ext}"),
-                i,
-                include_static,
-                options,
-                delete_exist=clear,
+        fixed_scene = self._fixed_session.fixed_scene
+        if fixed_scene is None:
+            raise ValueError("Scene must be initialized")
+        skip_render = options.get("skip_render", False)
+        has_ffmpeg = shutil.which("ffmpeg") is not None
+        if video_only and not has_ffmpeg:
+            print("ffmpeg is not found. Exporting frames instead of a video.")
+        if video_only and has_ffmpeg and not skip_render:
+            if options.get("renderer", "opengl") == "opengl":
+                mode = "stream"
+            else:
+                mode = "image"
+        else:
+            mode = "export"
+
+        vid_name = "frame.mp4"
+        vid_path = os.path.join(path, vid_name)
+        vert_path = [
+            os.path.join(self._fixed_session.output.path, f"vert_{i}.bin")
+            for i in range(latest_frame)
+        ]
+        vert_mtime = [
+            os.path.getmtime(p) if os.path.exists(p) else 0.0 for p in vert_path
+        ]
+
+        # Outputs written with other options are stale whatever their age
+        stamp = _export_stamp(ext, include_static, options)
+        stamp_path = os.path.join(path, ".export_stamp")
+        fresh = False
+        if os.path.exists(stamp_path):
+            with open(stamp_path) as f:
+                fresh = f.read() == stamp
+            if not fresh:
+                os.remove(stamp_path)
+
+        def up_to_date(output: str, mtime: float) -> bool:
+            return (
+                fresh
+                and os.path.exists(output)
+                and os.path.getmtime(output) >= mtime
             )
 
-        if shutil.which("ffmpeg") is not None:
-            vid_name = "frame.mp4"
-            command = f"ffmpeg -hide_banner -loglevel error -y -r 60 -i frame_%d.{ext}.png -pix_fmt yuv420p -b:v 50000k {vid_name}"
-            subprocess.run(command, shell=True, cwd=path)
+        tasks = []
+        for i in range(latest_frame):
+            mesh_path = os.path.join(path, f"frame_{i}.{ext}")
+            if mode == "export":
+                outputs = []
+                if ci_name is None or skip_render:
+                    outputs.append(mesh_path)
+                if not skip_render:
+                    outputs.append(mesh_path + ".png")
+                if all(up_to_date(output, vert_mtime[i]) for output in outputs):
+                    continue
+            tasks.append((i, vert_path[i], mesh_path, mode))
+        if mode != "export" and up_to_date(vid_path, max(vert_mtime)):
+            # The video already covers every frame
+            tasks = []
+
+        encoder = None
+        results = _run_export(tasks, workers, (fixed_scene, include_static, options))
+        for _, image in tqdm(results, total=len(tasks), desc="export", ncols=70):
+            if image is not None:
+                if encoder is None:
+                    height, width = image.shape[:2]
+                    command = (
+                        "ffmpeg -hide_banner -loglevel error -y -f rawvideo -pix_fmt rgb24 "
+                        f"-s {width}x{height} -r 60 -i - -pix_fmt yuv420p -b:v 50000k {vid_name}"
+                    ).split()
+                    encoder = subprocess.Popen(command, stdin=subprocess.PIPE, cwd=path)
+                assert encoder.stdin is not None
+                encoder.stdin.write(image.tobytes())
+        if encoder is not None:
+            assert encoder.stdin is not None
+            encoder.stdin.close()
+            encoder.wait()
+
+        if has_ffmpeg:
+            if mode != "stream" and (tasks or not os.path.exists(vid_path)):
+                command = f"ffmpeg -hide_banner -loglevel error -y -r 60 -i frame_%d.{ext}.png -pix_fmt yuv420p -b:v 50000k {vid_name}"
+                subprocess.run(command, shell=True, cwd=path)
             if Utils.in_jupyter_notebook():
                 from IPython.display import Video, display
 
-                display(Video(os.path.join(path, vid_name), embed=True))
+                display(Video(vid_path, embed=True))
 
-            if ci_name is not None:
+            if ci_name is not None or mode == "image":
                 for file in os.listdir(path):
                     if file.endswith(".png"):
                         os.remove(os.path.join(path, file))
 
+        with open(stamp_path, "w") as f:
+            f.write(stamp)
+
         return Zippable(path)
 
     def frame(
@@ -627,6 +716,16 @@ class SessionLog:
         src_path = os.path.join(fixed_session.session.proj_root, "src")
         self._fixed_session = fixed_session
         self._log = CppRustDocStringParser.get_logging_docstrings(src_path)
+        self._numbers: dict[str, _NumberLog] = {}
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop("_numbers", None)
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._numbers = {}
 
     def names(self) -> list[str]:
         """Get the list of log names.
@@ -647,13 +746,19 @@ class SessionLog:
             list[str]: The last n lines of the file.
         """
         if os.path.exists(path):
-            with open(path) as f:
-                lines = f.readlines()
-                lines = [line.rstrip("\n") for line in lines]
-                if n_lines is not None:
-                    return lines[-n_lines:]
+            with open(path, "rb") as f:
+                if n_lines:
+                    data = _read_tail(f, n_lines)
                 else:
-                    return lines
+                    data = f.read()
+            text = data.decode(errors="replace")
+            lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+            if lines[-1] == "":
+                lines.pop()
+            if n_lines is not None:
+                return lines[-n_lines:]
+            else:
+                return lines
         return []
 
     def stdout(self, n_lines: int | None = None) -> list[str]:
@@ -682,37 +787,28 @@ class SessionLog:
             os.path.join(self._fixed_session.info.path, "error.log"), n_lines
         )
 
-    def numbers(self, name: str):
+    def numbers(self, name: str) -> Optional[np.ndarray]:
         """Get a pair of numbers from a log file.
 
+        Only the bytes appended since the previous call are parsed.
+
         Args:
             name (str): The name of the log file.
 
         Returns:
-            list[list[float]]: The list of pair of numbers.
+            Optional[np.ndarray]: The read-only (N, 2) array of pairs of numbers.
         """
-
-        def float_or_int(var):
-            var = float(var)
-            if var.is_integer():
-                return int(var)
-            else:
-                return var
-
         if name not in self._log:
             return None
         filename = self._log[name]["filename"]
         path = os.path.join(self._fixed_session.info.path, "output", "data", filename)
-        entries = []
-        if os.path.exists(path):
-            with open(path) as f:
-                lines = f.readlines()
-                for line in lines:
-                    entry = line.split(" ")
-                    entries.append([float_or_int(entry[0]), float_or_int(entry[1])])
-            return entries
-        else:
-            return None
+        # Sessions pickled before the cache existed have no _numbers attribute
+        if "_numbers" not in self.__dict__:
+            self._numbers = {}
+        log = self._numbers.get(name)
+        if log is None or log.path != path:
+            log = self._numbers[name] = _NumberLog(path)
+        return log.read()
 
     def number(self, name: str):
         """Get the latest value from a log file.
@@ -724,8 +820,9 @@ class SessionLog:
             float: The latest value.
         """
         entries = self.numbers(name)
-        if entries:
-            return entries[-1][1]
+        if entries is not None and len(entries):
+            value = float(entries[-1, 1])
+            return int(value) if value.is_integer() else value
         else:
             return None
 
@@ -764,27 +861,32 @@ class SessionGet:
         """
         self._fixed_session = fixed_session
         self._log = SessionLog(fixed_session)
+        self._index: Optional[FrameStore] = None
 
     @property
     def log(self) -> SessionLog:
         """Get the session log object."""
         return self._log
 
+    @property
+    def frames(self) -> FrameStore:
+        """Get the cached frame store of the session output."""
+        path = os.path.join(self._fixed_session.info.path, "output")
+        # Sessions pickled before the store existed have no _index attribute
+        store = getattr(self, "_index", None)
+        if not isinstance(store, FrameStore) or store.path != path:
+            if store is not None:
+                store.close()
+            store = self._index = FrameStore(path)
+        return store
+
     def vertex_frame_count(self) -> int:
         """Get the vertex count.
 
         Returns:
             int: The vertex count.
         """
-        path = os.path.join(self._fixed_session.info.path, "output")
-        max_frame = 0
-        if os.path.exists(path):
-            files = os.listdir(path)
-            for file in files:
-                if file.startswith("vert") and file.endswith(".bin"):
-                    frame = int(file.split("_")[1].split(".")[0])
-                    max_frame = max(max_frame, frame)
-        return max_frame
+        return self.frames.latest()
 
     def latest_frame(self) -> int:
         """Get the latest frame number.
@@ -792,17 +894,7 @@ class SessionGet:
         Returns:
             int: The latest frame number.
         """
-        path = os.path.join(self._fixed_session.info.path, "output")
-        if os.path.exists(path):
-            files = os.listdir(path)
-            frames = []
-            for file in files:
-                if file.startswith("vert") and file.endswith(".bin"):
-                    frame = int(file.split("_")[1].split(".")[0])
-                    frames.append(frame)
-            if len(frames) > 0:
-                return sorted(frames)[-1]
-        return 0
+        return self.frames.latest()
 
     def saved(self) -> list[int]:
         """Get the list of saved frame numbers.
@@ -810,14 +902,7 @@ class SessionGet:
         Returns:
             list[int]: The list of saved frame numbers.
         """
-        result = []
-        output_path = os.path.join(self._fixed_session.info.path, "output")
-        if os.path.exists(output_path):
-            for file in os.listdir(output_path):
-                if file.startswith("state_") and file.endswith(".bin.gz"):
-                    frame = int(file.split("_")[1].split(".")[0])
-                    result.append(frame)
-        return result
+        return self.frames.saved()
 
     def vertex(self, n: int | None = None) -> tuple[np.ndarray, int] | None:
         """Get the vertex data for a specific frame.
@@ -828,40 +913,11 @@ class SessionGet:
         Returns:
             Optional[tuple[np.ndarray, int]]: The vertex data and frame number.
         """
-        path = os.path.join(self._fixed_session.info.path, "output")
-        if os.path.exists(path):
-            if n is None:
-                files = os.listdir(path)
-                frames = []
-                for file in files:
-                    if file.startswith("vert") and file.endswith(".bin"):
-                        frame = int(file.split("_")[1].split(".")[0])
-                        frames.append(frame)
-                if len(frames) > 0:
-                    frames = sorted(frames)
-                    last_frame = frames[-1]
-                    path = os.path.join(path, f"vert_{last_frame}.bin")
-                    try:
-                        with open(path, "rb") as f:
-                            data = f.read()
-                            vert = np.frombuffer(data, dtype=np.float32).reshape(-1, 3)
-                        return (
-                            vert,
-                            last_frame,
-                        )
-                    except ValueError:
-                        return None
-            else:
-                try:
-                    path = os.path.join(path, f"vert_{n}.bin")
-                    if os.path.exists(path):
-                        with open(path, "rb") as f:
-                            data = f.read()
-                            vert = np.frombuffer(data, dtype=np.float32).reshape(-1, 3)
-                        return (vert, n)
-                except ValueError:
-                    pass
-        return None
+        store = self.frames
+        if n is None:
+            n = store.latest()
+        vert = store.get(n)
+        return None if vert is None else (vert, n)
 
     def command(self) -> str | None:
         """Get the path to the command.sh file.
@@ -920,11 +976,15 @@ class SessionGet:
 class FixedSession:
     """Class to manage a fixed simulation session."""
 
-    def __init__(self, session: "Session"):
+    def __init__(
+        self, session: "Session", pack: bool = False, compress: bool = False
+    ):
         """Initialize the Session class.
 
         Args:
             session (Session): The session object.
+            pack (bool, optional): Whether to export the scene as a single scene.pack file. Defaults to False.
+            compress (bool, optional): Whether to compress the entries of the scene.pack. Defaults to False.
         """
         self._session = session
         self._update_preview_interval = 0.1
@@ -945,7 +1005,9 @@ class FixedSession:
         }
         if self.fixed_scene is not None:
             self.delete()
-            self.fixed_scene.export_fixed(self.info.path, True)
+            self.fixed_scene.export_fixed(
+                self.info.path, True, pack=pack, compress=compress
+            )
         else:
             raise ValueError("Scene and param must be initialized")
         self._cmd_path = self.export.shell_command(self._param)
@@ -1519,12 +1581,17 @@ class FixedSession:
             return None
 
     def animate(
-        self, options: Optional[dict] = None, engine: str = "threejs"
+        self,
+        options: Optional[dict] = None,
+        engine: str = "threejs",
+        prefetch: int = 8,
     ) -> "FixedSession":
         """Show the animation.
 
         Args:
             options (dict, optional): The render options.
+            engine (str, optional): The rendering engine. Defaults to "threejs".
+            prefetch (int, optional): The number of frames to read ahead of the slider. Defaults to 8.
 
         Returns:
             Session: The animated session.
@@ -1566,31 +1633,28 @@ class FixedSession:
                             frame_count = self.get.vertex_frame_count()
                             print(f"Found {frame_count} frame(s). Loading animation...")
 
-                        vert_list = []
-                        for i in tqdm(
-                            range(frame_count), desc="Loading frames", ncols=70
-                        ):
-                            result = self.get.vertex(i)
-                            if result is not None:
-                                vert, _ = result
-                                vert_list.append(vert)
+                        # Frames are read on demand; the store keeps recent
+                        # ones and reads ahead of the slider in the background
+                        store = self.get.frames
+                        store.prefetch(0, prefetch)
 
                         # Create status label and reload button
                         status_label = widgets.Label(
-                            value=f"Loaded {len(vert_list)} frames"
+                            value=f"Found {frame_count} frames"
                         )
                         reload_button = widgets.Button(description="Reload")
                         display(widgets.HBox([reload_button, status_label]))
 
                         def update(frame=1):
-                            nonlocal vert_list
                             nonlocal plot
                             assert plot is not None
-                            if fixed_scene is not None and frame - 1 < len(vert_list):
-                                vert = vert_list[frame - 1]
-                                color = fixed_scene.color(vert, options)
-                                # Always recompute normals for correct lighting
-                                plot.update(vert, color, recompute_normals=True)
+                            if fixed_scene is not None and frame - 1 < frame_count:
+                                vert = store.get(frame - 1)
+                                store.prefetch(frame, prefetch)
+                                if vert is not None:
+                                    color = fixed_scene.color(vert, options)
+                                    # Always recompute normals for correct lighting
+                                    plot.update(vert, color, recompute_normals=True)
 
                         # Create the interactive slider
                         slider = widgets.IntSlider(
@@ -1599,28 +1663,21 @@ class FixedSession:
                         output = widgets.interactive_output(update, {"frame": slider})
 
                         def _reload(button):
-                            nonlocal vert_list
+                            nonlocal frame_count
                             nonlocal slider
                             nonlocal status_label
                             button.disabled = True
                             button.description = "Reloading..."
                             try:
-                                # Reload frames from disk
                                 new_frame_count = self.get.vertex_frame_count()
-                                if new_frame_count > len(vert_list):
-                                    for i in range(len(vert_list), new_frame_count):
-                                        result = self.get.vertex(i)
-                                        if result is not None:
-                                            vert, _ = result
-                                            vert_list.append(vert)
+                                if new_frame_count > frame_count:
+                                    frame_count = new_frame_count
 
                                     # Update the slider range
                                     slider.max = new_frame_count
 
                                     # Update status label
-                                    status_label.value = (
-                                        f"Loaded {len(vert_list)} frames"
-                                    )
+                                    status_label.value = f"Found {frame_count} frames"
                                 button.description = "Reload"
                             except Exception as e:
                                 button.description = "Reload"
@@ -1833,8 +1890,17 @@ class Session:
         self._fixed_scene = scene
         return self
 
-    def build(self) -> FixedSession:
-        self._fixed_session = FixedSession(self)
+    def build(self, pack: bool = False, compress: bool = False) -> FixedSession:
+        """Build the fixed session and export its scene.
+
+        Args:
+            pack (bool, optional): Whether to export the scene as a single scene.pack file instead of separate files. Defaults to False.
+            compress (bool, optional): Whether to compress the entries of the scene.pack. Ignored without pack. Defaults to False.
+
+        Returns:
+            FixedSession: The fixed session.
+        """
+        self._fixed_session = FixedSession(self, pack, compress)
         # Use app name with counter suffix if autogenerated
         if self._autogenerated is not None:
             if self._autogenerated == 0:
@@ -1918,3 +1984,182 @@ def convert_integer(number) -> str:
         return f"{number / 1_000_000:.2f}M"
     else:
         return f"{number / 1_000_000_000:.2f}B"
+
+
+def _read_tail(f, n_lines: int, block: int = 65536) -> bytes:
+    # Seek backward from the end until n_lines complete lines are covered
+    pos = f.seek(0, os.SEEK_END)
+    data = b""
+    while pos > 0 and data.count(b"\n") <= n_lines:
+        step = min(block, pos)
+        pos -= step
+        f.seek(pos)
+        data = f.read(step) + data
+    return data
+
+
+class _NumberLog:
+    """Incremental reader of a two-column number log written by the solver."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._reset()
+
+    def _reset(self, ino: Optional[int] = None):
+        self._ino = ino
+        self._offset = 0
+        self._partial = b""
+        self._values = np.empty((0, 2))
+        self._count = 0
+
+    def read(self) -> Optional[np.ndarray]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset()
+            return None
+        if st.st_ino != self._ino or st.st_size < self._offset:
+            # The log was replaced or truncated, so start over
+            self._reset(st.st_ino)
+        if st.st_size > self._offset:
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                appended = f.read()
+            self._offset += len(appended)
+            data = self._partial + appended
+            # A trailing line without a newline may still be being written
+            end = data.rfind(b"\n") + 1
+            self._partial = data[end:]
+            self._append(data[:end])
+        values = self._values[: self._count]
+        values.flags.writeable = False
+        return values
+
+    def _append(self, data: bytes):
+        values = np.array(data.split(), dtype=np.float64)
+        values = values[: len(values) // 2 * 2].reshape(-1, 2)
+        count = self._count + len(values)
+        if count > len(self._values):
+            # Grow geometrically so appending stays amortized constant time
+            grown = np.empty((max(count, 2 * len(self._values)), 2))
+            grown[: self._count] = self._values[: self._count]
+            self._values = grown
+        self._values[self._count : count] = values
+        self._count = count
+
+
+_export_worker: dict[str, Any] = {}
+
+
+def _export_init(fixed_scene: FixedScene, include_static: bool, options: dict):
+    """Set up the export state of a worker. The renderer is created on first use."""
+    options = dict(options)
+    if options.get("renderer") == "mitsuba" and "tmp_path" not in options:
+        # Workers must not share the intermediate mesh file
+        options["tmp_path"] = os.path.join(
+            tempfile.gettempdir(), f"tmp_mesh_{os.getpid()}.ply"
+        )
+    _export_worker.clear()
+    _export_worker.update(
+        scene=fixed_scene,
+        include_static=include_static,
+        options=options,
+        renderer=None,
+    )
+
+
+def _export_stamp(ext: str, include_static: bool, options: dict) -> str:
+    """Digest the settings that shape exported frames."""
+    settings = {"ext": ext, "include_static": include_static, "options": options}
+    text = json.dumps(settings, sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _read_frame(path: str, fixed_scene: FixedScene) -> np.ndarray:
+    """Read the vertices of a frame, falling back to the initial vertices."""
+    if os.path.exists(path):
+        try:
+            return np.fromfile(path, dtype=np.float32).reshape(-1, 3)
+        except ValueError:
+            pass
+    return fixed_scene.vertex(True)
+
+
+def _export_frame(
+    task: tuple[int, str, str, str], vert: Optional[np.ndarray] = None
+) -> tuple[int, Optional[np.ndarray]]:
+    """Export one frame in a worker.
+
+    A task is ``(frame, vert_path, mesh_path, mode)``: "export" writes the mesh
+    and its image, "image" writes only the image and "stream" returns the image.
+    """
+    frame, vert_path, mesh_path, mode = task
+    scene: FixedScene = _export_worker["scene"]
+    options = _export_worker["options"]
+    include_static = _export_worker["include_static"]
+    if vert is None:
+        vert = _read_frame(vert_path, scene)
+    color = scene.color(vert, options)
+    if _export_worker["renderer"] is None and not options.get("skip_render", False):
+        _export_worker["renderer"] = scene.renderer(options)
+    renderer = _export_worker["renderer"]
+    if mode == "export":
+        scene.export(
+            vert, color, mesh_path, include_static, options, True, renderer
+        )
+        return frame, None
+    elif mode == "image":
+        scene.render(vert, color, include_static, options, renderer, mesh_path + ".png")
+        return frame, None
+    else:
+        return frame, scene.render(vert, color, include_static, options, renderer)
+
+
+def _prefetch(
+    tasks: list[tuple[int, str, str, str]], fixed_scene: FixedScene
+) -> Iterator[tuple[tuple[int, str, str, str], np.ndarray]]:
+    """Yield each task with its vertices while a thread reads the next frame."""
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        pending = reader.submit(_read_frame, tasks[0][1], fixed_scene)
+        for k, task in enumerate(tasks):
+            vert = pending.result()
+            if k + 1 < len(tasks):
+                pending = reader.submit(_read_frame, tasks[k + 1][1], fixed_scene)
+            yield task, vert
+
+
+def _run_export(
+    tasks: list[tuple[int, str, str, str]],
+    workers: int,
+    initargs: tuple[FixedScene, bool, dict],
+) -> Iterator[tuple[int, Optional[np.ndarray]]]:
+    """Run export tasks and yield their results in order.
+
+    A thread reads the next frame while the current one is exported. With
+    several workers, tasks run in a pool of spawned processes with a bounded
+    window of frames in flight; spawning rather than forking keeps the pool
+    safe to start from threaded hosts such as a Jupyter kernel.
+    """
+    if not tasks:
+        return
+    frames = _prefetch(tasks, initargs[0])
+    if workers <= 1 or len(tasks) == 1:
+        _export_init(*initargs)
+        for task, vert in frames:
+            yield _export_frame(task, vert)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_export_init,
+            initargs=initargs,
+        ) as pool:
+            window = deque(
+                pool.submit(_export_frame, task, vert)
+                for task, vert in itertools.islice(frames, 2 * workers)
+            )
+            while window:
+                result = window.popleft().result()
+                for task, vert in itertools.islice(frames, 1):
+                    window.append(pool.submit(_export_frame, task, vert))
+                yield result
@@ -184,10 +184,66 @@ impl InProcessSession {
         Ok(())
     }
 
+    /// Overrides a contiguous range of collision mesh vertices, starting at `offset`.
+    ///
+    /// Vertices outside the range keep their current override (or the exported positions if
+    /// no override was set yet), so a host only needs to re-send the colliders that moved.
+    pub fn set_collision_mesh_vertices_range(&mut self, offset: usize, positions_flat: &[f32]) -> Result<(), String> {
+        let n = self.collision_mesh_vert_count;
+        if n == 0 {
+            return Err("Scene has no collision mesh vertices".to_string());
+        }
+        if positions_flat.len() % 3 != 0 {
+            return Err(format!(
+                "Expected a multiple of 3 floats, got {}",
+                positions_flat.len()
+            ));
+        }
+        let count = positions_flat.len() / 3;
+        if offset + count > n {
+            return Err(format!(
+                "Collision vertex range {}..{} exceeds {} collision vertices",
+                offset,
+                offset + count,
+                n
+            ));
+        }
+
+        if self.collision_mesh_override.is_none() {
+            self.collision_mesh_override = Some(self.exported_collision_mesh_vertices());
+        }
+        if let Some(m) = self.collision_mesh_override.as_mut() {
+            for i in 0..count {
+                m[(0, offset + i)] = positions_flat[3 * i + 0];
+                m[(1, offset + i)] = positions_flat[3 * i + 1];
+                m[(2, offset + i)] = positions_flat[3 * i + 2];
+            }
+        }
+        Ok(())
+    }
+
     pub fn clear_collision_mesh_vertices(&mut self) {
         self.collision_mesh_override = None;
     }
 
+    fn exported_collision_mesh_vertices(&self) -> Matrix3xX<f32> {
+        let n = self.collision_mesh_vert_count;
+        let mut m = Matrix3xX::<f32>::zeros(n);
+        let constraint = self.scene.make_constraint(self.backend.state.time);
+        unsafe {
+            let mesh = &constraint.mesh;
+            if mesh.vertex.size as usize == n && n > 0 && !mesh.vertex.data.is_null() {
+                let verts = std::slice::from_raw_parts(mesh.vertex.data, n);
+                for (i, v) in verts.iter().enumerate() {
+                    m[(0, i)] = v.x;
+                    m[(1, i)] = v.y;
+                    m[(2, i)] = v.z;
+                }
+            }
+        }
+        m
+    }
+
     fn debug_enabled() -> bool {
         std::env::var("PPF_INPROCESS_DEBUG")
             .ok()
@@ -11,6 +11,7 @@ mod cvec;
 mod cvecvec;
 mod data;
 mod mesh;
+mod pack;
 mod scene;
 mod triutils;
 
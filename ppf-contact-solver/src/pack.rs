@@ -0,0 +1,282 @@
+// File: pack.rs
+// Code: Claude Code and Codex
+// Review: Ryoichi Ando (ryoichi.ando@zozo.com)
+// License: Apache v2.0
+
+use flate2::read::ZlibDecoder;
+use std::collections::HashMap;
+use std::fs::{self, File};
+use std::io::{self, Read};
+
+const SCENE_PACK: &str = "scene.pack";
+const PACK_MAGIC: &[u8; 8] = b"PPFSCENE";
+const PACK_VERSION: u32 = 1;
+const PACK_HEADER_SIZE: usize = 64;
+const PACK_ENTRY_SIZE: usize = 32;
+
+struct PackEntry {
+    codec: u8,
+    offset: usize,
+    stored: usize,
+    raw: usize,
+}
+
+// Scene files, read either from the scene directory or from the single-file
+// scene.pack written by the frontend with the same entry names
+pub struct SceneFiles {
+    root: String,
+    pack: Option<(Vec<u8>, HashMap<String, PackEntry>)>,
+}
+
+impl SceneFiles {
+    pub fn open(root: &str) -> io::Result<Self> {
+        let pack_path = format!("{}/{}", root, SCENE_PACK);
+        let pack = if std::path::Path::new(&pack_path).exists() {
+            let data = fs::read(&pack_path)?;
+            let entries = Self::parse_pack(&data).map_err(|msg| {
+                io::Error::new(
+                    io::ErrorKind::InvalidData,
+                    format!("{}: {}", pack_path, msg),
+                )
+            })?;
+            Some((data, entries))
+        } else {
+            None
+        };
+        Ok(Self {
+            root: root.to_string(),
+            pack,
+        })
+    }
+
+    fn parse_pack(data: &[u8]) -> Result<HashMap<String, PackEntry>, String> {
+        let u32_at = |pos: usize| u32::from_le_bytes(data[pos..pos + 4].try_into().unwrap());
+        let u64_at =
+            |pos: usize| u64::from_le_bytes(data[pos..pos + 8].try_into().unwrap()) as usize;
+        if data.len() < PACK_HEADER_SIZE || &data[0..8] != PACK_MAGIC {
+            return Err("not a scene pack".to_string());
+        }
+        if u32_at(8) != PACK_VERSION {
+            return Err(format!("unsupported scene pack version {}", u32_at(8)));
+        }
+        let count = u32_at(12) as usize;
+        let (table_start, table_size) = (u64_at(16), u64_at(24));
+        let table_end = table_start
+            .checked_add(table_size)
+            .filter(|&end| end <= data.len())
+            .ok_or("table of contents out of range")?;
+        let mut entries = HashMap::new();
+        let mut pos = table_start;
+        for _ in 0..count {
+            if pos + PACK_ENTRY_SIZE > table_end {
+                return Err("truncated table of contents".to_string());
+            }
+            let name_len = u32_at(pos) as usize;
+            let entry = PackEntry {
+                codec: data[pos + 4],
+                offset: u64_at(pos + 8),
+                stored: u64_at(pos + 16),
+                raw: u64_at(pos + 24),
+            };
+            let name_start = pos + PACK_ENTRY_SIZE;
+            if name_start + name_len > table_end
+                || entry.offset.saturating_add(entry.stored) > data.len()
+            {
+                return Err("entry out of range".to_string());
+            }
+            let name = std::str::from_utf8(&data[name_start..name_start + name_len])
+                .map_err(|_| "entry name is not UTF-8")?
+                .to_string();
+            pos = name_start + name_len.div_ceil(8) * 8;
+            entries.insert(name, entry);
+        }
+        Ok(entries)
+    }
+
+    pub fn read(&self, name: &str) -> io::Result<Vec<u8>> {
+        match &self.pack {
+            None => {
+                let mut file = File::open(format!("{}/{}", self.root, name))?;
+                let mut buff = Vec::new();
+                file.read_to_end(&mut buff)?;
+                Ok(buff)
+            }
+            Some((data, entries)) => {
+                let entry = entries.get(name).ok_or_else(|| {
+                    io::Error::new(
+                        io::ErrorKind::NotFound,
+                        format!("{} not in scene pack", name),
+                    )
+                })?;
+                let stored = &data[entry.offset..entry.offset + entry.stored];
+                match entry.codec {
+                    0 => Ok(stored.to_vec()),
+                    1 => {
+                        let mut buff = Vec::with_capacity(entry.raw);
+                        ZlibDecoder::new(stored).read_to_end(&mut buff)?;
+                        if buff.len() != entry.raw {
+                            return Err(io::Error::new(
+                                io::ErrorKind::InvalidData,
+                                format!("{} has the wrong decompressed size", name),
+                            ));
+                        }
+                        Ok(buff)
+                    }
+                    codec => Err(io::Error::new(
+                        io::ErrorKind::InvalidData,
+                        format!("unknown codec {} for {}", codec, name),
+                    )),
+                }
+            }
+        }
+    }
+
+    pub fn exists(&self, name: &str) -> bool {
+        match &self.pack {
+            None => std::path::Path::new(&format!("{}/{}", self.root, name)).exists(),
+            Some((_, entries)) => entries.contains_key(name),
+        }
+    }
+
+    // File names directly inside a directory, sorted for a stable order
+    pub fn list(&self, dir: &str) -> io::Result<Vec<String>> {
+        let mut names = Vec::new();
+        match &self.pack {
+            None => {
+                for entry in fs::read_dir(format!("{}/{}", self.root, dir))? {
+                    let path = entry?.path();
+                    if path.is_file() {
+                        names.push(path.file_name().unwrap().to_string_lossy().to_string());
+                    }
+                }
+            }
+            Some((_, entries)) => {
+                let prefix = format!("{}/", dir);
+                for name in entries.keys() {
+                    if let Some(file_name) = name.strip_prefix(&prefix) {
+                        if !file_name.contains('/') {
+                            names.push(file_name.to_string());
+                        }
+                    }
+                }
+            }
+        }
+        names.sort();
+        Ok(names)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use flate2::write::ZlibEncoder;
+    use flate2::Compression;
+    use std::io::Write;
+
+    // Same layout as ScenePackWriter in frontend/_pack_.py
+    fn write_pack(entries: &[(&str, &[u8], bool)]) -> Vec<u8> {
+        let mut data = vec![0u8; PACK_HEADER_SIZE];
+        let mut table = Vec::new();
+        for (name, raw, compress) in entries {
+            let (codec, stored) = if *compress {
+                let mut encoder = ZlibEncoder::new(Vec::new(), Compression::fast());
+                encoder.write_all(raw).unwrap();
+                (1u8, encoder.finish().unwrap())
+            } else {
+                (0u8, raw.to_vec())
+            };
+            data.resize(data.len().div_ceil(64) * 64, 0);
+            table.extend_from_slice(&(name.len() as u32).to_le_bytes());
+            table.extend_from_slice(&[codec, 0, 0, 0]);
+            for value in [data.len(), stored.len(), raw.len()] {
+                table.extend_from_slice(&(value as u64).to_le_bytes());
+            }
+            table.extend_from_slice(name.as_bytes());
+            table.resize(table.len().div_ceil(8) * 8, 0);
+            data.extend_from_slice(&stored);
+        }
+        data.resize(data.len().div_ceil(64) * 64, 0);
+        let table_start = data.len();
+        data.extend_from_slice(&table);
+        data[0..8].copy_from_slice(PACK_MAGIC);
+        data[8..12].copy_from_slice(&PACK_VERSION.to_le_bytes());
+        data[12..16].copy_from_slice(&(entries.len() as u32).to_le_bytes());
+        data[16..24].copy_from_slice(&(table_start as u64).to_le_bytes());
+        data[24..32].copy_from_slice(&(table.len() as u64).to_le_bytes());
+        data
+    }
+
+    fn scene_dir(name: &str) -> String {
+        let dir = std::env::temp_dir().join(format!("pack-{}-{}", name, std::process::id()));
+        let _ = fs::remove_dir_all(&dir);
+        fs::create_dir_all(dir.join("bin/param")).unwrap();
+        dir.to_string_lossy().to_string()
+    }
+
+    const ENTRIES: [(&str, &[u8]); 4] = [
+        ("info.toml", b"[count]\nvert = 3\n"),
+        ("bin/vert.bin", &[7; 36]),
+        ("bin/param/b.bin", &[1, 2, 3, 4]),
+        ("bin/param/a.bin", &[]),
+    ];
+
+    fn check(files: &SceneFiles) {
+        for (name, raw) in ENTRIES {
+            assert!(files.exists(name));
+            assert_eq!(files.read(name).unwrap(), raw);
+        }
+        assert!(!files.exists("bin/uv.bin"));
+        assert!(files.read("bin/uv.bin").is_err());
+        assert_eq!(files.list("bin").unwrap(), ["vert.bin"]);
+        assert_eq!(files.list("bin/param").unwrap(), ["a.bin", "b.bin"]);
+    }
+
+    #[test]
+    fn reads_a_scene_directory() {
+        let root = scene_dir("dir");
+        for (name, raw) in ENTRIES {
+            fs::write(format!("{}/{}", root, name), raw).unwrap();
+        }
+        let files = SceneFiles::open(&root).unwrap();
+        assert!(files.pack.is_none());
+        check(&files);
+        fs::remove_dir_all(&root).unwrap();
+    }
+
+    #[test]
+    fn reads_raw_and_compressed_pack_entries() {
+        for compress in [false, true] {
+            let root = scene_dir(if compress { "zlib" } else { "raw" });
+            let entries: Vec<_> = ENTRIES.iter().map(|(n, r)| (*n, *r, compress)).collect();
+            fs::write(format!("{}/{}", root, SCENE_PACK), write_pack(&entries)).unwrap();
+            let files = SceneFiles::open(&root).unwrap();
+            assert!(files.pack.is_some());
+            check(&files);
+            fs::remove_dir_all(&root).unwrap();
+        }
+    }
+
+    #[test]
+    fn rejects_damaged_packs() {
+        let data = write_pack(&[("info.toml", b"x", false)]);
+        assert!(SceneFiles::parse_pack(&data).is_ok());
+
+        let mut bad = data.clone();
+        bad[0] = b'X';
+        assert!(SceneFiles::parse_pack(&bad).is_err());
+
+        let mut bad = data.clone();
+        bad[8..12].copy_from_slice(&2u32.to_le_bytes());
+        assert!(SceneFiles::parse_pack(&bad).is_err());
+
+        let mut bad = data.clone();
+        bad[12..16].copy_from_slice(&2u32.to_le_bytes());
+        assert!(SceneFiles::parse_pack(&bad).is_err());
+
+        let mut bad = data.clone();
+        bad.truncate(data.len() - 8);
+        assert!(SceneFiles::parse_pack(&bad).is_err());
+
+        assert!(SceneFiles::parse_pack(&data[..PACK_HEADER_SIZE - 1]).is_err());
+    }
+}
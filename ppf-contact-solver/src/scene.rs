@@ -5,6 +5,7 @@
 
 use super::builder::{convert_prop, make_collision_mesh};
 use super::data::*;
+use super::pack::SceneFiles;
 use super::{CVec, MeshSet, ParamSet, ProgramArgs, Props, SimArgs, SimMesh};
 use bytemuck::{cast_slice, Pod};
 use more_asserts::*;
@@ -12,7 +13,7 @@ use na::{Const, Matrix, Matrix2x3, Matrix2xX, Matrix3xX, Matrix4xX, VecStorage,
 use serde::Deserialize;
 use std::collections::HashMap;
 use std::fs::{self, File};
-use std::io::{self, BufRead, Read, Write};
+use std::io::{self, BufRead, Write};
 use toml::Value;
 
 pub struct Scene {
@@ -111,13 +112,11 @@ type MatReadResult<T, const C: usize> =
     io::Result<Matrix<T, Const<C>, na::Dyn, VecStorage<T, Const<C>, na::Dyn>>>;
 type DynParamTable = Vec<(String, Vec<(f64, f64)>)>;
 
-fn read_mat_from_file<T, const C: usize>(path: &str) -> MatReadResult<T, C>
+fn read_mat_from_file<T, const C: usize>(files: &SceneFiles, path: &str) -> MatReadResult<T, C>
 where
     T: Pod + std::cmp::PartialEq + std::fmt::Debug,
 {
-    let mut file = File::open(path)?;
-    let mut buff = Vec::new();
-    file.read_to_end(&mut buff)?;
+    let buff = files.read(path)?;
     if !buff.len().is_multiple_of(std::mem::size_of::<T>()) {
         return Err(io::Error::new(
             io::ErrorKind::InvalidData,
@@ -140,13 +139,11 @@ where
     })
 }
 
-fn read_vec<T>(path: &str) -> io::Result<Vec<T>>
+fn read_vec<T>(files: &SceneFiles, path: &str) -> io::Result<Vec<T>>
 where
     T: bytemuck::AnyBitPattern,
 {
-    let mut buff = Vec::new();
-    let mut file = File::open(path)?;
-    file.read_to_end(&mut buff)?;
+    let buff = files.read(path)?;
     Ok(cast_slice(&buff).to_vec())
 }
 
@@ -185,8 +182,13 @@ impl Scene {
     pub fn new(args: &ProgramArgs) -> Self {
         assert!(std::path::Path::new(&args.path).exists());
 
-        let toml_path = format!("{}/info.toml", args.path);
-        let content = fs::read_to_string(toml_path).expect("Failed to read the TOML file");
+        let files = SceneFiles::open(&args.path).expect("Failed to open the scene pack");
+        let content = String::from_utf8(
+            files
+                .read("info.toml")
+                .expect("Failed to read the TOML file"),
+        )
+        .expect("Failed to read the TOML file");
         let parsed: Value = content.parse::<Value>().expect("Failed to parse TOML");
         let read_usize = |count: &Value, key: &str| {
             count
@@ -238,30 +240,32 @@ impl Scene {
         let _rod_count = read_usize(count, "rod_count");
         let shell_count = read_usize(count, "shell_count");
 
-        let displacement_path = format!("{}/bin/displacement.bin", args.path);
-        let vert_dmap_path = format!("{}/bin/vert_dmap.bin", args.path);
-        let vert_path = format!("{}/bin/vert.bin", args.path);
-        let vel_path = format!("{}/bin/vel.bin", args.path);
-        let uv_path = format!("{}/bin/uv.bin", args.path);
-        let rod_path = format!("{}/bin/rod.bin", args.path);
-        let tri_path = format!("{}/bin/tri.bin", args.path);
-        let tet_path = format!("{}/bin/tet.bin", args.path);
-        let static_vert_dmap_path = format!("{}/bin/static_vert_dmap.bin", args.path);
-        let static_vert_path = format!("{}/bin/static_vert.bin", args.path);
-        let static_tri_path = format!("{}/bin/static_tri.bin", args.path);
-        let stitch_ind_path = format!("{}/bin/stitch_ind.bin", args.path);
-        let stitch_w_path = format!("{}/bin/stitch_w.bin", args.path);
-
-        let displacement_mat = read_mat_from_file::<f64, 3>(&displacement_path)
+        let displacement_path = "bin/displacement.bin";
+        let vert_dmap_path = "bin/vert_dmap.bin";
+        let vert_path = "bin/vert.bin";
+        let vel_path = "bin/vel.bin";
+        let uv_path = "bin/uv.bin";
+        let rod_path = "bin/rod.bin";
+        let tri_path = "bin/tri.bin";
+        let tet_path = "bin/tet.bin";
+        let static_vert_dmap_path = "bin/static_vert_dmap.bin";
+        let static_vert_path = "bin/static_vert.bin";
+        let static_tri_path = "bin/static_tri.bin";
+        let stitch_ind_path = "bin/stitch_ind.bin";
+        let stitch_w_path = "bin/stitch_w.bin";
+
+        let displacement_mat = read_mat_from_file::<f64, 3>(&files, displacement_path)
             .expect("Failed to read displacement")
             .map(|x| x as f32);
-        let vert_dmap_mat = read_vec::<u32>(&vert_dmap_path).expect("Failed to read vert_dmap");
-        let vert_mat = read_mat_from_file::<f64, 3>(&vert_path)
+        let vert_dmap_mat =
+            read_vec::<u32>(&files, vert_dmap_path).expect("Failed to read vert_dmap");
+        let vert_mat = read_mat_from_file::<f64, 3>(&files, vert_path)
             .expect("Failed to read vert")
             .map(|x| x as f32);
-        let vel_mat = read_mat_from_file::<f32, 3>(&vel_path).expect("Failed to read velocity");
-        let uv_mat = if std::path::Path::new(&uv_path).exists() {
-            let data = read_vec::<f32>(&uv_path).expect("Failed to read uv");
+        let vel_mat =
+            read_mat_from_file::<f32, 3>(&files, vel_path).expect("Failed to read velocity");
+        let uv_mat = if files.exists(uv_path) {
+            let data = read_vec::<f32>(&files, uv_path).expect("Failed to read uv");
             assert_eq!(data.len(), shell_count * 6, "UV data length mismatch");
             let mat = (0..shell_count)
                 .map(|i| {
@@ -276,24 +280,25 @@ impl Scene {
             None
         };
         let rod_mat = if n_rod > 0 {
-            read_mat_from_file::<usize, 2>(&rod_path).expect("Failed to read rod")
+            read_mat_from_file::<usize, 2>(&files, rod_path).expect("Failed to read rod")
         } else {
             Matrix2xX::<usize>::zeros(0)
         };
         let tri_mat = if n_tri > 0 {
-            read_mat_from_file::<usize, 3>(&tri_path).expect("Failed to read tri")
+            read_mat_from_file::<usize, 3>(&files, tri_path).expect("Failed to read tri")
         } else {
             Matrix3xX::<usize>::zeros(0)
         };
         let tet_mat = if n_tet > 0 {
-            read_mat_from_file::<usize, 4>(&tet_path).expect("Failed to read tet")
+            read_mat_from_file::<usize, 4>(&files, tet_path).expect("Failed to read tet")
         } else {
             Matrix4xX::<usize>::zeros(0)
         };
         let (static_vert_dmap_mat, static_vert_mat) = if n_static_vert > 0 {
             (
-                read_vec::<u32>(&static_vert_dmap_path).expect("Failed to read static_vert_dmap"),
-                read_mat_from_file::<f64, 3>(&static_vert_path)
+                read_vec::<u32>(&files, static_vert_dmap_path)
+                    .expect("Failed to read static_vert_dmap"),
+                read_mat_from_file::<f64, 3>(&files, static_vert_path)
                     .expect("Failed to read static_vert")
                     .map(|x| x as f32),
             )
@@ -301,15 +306,17 @@ impl Scene {
             (Vec::new(), Matrix3xX::<f32>::zeros(0))
         };
         let static_tri_mat = if n_static_tri > 0 {
-            read_mat_from_file::<usize, 3>(&static_tri_path).expect("Failed to read static_tri")
+            read_mat_from_file::<usize, 3>(&files, static_tri_path)
+                .expect("Failed to read static_tri")
         } else {
             Matrix3xX::<usize>::zeros(0)
         };
         let (stitch_ind_mat, stitch_w_mat) = if n_stitch > 0 {
             (
-                read_mat_from_file::<usize, 3>(&stitch_ind_path)
+                read_mat_from_file::<usize, 3>(&files, stitch_ind_path)
                     .expect("Failed to read stitch_ind"),
-                read_mat_from_file::<f32, 2>(&stitch_w_path).expect("Failed to read stitch_w"),
+                read_mat_from_file::<f32, 2>(&files, stitch_w_path)
+                    .expect("Failed to read stitch_w"),
             )
         } else {
             (Matrix3xX::<usize>::zeros(0), Matrix2xX::<f32>::zeros(0))
@@ -325,9 +332,10 @@ impl Scene {
             let operation_count = read_usize(count, "operation_count");
             let unpin_time = count.get("unpin_time").and_then(|v| v.as_float());
             let pull_w = read_f32(count, "pull");
-            let pin_ind_path = format!("{}/bin/pin-ind-{}.bin", args.path, i);
+            let pin_ind_path = format!("bin/pin-ind-{}.bin", i);
 
-            let pin_ind = read_vec::<usize>(&pin_ind_path).expect("Failed to read pin index");
+            let pin_ind =
+                read_vec::<usize>(&files, &pin_ind_path).expect("Failed to read pin index");
             assert_eq!(pin_ind.len(), n_pin as usize);
 
             // Read operations in order
@@ -345,8 +353,8 @@ impl Scene {
                         let t_start = read_f64(op_entry, "t_start");
                         let t_end = read_f64(op_entry, "t_end");
                         let transition = read_string(op_entry, "transition");
-                        let delta_path = format!("{}/bin/pin-{}-op-{}.bin", args.path, i, j);
-                        let delta = read_mat_from_file::<f64, 3>(&delta_path)
+                        let delta_path = format!("bin/pin-{}-op-{}.bin", i, j);
+                        let delta = read_mat_from_file::<f64, 3>(&files, &delta_path)
                             .expect("Failed to read move_by delta")
                             .map(|x| x as f32);
                         operations.push(PinOperation::MoveBy {
@@ -360,8 +368,8 @@ impl Scene {
                         let t_start = read_f64(op_entry, "t_start");
                         let t_end = read_f64(op_entry, "t_end");
                         let transition = read_string(op_entry, "transition");
-                        let target_path = format!("{}/bin/pin-{}-op-{}.bin", args.path, i, j);
-                        let target = read_mat_from_file::<f64, 3>(&target_path)
+                        let target_path = format!("bin/pin-{}-op-{}.bin", i, j);
+                        let target = read_mat_from_file::<f64, 3>(&files, &target_path)
                             .expect("Failed to read move_to target")
                             .map(|x| x as f32);
                         operations.push(PinOperation::MoveTo {
@@ -435,12 +443,11 @@ impl Scene {
                 let mut normal = Vector3::new(nx, ny, nz);
                 normal.normalize_mut();
                 let position =
-                    read_mat_from_file::<f64, 3>(&format!("{}/bin/wall-pos-{}.bin", args.path, i))
+                    read_mat_from_file::<f64, 3>(&files, &format!("bin/wall-pos-{}.bin", i))
                         .expect("Failed to read pos_path")
                         .map(|x| x as f32);
-                let wall_timing =
-                    read_vec::<f64>(&format!("{}/bin/wall-timing-{}.bin", args.path, i))
-                        .expect("Failed to read wall timing");
+                let wall_timing = read_vec::<f64>(&files, &format!("bin/wall-timing-{}.bin", i))
+                    .expect("Failed to read wall timing");
                 let contact_gap = read_f32(count, "contact-gap");
                 let friction = read_f32(count, "friction");
                 assert_eq!(position.ncols(), n_keyframe as usize);
@@ -467,15 +474,13 @@ impl Scene {
             let transition = read_string(count, "transition");
             let n_keyframe = read_usize(count, "keyframe");
             if n_keyframe > 0 {
-                let center = read_mat_from_file::<f64, 3>(&format!(
-                    "{}/bin/sphere-pos-{}.bin",
-                    args.path, i
-                ))
-                .expect("Failed to read sphere pos_path")
-                .map(|x| x as f32);
-                let radius = read_vec::<f32>(&format!("{}/bin/sphere-radius-{}.bin", args.path, i))
+                let center =
+                    read_mat_from_file::<f64, 3>(&files, &format!("bin/sphere-pos-{}.bin", i))
+                        .expect("Failed to read sphere pos_path")
+                        .map(|x| x as f32);
+                let radius = read_vec::<f32>(&files, &format!("bin/sphere-radius-{}.bin", i))
                     .expect("Failed to read sphere radius");
-                let timing = read_vec::<f64>(&format!("{}/bin/sphere-timing-{}.bin", args.path, i))
+                let timing = read_vec::<f64>(&files, &format!("bin/sphere-timing-{}.bin", i))
                     .expect("Failed to read sphere timing");
                 let contact_gap = read_f32(count, "contact-gap");
                 let friction = read_f32(count, "friction");
@@ -516,59 +521,56 @@ impl Scene {
             Vec::new()
         };
 
-        let param_dir = format!("{}/bin/param", args.path);
+        let param_dir = "bin/param";
         let mut rod_param = Vec::new();
         let mut tri_param = Vec::new();
         let mut tet_param = Vec::new();
         let mut static_param = Vec::new();
 
-        for entry in fs::read_dir(&param_dir).expect("Failed to read param directory") {
-            let entry = entry.expect("Failed to read entry");
-            let path = entry.path();
-            if path.is_file() {
-                let file_name = path.file_name().unwrap().to_str().unwrap();
-
-                let (target_param, prefix, n_element) = if file_name.starts_with("rod-") {
-                    (&mut rod_param, "rod-", n_rod)
-                } else if file_name.starts_with("tri-") {
-                    (&mut tri_param, "tri-", n_tri)
-                } else if file_name.starts_with("tet-") {
-                    (&mut tet_param, "tet-", n_tet)
-                } else if file_name.starts_with("static-") {
-                    (&mut static_param, "static-", n_static_tri)
-                } else {
-                    continue;
-                };
+        for file_name in files
+            .list(param_dir)
+            .expect("Failed to read param directory")
+        {
+            let path = format!("{}/{}", param_dir, file_name);
+            let (target_param, prefix, n_element) = if file_name.starts_with("rod-") {
+                (&mut rod_param, "rod-", n_rod)
+            } else if file_name.starts_with("tri-") {
+                (&mut tri_param, "tri-", n_tri)
+            } else if file_name.starts_with("tet-") {
+                (&mut tet_param, "tet-", n_tet)
+            } else if file_name.starts_with("static-") {
+                (&mut static_param, "static-", n_static_tri)
+            } else {
+                continue;
+            };
 
-                if file_name.ends_with(".bin") {
-                    let name = file_name[prefix.len()..file_name.len() - 4].to_string();
-                    if name == "model" {
-                        let values = read_vec::<u8>(&path.to_string_lossy())
-                            .expect("Failed to read model values");
-                        let values = values
-                            .iter()
-                            .map(|&k| {
-                                if k == 0 {
-                                    Model::Arap
-                                } else if k == 1 {
-                                    Model::StVK
-                                } else if k == 2 {
-                                    Model::BaraffWitkin
-                                } else if k == 3 {
-                                    Model::SNHk
-                                } else {
-                                    panic!("Unknown model type: {}", k);
-                                }
-                            })
-                            .collect::<Vec<_>>();
-                        assert_eq!(values.len(), n_element, "path: {}", path.display());
-                        target_param.push((name, ParamValueList::Model(values)));
-                    } else {
-                        let values = read_vec::<f32>(&path.to_string_lossy())
-                            .expect("Failed to read values");
-                        assert_eq!(values.len(), n_element, "path: {}", path.display());
-                        target_param.push((name, ParamValueList::Value(values)));
-                    }
+            if file_name.ends_with(".bin") {
+                let name = file_name[prefix.len()..file_name.len() - 4].to_string();
+                if name == "model" {
+                    let values =
+                        read_vec::<u8>(&files, &path).expect("Failed to read model values");
+                    let values = values
+                        .iter()
+                        .map(|&k| {
+                            if k == 0 {
+                                Model::Arap
+                            } else if k == 1 {
+                                Model::StVK
+                            } else if k == 2 {
+                                Model::BaraffWitkin
+                            } else if k == 3 {
+                                Model::SNHk
+                            } else {
+                                panic!("Unknown model type: {}", k);
+                            }
+                        })
+                        .collect::<Vec<_>>();
+                    assert_eq!(values.len(), n_element, "path: {}", path);
+                    target_param.push((name, ParamValueList::Model(values)));
+                } else {
+                    let values = read_vec::<f32>(&files, &path).expect("Failed to read values");
+                    assert_eq!(values.len(), n_element, "path: {}", path);
+                    target_param.push((name, ParamValueList::Value(values)));
                 }
             }
         }
@@ -0,0 +1,157 @@
+# File: test_frame.py
+# Code: Claude Code and Codex
+# Review: Ryoichi Ando (ryoichi.ando@zozo.com)
+# License: Apache v2.0
+
+import os
+import pickle
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frontend._frame_ import FrameStore, _FrameIndex  # noqa: E402
+
+
+def _write(path, frame, count=4, offset=0.0):
+    vert = np.full((count, 3), frame + offset, dtype=np.float32)
+    tmp = os.path.join(path, f"vert_{frame}.bin.tmp")
+    vert.tofile(tmp)
+    os.replace(tmp, os.path.join(path, f"vert_{frame}.bin"))
+
+
+def _save(path, frame):
+    with open(os.path.join(path, f"state_{frame}.bin.gz"), "wb") as f:
+        f.write(b"\0")
+
+
+@pytest.fixture(params=["watch", "stat"])
+def index(request, tmp_path):
+    index = _FrameIndex(str(tmp_path))
+    if request.param == "stat":
+        index._watch_failed = True
+    yield index
+    index.close()
+
+
+def test_index_follows_new_frames(index, tmp_path):
+    assert index.latest() == 0
+    for frame in range(3):
+        _write(tmp_path, frame)
+    assert index.latest() == 2
+
+    _write(tmp_path, 3)
+    assert index.latest() == 3
+    _write(tmp_path, 4)
+    _write(tmp_path, 5)
+    assert index.latest() == 5
+
+
+def test_index_follows_saved_states(index, tmp_path):
+    _write(tmp_path, 0)
+    assert index.saved() == []
+    _save(tmp_path, 1)
+    _write(tmp_path, 1)
+    assert index.saved() == [1]
+    _save(tmp_path, 2)
+    os.remove(tmp_path / "state_1.bin.gz")
+    assert index.saved() == [2]
+
+
+def test_index_rescans_when_the_latest_frame_goes(index, tmp_path):
+    for frame in range(4):
+        _write(tmp_path, frame)
+    assert index.latest() == 3
+    os.remove(tmp_path / "vert_3.bin")
+    os.remove(tmp_path / "vert_2.bin")
+    assert index.latest() == 1
+
+
+def test_index_survives_a_replaced_directory(index, tmp_path):
+    for frame in range(3):
+        _write(tmp_path, frame)
+    assert index.latest() == 2
+    for frame in range(3):
+        os.remove(tmp_path / f"vert_{frame}.bin")
+    os.rmdir(tmp_path)
+    assert index.latest() == 0
+    os.mkdir(tmp_path)
+    _write(tmp_path, 0)
+    _write(tmp_path, 1)
+    assert index.latest() == 1
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FrameStore(str(tmp_path), capacity=2)
+    yield store
+    store.close()
+
+
+def test_store_reads_frames_read_only(store, tmp_path):
+    _write(tmp_path, 0)
+    vert = store.get(0)
+    assert vert.shape == (4, 3)
+    assert np.all(vert == 0)
+    assert not vert.flags.writeable
+    assert store.get(1) is None
+    with open(tmp_path / "vert_1.bin", "wb") as f:
+        f.write(b"\0" * 10)
+    assert store.get(1) is None
+
+
+def test_store_evicts_least_recently_used(store, tmp_path):
+    for frame in range(3):
+        _write(tmp_path, frame)
+    first = store.get(0)
+    store.get(1)
+    assert store.get(0) is first
+    store.get(2)
+    assert list(store._cache) == [0, 2]
+    assert store.get(0) is first
+    assert store.get(1) is not None
+    assert list(store._cache) == [0, 1]
+
+
+def test_store_reloads_changed_frames(store, tmp_path):
+    _write(tmp_path, 0)
+    assert np.all(store.get(0) == 0)
+    _write(tmp_path, 0, count=5, offset=0.5)
+    vert = store.get(0)
+    assert vert.shape == (5, 3)
+    assert np.all(vert == 0.5)
+    os.remove(tmp_path / "vert_0.bin")
+    assert store.get(0) is None
+    assert 0 not in store._cache
+
+
+def test_store_prefetches_ahead(tmp_path):
+    for frame in range(6):
+        _write(tmp_path, frame)
+    store = FrameStore(str(tmp_path), capacity=4)
+    try:
+        store.prefetch(1, 8)
+        assert store.get(1) is not None
+        assert store._reader is not None
+        store._reader.submit(lambda: None).result()
+        assert store._pending == {}
+        assert sorted(store._cache) == [1, 2, 3, 4]
+        cached = dict(store._cache)
+        assert all(store.get(frame) is cached[frame][1] for frame in range(1, 5))
+    finally:
+        store.close()
+
+
+def test_store_pickles_without_its_cache(store, tmp_path):
+    _write(tmp_path, 0)
+    store.get(0)
+    store.prefetch(0, 2)
+    copy = pickle.loads(pickle.dumps(store))
+    try:
+        assert copy.path == store.path
+        assert copy._cache == {}
+        assert np.all(copy.get(0) == 0)
+    finally:
+        copy.close()
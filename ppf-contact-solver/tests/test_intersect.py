@@ -0,0 +1,114 @@
+# File: test_intersect.py
+# Code: Claude Code and Codex
+# Review: Ryoichi Ando (ryoichi.ando@zozo.com)
+# License: Apache v2.0
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frontend._intersect_ import _candidates, _intersect, find_intersections  # noqa: E402
+
+
+def _brute_force(vert, tri, other_vert=None, other_tri=None):
+    """Test every triangle pair."""
+    tri_pos = np.asarray(vert, dtype=np.float64)[tri]
+    if other_vert is None:
+        first, second = np.triu_indices(len(tri), 1)
+        shared = (tri[first][:, :, None] == tri[second][:, None, :]).any(axis=(1, 2))
+        first, second = first[~shared], second[~shared]
+        other_pos = tri_pos
+    else:
+        other_pos = np.asarray(other_vert, dtype=np.float64)[other_tri]
+        first, second = np.divmod(np.arange(len(tri) * len(other_tri)), len(other_tri))
+    hit = _intersect(tri_pos[first], other_pos[second])
+    return np.stack([first[hit], second[hit]], axis=1)
+
+
+def _soup(rng, count, scale):
+    """Random triangles of mixed sizes in the unit cube."""
+    center = rng.random((count, 1, 3))
+    size = scale * np.exp2(rng.integers(0, 6, (count, 1, 1)))
+    vert = (center + size * rng.standard_normal((count, 3, 3))).reshape(-1, 3)
+    return vert, np.arange(3 * count).reshape(-1, 3)
+
+
+def _grid(res, size, height=None):
+    """A (res x res) sheet in the xz plane, displaced by ``height(x, z)``."""
+    xs = np.linspace(-size, size, res)
+    x, z = np.meshgrid(xs, xs, indexing="ij")
+    y = np.zeros_like(x) if height is None else height(x, z)
+    vert = np.stack([x, y, z], axis=-1).reshape(-1, 3)
+    v0 = (np.arange(res - 1)[:, None] * res + np.arange(res - 1)[None, :]).ravel()
+    tri = np.concatenate(
+        [
+            np.stack([v0, v0 + 1, v0 + res], axis=1),
+            np.stack([v0 + 1, v0 + res + 1, v0 + res], axis=1),
+        ]
+    )
+    return vert, tri
+
+
+def _cloth(res):
+    return _grid(res, 1.0, lambda x, z: 0.05 * np.sin(7.0 * x) * np.cos(5.0 * z))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_self_intersections_match_brute_force(seed):
+    vert, tri = _soup(np.random.default_rng(seed), 400, 0.01)
+    expected = _brute_force(vert, tri)
+    assert len(expected)
+    np.testing.assert_array_equal(find_intersections(vert, tri), expected)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_cross_intersections_match_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    vert, tri = _soup(rng, 300, 0.01)
+    other_vert, other_tri = _soup(rng, 200, 0.02)
+    expected = _brute_force(vert, tri, other_vert, other_tri)
+    assert len(expected)
+    np.testing.assert_array_equal(
+        find_intersections(vert, tri, other_vert, other_tri), expected
+    )
+
+
+def test_mixed_resolution_matches_brute_force():
+    vert, tri = _cloth(32)
+    other_vert, other_tri = _grid(5, 1.2)
+    expected = _brute_force(vert, tri, other_vert, other_tri)
+    assert len(expected)
+    np.testing.assert_array_equal(
+        find_intersections(vert, tri, other_vert, other_tri), expected
+    )
+
+    # The same soup as one mesh, fine and coarse triangles side by side
+    both_vert = np.concatenate([vert, other_vert])
+    both_tri = np.concatenate([tri, other_tri + len(vert)])
+    np.testing.assert_array_equal(
+        find_intersections(both_vert, both_tri), _brute_force(both_vert, both_tri)
+    )
+
+
+def test_mixed_resolution_candidates_are_the_overlapping_boxes():
+    vert, tri = _cloth(96)
+    other_vert, other_tri = _grid(9, 1.2)
+    tri_pos = np.concatenate([vert[tri], other_vert[other_tri]])
+    lo, hi = tri_pos.min(axis=1), tri_pos.max(axis=1)
+    first, second = _candidates(lo, hi, len(tri))
+
+    # Every overlapping box pair is listed once
+    overlap = np.all(
+        (lo[: len(tri), None] <= hi[None, len(tri) :])
+        & (lo[None, len(tri) :] <= hi[: len(tri), None]),
+        axis=2,
+    )
+    expected = np.argwhere(overlap)
+    expected[:, 1] += len(tri)
+    found = np.stack([first, second], axis=1)
+    found = found[np.lexsort((found[:, 1], found[:, 0]))]
+    np.testing.assert_array_equal(found, expected)
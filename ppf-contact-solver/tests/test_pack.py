@@ -0,0 +1,115 @@
+# File: test_pack.py
+# Code: Claude Code and Codex
+# Review: Ryoichi Ando (ryoichi.ando@zozo.com)
+# License: Apache v2.0
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frontend._asset_ import AssetManager  # noqa: E402
+from frontend._mesh_ import MeshManager  # noqa: E402
+from frontend._pack_ import PACK_NAME, ScenePack, ScenePackWriter  # noqa: E402
+from frontend._scene_ import Scene  # noqa: E402
+from frontend._session_ import Session  # noqa: E402
+
+ENTRIES = {
+    "info.toml": b"[count]\nvert = 3\n",
+    "bin/vert.bin": np.arange(9, dtype=np.float32),
+    "bin/tri.bin": np.zeros(600, dtype=np.uint64),
+    "bin/param/empty.bin": np.zeros(0, dtype=np.float32),
+    "bin/param/odd.bin": b"\x01\x02\x03",
+}
+
+
+def _write(path, compress):
+    with ScenePackWriter(str(path), compress) as writer:
+        for name, data in ENTRIES.items():
+            writer.add(name, data)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_pack_round_trip(tmp_path, compress):
+    path = tmp_path / PACK_NAME
+    _write(path, compress)
+    assert not os.path.exists(str(path) + ".tmp")
+
+    pack = ScenePack(str(tmp_path))
+    assert pack.names() == list(ENTRIES)
+    assert "bin/vert.bin" in pack and "bin/uv.bin" not in pack
+    for name, data in ENTRIES.items():
+        if isinstance(data, np.ndarray):
+            array = pack.array(name, data.dtype)
+            np.testing.assert_array_equal(array, data)
+            assert array.dtype == data.dtype
+            assert not array.flags.writeable
+        else:
+            assert pack.read(name) == data
+    codecs = {name: entry[0] for name, entry in pack._entries.items()}
+    assert codecs["bin/tri.bin"] == (1 if compress else 0)
+    assert all(entry[1] % 64 == 0 for entry in pack._entries.values())
+
+
+def test_pack_bytes_are_deterministic(tmp_path):
+    _write(tmp_path / "a.pack", True)
+    _write(tmp_path / "b.pack", True)
+    assert (tmp_path / "a.pack").read_bytes() == (tmp_path / "b.pack").read_bytes()
+
+
+def test_failed_write_leaves_no_pack(tmp_path):
+    path = tmp_path / PACK_NAME
+    with pytest.raises(RuntimeError):
+        with ScenePackWriter(str(path)) as writer:
+            writer.add("info.toml", b"x")
+            raise RuntimeError
+    assert os.listdir(tmp_path) == []
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(bytes(128))
+    with pytest.raises(Exception, match="not a scene pack"):
+        ScenePack(str(path))
+
+
+@pytest.fixture
+def scene(tmp_path):
+    mesh = MeshManager(str(tmp_path / "mesh"))
+    asset = AssetManager()
+    V, F = mesh.square(res=8, ex=[1, 0, 0], ey=[0, 0, 1])
+    asset.add.tri("sheet", V, F)
+    scene = Scene("sheet", None, asset)
+    sheet = scene.add("sheet")
+    sheet.pin(sheet.grab([-1, 0, 0])).move_by([0, 1, 0], 0.0, 1.0)
+    scene.add.invisible.wall([0, -1, 0], [0, 1, 0])
+    return scene.build()
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_pack_matches_directory_export(scene, tmp_path, compress):
+    plain, packed = tmp_path / "plain", tmp_path / "packed"
+    scene.export_fixed(str(plain), False)
+    scene.export_fixed(str(packed), False, pack=True, compress=compress)
+    assert os.listdir(packed) == [PACK_NAME]
+
+    files = sorted(
+        os.path.relpath(os.path.join(root, name), plain)
+        for root, _, names in os.walk(plain)
+        for name in names
+    )
+    pack = ScenePack(str(packed))
+    assert sorted(pack.names()) == files
+    for name in files:
+        assert pack.read(name) == (plain / name).read_bytes(), name
+
+
+def test_session_build_forwards_compress(scene, tmp_path):
+    root = str(tmp_path / "app")
+    session = Session("app", root, root, root, "session").init(scene)
+    fixed = session.build(pack=True, compress=True)
+    pack = ScenePack(fixed.info.path)
+    assert any(entry[0] == 1 for entry in pack._entries.values())
@@ -0,0 +1,206 @@
+# File: test_scene_build.py
+# Code: Claude Code and Codex
+# Review: Ryoichi Ando (ryoichi.ando@zozo.com)
+# License: Apache v2.0
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frontend._asset_ import AssetManager  # noqa: E402
+from frontend._mesh_ import MeshManager  # noqa: E402
+from frontend._scene_ import Scene  # noqa: E402
+
+# Parameters each element kind does not carry, cleared after concatenation
+DROPPED = {
+    "rod": ["model", "poiss-rat", "strain-limit", "shrink"],
+    "tri": ["length-factor"],
+    "tet": ["strain-limit", "shrink", "friction", "contact-gap", "contact-offset", "bend", "length-factor"],
+    "static": ["model", "strain-limit", "shrink", "young-mod", "poiss-rat", "bend", "density", "length-factor"],
+}
+
+
+def _loop_build(scene):
+    """Concatenate the objects of a built scene one vertex at a time, as the scene used to."""
+    out = {}
+    count = 0
+    dyn = [(name, obj) for name, obj in scene._object.items() if not obj.static]
+
+    def add_entry(map, entry):
+        nonlocal count
+        for e in entry:
+            for vi in e:
+                if map[vi] == -1:
+                    map[vi] = count
+                    count += 1
+
+    def vec_map(map, elm):
+        return [[map[vi] for vi in e] for e in elm]
+
+    def extend_param(param, concat, n):
+        for key, value in param.items():
+            concat.setdefault(key, []).extend([value] * n)
+
+    maps = {name: [-1] * len(obj.get("V")) for name, obj in dyn}
+    for name, obj in dyn:
+        if obj.get("T") is None and obj.get("E") is not None:
+            add_entry(maps[name], obj.get("E"))
+    out["rod_vert_range"] = (0, count)
+    for name, obj in dyn:
+        if obj.get("T") is None and obj.get("F") is not None:
+            add_entry(maps[name], obj.get("F"))
+    out["shell_vert_range"] = (out["rod_vert_range"][1], count)
+    for name, obj in dyn:
+        if obj.get("F") is not None:
+            add_entry(maps[name], obj.get("F"))
+    for name, _obj in dyn:
+        map = maps[name]
+        for i in range(len(map)):
+            if map[i] == -1:
+                map[i] = count
+                count += 1
+
+    dmap = {name: i for i, name in enumerate(scene._object)}
+    out["displacement"] = np.array([obj.position for obj in scene._object.values()])
+    vert, vert_dmap = np.zeros((count, 3)), np.zeros(count, dtype=np.uint32)
+    vel, color = np.zeros((count, 3)), np.zeros((count, 3))
+    for name, obj in dyn:
+        map = maps[name]
+        vert[map] = obj.vertex(False)
+        vert_dmap[map] = [dmap[name]] * len(map)
+        vel[map] = obj.object_velocity
+        color[map] = obj.get("color")
+    out.update(vert=vert, vert_dmap=vert_dmap, vel=vel, color=color, map_by_name=maps)
+
+    rod, tri, tet, uv, dyn_color, dyn_intensity = [], [], [], [], [], []
+    params = {kind: {} for kind in DROPPED}
+    for name, obj in dyn:
+        if obj.obj_type == "rod":
+            t = vec_map(maps[name], obj.get("E"))
+            rod.extend(t)
+            extend_param(obj.param, params["rod"], len(t))
+    for name, obj in dyn:
+        if obj.get("F") is not None and obj.get("T") is None:
+            t = vec_map(maps[name], obj.get("F"))
+            tri.extend(t)
+            uv.extend(obj.uv_coords or [np.zeros((2, 3), dtype=np.float32)] * len(t))
+            dyn_color.extend([obj.dynamic_color] * len(t))
+            dyn_intensity.extend([obj.dynamic_intensity] * len(t))
+            extend_param(obj.param, params["tri"], len(t))
+    out["shell_count"] = len(tri)
+    for name, obj in dyn:
+        if obj.get("F") is not None and obj.get("T") is not None:
+            t = vec_map(maps[name], obj.get("F"))
+            tri.extend(t)
+            dyn_color.extend([obj.dynamic_color] * len(t))
+            dyn_intensity.extend([obj.dynamic_intensity] * len(t))
+            extend_param(obj.param, params["tri"], len(t))
+    for name, obj in dyn:
+        if obj.get("T") is not None:
+            t = vec_map(maps[name], obj.get("T"))
+            tet.extend(t)
+            extend_param(obj.param, params["tet"], len(t))
+    out.update(rod=rod, tri=tri, tet=tet, uv=uv, dyn_color=dyn_color, dyn_intensity=dyn_intensity)
+
+    pins, stitch_ind, stitch_w = [], [], []
+    for name, obj in dyn:
+        for p in obj.pin_list:
+            pins.append([maps[name][vi] for vi in p.index])
+        if obj.get("Ind") is not None and obj.get("W") is not None:
+            stitch_ind.extend(vec_map(maps[name], obj.get("Ind")))
+            stitch_w.extend(obj.get("W"))
+    out.update(pins=pins, stitch_ind=stitch_ind, stitch_w=stitch_w)
+
+    static_vert, static_tri, static_color, static_dmap = [], [], [], []
+    for name, obj in scene._object.items():
+        if obj.static:
+            offset = len(static_vert)
+            static_tri.extend(obj.get("F") + offset)
+            static_vert.extend(obj.apply_transform(obj.get("V"), False))
+            static_color.extend([obj.get("color")] * len(obj.get("V")))
+            static_dmap.extend([dmap[name]] * len(obj.get("V")))
+            extend_param(obj.param, params["static"], len(obj.get("F")))
+    out.update(static_vert=static_vert, static_tri=static_tri, static_color=static_color, static_dmap=static_dmap)
+
+    for kind, keys in DROPPED.items():
+        for key in keys:
+            params[kind][key] = []
+    out["params"] = params
+    return out
+
+
+def _tet_mesh():
+    """A tetrahedron split at an interior vertex that no surface triangle uses."""
+    V = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [0.25, 0.25, 0.25]], dtype=float)
+    F = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+    T = np.array([[0, 1, 2, 4], [0, 1, 3, 4], [0, 2, 3, 4], [1, 2, 3, 4]])
+    return V, F, T
+
+
+@pytest.fixture
+def scene(tmp_path):
+    mesh = MeshManager(str(tmp_path))
+    asset = AssetManager()
+    V, F = mesh.square(res=6, ex=[1, 0, 0], ey=[0, 0, 1])
+    asset.add.tri("sheet", V, F)
+    V, E = mesh.line([-1, 1, 0], [1, 1, 0], 8)
+    asset.add.rod("rod", V, E)
+    asset.add.tet("tet", *_tet_mesh())
+    V, F = mesh.box(0.5, 0.5, 0.5)
+    asset.add.tri("box", V, F)
+    asset.add.stitch("seam", (np.array([[0, 7, 8], [5, 10, 11]]), np.array([[0.25, 0.75], [0.5, 0.5]])))
+
+    scene = Scene("build", None, asset)
+    rod = scene.add("rod").at(0, 0.5, 0)
+    rod.pin(rod.grab([-1, 0, 0]))
+    scene.add("box").at(2, 0, 0).pin()
+    sheet = scene.add("sheet").at(0, 1, 0).dyn_color("area", 1.0).stitch("seam")
+    sheet.pin(sheet.grab([-1, 0, 0])).move_by([0, 1, 0], 0.0, 1.0)
+    scene.add("tet").at(0, -1, 0).velocity(0, 1, 0)
+    scene.add("sheet").at(0, 2, 0).param.set("young-mod", 123.0)
+    scene.add("box").at(-2, 0, 0).pin()
+    scene.add("tet").at(1, -1, 0)
+    return scene
+
+
+def test_build_matches_loop_implementation(scene):
+    fixed = scene.build()
+    ref = _loop_build(scene)
+
+    assert fixed._map_by_name.keys() == ref["map_by_name"].keys()
+    for name, map in ref["map_by_name"].items():
+        np.testing.assert_array_equal(fixed._map_by_name[name], map)
+    assert fixed._rod_vert_range == ref["rod_vert_range"]
+    assert fixed._shell_vert_range == ref["shell_vert_range"]
+    assert fixed._rod_count == len(ref["rod"]) and fixed._shell_count == ref["shell_count"]
+
+    np.testing.assert_array_equal(fixed._displacement, ref["displacement"])
+    np.testing.assert_array_equal(fixed._vert[0], ref["vert_dmap"])
+    np.testing.assert_array_equal(fixed._vert[1], ref["vert"])
+    np.testing.assert_array_equal(fixed._vel, ref["vel"])
+    np.testing.assert_array_equal(fixed._color, ref["color"])
+
+    for key in ("rod", "tri", "tet", "stitch_ind", "static_tri"):
+        np.testing.assert_array_equal(getattr(fixed, f"_{key}"), ref[key], err_msg=key)
+    np.testing.assert_array_equal(fixed._stitch_w, ref["stitch_w"])
+    np.testing.assert_array_equal(fixed._static_vert[0], ref["static_dmap"])
+    np.testing.assert_array_equal(fixed._static_vert[1], ref["static_vert"])
+    np.testing.assert_array_equal(fixed._static_color, ref["static_color"])
+    np.testing.assert_array_equal(np.array(fixed._uv), np.array(ref["uv"]))
+    assert list(fixed._dyn_face_color) == ref["dyn_color"]
+    assert list(fixed._dyn_face_intensity) == ref["dyn_intensity"]
+    assert [list(pin.index) for pin in fixed._pin] == ref["pins"]
+
+    for kind in DROPPED:
+        got, expected = getattr(fixed, f"_{kind}_param"), ref["params"][kind]
+        assert list(got) == list(expected), kind
+        for key, values in expected.items():
+            np.testing.assert_array_equal(got[key], values, err_msg=f"{kind} {key}")
+
+    # Every element kind and the unmapped interior tet vertices are present
+    assert len(fixed._rod) and len(fixed._tet) and len(fixed._static_tri) and len(fixed._stitch_ind)
+    assert ref["map_by_name"]["tet"][4] >= len(fixed._vert[0]) - 2
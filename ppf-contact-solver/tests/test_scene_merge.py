@@ -0,0 +1,165 @@
+# File: test_scene_merge.py
+# Code: Claude Code and Codex
+# Review: Ryoichi Ando (ryoichi.ando@zozo.com)
+# License: Apache v2.0
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy.sparse import csr_matrix
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frontend._asset_ import AssetManager  # noqa: E402
+from frontend._mesh_ import MeshManager  # noqa: E402
+from frontend._scene_ import Scene, _duplicate_representatives  # noqa: E402
+
+
+def _loop_representatives(pos, candidate, epsilon, scale_factor):
+    """The per-vertex hash and pairwise allclose merge the scene used to run."""
+    buckets = {}
+    for i in candidate:
+        key = tuple(int(x * scale_factor) for x in pos[i])
+        buckets.setdefault(key, []).append(i)
+    group_of = {}
+    for members in buckets.values():
+        for a, i in enumerate(members):
+            for j in members[a + 1 :]:
+                if np.allclose(pos[i], pos[j], rtol=0, atol=epsilon):
+                    gi = group_of.get(i, {i})
+                    gj = group_of.get(j, {j})
+                    if gi is not gj:
+                        gi |= gj
+                        for k in gi:
+                            group_of[k] = gi
+    representative = np.arange(len(pos))
+    for i, group in group_of.items():
+        representative[i] = min(group)
+    groups = {id(group) for group in group_of.values()}
+    return representative, len(groups)
+
+
+def _loop_face_to_vert(tri, num_vert):
+    total = np.zeros(num_vert) + 0.0001
+    rows, cols, vals = [], [], []
+    for i, f in enumerate(tri):
+        for j in f:
+            rows.append(j)
+            cols.append(i)
+            vals.append(1.0)
+            total[j] += 1
+    mat = csr_matrix((vals, (rows, cols)), shape=(num_vert, len(tri)))
+    return mat.multiply(1.0 / total[:, None]).tocsr()
+
+
+@pytest.fixture(scope="module")
+def mesh(tmp_path_factory):
+    return MeshManager(str(tmp_path_factory.mktemp("mesh")))
+
+
+def _drape(mesh):
+    """Two sheets meeting along a seam over a pinned box, as in the drape example."""
+    asset = AssetManager()
+    V, F = mesh.square(res=16, ex=[1, 0, 0], ey=[0, 0, 1])
+    asset.add.tri("sheet", V, F)
+    V, F = mesh.box(0.8, 0.8, 0.8)
+    asset.add.tri("box", V, F)
+    scene = Scene("drape", None, asset)
+    scene.add("sheet").at(-1, 0.6, 0)
+    scene.add("sheet").at(1, 0.6, 0)
+    scene.add("box").at(0, 0, 0).pin()
+    return scene
+
+
+def _trampoline(mesh):
+    """Overlapping copies of a dynamically colored sheet centred on the origin."""
+    asset = AssetManager()
+    V, F = mesh.square(res=17, ex=[1, 0, 0], ey=[0, 0, 1])
+    asset.add.tri("sheet", V, F)
+    scene = Scene("trampoline", None, asset)
+    for _ in range(2):
+        sheet = scene.add("sheet").dyn_color("area", 1.0)
+        sheet.pin(sheet.grab([-1, 0, 0]) + sheet.grab([1, 0, 0]))
+    return scene
+
+
+def _headless(mesh):
+    """A row of sheets with touching borders and a box, as in headless.py."""
+    asset = AssetManager()
+    V, F = mesh.square(res=12, ex=[0, 0, 1], ey=[0, 1, 0])
+    asset.add.tri("sheet", V, F)
+    V, F = mesh.box(0.5, 0.5, 0.5)
+    asset.add.tri("box", V, F)
+    scene = Scene("headless", None, asset)
+    for i in range(3):
+        obj = scene.add("sheet")
+        obj.at(0, 0, 2.0 * i)
+        obj.pin(obj.grab([0, 1, 0]))
+    scene.add("box").at(-1, 0, 0).pin()
+    return scene
+
+
+@pytest.mark.parametrize("build", [_drape, _trampoline, _headless])
+def test_merge_matches_loop_implementation(mesh, build):
+    plain = build(mesh).build()
+    merged = build(mesh).build(merge=True)
+
+    pos = plain._vert[1] + plain._displacement[plain._vert[0]]
+    edge = np.concatenate([plain._tri[:, [0, 1]], plain._tri[:, [1, 2]], plain._tri[:, [2, 0]]])
+    epsilon = float(0.1 * np.linalg.norm(pos[edge[:, 1]] - pos[edge[:, 0]], axis=1).min())
+    representative, _ = _loop_representatives(pos, np.arange(len(pos)), epsilon, 1.0 / epsilon)
+
+    keep = representative == np.arange(len(pos))
+    assert not keep.all()
+    old_to_new = (np.cumsum(keep) - 1)[representative]
+    tri = old_to_new[plain._tri.astype(np.int64)]
+    tri = tri[[len(set(f)) == 3 for f in tri.tolist()]]
+
+    assert len(merged._vert[0]) == np.count_nonzero(keep)
+    np.testing.assert_array_equal(merged._vert[1], plain._vert[1][keep])
+    np.testing.assert_array_equal(merged._tri.astype(np.int64), tri)
+
+
+@pytest.mark.parametrize("build", [_drape, _trampoline, _headless])
+def test_representatives_match_loop_implementation(mesh, build):
+    plain = build(mesh).build()
+    pos = plain._vert[1] + plain._displacement[plain._vert[0]]
+    candidate = np.arange(len(pos))
+    epsilon = 0.01
+    expected, expected_groups = _loop_representatives(pos, candidate, epsilon, 1.0 / epsilon)
+    representative, groups = _duplicate_representatives(pos, candidate, epsilon, 1.0 / epsilon)
+    np.testing.assert_array_equal(representative, expected)
+    assert groups == expected_groups
+
+
+def test_zero_straddling_cell_keeps_the_epsilon_check():
+    epsilon = 0.1
+    pos = np.array(
+        [
+            [-0.06, 0.5, 0.5],
+            [0.06, 0.5, 0.5],  # same cell as 0, but 0.12 apart
+            [-0.04, 1.5, 0.5],
+            [0.04, 1.5, 0.5],  # same cell as 2 and within epsilon
+            [0.09, 1.5, 0.5],  # within epsilon of 3 only
+            [2.01, 2.01, 2.01],
+            [2.02, 2.02, 2.02],
+        ]
+    )
+    candidate = np.arange(len(pos))
+    representative, groups = _duplicate_representatives(pos, candidate, epsilon, 1.0 / epsilon)
+    np.testing.assert_array_equal(representative, [0, 1, 2, 2, 2, 5, 5])
+    assert groups == 2
+    expected, expected_groups = _loop_representatives(pos, candidate, epsilon, 1.0 / epsilon)
+    np.testing.assert_array_equal(representative, expected)
+    assert groups == expected_groups
+
+
+def test_face_to_vert_matches_loop_implementation(mesh):
+    scene = _trampoline(mesh).build()
+    num_vert = len(scene._vert[0])
+    expected = _loop_face_to_vert(scene._tri, num_vert)
+    actual = scene._face_to_vert_mat
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(actual.toarray(), expected.toarray(), rtol=1e-12, atol=0)
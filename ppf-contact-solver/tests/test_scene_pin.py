@@ -0,0 +1,85 @@
+# File: test_scene_pin.py
+# Code: Claude Code and Codex
+# Review: Ryoichi Ando (ryoichi.ando@zozo.com)
+# License: Apache v2.0
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frontend._asset_ import AssetManager  # noqa: E402
+from frontend._mesh_ import MeshManager  # noqa: E402
+from frontend._scene_ import MoveByOperation, PinData, Scene  # noqa: E402
+
+
+def _loop_time(fixed, time):
+    """Apply every pin operation in order, as the scene did before compiling them."""
+    vert = fixed._vert[1].copy()
+    for pin in fixed._pin:
+        for op in pin.operations:
+            vert[pin.index] = op.apply(vert[pin.index], time)
+    vert += time * fixed._vel
+    return vert + fixed._displacement[fixed._vert[0]]
+
+
+@pytest.fixture
+def scene(tmp_path):
+    mesh = MeshManager(str(tmp_path))
+    asset = AssetManager()
+    V, F = mesh.square(res=6, ex=[1, 0, 0], ey=[0, 0, 1])
+    asset.add.tri("sheet", V, F)
+    scene = Scene("pin", None, asset)
+    sheet = scene.add("sheet")
+    left = sheet.pin(sheet.grab([-1, 0, 0])).move_by([0, 1, 0], 0.0, 1.0)
+    right = sheet.pin(sheet.grab([1, 0, 0])).scale(2.0, 0.0, 1.0)
+    return scene, left, right
+
+
+def _move(y):
+    return MoveByOperation(delta=np.array([[0.0, y, 0.0]]), t_start=0.0, t_end=1.0)
+
+
+def test_schedule_matches_the_operation_loop(scene):
+    fixed = scene[0].build()
+    for t in (0.0, 0.3, 1.0, 2.0):
+        np.testing.assert_allclose(fixed.time(t), _loop_time(fixed, t), atol=1e-12)
+
+
+def test_in_place_edits_rebuild_the_schedule(scene):
+    fixed = scene[0].build()
+    before = fixed.time(0.5)
+    assert fixed._pin_schedule() is fixed._pin_schedule()
+
+    pin = fixed._pin[0]
+    pin.operations[0] = _move(-1.0)
+    pin.modified()
+    np.testing.assert_allclose(fixed.time(0.5), _loop_time(fixed, 0.5), atol=1e-12)
+    assert not np.allclose(fixed.time(0.5), before)
+
+    pin.index = list(reversed(pin.index))
+    pin.modified()
+    np.testing.assert_allclose(fixed.time(0.5), _loop_time(fixed, 0.5), atol=1e-12)
+
+
+def test_replaced_pins_rebuild_the_schedule(scene):
+    fixed = scene[0].build()
+    fixed.time(0.5)
+    old = fixed._pin
+    fixed.set_pin(
+        [PinData(index=list(pin.index), operations=[_move(2.0)]) for pin in old]
+    )
+    del old
+    np.testing.assert_allclose(fixed.time(0.5), _loop_time(fixed, 0.5), atol=1e-12)
+
+
+def test_pin_edits_after_build_leave_the_scene_alone(scene):
+    builder, left, _right = scene
+    fixed = builder.build()
+    before = fixed.time(0.5)
+    left.move_by([1, 0, 0], 0.0, 1.0)
+    np.testing.assert_array_equal(fixed.time(0.5), before)
+    assert len(builder.build()._pin[0].operations) == 2
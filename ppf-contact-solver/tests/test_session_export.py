@@ -0,0 +1,105 @@
+# File: test_session_export.py
+# Code: Claude Code and Codex
+# Review: Ryoichi Ando (ryoichi.ando@zozo.com)
+# License: Apache v2.0
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frontend._asset_ import AssetManager  # noqa: E402
+from frontend._mesh_ import MeshManager  # noqa: E402
+from frontend._scene_ import Scene  # noqa: E402
+from frontend._session_ import Session, _run_export  # noqa: E402
+
+OPTIONS = {"skip_render": True}
+
+
+@pytest.fixture
+def session(tmp_path):
+    mesh = MeshManager(str(tmp_path / "mesh"))
+    asset = AssetManager()
+    V, F = mesh.square(res=8, ex=[1, 0, 0], ey=[0, 0, 1])
+    asset.add.tri("sheet", V, F)
+    scene = Scene("sheet", None, asset)
+    scene.add("sheet").dyn_color("area", 1.0)
+    root = str(tmp_path / "app")
+    fixed = Session("app", root, root, root, "session").init(scene.build()).build()
+    os.makedirs(fixed.output.path, exist_ok=True)
+    return fixed
+
+
+def _write_frames(session, count):
+    vert = session.fixed_scene.vertex(True)
+    for i in range(count):
+        path = os.path.join(session.output.path, f"vert_{i}.bin")
+        (vert + 0.01 * i).astype(np.float32).tofile(path)
+
+
+def _mtimes(path):
+    return {
+        name: os.path.getmtime(os.path.join(path, name))
+        for name in os.listdir(path)
+        if name.endswith(".ply")
+    }
+
+
+def test_reexport_skips_unchanged_frames(session, tmp_path):
+    out = str(tmp_path / "export")
+    _write_frames(session, 3)
+    session.export.animation(out, options=dict(OPTIONS))
+    before = _mtimes(out)
+    assert before
+
+    session.export.animation(out, options=dict(OPTIONS))
+    assert _mtimes(out) == before
+
+
+def test_new_frames_are_exported(session, tmp_path):
+    out = str(tmp_path / "export")
+    _write_frames(session, 2)
+    session.export.animation(out, options=dict(OPTIONS))
+    before = _mtimes(out)
+
+    _write_frames(session, 4)
+    os.utime(os.path.join(session.output.path, "vert_0.bin"), (0, 0))
+    session.export.animation(out, options=dict(OPTIONS))
+    after = _mtimes(out)
+    assert len(after) > len(before)
+    assert after["frame_0.ply"] == before["frame_0.ply"]
+
+
+def test_changed_options_invalidate_frames(session, tmp_path):
+    out = str(tmp_path / "export")
+    _write_frames(session, 3)
+    session.export.animation(out, options=dict(OPTIONS))
+    before = _mtimes(out)
+
+    session.export.animation(out, options=dict(OPTIONS, wireframe=True))
+    after = _mtimes(out)
+    assert after.keys() == before.keys()
+    assert all(after[name] > before[name] for name in before)
+
+    session.export.animation(out, include_static=False, options=dict(OPTIONS, wireframe=True))
+    assert all(t > after[name] for name, t in _mtimes(out).items())
+
+
+def test_worker_pool_matches_single_process(session, tmp_path):
+    _write_frames(session, 4)
+    scene = session.fixed_scene
+    options = session.update_options(dict(OPTIONS))
+    outputs = []
+    for workers in (1, 2):
+        out = tmp_path / f"workers_{workers}"
+        tasks = [
+            (i, os.path.join(session.output.path, f"vert_{i}.bin"), str(out / f"frame_{i}.ply"), "export")
+            for i in range(4)
+        ]
+        frames = [frame for frame, _ in _run_export(tasks, workers, (scene, True, options))]
+        assert frames == list(range(4))
+        outputs.append([(out / f"frame_{i}.ply").read_bytes() for i in range(4)])
+    assert outputs[0] == outputs[1]
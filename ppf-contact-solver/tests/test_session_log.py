@@ -0,0 +1,138 @@
+# File: test_session_log.py
+# Code: Claude Code and Codex
+# Review: Ryoichi Ando (ryoichi.ando@zozo.com)
+# License: Apache v2.0
+
+import functools
+import os
+import sys
+
+import numpy as np
+import pytest
+
+PROJ_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJ_ROOT)
+
+from frontend import _session_  # noqa: E402
+from frontend._asset_ import AssetManager  # noqa: E402
+from frontend._mesh_ import MeshManager  # noqa: E402
+from frontend._scene_ import Scene  # noqa: E402
+from frontend._session_ import Session, _NumberLog, _read_tail  # noqa: E402
+
+
+def _line_numbers(path):
+    """Parse a number log line by line, as the session did before reading it incrementally."""
+
+    def float_or_int(var):
+        var = float(var)
+        return int(var) if var.is_integer() else var
+
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return [[float_or_int(x) for x in line.split(" ")[:2]] for line in f.readlines()]
+
+
+def _line_tail(path, n_lines):
+    """Read the last lines of a file with readlines(), as the session did before seeking."""
+    with open(path) as f:
+        lines = [line.rstrip("\n") for line in f.readlines()]
+    return lines if n_lines is None else lines[-n_lines:]
+
+
+def _append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def session(tmp_path):
+    mesh = MeshManager(str(tmp_path / "mesh"))
+    asset = AssetManager()
+    V, F = mesh.square(res=4, ex=[1, 0, 0], ey=[0, 0, 1])
+    asset.add.tri("sheet", V, F)
+    scene = Scene("sheet", None, asset)
+    scene.add("sheet")
+    root = str(tmp_path / "app")
+    return Session("app", root, PROJ_ROOT, root, "session").init(scene.build()).build()
+
+
+def test_number_log_reads_appended_pieces(tmp_path):
+    path = str(tmp_path / "energy.out")
+    log = _NumberLog(path)
+    assert log.read() is None
+
+    _append(path, "0 1.5\n1 2")
+    values = log.read()
+    np.testing.assert_array_equal(values, [[0, 1.5]])
+    assert not values.flags.writeable
+
+    # The unfinished line is completed by the next write
+    _append(path, ".25\n2 3")
+    np.testing.assert_array_equal(log.read(), [[0, 1.5], [1, 2.25]])
+    assert log.read().shape == (2, 2)
+    _append(path, "\n")
+    np.testing.assert_array_equal(log.read(), _line_numbers(path))
+
+    _append(path, "".join(f"{i} {0.5 * i}\n" for i in range(3, 200)))
+    np.testing.assert_array_equal(log.read(), _line_numbers(path))
+
+
+def test_number_log_restarts_on_truncated_or_replaced_log(tmp_path):
+    path = str(tmp_path / "energy.out")
+    log = _NumberLog(path)
+    _append(path, "0 1\n1 2\n2 3\n")
+    assert len(log.read()) == 3
+
+    with open(path, "w") as f:
+        f.write("0 7\n")
+    np.testing.assert_array_equal(log.read(), [[0, 7]])
+
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        f.write("0 8\n1 9\n")
+    os.replace(tmp, path)
+    np.testing.assert_array_equal(log.read(), [[0, 8], [1, 9]])
+
+    os.remove(path)
+    assert log.read() is None
+
+
+def test_numbers_match_the_line_parser(session):
+    log = session.get.log
+    name = log.names()[0]
+    path = os.path.join(session.info.path, "output", "data", log._log[name]["filename"])
+    assert log.numbers(name) is None
+    assert log.numbers("no such log") is None
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    rng = np.random.default_rng(0)
+    for count in (1, 5, 50):
+        _append(path, "".join(f"{i} {rng.choice([i, rng.random()])}\n" for i in range(count)))
+        expected = _line_numbers(path)
+        assert log.numbers(name).tolist() == expected
+        assert log.number(name) == expected[-1][1]
+
+
+@pytest.mark.parametrize("block", [1, 3, 16])
+def test_tail_file_matches_readlines(session, tmp_path, monkeypatch, block):
+    monkeypatch.setattr(_session_, "_read_tail", functools.partial(_read_tail, block=block))
+    log = session.get.log
+    path = str(tmp_path / "stdout.log")
+    assert log._tail_file(path, 3) == []
+
+    lines = ["", "short", "a somewhat longer line of output", "", "x" * 40, "end"]
+    for text in ("\n".join(lines) + "\n", "\n".join(lines)):
+        with open(path, "w") as f:
+            f.write(text)
+        for n_lines in (None, 1, 2, 3, len(lines), 2 * len(lines)):
+            assert log._tail_file(path, n_lines) == _line_tail(path, n_lines), n_lines
+
+
+def test_read_tail_stops_once_enough_lines_are_covered(tmp_path):
+    path = tmp_path / "stdout.log"
+    path.write_bytes(b"".join(b"line %d\n" % i for i in range(100)))
+    with open(path, "rb") as f:
+        data = _read_tail(f, 2, block=8)
+    assert data.split(b"\n")[-3:] == [b"line 98", b"line 99", b""]
+    assert len(data) < 40
@@ -105,6 +105,24 @@ impl Session {
         Ok(())
     }
 
+    /// Override a contiguous range of collision mesh vertex positions.
+    ///
+    /// Args:
+    ///   offset: first collision-mesh vertex to overwrite
+    ///   verts_flat: flat xyz positions (3 per vertex), in solver coordinates.
+    fn set_collision_mesh_vertices_range(&mut self, offset: usize, verts_flat: Vec<f32>) -> PyResult<()> {
+        let Some(inner) = self.inner.as_mut() else {
+            return Err(pyo3::exceptions::PyRuntimeError::new_err(
+                "Session is closed".to_string(),
+            ));
+        };
+
+        inner
+            .set_collision_mesh_vertices_range(offset, &verts_flat)
+            .map_err(pyo3::exceptions::PyRuntimeError::new_err)?;
+        Ok(())
+    }
+
     fn clear_collision_mesh_vertices(&mut self) -> PyResult<()> {
         let Some(inner) = self.inner.as_mut() else {
             return Err(pyo3::exceptions::PyRuntimeError::new_err(
@@ -0,0 +1,89 @@
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import time
+
+
+def _make_scene(subdiv: int, with_collider: bool):
+    import bpy  # type: ignore
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=subdiv, y_subdivisions=subdiv, size=1.0)
+    deform = bpy.context.active_object
+    deform.name = "Deform"
+
+    dprops = getattr(deform, "andosim_artezbuild")
+    dprops.enabled = True
+    dprops.role = "DEFORMABLE"
+
+    if with_collider:
+        bpy.ops.mesh.primitive_uv_sphere_add(segments=128, ring_count=64, radius=0.3, location=(0.0, 0.0, -0.5))
+        coll = bpy.context.active_object
+        coll.name = "Collider"
+        cprops = getattr(coll, "andosim_artezbuild")
+        cprops.enabled = True
+        cprops.role = "STATIC_COLLIDER"
+
+    return bpy.context.scene.andosim_artezbuild
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Time export_ppf_scene_from_roles on a large grid scene")
+    parser.add_argument(
+        "--addon-root",
+        default=os.environ.get("ADDON_ROOT", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        help="Repo root containing blender_addon/",
+    )
+    parser.add_argument("--subdiv", type=int, default=317, help="Grid subdivisions (317 -> ~200k triangles)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed export runs")
+    parser.add_argument("--no-collider", action="store_true", help="Skip the static collider")
+    args = parser.parse_args(argv)
+
+    import bpy  # type: ignore
+
+    if args.addon_root not in sys.path:
+        sys.path.insert(0, args.addon_root)
+
+    import importlib
+
+    addon = importlib.import_module("blender_addon")
+    addon.register()
+
+    try:
+        settings = _make_scene(args.subdiv, not args.no_collider)
+
+        from blender_addon import ppf_export  # type: ignore
+
+        times: list[float] = []
+        for i in range(max(1, args.repeat)):
+            t0 = time.perf_counter()
+            export = ppf_export.export_ppf_scene_from_roles(bpy.context, settings)
+            times.append(time.perf_counter() - t0)
+
+            if i == 0:
+                n_vert = sum(count for _name, _start, count in export.deformable_slices)
+                n_static = sum(count for _name, _start, count in export.collider_slices)
+                with open(os.path.join(export.scene_path, "info.toml"), encoding="utf-8") as f:
+                    n_tri = next(ln.split("=")[1].strip() for ln in f if ln.startswith("tri ="))
+                print("verts", n_vert, "tris", n_tri, "static_verts", n_static)
+            shutil.rmtree(export.scene_path, ignore_errors=True)
+
+        print("export_s min", f"{min(times):.4f}", "median", f"{statistics.median(times):.4f}", "max", f"{max(times):.4f}")
+    finally:
+        try:
+            addon.unregister()
+        except Exception:
+            pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    if "--" in sys.argv:
+        argv = sys.argv[sys.argv.index("--") + 1 :]
+    else:
+        argv = []
+    raise SystemExit(main(argv))
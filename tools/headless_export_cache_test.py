@@ -0,0 +1,146 @@
+import argparse
+import filecmp
+import os
+import shutil
+import sys
+
+
+def _make_scene(subdiv: int):
+    import bpy  # type: ignore
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=subdiv, y_subdivisions=subdiv, size=1.0)
+    deform = bpy.context.active_object
+    deform.name = "Deform"
+    dprops = getattr(deform, "andosim_artezbuild")
+    dprops.enabled = True
+    dprops.role = "DEFORMABLE"
+
+    bpy.ops.mesh.primitive_uv_sphere_add(segments=32, ring_count=16, radius=0.3, location=(0.0, 0.0, -0.5))
+    coll = bpy.context.active_object
+    coll.name = "Collider"
+    cprops = getattr(coll, "andosim_artezbuild")
+    cprops.enabled = True
+    cprops.role = "STATIC_COLLIDER"
+
+    bpy.context.view_layer.update()
+    return bpy.context.scene.andosim_artezbuild, deform, coll
+
+
+def _animate_shape_key(obj, frame_start: int, frame_end: int) -> None:
+    """Lift every vertex through a shape key keyed from 0 to 1 over the frame range."""
+    if obj.data.shape_keys is None:
+        obj.shape_key_add(name="Basis")
+    key = obj.shape_key_add(name="Lift")
+    for point in key.data:
+        point.co.z += 0.05
+    key.value = 0.0
+    key.keyframe_insert("value", frame=frame_start)
+    key.value = 1.0
+    key.keyframe_insert("value", frame=frame_end)
+
+
+def _bin_files(scene_path: str) -> list[str]:
+    root = os.path.join(scene_path, "bin")
+    out = []
+    for dirpath, _dirs, files in os.walk(root):
+        out.extend(os.path.relpath(os.path.join(dirpath, f), root) for f in files)
+    return sorted(out)
+
+
+def _same_files(a: str, b: str) -> bool:
+    files = _bin_files(a)
+    if files != _bin_files(b):
+        return False
+    _match, mismatch, errors = filecmp.cmpfiles(os.path.join(a, "bin"), os.path.join(b, "bin"), files, shallow=False)
+    return not mismatch and not errors
+
+
+def _check(cond: bool, msg: str) -> None:
+    if not cond:
+        raise AssertionError(msg)
+    print("ok", msg)
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Check that repeated exports skip unchanged objects")
+    parser.add_argument(
+        "--addon-root",
+        default=os.environ.get("ADDON_ROOT", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        help="Repo root containing blender_addon/",
+    )
+    parser.add_argument("--subdiv", type=int, default=64, help="Grid subdivisions")
+    args = parser.parse_args(argv)
+
+    import bpy  # type: ignore
+
+    if args.addon_root not in sys.path:
+        sys.path.insert(0, args.addon_root)
+
+    import importlib
+
+    addon = importlib.import_module("blender_addon")
+    addon.register()
+
+    exports = []
+    try:
+        settings, deform, coll = _make_scene(args.subdiv)
+
+        from blender_addon import ppf_export  # type: ignore
+
+        def export():
+            result = ppf_export.export_ppf_scene_from_roles(bpy.context, settings)
+            exports.append(result.scene_path)
+            return result
+
+        first = export()
+        _check(ppf_export._bin_cache.written > 0, "first export writes its blocks")
+
+        second = export()
+        _check(ppf_export._object_cache.evaluated == 0, "unchanged export evaluates no objects")
+        _check(ppf_export._bin_cache.written == 0, "unchanged export writes no blocks")
+        _check(_same_files(first.scene_path, second.scene_path), "unchanged export is byte-identical")
+
+        coll.location.z -= 0.1
+        bpy.context.view_layer.update()
+        export()
+        # Collider tris plus nothing else: the deformable's tris and groups stay cached.
+        _check(ppf_export._object_cache.evaluated == 1, "moving the collider re-evaluates only the collider")
+        _check(ppf_export._bin_cache.written == 1, "moving the collider rewrites only static_vert.bin")
+
+        settings.tri_friction = float(settings.tri_friction) + 0.1
+        export()
+        _check(ppf_export._object_cache.evaluated == 0, "changing a parameter re-evaluates no objects")
+        _check(ppf_export._bin_cache.written == 1, "changing a parameter rewrites only its param block")
+
+        _animate_shape_key(coll, frame_start=1, frame_end=10)
+        _animate_shape_key(deform, frame_start=1, frame_end=10)
+        bpy.context.scene.frame_set(1)
+        rest = export()
+        bpy.context.scene.frame_set(10)
+        bpy.context.view_layer.update()
+        moved = export()
+        _check(ppf_export._object_cache.evaluated == 2, "changing the frame re-evaluates deformed objects")
+        _check(not _same_files(rest.scene_path, moved.scene_path), "changing the frame exports the deformed geometry")
+        bpy.context.scene.frame_set(1)
+        bpy.context.view_layer.update()
+        back = export()
+        _check(_same_files(rest.scene_path, back.scene_path), "returning to the frame restores its geometry")
+    finally:
+        for path in exports:
+            shutil.rmtree(path, ignore_errors=True)
+        try:
+            addon.unregister()
+        except Exception:
+            pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    if "--" in sys.argv:
+        argv = sys.argv[sys.argv.index("--") + 1 :]
+    else:
+        argv = []
+    raise SystemExit(main(argv))
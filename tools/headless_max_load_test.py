@@ -201,7 +201,7 @@ def _stress_ppf_steps(module_name: str, outdir: str, subdiv: int, steps: int, mo
 
     sess = ppf_cts_backend.Session(export.scene_path, outdir)
     try:
-        collider_names = list(getattr(export, "collider_object_names", []) or [])
+        collider_stream = ops_mod._PPFColliderStream(list(getattr(export, "collider_slices", []) or []))
 
         t0 = time.time()
         for k in range(int(steps)):
@@ -210,8 +210,7 @@ def _stress_ppf_steps(module_name: str, outdir: str, subdiv: int, steps: int, mo
                 coll.location.z = -0.6 + 0.1 * math.sin(0.05 * k)
                 bpy.context.view_layer.update()
 
-            collider_verts_flat = ops_mod._ppf_build_collision_mesh_vertices_flat(bpy.context, collider_names)
-            ops_mod._ppf_apply_collision_mesh_vertices(sess, collider_verts_flat)
+            ops_mod._sync_ppf_collision_mesh_to_backend(bpy.context, sess, collider_stream)
 
             out = sess.step(curr)
             if len(out) != len(curr):